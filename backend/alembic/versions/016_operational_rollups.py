@@ -0,0 +1,65 @@
+"""Add operational rollup tables.
+
+Revision ID: 016_operational_rollups
+Revises: 015_permission_role_tenant
+Create Date: 2026-10-16
+
+PERFORMANCE: Hourly per-tenant, per-queue counters for reports and queue
+stats. Maintained incrementally by app.services.rollup_service; backfill
+after upgrading with:
+    python scripts/run_rollup_repair.py --all
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "016_operational_rollups"
+down_revision = "015_permission_role_tenant"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create item_state_rollups and activity_rollups tables."""
+    op.create_table(
+        "item_state_rollups",
+        sa.Column("tenant_id", sa.String(36), primary_key=True),
+        sa.Column("queue_id", sa.String(36), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("status", sa.String(30), primary_key=True),
+        sa.Column("risk_level", sa.String(20), primary_key=True),
+        sa.Column("sla_breached", sa.Boolean(), primary_key=True),
+        sa.Column("item_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_item_state_rollups_tenant_bucket", "item_state_rollups", ["tenant_id", "bucket_start"]
+    )
+    op.create_index(
+        "ix_item_state_rollups_tenant_queue", "item_state_rollups", ["tenant_id", "queue_id"]
+    )
+
+    op.create_table(
+        "activity_rollups",
+        sa.Column("tenant_id", sa.String(36), primary_key=True),
+        sa.Column("queue_id", sa.String(36), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("metric", sa.String(30), primary_key=True),
+        sa.Column("value", sa.String(50), primary_key=True),
+        sa.Column("event_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("amount_total", sa.Numeric(16, 2), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_activity_rollups_tenant_metric_bucket",
+        "activity_rollups",
+        ["tenant_id", "metric", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    """Drop rollup tables."""
+    op.drop_index("ix_activity_rollups_tenant_metric_bucket", table_name="activity_rollups")
+    op.drop_table("activity_rollups")
+    op.drop_index("ix_item_state_rollups_tenant_queue", table_name="item_state_rollups")
+    op.drop_index("ix_item_state_rollups_tenant_bucket", table_name="item_state_rollups")
+    op.drop_table("item_state_rollups")
@@ -0,0 +1,43 @@
+"""Add composite indexes for keyset pagination.
+
+Revision ID: 017_keyset_pagination_indexes
+Revises: 016_operational_rollups
+Create Date: 2026-10-16
+
+PERFORMANCE: Keyset (cursor) pagination resumes after the last row of the
+previous page using the sort key. These indexes match each search's
+tenant filter and sort key so every page is a short index range scan:
+- check search: (tenant_id, priority, presented_date, id)
+- archive search: (tenant_id, updated_at, id)
+- audit log search: (tenant_id, timestamp, id)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "017_keyset_pagination_indexes"
+down_revision = "016_operational_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create keyset pagination indexes."""
+    op.create_index(
+        "ix_check_items_tenant_priority_presented",
+        "check_items",
+        ["tenant_id", "priority", "presented_date", "id"],
+    )
+    op.create_index(
+        "ix_check_items_tenant_updated", "check_items", ["tenant_id", "updated_at", "id"]
+    )
+    op.create_index(
+        "ix_audit_logs_tenant_timestamp", "audit_logs", ["tenant_id", "timestamp", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    op.drop_index("ix_audit_logs_tenant_timestamp", table_name="audit_logs")
+    op.drop_index("ix_check_items_tenant_updated", table_name="check_items")
+    op.drop_index("ix_check_items_tenant_priority_presented", table_name="check_items")
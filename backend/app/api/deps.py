@@ -17,6 +17,7 @@ from app.core.security import decode_token
 from app.core.tenant import TenantAwareSession, TenantContext
 from app.db.session import AsyncSessionLocal
 from app.models.user import Role, User
+from app.services.principal_cache import Principal, principal_cache
 
 # Security audit logger - separate from general logging for SIEM integration
 auth_logger = logging.getLogger("security.auth")
@@ -46,11 +47,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def get_current_user(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-) -> User:
-    """Get the current authenticated user."""
+def _get_token_subject(credentials: HTTPAuthorizationCredentials) -> str:
+    """Validate an access token and return its subject (user ID)."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -70,6 +68,20 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
+    return user_id
+
+
+async def get_current_user(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+) -> User:
+    """Get the current authenticated user.
+
+    Loads the full User row. Endpoints that only need identity and
+    permission checks should depend on get_current_principal instead.
+    """
+    user_id = _get_token_subject(credentials)
+
     result = await db.execute(
         select(User)
         .options(selectinload(User.roles).selectinload(Role.permissions))
@@ -78,11 +90,38 @@ async def get_current_user(
     user = result.scalar_one_or_none()
 
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     return user
 
 
+async def get_current_principal(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+) -> Principal:
+    """Get the current authenticated principal.
+
+    Served from the two-tier principal cache; the database is only queried
+    on a cache miss, so the common path costs zero DB round trips. Inactive
+    users are never loaded and get 401, as they do from get_current_user.
+    """
+    user_id = _get_token_subject(credentials)
+
+    principal = await principal_cache.get_or_load(db, user_id)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
@@ -92,6 +131,15 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_principal(
+    current_user: Annotated[Principal, Depends(get_current_principal)],
+) -> Principal:
+    """Get current principal if active."""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
 async def get_current_active_superuser(
     current_user: Annotated[User, Depends(get_current_active_user)],
 ) -> User:
@@ -106,7 +154,7 @@ async def get_current_active_superuser(
 
 def _log_auth_failure(
     event_type: str,
-    user: User,
+    user: Principal,
     resource: str,
     action: str,
     request: Request | None = None,
@@ -128,7 +176,7 @@ def _log_auth_failure(
         "username": user.username,
         "resource": resource,
         "action": action,
-        "user_roles": [r.name for r in user.roles] if user.roles else [],
+        "user_roles": sorted(user.role_names),
     }
 
     if request:
@@ -150,7 +198,8 @@ def require_permission(resource: str, action: str):
     """
     Dependency factory for permission checking.
 
-    Logs all authorization failures for security audit.
+    Logs all authorization failures for security audit. The check runs
+    against the cached Principal, so it is a set lookup with no DB access.
 
     Usage:
         @router.get("/items")
@@ -162,8 +211,8 @@ def require_permission(resource: str, action: str):
 
     async def permission_checker(
         request: Request,
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_active_principal)],
+    ) -> Principal:
         if not current_user.has_permission(resource, action):
             _log_auth_failure(
                 event_type="permission_denied",
@@ -190,8 +239,8 @@ def require_role(role_name: str):
 
     async def role_checker(
         request: Request,
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_active_principal)],
+    ) -> Principal:
         if not current_user.has_role(role_name) and not current_user.is_superuser:
             _log_auth_failure(
                 event_type="role_required",
@@ -226,8 +275,8 @@ def require_any_permission(*permissions: tuple[str, str]):
 
     async def permission_checker(
         request: Request,
-        current_user: Annotated[User, Depends(get_current_active_user)],
-    ) -> User:
+        current_user: Annotated[Principal, Depends(get_current_active_principal)],
+    ) -> Principal:
         for resource, action in permissions:
             if current_user.has_permission(resource, action):
                 return current_user
@@ -250,14 +299,15 @@ def require_any_permission(*permissions: tuple[str, str]):
 # Type aliases for commonly used dependencies
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUser = Annotated[User, Depends(get_current_active_user)]
+CurrentPrincipal = Annotated[Principal, Depends(get_current_active_principal)]
 
 
 # Pre-built permission dependencies for common operations
-RequireCheckView = Annotated[User, Depends(require_permission("check_item", "view"))]
-RequireCheckReview = Annotated[User, Depends(require_permission("check_item", "review"))]
-RequireCheckApprove = Annotated[User, Depends(require_permission("check_item", "approve"))]
-RequireAuditView = Annotated[User, Depends(require_permission("audit", "view"))]
-RequireAdmin = Annotated[User, Depends(require_role("admin"))]
+RequireCheckView = Annotated[Principal, Depends(require_permission("check_item", "view"))]
+RequireCheckReview = Annotated[Principal, Depends(require_permission("check_item", "review"))]
+RequireCheckApprove = Annotated[Principal, Depends(require_permission("check_item", "approve"))]
+RequireAuditView = Annotated[Principal, Depends(require_permission("audit", "view"))]
+RequireAdmin = Annotated[Principal, Depends(require_role("admin"))]
 
 
 # =============================================================================
@@ -266,7 +316,7 @@ RequireAdmin = Annotated[User, Depends(require_role("admin"))]
 
 
 async def get_tenant_db(
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[Principal, Depends(get_current_active_principal)],
 ) -> AsyncGenerator[TenantAwareSession, None]:
     """
     Dependency to get a tenant-scoped database session.
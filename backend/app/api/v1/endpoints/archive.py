@@ -1,22 +1,33 @@
 """Archive endpoints for historical items and decisions."""
 
-import csv
-import io
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import joinedload
 
 from app.api.deps import DBSession, require_permission
 from app.audit.service import AuditService
 from app.core.rate_limit import RateLimits, user_limiter
+from app.db.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    page_count,
+    resolve_count_mode,
+)
+from app.db.session import AsyncSessionLocal
 from app.models.audit import AuditAction, AuditLog
 from app.models.check import CheckItem, CheckStatus, RiskLevel
 from app.models.decision import Decision, DecisionAction
 from app.schemas.common import PaginatedResponse
+from app.services.csv_export import EXPORT_BATCH_SIZE, csv_response
 
 router = APIRouter()
 
@@ -28,6 +39,9 @@ ARCHIVED_STATUSES = [
     CheckStatus.CLOSED,
 ]
 
+# Archive sort key (descending); id breaks ties so keyset cursors are unique
+ARCHIVE_ORDER = (CheckItem.updated_at, CheckItem.id)
+
 
 @router.get("/items")
 @user_limiter.limit(RateLimits.SEARCH)  # User-based: 60/min, 500/hour
@@ -47,12 +61,21 @@ async def search_archived_items(
     account_number: str | None = None,
     reviewer_id: str | None = None,
     search_query: str | None = None,
+    cursor: str | None = Query(
+        None, description="Keyset cursor (next_cursor); pass empty to start cursor paging"
+    ),
+    count: CountMode | None = Query(
+        None, description="Total count mode; keyset pages after the first skip it by default"
+    ),
 ):
     """
     Search archived (completed) items.
 
     Returns items with final statuses: APPROVED, RETURNED, REJECTED, EXCEPTION.
     Supports filtering by date range, amount, risk level, reviewer, etc.
+
+    Passing `cursor` switches from page/offset paging to keyset paging over
+    (updated_at, id), whose cost does not grow with depth.
     """
     tenant_id = current_user.tenant_id
 
@@ -100,19 +123,40 @@ async def search_archived_items(
         if decision_action:
             query = query.where(Decision.action.in_(decision_action))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Count total (keyset pages after the first skip it by default)
+    total, total_is_estimate = await count_rows(db, query, resolve_count_mode(count, cursor))
 
     # Apply pagination and ordering
-    query = query.order_by(CheckItem.updated_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    next_cursor = None
+    if cursor is not None:
+        if cursor:
+            try:
+                values = decode_cursor(cursor, datetime.fromisoformat, str)
+            except InvalidCursorError:
+                # `status` is shadowed by the query parameter here
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query = query.where(keyset_after(ARCHIVE_ORDER, values))
+        query = query.order_by(*(column.desc() for column in ARCHIVE_ORDER))
+
+        # Fetch one extra row to know whether another page exists
+        result = await db.execute(query.limit(page_size + 1))
+        items = list(result.scalars().all())
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        if has_next:
+            next_cursor = encode_cursor(items[-1].updated_at, items[-1].id)
+        page = 1
+        has_previous = bool(cursor)
+    else:
+        query = query.order_by(*(column.desc() for column in ARCHIVE_ORDER))
+        query = query.offset((page - 1) * page_size).limit(page_size)
 
-    result = await db.execute(query)
-    items = result.scalars().all()
+        result = await db.execute(query)
+        items = result.scalars().all()
+        has_next = page < page_count(total, page_size)
+        has_previous = page > 1
 
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = page_count(total, page_size)
 
     # Format response
     items_response = []
@@ -163,8 +207,10 @@ async def search_archived_items(
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
-        "has_next": page < total_pages,
-        "has_previous": page > 1,
+        "has_next": has_next,
+        "has_previous": has_previous,
+        "next_cursor": next_cursor,
+        "total_is_estimate": total_is_estimate,
     }
 
 
@@ -263,6 +309,75 @@ async def get_archived_item_detail(
     }
 
 
+ARCHIVE_CSV_HEADER = (
+    "Item ID",
+    "External ID",
+    "Account Number",
+    "Amount",
+    "Payee Name",
+    "Check Number",
+    "Check Date",
+    "Status",
+    "Risk Level",
+    "Risk Score",
+    "Decision Action",
+    "Decision Date",
+    "Reviewer ID",
+    "Decision Notes",
+    "AI Assisted",
+    "Dual Control Required",
+    "Created At",
+    "Updated At",
+)
+
+
+async def _archive_csv_rows(query, tenant_id: str) -> AsyncIterator[list]:
+    """Stream archive export rows through a server-side cursor.
+
+    Decisions are loaded per cursor batch, latest decision per item.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream_scalars(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for items in result.partitions():
+            decisions_result = await session.execute(
+                select(Decision)
+                .where(
+                    Decision.check_item_id.in_([item.id for item in items]),
+                    Decision.tenant_id == tenant_id,
+                )
+                .order_by(Decision.created_at.desc())
+            )
+            decisions_by_item = {}
+            for decision in decisions_result.scalars():
+                decisions_by_item.setdefault(decision.check_item_id, decision)
+
+            for item in items:
+                decision = decisions_by_item.get(item.id)
+                yield [
+                    item.id,
+                    item.external_item_id,
+                    item.account_number_masked,
+                    float(item.amount) if item.amount else "",
+                    item.payee_name or "",
+                    item.check_number or "",
+                    item.check_date.isoformat() if item.check_date else "",
+                    item.status.value,
+                    item.risk_level.value if item.risk_level else "",
+                    float(item.ai_risk_score) if item.ai_risk_score else "",
+                    decision.action.value if decision else "",
+                    decision.created_at.isoformat() if decision and decision.created_at else "",
+                    decision.user_id if decision else "",
+                    decision.notes or "" if decision else "",
+                    decision.ai_assisted if decision else "",
+                    decision.is_dual_control_required if decision else "",
+                    item.created_at.isoformat() if item.created_at else "",
+                    item.updated_at.isoformat() if item.updated_at else "",
+                ]
+
+            # Rows are written; don't keep the batch in the identity map
+            session.expunge_all()
+
+
 @router.get("/export/csv")
 @user_limiter.limit(RateLimits.EXPORT_CSV)  # User-based: 5/min, 20/hour (expensive)
 async def export_archived_items_csv(
@@ -274,15 +389,17 @@ async def export_archived_items_csv(
     date_from: datetime | None = None,
     date_to: datetime | None = None,
     max_records: int = Query(10000, ge=1, le=50000),
+    compress: bool = False,
 ):
     """
     Export archived items to CSV.
 
     Maximum 50,000 records per export. Use date filters for larger datasets.
+    The file is streamed as rows are read; set compress=true for a .csv.gz.
     """
     tenant_id = current_user.tenant_id
 
-    # Audit log the export
+    # Audit log the export (committed before streaming starts)
     audit_service = AuditService(db)
     await audit_service.log_report_access(
         report_type="archive_export_csv",
@@ -295,6 +412,7 @@ async def export_archived_items_csv(
             "date_from": date_from.isoformat() if date_from else None,
             "date_to": date_to.isoformat() if date_to else None,
             "max_records": max_records,
+            "compress": compress,
         },
         exported=True,
     )
@@ -317,91 +435,14 @@ async def export_archived_items_csv(
 
     query = query.order_by(CheckItem.updated_at.desc()).limit(max_records)
 
-    result = await db.execute(query)
-    items = result.scalars().all()
-
-    # Get decisions for all items
-    item_ids = [item.id for item in items]
-    decisions_result = await db.execute(
-        select(Decision).where(
-            Decision.check_item_id.in_(item_ids),
-            Decision.tenant_id == tenant_id,
-        )
-    )
-    decisions_by_item = {}
-    for decision in decisions_result.scalars().all():
-        if decision.check_item_id not in decisions_by_item:
-            decisions_by_item[decision.check_item_id] = decision
-
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow(
-        [
-            "Item ID",
-            "External ID",
-            "Account Number",
-            "Amount",
-            "Payee Name",
-            "Check Number",
-            "Check Date",
-            "Status",
-            "Risk Level",
-            "Risk Score",
-            "Decision Action",
-            "Decision Date",
-            "Reviewer ID",
-            "Decision Notes",
-            "AI Assisted",
-            "Dual Control Required",
-            "Created At",
-            "Updated At",
-        ]
-    )
-
-    # Data rows
-    for item in items:
-        decision = decisions_by_item.get(item.id)
-        writer.writerow(
-            [
-                item.id,
-                item.external_item_id,
-                item.account_number_masked,
-                float(item.amount) if item.amount else "",
-                item.payee_name or "",
-                item.check_number or "",
-                item.check_date.isoformat() if item.check_date else "",
-                item.status.value,
-                item.risk_level.value if item.risk_level else "",
-                float(item.ai_risk_score) if item.ai_risk_score else "",
-                decision.action.value if decision else "",
-                decision.created_at.isoformat() if decision and decision.created_at else "",
-                decision.user_id if decision else "",
-                decision.notes or "" if decision else "",
-                decision.ai_assisted if decision else "",
-                decision.is_dual_control_required if decision else "",
-                item.created_at.isoformat() if item.created_at else "",
-                item.updated_at.isoformat() if item.updated_at else "",
-            ]
-        )
-
-    csv_content = output.getvalue()
-    output.close()
-
     # Generate filename with date range
     if date_from and date_to:
-        filename = (
-            f"archive_export_{date_from.strftime('%Y%m%d')}_to_{date_to.strftime('%Y%m%d')}.csv"
-        )
+        filename = f"archive_export_{date_from.strftime('%Y%m%d')}_to_{date_to.strftime('%Y%m%d')}"
     else:
-        filename = f"archive_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = f"archive_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    return csv_response(
+        filename, ARCHIVE_CSV_HEADER, _archive_csv_rows(query, tenant_id), compress=compress
     )
 
 
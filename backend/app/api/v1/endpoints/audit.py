@@ -1,10 +1,8 @@
 """Audit log endpoints."""
 
-import io
 import json
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Annotated
-from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
@@ -12,21 +10,32 @@ from sqlalchemy import select
 
 from app.api.deps import CurrentUser, DBSession, require_permission
 from app.audit.service import AuditService
+from app.db.pagination import CountMode, InvalidCursorError, page_count, resolve_count_mode
 from app.models.audit import AuditAction, AuditLog, ItemView
 from app.models.check import CheckItem
 from app.schemas.audit import (
     AuditLogResponse,
     AuditLogSearchRequest,
+    AuditPacketJobResponse,
     AuditPacketRequest,
     AuditPacketResponse,
     ItemViewResponse,
 )
 from app.schemas.common import PaginatedResponse
-from app.services.cache_service import get_cache
-from app.services.pdf_generator import AuditPacketGenerator
+from app.services.audit_packet_jobs import (
+    AuditPacketJobError,
+    AuditPacketJobs,
+    AuditPacketJobStatus,
+)
+from app.services.cache_service import CacheService, get_cache
 
 router = APIRouter()
 
+# How long POST /audit/packet waits for rendering before asking the client to poll
+PACKET_SYNC_TIMEOUT_SECONDS = 120
+
+PACKET_TTL = CacheService.TTL_AUDIT_PACKET
+
 
 @router.get("/logs", response_model=PaginatedResponse[AuditLogResponse])
 async def search_audit_logs(
@@ -40,12 +49,21 @@ async def search_audit_logs(
     user_id: str | None = None,
     date_from: datetime | None = None,
     date_to: datetime | None = None,
+    cursor: str | None = Query(
+        None, description="Keyset cursor (next_cursor); pass empty to start cursor paging"
+    ),
+    count: CountMode | None = Query(
+        None, description="Total count mode; keyset pages after the first skip it by default"
+    ),
 ):
-    """Search audit logs with filtering."""
-    audit_service = AuditService(db)
+    """Search audit logs with filtering.
 
-    # CRITICAL: Filter by tenant_id for multi-tenant security
-    logs, total = await audit_service.search_audit_logs(
+    Passing `cursor` switches from page/offset paging to keyset paging
+    over (timestamp, id), whose cost does not grow with depth.
+    """
+    audit_service = AuditService(db)
+    filters = dict(
+        # CRITICAL: Filter by tenant_id for multi-tenant security
         tenant_id=current_user.tenant_id,
         action=action,
         resource_type=resource_type,
@@ -53,11 +71,32 @@ async def search_audit_logs(
         user_id=user_id,
         date_from=date_from,
         date_to=date_to,
-        page=page,
-        page_size=page_size,
     )
 
-    total_pages = (total + page_size - 1) // page_size
+    next_cursor = None
+    total_is_estimate = False
+    if cursor is not None:
+        try:
+            result = await audit_service.search_audit_logs_keyset(
+                **filters,
+                cursor=cursor or None,
+                page_size=page_size,
+                count_mode=resolve_count_mode(count, cursor),
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        logs, total = result.items, result.total
+        next_cursor, total_is_estimate = result.next_cursor, result.total_is_estimate
+        page = 1
+        has_next, has_previous = result.has_next, bool(cursor)
+    else:
+        logs, total = await audit_service.search_audit_logs(
+            **filters, page=page, page_size=page_size
+        )
+        has_next = page < page_count(total, page_size)
+        has_previous = page > 1
+
+    total_pages = page_count(total, page_size)
 
     return PaginatedResponse(
         items=[
@@ -81,8 +120,10 @@ async def search_audit_logs(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -173,108 +214,163 @@ async def get_item_views(
     return responses
 
 
-@router.post("/packet", response_model=AuditPacketResponse)
-async def generate_audit_packet(
-    packet_request: AuditPacketRequest,
-    db: DBSession,
-    current_user: Annotated[object, Depends(require_permission("audit", "export"))],
-):
-    """Generate an audit packet for a check item.
+def _packet_options(packet_request: AuditPacketRequest) -> dict:
+    """Rendering options that affect packet content (part of the dedupe key)."""
+    return {
+        "format": packet_request.format,
+        "include_images": packet_request.include_images,
+        "include_history": packet_request.include_history,
+    }
+
+
+def _job_response(job: dict) -> AuditPacketJobResponse:
+    completed = job["status"] == AuditPacketJobStatus.COMPLETED.value
+    completed_at = datetime.fromisoformat(job["completed_at"]) if job["completed_at"] else None
+    return AuditPacketJobResponse(
+        job_id=job["job_id"],
+        check_item_id=job["check_item_id"],
+        status=job["status"],
+        reused=job.get("reused", False),
+        submitted_at=datetime.fromisoformat(job["submitted_at"]),
+        completed_at=completed_at,
+        packet_id=job["packet_id"] if completed else None,
+        # Relative to API base, frontend adds /api/v1 prefix
+        download_url=f"/audit/packet/{job['packet_id']}/download" if completed else None,
+        expires_at=completed_at + PACKET_TTL if completed_at and completed else None,
+        error=job.get("error"),
+    )
 
-    SECURITY: Packets are stored in Redis with tenant_id and user_id binding.
-    Only the user who generated the packet can download it, and only while
-    within the same tenant. This prevents:
-    - Cross-tenant access if packet_id is leaked
-    - Cross-user access within the same tenant
-    """
-    now = datetime.now(timezone.utc)
 
+async def _submit_packet_job(
+    packet_request: AuditPacketRequest, db: DBSession, current_user
+) -> tuple[AuditPacketJobs, dict]:
+    """Verify item ownership and submit (or reuse) a packet job."""
     # Verify item exists and belongs to this tenant
     # CRITICAL: Filter by tenant_id for multi-tenant security
     result = await db.execute(
-        select(CheckItem).where(
+        select(CheckItem.id).where(
             CheckItem.id == packet_request.check_item_id,
             CheckItem.tenant_id == current_user.tenant_id,
         )
     )
-    item = result.scalar_one_or_none()
-
-    if not item:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Check item not found",
         )
 
-    # Generate packet ID
-    packet_id = str(uuid4())
-
-    # Generate PDF
-    pdf_generator = AuditPacketGenerator(db)
+    jobs = AuditPacketJobs(await get_cache())
     try:
-        pdf_bytes = await pdf_generator.generate(
+        job = await jobs.submit(
+            db,
             check_item_id=packet_request.check_item_id,
-            include_images=packet_request.include_images,
-            include_history=packet_request.include_history,
-            generated_by=current_user.username,
-        )
-    except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate PDF: {str(e)}",
+            tenant_id=current_user.tenant_id,
+            user_id=current_user.id,
+            username=current_user.username,
+            options=_packet_options(packet_request),
         )
-
-    # Store in Redis with tenant/user ownership binding
-    # SECURITY: Packets can only be retrieved by the same tenant+user
-    cache = await get_cache()
-    stored = await cache.store_audit_packet(
-        packet_id=packet_id,
-        pdf_bytes=pdf_bytes,
-        tenant_id=current_user.tenant_id,
-        user_id=current_user.id,
-        check_item_id=packet_request.check_item_id,
-    )
-
-    if not stored:
+    except AuditPacketJobError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Failed to store audit packet. Please try again.",
         )
+    return jobs, job
 
-    expires_at = now + timedelta(hours=1)
 
-    # Log packet generation
-    audit_service = AuditService(db)
-    await audit_service.log(
-        action=AuditAction.AUDIT_PACKET_GENERATED,
-        resource_type="check_item",
-        resource_id=packet_request.check_item_id,
-        user_id=current_user.id,
-        username=current_user.username,
-        description=f"Generated audit packet {packet_id}",
-        metadata={
-            "packet_id": packet_id,
-            "format": packet_request.format,
-            "include_images": packet_request.include_images,
-        },
-    )
+@router.post("/packet", response_model=AuditPacketResponse)
+async def generate_audit_packet(
+    packet_request: AuditPacketRequest,
+    db: DBSession,
+    current_user: Annotated[object, Depends(require_permission("audit", "export"))],
+):
+    """Generate an audit packet for a check item and wait for it.
+
+    Equivalent to submitting a job with POST /audit/packet/jobs and waiting
+    for it to complete; prefer the job endpoints for large packets.
 
-    # Generate download URL (relative to API base, frontend adds /api/v1 prefix)
-    download_url = f"/audit/packet/{packet_id}/download"
+    SECURITY: Packets are stored in Redis with tenant_id and user_id binding.
+    Only the user who generated the packet can download it, and only while
+    within the same tenant. This prevents:
+    - Cross-tenant access if packet_id is leaked
+    - Cross-user access within the same tenant
+    """
+    jobs, job = await _submit_packet_job(packet_request, db, current_user)
+    # Make the dedupe lookup's reuse audit entry durable before waiting
+    await db.commit()
+
+    job = await jobs.wait(
+        job["job_id"], current_user.tenant_id, current_user.id, timeout=PACKET_SYNC_TIMEOUT_SECONDS
+    )
+    if job is None or job["status"] == AuditPacketJobStatus.FAILED.value:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate PDF",
+        )
+    if job["status"] != AuditPacketJobStatus.COMPLETED.value:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Audit packet is still rendering; poll /audit/packet/jobs/{job['job_id']}",
+        )
 
+    response = _job_response(job)
     return AuditPacketResponse(
-        packet_id=packet_id,
-        check_item_id=packet_request.check_item_id,
-        generated_at=now,
+        packet_id=response.packet_id,
+        check_item_id=response.check_item_id,
+        generated_at=response.completed_at,
         generated_by=current_user.username,
         format=packet_request.format,
-        download_url=download_url,
-        expires_at=expires_at,
+        download_url=response.download_url,
+        expires_at=response.expires_at,
     )
 
 
+@router.post(
+    "/packet/jobs",
+    response_model=AuditPacketJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_audit_packet_job(
+    packet_request: AuditPacketRequest,
+    db: DBSession,
+    current_user: Annotated[object, Depends(require_permission("audit", "export"))],
+):
+    """Submit an audit packet rendering job.
+
+    Returns immediately. Poll GET /audit/packet/jobs/{job_id} until the
+    status is "completed", then download from download_url. An identical
+    request (same item, options and audit history) reuses the packet
+    already rendered for this user.
+    """
+    _, job = await _submit_packet_job(packet_request, db, current_user)
+    # Make the dedupe lookup's reuse audit entry durable
+    await db.commit()
+    return _job_response(job)
+
+
+@router.get("/packet/jobs/{job_id}", response_model=AuditPacketJobResponse)
+async def get_audit_packet_job(
+    job_id: str,
+    current_user: Annotated[object, Depends(require_permission("audit", "export"))],
+    wait: float = Query(0, ge=0, le=30, description="Seconds to wait for completion"),
+):
+    """Get the status of an audit packet job.
+
+    With `wait`, the request is held until the job finishes or the wait
+    elapses (long polling).
+
+    SECURITY: Jobs are bound to the submitting tenant and user; returns 404
+    for both unknown and foreign jobs.
+    """
+    jobs = AuditPacketJobs(await get_cache())
+    job = await jobs.wait(job_id, current_user.tenant_id, current_user.id, timeout=wait)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or expired",
+        )
+    return _job_response(job)
+
+
 @router.get("/packet/{packet_id}/download")
 async def download_audit_packet(
     packet_id: str,
@@ -294,15 +390,16 @@ async def download_audit_packet(
     """
     cache = await get_cache()
 
-    # Retrieve with ownership verification
+    # Look up with ownership verification
     # CRITICAL: This checks both tenant_id and user_id match
-    pdf_bytes, check_item_id = await cache.retrieve_audit_packet(
+    # Missing or incomplete data is rejected here, before streaming starts
+    packet = await cache.open_audit_packet(
         packet_id=packet_id,
         tenant_id=current_user.tenant_id,
         user_id=current_user.id,
     )
 
-    if pdf_bytes is None:
+    if packet is None:
         # Note: We intentionally don't distinguish between "not found",
         # "expired", and "unauthorized" to prevent information disclosure
         raise HTTPException(
@@ -310,13 +407,13 @@ async def download_audit_packet(
             detail="Packet not found or expired",
         )
 
-    # Return PDF as streaming response
+    # Stream the stored chunks; the packet is never held in memory whole
     return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+        cache.iter_audit_packet(packet_id, packet["chunks"]),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename=audit_packet_{packet_id}.pdf",
-            "Content-Length": str(len(pdf_bytes)),
+            "Content-Length": str(packet["size"]),
         },
     )
 
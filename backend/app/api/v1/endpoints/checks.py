@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from app.api.deps import DBSession, RequireCheckView, require_permission
 from app.audit.service import AuditService
 from app.core.client_ip import get_client_ip
+from app.db.pagination import CountMode, InvalidCursorError, page_count, resolve_count_mode
 from app.models.audit import AuditAction
 from app.models.check import CheckStatus, RiskLevel
 from app.schemas.check import (
@@ -19,6 +20,7 @@ from app.schemas.check import (
 )
 from app.schemas.common import PaginatedResponse
 from app.services.check import CheckService
+from app.services.image_prefetch import image_prefetcher
 
 router = APIRouter()
 
@@ -39,8 +41,18 @@ async def list_check_items(
     sla_breached: bool | None = None,
     date_from: datetime | None = None,
     date_to: datetime | None = None,
+    cursor: str | None = Query(
+        None, description="Keyset cursor (next_cursor); pass empty to start cursor paging"
+    ),
+    count: CountMode | None = Query(
+        None, description="Total count mode; keyset pages after the first skip it by default"
+    ),
 ):
-    """List check items with filtering and pagination."""
+    """List check items with filtering and pagination.
+
+    Passing `cursor` switches from page/offset paging to keyset paging,
+    whose cost does not grow with depth.
+    """
     check_service = CheckService(db)
 
     search = CheckSearchRequest(
@@ -56,6 +68,9 @@ async def list_check_items(
         date_to=date_to,
     )
 
+    if cursor is not None:
+        return await _keyset_response(check_service, search, current_user, cursor, page_size, count)
+
     items, total = await check_service.search_items(
         search, current_user.id, current_user.tenant_id, page, page_size
     )
@@ -79,6 +94,12 @@ async def get_my_queue(
     current_user: RequireCheckView,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=500),
+    cursor: str | None = Query(
+        None, description="Keyset cursor (next_cursor); pass empty to start cursor paging"
+    ),
+    count: CountMode | None = Query(
+        None, description="Total count mode; keyset pages after the first skip it by default"
+    ),
 ):
     """Get check items assigned to current user."""
     check_service = CheckService(db)
@@ -88,6 +109,9 @@ async def get_my_queue(
         status=[CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL],
     )
 
+    if cursor is not None:
+        return await _keyset_response(check_service, search, current_user, cursor, page_size, count)
+
     items, total = await check_service.search_items(
         search, current_user.id, current_user.tenant_id, page, page_size
     )
@@ -104,6 +128,40 @@ async def get_my_queue(
     )
 
 
+async def _keyset_response(
+    check_service: CheckService,
+    search: CheckSearchRequest,
+    current_user,
+    cursor: str,
+    page_size: int,
+    count: CountMode | None,
+) -> PaginatedResponse[CheckItemListResponse]:
+    """Run a keyset-paginated search and wrap it in the paginated response."""
+    try:
+        result = await check_service.search_items_keyset(
+            search,
+            current_user.id,
+            current_user.tenant_id,
+            cursor=cursor or None,
+            page_size=page_size,
+            count_mode=resolve_count_mode(count, cursor),
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    return PaginatedResponse(
+        items=result.items,
+        total=result.total,
+        page=1,
+        page_size=page_size,
+        total_pages=page_count(result.total, page_size),
+        has_next=result.has_next,
+        has_previous=bool(cursor),
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
+    )
+
+
 @router.get("/{item_id}", response_model=CheckItemResponse)
 async def get_check_item(
     request: Request,
@@ -134,6 +192,8 @@ async def get_check_item(
 
     await db.commit()  # Commit the audit log
 
+    image_prefetcher.schedule(current_user.tenant_id, [item_id])
+
     return item
 
 
@@ -219,6 +279,9 @@ async def assign_check_item(
         },
     )
 
+    # Warm the images before the assignee opens the item
+    image_prefetcher.schedule(current_user.tenant_id, [item_id])
+
     check_service = CheckService(db)
     return await check_service.get_check_item(item_id, current_user.id, current_user.tenant_id)
 
@@ -279,11 +342,14 @@ async def get_adjacent_items(
     current_user: Annotated[object, Depends(require_permission("check_item", "view"))],
     status: list[CheckStatus] | None = Query(None),
     risk_level: list[RiskLevel] | None = Query(None),
+    prefetch: int = Query(0, ge=0, le=20, description="Number of upcoming item IDs to return"),
 ):
     """Get IDs of previous and next items in queue for navigation.
 
     Returns the adjacent item IDs based on the same filters as the queue view,
     allowing reviewers to navigate directly between items without returning to queue.
+    With `prefetch`, next_ids lists the upcoming items so the review UI can
+    warm their images and context while the current item is being worked.
     """
     check_service = CheckService(db)
 
@@ -302,6 +368,14 @@ async def get_adjacent_items(
         tenant_id=current_user.tenant_id,
         status=status,
         risk_level=risk_level,
+        prefetch=prefetch,
+    )
+
+    # Replaces this reviewer's previous look-ahead batch
+    image_prefetcher.schedule(
+        current_user.tenant_id,
+        adjacent["next_ids"] or [adjacent["next_id"]],
+        owner=current_user.id,
     )
 
     return adjacent
@@ -313,10 +387,18 @@ async def sync_presented_items(
     current_user: Annotated[object, Depends(require_permission("check_item", "sync"))],
     amount_min: Decimal = Query(Decimal("5000")),
 ):
-    """Sync new presented items from external system."""
+    """Sync new presented items from external system.
+
+    Returns the number of items created plus throughput and per-stage
+    timings so operators can size the sync window.
+    """
     check_service = CheckService(db)
-    count = await check_service.sync_presented_items(
+    stats = await check_service.ingest_presented_items(
         tenant_id=current_user.tenant_id,
         amount_min=amount_min,
     )
-    return {"message": f"Synced {count} new items", "count": count}
+    return {
+        "message": f"Synced {stats.created} new items",
+        "count": stats.created,
+        "stats": stats.to_dict(),
+    }
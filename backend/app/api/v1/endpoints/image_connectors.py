@@ -416,17 +416,20 @@ async def rotate_key(
     "/generate-keypair",
     response_model=KeyPairResponse,
     summary="Generate Key Pair",
-    description="Generate a new RSA key pair for connector authentication.",
+    description="Generate a new key pair (RSA, P-256 or Ed25519) for connector authentication.",
 )
 async def generate_keypair(
+    algorithm: str = Query(
+        "RS256", pattern=r"^(RS256|ES256|EdDSA)$", description="JWT algorithm of the key"
+    ),
     current_user: User = Depends(require_permission("image_connector", "create")),
 ) -> KeyPairResponse:
     """
-    Generate a new RSA key pair.
+    Generate a new key pair.
 
     Returns both private and public keys. The private key should be
     securely stored and configured on the connector. The public key
     is used when creating or updating the connector in the SaaS.
     """
-    private_key, public_key = generate_key_pair()
+    private_key, public_key = generate_key_pair(algorithm)
     return KeyPairResponse(private_key_pem=private_key, public_key_pem=public_key)
@@ -2,10 +2,11 @@
 
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 
 from app.api.deps import DBSession, require_permission
 from app.audit.service import AuditService
@@ -15,15 +16,19 @@ from app.core.rate_limit import RateLimits, limiter, user_limiter
 from app.core.security import verify_signed_url
 from app.integrations.adapters.factory import get_adapter
 from app.models.audit import AuditAction
-from app.models.check import CheckImage
+from app.models.check import CheckImage, CheckItem
 from app.models.image_token import ImageAccessToken
-from app.models.user import User
+from app.services.image_cache import image_cache
+from app.services.principal_cache import principal_cache
 
 router = APIRouter()
 
 # Default token TTL in seconds (90 seconds for one-time tokens)
 ONE_TIME_TOKEN_TTL_SECONDS = 90
 
+# Tokens per batch mint request (enough for a full queue page of thumbnails)
+MAX_BATCH_TOKENS = 100
+
 
 # ============================================================================
 # Pydantic Schemas for One-Time Token System
@@ -113,11 +118,11 @@ async def get_secure_image(
     # Access control relies solely on token validity + short TTL
     user_id = payload.user_id
 
-    # Get user for audit logging
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Audit identity from the principal cache. The URL was minted moments ago
+    # by an authenticated request, so this is normally served without a DB read
+    user = await principal_cache.get_or_load(db, user_id)
 
-    if not user:
+    if not user or (payload.tenant_id and payload.tenant_id != user.tenant_id):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found for signed URL",
@@ -134,7 +139,7 @@ async def get_secure_image(
     audit_service = AuditService(db)
 
     if is_thumbnail or thumbnail:
-        image_data = await adapter.get_thumbnail(resource_id)
+        image_data = await image_cache.get_thumbnail(adapter, user.tenant_id, resource_id)
         if image_data:
             # Log thumbnail access (less detailed than full image)
             await audit_service.log(
@@ -143,6 +148,7 @@ async def get_secure_image(
                 resource_id=resource_id,
                 user_id=user.id,
                 username=user.username,
+                tenant_id=user.tenant_id,
                 ip_address=get_client_ip(request),
                 description="User viewed check thumbnail via signed URL",
             )
@@ -152,7 +158,7 @@ async def get_secure_image(
                 headers=SECURE_IMAGE_HEADERS,
             )
     else:
-        image = await adapter.get_image(resource_id)
+        image = await image_cache.get_image(adapter, user.tenant_id, resource_id)
         if image:
             # Log full image access
             await audit_service.log(
@@ -161,6 +167,7 @@ async def get_secure_image(
                 resource_id=resource_id,
                 user_id=user.id,
                 username=user.username,
+                tenant_id=user.tenant_id,
                 ip_address=get_client_ip(request),
                 description="User viewed full check image via signed URL",
             )
@@ -195,7 +202,7 @@ async def get_image_direct(
     audit_service = AuditService(db)
 
     if thumbnail:
-        image_data = await adapter.get_thumbnail(image_id)
+        image_data = await image_cache.get_thumbnail(adapter, current_user.tenant_id, image_id)
         if image_data:
             return Response(
                 content=image_data,
@@ -203,7 +210,7 @@ async def get_image_direct(
                 headers=SECURE_IMAGE_HEADERS,
             )
     else:
-        image = await adapter.get_image(image_id)
+        image = await image_cache.get_image(adapter, current_user.tenant_id, image_id)
         if image:
             # Log image view
             await audit_service.log(
@@ -299,18 +306,21 @@ async def mint_image_token(
     tenant_id = current_user.tenant_id
     audit_service = AuditService(db)
 
-    # Verify image exists and belongs to user's tenant
-    image_result = await db.execute(select(CheckImage).where(CheckImage.id == data.image_id))
-    image = image_result.scalar_one_or_none()
+    # Verify image exists and belongs to user's tenant (owner via the check item)
+    owner_result = await db.execute(
+        select(CheckItem.tenant_id)
+        .join(CheckImage, CheckImage.check_item_id == CheckItem.id)
+        .where(CheckImage.id == data.image_id)
+    )
+    owner_tenant_id = owner_result.scalar_one_or_none()
 
-    if not image:
+    if owner_tenant_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image not found",
         )
 
-    # Validate tenant ownership via the check item
-    if image.check_item and image.check_item.tenant_id != tenant_id:
+    if owner_tenant_id != tenant_id:
         # Log the access attempt
         await audit_service.log(
             action=AuditAction.IMAGE_ACCESS_DENIED,
@@ -331,6 +341,7 @@ async def mint_image_token(
     # Create the one-time token
     expires_at = datetime.now(timezone.utc) + timedelta(seconds=ONE_TIME_TOKEN_TTL_SECONDS)
     token = ImageAccessToken(
+        id=str(uuid4()),
         tenant_id=tenant_id,
         image_id=data.image_id,
         expires_at=expires_at,
@@ -370,7 +381,7 @@ async def mint_image_token(
 @router.post("/mint-tokens-batch", response_model=BatchTokenMintResponse)
 @user_limiter.limit(
     RateLimits.IMAGE_MINT_BATCH
-)  # User-based: 10/min, 50/hour (strict - up to 10 images per call)
+)  # User-based: 10/min, 50/hour (strict - up to MAX_BATCH_TOKENS images per call)
 async def mint_image_tokens_batch(
     request: Request,
     data: BatchTokenMintRequest,
@@ -380,50 +391,52 @@ async def mint_image_tokens_batch(
     """
     Mint multiple one-time tokens for efficient image loading.
 
-    Maximum 10 tokens per request to prevent abuse.
-    Useful for loading all images on a check detail view at once.
+    Maximum MAX_BATCH_TOKENS tokens per request to prevent abuse. Images are
+    checked in one query and tokens written in one bulk insert, so a whole
+    queue page of thumbnails costs the same round trips as a single image.
+    Missing images and images from other tenants are skipped.
     """
-    if len(data.image_ids) > 10:
+    if len(data.image_ids) > MAX_BATCH_TOKENS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum 10 tokens per batch request",
+            detail=f"Maximum {MAX_BATCH_TOKENS} tokens per batch request",
         )
 
     tenant_id = current_user.tenant_id
     audit_service = AuditService(db)
     expires_at = datetime.now(timezone.utc) + timedelta(seconds=ONE_TIME_TOKEN_TTL_SECONDS)
-    tokens = []
-
-    for image_id in data.image_ids:
-        # Verify each image exists and belongs to tenant
-        image_result = await db.execute(select(CheckImage).where(CheckImage.id == image_id))
-        image = image_result.scalar_one_or_none()
-
-        if not image:
-            continue  # Skip missing images in batch
-
-        # Validate tenant ownership
-        if image.check_item and image.check_item.tenant_id != tenant_id:
-            continue  # Skip images from other tenants
 
-        # Create token
-        token = ImageAccessToken(
-            tenant_id=tenant_id,
-            image_id=image_id,
+    # CRITICAL: Only images whose check item belongs to the tenant
+    owned_result = await db.execute(
+        select(CheckImage.id)
+        .join(CheckItem, CheckImage.check_item_id == CheckItem.id)
+        .where(CheckImage.id.in_(set(data.image_ids)), CheckItem.tenant_id == tenant_id)
+    )
+    owned = set(owned_result.scalars().all())
+
+    token_rows = [
+        {
+            "id": str(uuid4()),
+            "tenant_id": tenant_id,
+            "image_id": image_id,
+            "expires_at": expires_at,
+            "created_by_user_id": current_user.id,
+            "is_thumbnail": data.is_thumbnail,
+        }
+        for image_id in data.image_ids
+        if image_id in owned
+    ]
+    if token_rows:
+        await db.execute(insert(ImageAccessToken), token_rows)
+
+    tokens = [
+        TokenMintResponse(
+            token_id=row["id"],
+            image_url=f"{settings.API_V1_PREFIX}/images/token/{row['id']}",
             expires_at=expires_at,
-            created_by_user_id=current_user.id,
-            is_thumbnail=data.is_thumbnail,
-        )
-        db.add(token)
-
-        image_url = f"{settings.API_V1_PREFIX}/images/token/{token.id}"
-        tokens.append(
-            TokenMintResponse(
-                token_id=token.id,
-                image_url=image_url,
-                expires_at=expires_at,
-            )
         )
+        for row in token_rows
+    ]
 
     # Log batch token creation
     if tokens:
@@ -468,37 +481,56 @@ async def get_image_by_token(
     existed but is no longer available (vs 404 which means never existed).
     """
     audit_service = AuditService(db)
-
-    # Look up the token
-    token_result = await db.execute(select(ImageAccessToken).where(ImageAccessToken.id == token_id))
-    token = token_result.scalar_one_or_none()
-
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Token not found",
+    now = datetime.now(timezone.utc)
+
+    # CRITICAL: Claim the token BEFORE serving the image. The conditional
+    # UPDATE is atomic, so of two concurrent requests only one gets the row
+    claim_result = await db.execute(
+        update(ImageAccessToken)
+        .where(
+            ImageAccessToken.id == token_id,
+            ImageAccessToken.used_at.is_(None),
+            ImageAccessToken.expires_at > now,
         )
-
-    # Check if token is expired
-    if token.is_expired:
-        await audit_service.log(
-            action=AuditAction.IMAGE_TOKEN_EXPIRED,
-            resource_type="image_access_token",
-            resource_id=token_id,
-            user_id=token.created_by_user_id,
-            username=None,
-            tenant_id=token.tenant_id,
-            ip_address=get_client_ip(request),
-            description="Attempt to use expired image token",
+        .values(
+            used_at=now,
+            used_by_ip=get_client_ip(request),
+            used_by_user_agent=request.headers.get("user-agent", "")[:500],
         )
-        await db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_410_GONE,
-            detail="Token has expired",
+        .returning(ImageAccessToken)
+    )
+    token = claim_result.scalar_one_or_none()
+
+    if token is None:
+        # Not claimable - look it up only to report why
+        token_result = await db.execute(
+            select(ImageAccessToken).where(ImageAccessToken.id == token_id)
         )
+        token = token_result.scalar_one_or_none()
+
+        if not token:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Token not found",
+            )
+
+        if token.is_expired:
+            await audit_service.log(
+                action=AuditAction.IMAGE_TOKEN_EXPIRED,
+                resource_type="image_access_token",
+                resource_id=token_id,
+                user_id=token.created_by_user_id,
+                username=None,
+                tenant_id=token.tenant_id,
+                ip_address=get_client_ip(request),
+                description="Attempt to use expired image token",
+            )
+            await db.commit()
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Token has expired",
+            )
 
-    # Check if token was already used
-    if token.is_used:
         await audit_service.log(
             action=AuditAction.IMAGE_TOKEN_REUSE_ATTEMPTED,
             resource_type="image_access_token",
@@ -519,18 +551,14 @@ async def get_image_by_token(
             detail="Token has already been used",
         )
 
-    # CRITICAL: Mark token as used BEFORE serving the image
-    # This prevents race conditions where the same token is used twice
-    token.used_at = datetime.now(timezone.utc)
-    token.used_by_ip = get_client_ip(request)
-    token.used_by_user_agent = request.headers.get("user-agent", "")[:500]
+    # Commit the claim now, so the token stays used even if serving fails
     await db.commit()
 
     # Now fetch and serve the image
     adapter = get_adapter()
 
     if token.is_thumbnail:
-        image_data = await adapter.get_thumbnail(token.image_id)
+        image_data = await image_cache.get_thumbnail(adapter, token.tenant_id, token.image_id)
         if image_data:
             # Log successful token usage
             await audit_service.log(
@@ -550,7 +578,7 @@ async def get_image_by_token(
                 headers=SECURE_IMAGE_HEADERS,
             )
     else:
-        image = await adapter.get_image(token.image_id)
+        image = await image_cache.get_image(adapter, token.tenant_id, token.image_id)
         if image:
             # Log successful token usage
             await audit_service.log(
@@ -13,6 +13,7 @@ from app.audit.service import AuditService
 from app.core.client_ip import get_client_ip
 from app.models.audit import AuditAction
 from app.models.policy import Policy, PolicyRule, PolicyStatus, PolicyVersion
+from app.policy.cache import policy_program_cache
 from app.schemas.policy import (
     PolicyCreate,
     PolicyListResponse,
@@ -400,6 +401,9 @@ async def activate_policy(
     # Commit the changes
     await db.commit()
 
+    # Evaluation must pick up the new version
+    await policy_program_cache.invalidate_tenant(current_user.tenant_id, policy_id)
+
     return {
         "message": f"Policy activated (version {target_version.version_number})",
         "version_id": target_version.id,
@@ -472,6 +476,10 @@ async def update_policy(
 
     await db.commit()
 
+    # Status and applies_to changes affect which version is active
+    if changes:
+        await policy_program_cache.invalidate_tenant(current_user.tenant_id, policy_id)
+
     # Build response
     versions = []
     current_version = None
@@ -601,6 +609,8 @@ async def delete_policy(
 
     await db.commit()
 
+    await policy_program_cache.invalidate_tenant(current_user.tenant_id, policy_id)
+
     return {
         "message": f"Policy '{policy_name}' deleted successfully",
         "deleted_versions": version_count,
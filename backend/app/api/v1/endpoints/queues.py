@@ -3,7 +3,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import DBSession, require_permission
@@ -11,7 +11,7 @@ from app.audit.service import AuditService
 from app.core.client_ip import get_client_ip
 from app.core.rate_limit import RateLimits, user_limiter
 from app.models.audit import AuditAction
-from app.models.check import CheckItem, CheckStatus
+from app.models.check import CheckStatus
 from app.models.queue import Queue, QueueAssignment
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.schemas.queue import (
@@ -254,67 +254,38 @@ async def get_queue_stats(
             detail="Queue not found",
         )
 
-    # Get item counts by status
-    # CRITICAL: Filter by tenant_id for multi-tenant security
-    status_counts = {}
-    for status_val in CheckStatus:
-        count_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.queue_id == queue_id,
-                CheckItem.tenant_id == current_user.tenant_id,
-                CheckItem.status == status_val,
-            )
-        )
-        count = count_result.scalar() or 0
-        if count > 0:
-            status_counts[status_val.value] = count
-
-    # Get item counts by risk level
+    # Counts by status and risk level from the operational rollups
     # CRITICAL: Filter by tenant_id for multi-tenant security
     from app.models.check import RiskLevel
+    from app.services.rollup_service import RollupService
 
-    risk_counts = {}
-    for risk_val in RiskLevel:
-        count_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.queue_id == queue_id,
-                CheckItem.tenant_id == current_user.tenant_id,
-                CheckItem.risk_level == risk_val,
-                CheckItem.status.in_(
-                    [CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL]
-                ),
-            )
-        )
-        count = count_result.scalar() or 0
-        if count > 0:
-            risk_counts[risk_val.value] = count
-
-    # Get SLA breached count
-    # CRITICAL: Filter by tenant_id for multi-tenant security
-    sla_result = await db.execute(
-        select(func.count(CheckItem.id)).where(
-            CheckItem.queue_id == queue_id,
-            CheckItem.tenant_id == current_user.tenant_id,
-            CheckItem.sla_breached == True,
-            CheckItem.status.in_(
-                [CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL]
-            ),
-        )
+    active_statuses = (
+        CheckStatus.NEW.value,
+        CheckStatus.IN_REVIEW.value,
+        CheckStatus.PENDING_APPROVAL.value,
     )
-    sla_breached = sla_result.scalar() or 0
-
-    # Get total active items
-    # CRITICAL: Filter by tenant_id for multi-tenant security
-    total_result = await db.execute(
-        select(func.count(CheckItem.id)).where(
-            CheckItem.queue_id == queue_id,
-            CheckItem.tenant_id == current_user.tenant_id,
-            CheckItem.status.in_(
-                [CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL]
-            ),
-        )
+    state_counts = await RollupService(db).item_state_counts(
+        current_user.tenant_id, queue_id=queue_id
     )
-    total = total_result.scalar() or 0
+
+    status_counts: dict[str, int] = {}
+    risk_counts: dict[str, int] = {}
+    sla_breached = 0
+    total = 0
+
+    for status_val, risk_val, breached, count in state_counts:
+        status_counts[status_val] = status_counts.get(status_val, 0) + count
+        if status_val in active_statuses:
+            risk_counts[risk_val] = risk_counts.get(risk_val, 0) + count
+            if breached:
+                sla_breached += count
+            total += count
+
+    # Keep enum ordering in the response
+    status_counts = {
+        s.value: status_counts[s.value] for s in CheckStatus if status_counts.get(s.value)
+    }
+    risk_counts = {r.value: risk_counts[r.value] for r in RiskLevel if risk_counts.get(r.value)}
 
     return QueueStatsResponse(
         queue_id=queue_id,
@@ -1,6 +1,7 @@
 """Reporting endpoints."""
 
-from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, Response
@@ -10,13 +11,31 @@ from app.api.deps import DBSession, require_permission
 from app.audit.service import AuditService
 from app.core.client_ip import get_client_ip
 from app.core.rate_limit import RateLimits, user_limiter
+from app.db.session import AsyncSessionLocal
 from app.models.audit import AuditAction, AuditLog
 from app.models.check import CheckItem, CheckStatus, RiskLevel
 from app.models.decision import Decision, DecisionAction
+from app.services.csv_export import EXPORT_BATCH_SIZE, csv_response
+from app.services.rollup_service import METRIC_DECISION, METRIC_PROCESSED, RollupService
 
 router = APIRouter()
 
 
+# Statuses counted as awaiting review
+ACTIVE_STATUSES = (
+    CheckStatus.NEW.value,
+    CheckStatus.IN_REVIEW.value,
+    CheckStatus.PENDING_APPROVAL.value,
+)
+PENDING_STATUSES = ACTIVE_STATUSES + (CheckStatus.ESCALATED.value,)
+FINAL_ACTIONS = (DecisionAction.APPROVE, DecisionAction.RETURN, DecisionAction.REJECT)
+
+
+def _bucket_date(bucket: datetime | date) -> date:
+    """Normalize a date_trunc bucket to a date."""
+    return bucket.date() if isinstance(bucket, datetime) else bucket
+
+
 @router.get("/dashboard")
 @user_limiter.limit(RateLimits.SEARCH)  # User-based: 60/min, 500/hour
 async def get_dashboard_stats(
@@ -24,79 +43,35 @@ async def get_dashboard_stats(
     db: DBSession,
     current_user: Annotated[object, Depends(require_permission("report", "view"))],
 ):
-    """Get dashboard statistics."""
+    """Get dashboard statistics.
+
+    Item and activity counts are read from the operational rollups
+    (see app.services.rollup_service), so the cost does not grow with the
+    number of check items.
+    """
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
     # CRITICAL: All queries filter by tenant_id for multi-tenant security
     tenant_id = current_user.tenant_id
+    rollups = RollupService(db)
 
-    # Total items in review
-    pending_result = await db.execute(
-        select(func.count(CheckItem.id)).where(
-            CheckItem.tenant_id == tenant_id,
-            CheckItem.status.in_(
-                [
-                    CheckStatus.NEW,
-                    CheckStatus.IN_REVIEW,
-                    CheckStatus.PENDING_APPROVAL,
-                    CheckStatus.ESCALATED,
-                ]
-            ),
-        )
-    )
-    pending_count = pending_result.scalar() or 0
-
-    # Items processed today
-    processed_result = await db.execute(
-        select(func.count(CheckItem.id)).where(
-            CheckItem.tenant_id == tenant_id,
-            CheckItem.status.in_(
-                [CheckStatus.APPROVED, CheckStatus.RETURNED, CheckStatus.REJECTED]
-            ),
-            CheckItem.updated_at >= today_start,
-        )
-    )
-    processed_today = processed_result.scalar() or 0
-
-    # SLA breached items
-    sla_result = await db.execute(
-        select(func.count(CheckItem.id)).where(
-            CheckItem.tenant_id == tenant_id,
-            CheckItem.sla_breached == True,
-            CheckItem.status.in_(
-                [CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL]
-            ),
-        )
-    )
-    sla_breached = sla_result.scalar() or 0
-
-    # Items by risk level
-    risk_counts = {}
-    for risk in RiskLevel:
-        count_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.risk_level == risk,
-                CheckItem.status.in_(
-                    [CheckStatus.NEW, CheckStatus.IN_REVIEW, CheckStatus.PENDING_APPROVAL]
-                ),
-            )
-        )
-        risk_counts[risk.value] = count_result.scalar() or 0
-
-    # Items by status
-    status_counts = {}
-    for status_val in CheckStatus:
-        count_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.status == status_val,
-            )
-        )
-        count = count_result.scalar() or 0
-        if count > 0:
-            status_counts[status_val.value] = count
+    pending_count = 0
+    sla_breached = 0
+    risk_counts = {risk.value: 0 for risk in RiskLevel}
+    status_counts: dict[str, int] = {}
+
+    for status_val, risk, breached, count in await rollups.item_state_counts(tenant_id):
+        status_counts[status_val] = status_counts.get(status_val, 0) + count
+        if status_val in PENDING_STATUSES:
+            pending_count += count
+        if status_val in ACTIVE_STATUSES:
+            if breached:
+                sla_breached += count
+            risk_counts[risk] = risk_counts.get(risk, 0) + count
+
+    processed = await rollups.activity_totals(tenant_id, METRIC_PROCESSED, today_start)
+    processed_today = sum(count for count, _ in processed.values())
 
     # Dual control pending
     dual_control_result = await db.execute(
@@ -116,7 +91,7 @@ async def get_dashboard_stats(
             "dual_control_pending": dual_control_pending,
         },
         "items_by_risk": risk_counts,
-        "items_by_status": status_counts,
+        "items_by_status": {k: v for k, v in status_counts.items() if v > 0},
         "timestamp": now.isoformat(),
     }
 
@@ -127,45 +102,34 @@ async def get_throughput_report(
     current_user: Annotated[object, Depends(require_permission("report", "view"))],
     days: int = Query(7, ge=1, le=90),
 ):
-    """Get throughput report for the last N days."""
+    """Get throughput report for the last N days.
+
+    Daily counts (UTC days) are summed from the hourly rollups: one query
+    for processed items and one for received items.
+    """
     now = datetime.now(timezone.utc)
     start_date = now - timedelta(days=days)
+    period_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    period_end = period_start + timedelta(days=days)
 
     # CRITICAL: Filter by tenant_id for multi-tenant security
     tenant_id = current_user.tenant_id
+    rollups = RollupService(db)
 
-    # Get daily processing counts
-    daily_data = []
-    for i in range(days):
-        day_start = (start_date + timedelta(days=i)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        day_end = day_start + timedelta(days=1)
-
-        processed_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.status.in_(
-                    [CheckStatus.APPROVED, CheckStatus.RETURNED, CheckStatus.REJECTED]
-                ),
-                CheckItem.updated_at >= day_start,
-                CheckItem.updated_at < day_end,
-            )
-        )
+    processed = await rollups.activity_by_day(tenant_id, METRIC_PROCESSED, period_start, period_end)
+    processed_by_day = {_bucket_date(day): count for day, count in processed.items()}
 
-        received_result = await db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.presented_date >= day_start,
-                CheckItem.presented_date < day_end,
-            )
-        )
+    received = await rollups.received_by_day(tenant_id, period_start, period_end)
+    received_by_day = {_bucket_date(day): count for day, count in received.items()}
 
+    daily_data = []
+    for i in range(days):
+        day = (period_start + timedelta(days=i)).date()
         daily_data.append(
             {
-                "date": day_start.date().isoformat(),
-                "processed": processed_result.scalar() or 0,
-                "received": received_result.scalar() or 0,
+                "date": day.isoformat(),
+                "processed": processed_by_day.get(day, 0),
+                "received": received_by_day.get(day, 0),
             }
         )
 
@@ -188,40 +152,13 @@ async def get_decision_report(
     # CRITICAL: Filter by tenant_id for multi-tenant security
     tenant_id = current_user.tenant_id
 
-    # Decision action breakdown
-    action_counts = {}
-    for action in DecisionAction:
-        count_result = await db.execute(
-            select(func.count(Decision.id)).where(
-                Decision.tenant_id == tenant_id,
-                Decision.action == action,
-                Decision.created_at >= start_date,
-            )
-        )
-        count = count_result.scalar() or 0
-        if count > 0:
-            action_counts[action.value] = count
-
-    # Approval rate
-    total_final = await db.execute(
-        select(func.count(Decision.id)).where(
-            Decision.tenant_id == tenant_id,
-            Decision.action.in_(
-                [DecisionAction.APPROVE, DecisionAction.RETURN, DecisionAction.REJECT]
-            ),
-            Decision.created_at >= start_date,
-        )
-    )
-    total_final_count = total_final.scalar() or 0
+    # Decision action breakdown (approval rate is derived from the same counts).
+    # Rollups are hourly, so the window starts at the top of start_date's hour.
+    totals = await RollupService(db).activity_totals(tenant_id, METRIC_DECISION, start_date)
+    action_counts = {action: count for action, (count, _) in totals.items() if count > 0}
 
-    approved = await db.execute(
-        select(func.count(Decision.id)).where(
-            Decision.tenant_id == tenant_id,
-            Decision.action == DecisionAction.APPROVE,
-            Decision.created_at >= start_date,
-        )
-    )
-    approved_count = approved.scalar() or 0
+    total_final_count = sum(action_counts.get(action.value, 0) for action in FINAL_ACTIONS)
+    approved_count = action_counts.get(DecisionAction.APPROVE.value, 0)
 
     approval_rate = (approved_count / total_final_count * 100) if total_final_count > 0 else 0
 
@@ -239,7 +176,11 @@ async def get_reviewer_performance(
     current_user: Annotated[object, Depends(require_permission("report", "view"))],
     days: int = Query(30, ge=1, le=365),
 ):
-    """Get reviewer performance metrics."""
+    """Get reviewer performance metrics.
+
+    A single query joins decisions to users and groups by reviewer and
+    action, so the cost does not grow with the number of reviewers.
+    """
     from app.models.user import User
 
     now = datetime.now(timezone.utc)
@@ -248,53 +189,39 @@ async def get_reviewer_performance(
     # CRITICAL: Filter by tenant_id for multi-tenant security
     tenant_id = current_user.tenant_id
 
-    # Get all users who made decisions in the period (within this tenant)
-    users_result = await db.execute(
-        select(Decision.user_id, func.count(Decision.id).label("count"))
+    # Users are also tenant-scoped; the join drops decisions by unknown users
+    result = await db.execute(
+        select(
+            Decision.user_id,
+            User.username,
+            User.full_name,
+            Decision.action,
+            func.count(Decision.id),
+        )
+        .join(User, and_(User.id == Decision.user_id, User.tenant_id == tenant_id))
         .where(
             Decision.tenant_id == tenant_id,
             Decision.created_at >= start_date,
         )
-        .group_by(Decision.user_id)
-        .order_by(func.count(Decision.id).desc())
+        .group_by(Decision.user_id, User.username, User.full_name, Decision.action)
     )
-    user_stats = users_result.all()
-
-    performance = []
-    for user_id, count in user_stats:
-        # Get user info (users are also tenant-scoped)
-        user_result = await db.execute(
-            select(User.username, User.full_name).where(
-                User.id == user_id,
-                User.tenant_id == tenant_id,
-            )
+
+    reviewers: dict[str, dict] = {}
+    for user_id, username, full_name, action, count in result.all():
+        reviewer = reviewers.setdefault(
+            user_id,
+            {
+                "user_id": user_id,
+                "username": username,
+                "full_name": full_name,
+                "total_decisions": 0,
+                "by_action": {},
+            },
         )
-        user_info = user_result.one_or_none()
-
-        if user_info:
-            username, full_name = user_info
-
-            # Get breakdown by action
-            actions_result = await db.execute(
-                select(Decision.action, func.count(Decision.id))
-                .where(
-                    Decision.tenant_id == tenant_id,
-                    Decision.user_id == user_id,
-                    Decision.created_at >= start_date,
-                )
-                .group_by(Decision.action)
-            )
-            actions = {a.value: c for a, c in actions_result.all()}
-
-            performance.append(
-                {
-                    "user_id": user_id,
-                    "username": username,
-                    "full_name": full_name,
-                    "total_decisions": count,
-                    "by_action": actions,
-                }
-            )
+        reviewer["total_decisions"] += count
+        reviewer["by_action"][action.value] = count
+
+    performance = sorted(reviewers.values(), key=lambda r: r["total_decisions"], reverse=True)
 
     return {
         "period": {"start": start_date.isoformat(), "end": now.isoformat()},
@@ -302,6 +229,35 @@ async def get_reviewer_performance(
     }
 
 
+DECISIONS_CSV_HEADER = (
+    "Decision ID",
+    "Check Item ID",
+    "Account",
+    "Amount",
+    "Action",
+    "Reviewer",
+    "Decision Date",
+    "Notes",
+)
+
+
+async def _decision_csv_rows(query) -> AsyncIterator[list]:
+    """Stream decision export rows through a server-side cursor."""
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for row in result:
+            yield [
+                row.id,
+                row.check_item_id,
+                row.account_number_masked,
+                str(row.amount),
+                row.action.value,
+                row.username,
+                row.created_at.isoformat(),
+                row.notes or "",
+            ]
+
+
 @router.get("/export/decisions")
 @user_limiter.limit(RateLimits.EXPORT_CSV)  # User-based: 5/min, 20/hour (expensive)
 async def export_decisions_csv(
@@ -310,14 +266,20 @@ async def export_decisions_csv(
     current_user: Annotated[object, Depends(require_permission("report", "export"))],
     date_from: datetime | None = None,
     date_to: datetime | None = None,
+    compress: bool = False,
 ):
-    """Export decisions to CSV."""
+    """Export decisions to CSV.
+
+    The file is streamed as rows are read; set compress=true for a .csv.gz.
+    """
     from app.models.user import User
 
     # CRITICAL: Filter by tenant_id for multi-tenant security
     tenant_id = current_user.tenant_id
 
-    # Audit log the export - critical for data governance
+    # Audit log the export - critical for data governance.
+    # Committed before streaming starts so it is recorded even if the
+    # client disconnects part way through the download.
     audit_service = AuditService(db)
     await audit_service.log_report_access(
         report_type="decisions_csv",
@@ -327,10 +289,12 @@ async def export_decisions_csv(
         parameters={
             "date_from": date_from.isoformat() if date_from else None,
             "date_to": date_to.isoformat() if date_to else None,
+            "compress": compress,
         },
         exported=True,
         ip_address=get_client_ip(request),
     )
+    await db.commit()
 
     # CRITICAL: Filter by tenant_id for multi-tenant security
     query = (
@@ -356,48 +320,11 @@ async def export_decisions_csv(
 
     query = query.order_by(Decision.created_at.desc())
 
-    result = await db.execute(query)
-    rows = result.all()
-
-    # Build CSV
-    import csv
-    import io
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "Decision ID",
-            "Check Item ID",
-            "Account",
-            "Amount",
-            "Action",
-            "Reviewer",
-            "Decision Date",
-            "Notes",
-        ]
-    )
-
-    for row in rows:
-        writer.writerow(
-            [
-                row.id,
-                row.check_item_id,
-                row.account_number_masked,
-                str(row.amount),
-                row.action.value,
-                row.username,
-                row.created_at.isoformat(),
-                row.notes or "",
-            ]
-        )
-
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=decisions_{datetime.now().strftime('%Y%m%d')}.csv"
-        },
+    return csv_response(
+        f"decisions_{datetime.now().strftime('%Y%m%d')}",
+        DECISIONS_CSV_HEADER,
+        _decision_csv_rows(query),
+        compress=compress,
     )
 
 
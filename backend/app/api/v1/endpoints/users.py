@@ -23,6 +23,7 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
 )
+from app.services.principal_cache import principal_cache
 
 router = APIRouter()
 
@@ -288,6 +289,13 @@ async def update_user(
             metadata=changes,
         )
 
+    # Explicit commit for write operation
+    await db.commit()
+
+    # Drop the cached principal so deactivation and role changes apply immediately
+    if changes:
+        await principal_cache.invalidate_user(user.id, user.tenant_id)
+
     return UserResponse(
         id=user.id,
         email=user.email,
@@ -388,6 +396,9 @@ async def create_role(
     # Explicit commit for write operation
     await db.commit()
 
+    # Role grants are flattened into cached principals - rebuild them for the tenant
+    await principal_cache.invalidate_tenant(current_user.tenant_id)
+
     return RoleResponse(
         id=role.id,
         name=role.name,
@@ -4,10 +4,21 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
+from app.db.pagination import (
+    CountMode,
+    KeysetPage,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+)
 from app.models.audit import AuditAction, AuditLog, ItemView
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Audit search sort key (descending); id breaks ties between equal timestamps
+AUDIT_SEARCH_ORDER = (AuditLog.timestamp, AuditLog.id)
+
 
 class AuditService:
     """
@@ -272,11 +283,74 @@ class AuditService:
         page_size: int = 50,
     ) -> tuple[list[AuditLog], int]:
         """Search audit logs with filters."""
-        from sqlalchemy import func
+        query = self._audit_search_query(
+            tenant_id, action, resource_type, resource_id, user_id, date_from, date_to
+        )
+
+        # Get total count
+        total, _ = await count_rows(self.db, query)
 
-        query = select(AuditLog)
-        count_query = select(func.count(AuditLog.id))
+        # Apply pagination
+        query = query.order_by(*(column.desc() for column in AUDIT_SEARCH_ORDER))
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+        result = await self.db.execute(query)
+        logs = list(result.scalars().all())
+
+        return logs, total
+
+    async def search_audit_logs_keyset(
+        self,
+        tenant_id: str,  # Multi-tenant required
+        action: AuditAction | None = None,
+        resource_type: str | None = None,
+        resource_id: str | None = None,
+        user_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int = 50,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> KeysetPage[AuditLog]:
+        """Search audit logs, resuming after a (timestamp, id) cursor.
 
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        query = self._audit_search_query(
+            tenant_id, action, resource_type, resource_id, user_id, date_from, date_to
+        )
+        total, total_is_estimate = await count_rows(self.db, query, count_mode)
+
+        if cursor:
+            values = decode_cursor(cursor, datetime.fromisoformat, str)
+            query = query.where(keyset_after(AUDIT_SEARCH_ORDER, values))
+        query = query.order_by(*(column.desc() for column in AUDIT_SEARCH_ORDER))
+
+        result = await self.db.execute(query.limit(page_size + 1))
+        logs = list(result.scalars().all())
+        has_next = len(logs) > page_size
+        logs = logs[:page_size]
+
+        return KeysetPage(
+            items=logs,
+            total=total,
+            total_is_estimate=total_is_estimate,
+            has_next=has_next,
+            next_cursor=encode_cursor(logs[-1].timestamp, logs[-1].id) if has_next else None,
+        )
+
+    def _audit_search_query(
+        self,
+        tenant_id: str,
+        action: AuditAction | None,
+        resource_type: str | None,
+        resource_id: str | None,
+        user_id: str | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ):
+        """Build the filtered (unordered) audit log search query."""
         # CRITICAL: Always filter by tenant_id for multi-tenant security
         conditions = [AuditLog.tenant_id == tenant_id]
         if action:
@@ -292,23 +366,7 @@ class AuditService:
         if date_to:
             conditions.append(AuditLog.timestamp <= date_to)
 
-        from sqlalchemy import and_
-
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
-
-        # Get total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.order_by(AuditLog.timestamp.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.db.execute(query)
-        logs = list(result.scalars().all())
-
-        return logs, total
+        return select(AuditLog).where(and_(*conditions))
 
     # =========================================================================
     # Convenience methods for consistent audit logging
@@ -79,8 +79,30 @@ class Settings(BaseSettings):
     # Session
     SESSION_TIMEOUT_MINUTES: int = 30
 
+    # Principal cache (authenticated user + flattened permissions)
+    # The in-process tier is not invalidated across workers, so its TTL bounds
+    # how long another worker may keep honoring a revoked role or deactivation
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = 30
+
+    # Compiled policy programs (per tenant + account type, keyed by version)
+    # Activation invalidates Redis; other workers pick it up within the local TTL
+    POLICY_CACHE_MAX_PROGRAMS: int = 256
+    POLICY_CACHE_LOCAL_TTL_SECONDS: int = 30
+
     # Image handling
-    IMAGE_CACHE_TTL_SECONDS: int = 300
+    # Image bytes cached per tenant in front of the integration adapter: an
+    # in-process tier bounded by IMAGE_CACHE_MAX_MB per worker, and (when
+    # IMAGE_CACHE_REDIS) an encrypted Redis tier. Entries live as long as a
+    # signed URL; set IMAGE_CACHE_MAX_MB to 0 to disable the in-process tier
+    IMAGE_CACHE_TTL_SECONDS: int = 90
+    IMAGE_CACHE_MAX_MB: int = 64
+    IMAGE_CACHE_REDIS: bool = True
+    # Background warm-up of the image cache when items are opened, assigned or
+    # reported as next in the queue (fetches per worker / per tenant per minute)
+    IMAGE_PREFETCH_ENABLED: bool = True
+    IMAGE_PREFETCH_CONCURRENCY: int = 4
+    IMAGE_PREFETCH_TENANT_PER_MINUTE: int = 600
     # Short TTL for signed URLs - treated as bearer tokens, not user-bound
     # Frontend must refresh URLs before expiry for long review sessions
     IMAGE_SIGNED_URL_TTL_SECONDS: int = 90  # 90 seconds - security/usability balance
@@ -94,10 +116,41 @@ class Settings(BaseSettings):
     # Audit settings
     AUDIT_LOG_RETENTION_YEARS: int = 7
 
+    # Background jobs (app.scheduler): connector imports, rollup repair and
+    # token GC. Off by default: every API worker that enables it runs every
+    # job. Production runs them in one dedicated process instead
+    # (python -m app.scheduler.item_context_scheduler, see
+    # docker/docker-compose.pilot.yml); enable it only for a single-process API
+    SCHEDULER_ENABLED: bool = False
+
+    # Operational rollup repair (app.services.rollup_service), reconciling the
+    # incrementally maintained counters over a trailing window
+    ROLLUP_REPAIR_INTERVAL_MINUTES: int = 60
+    ROLLUP_REPAIR_WINDOW_HOURS: int = 48
+
+    # Expired image token / session garbage collection (app.services.token_gc)
+    # Tokens are kept a grace period after expiry or use so reuse attempts are
+    # still answered with 410; the session grace defaults to the 90-day session
+    # retention, lower it if expired session records are not needed for audit
+    TOKEN_GC_INTERVAL_MINUTES: int = 15
+    TOKEN_GC_BATCH_SIZE: int = 5000
+    TOKEN_GC_BATCH_PAUSE_SECONDS: float = 0.05
+    TOKEN_GC_IMAGE_TOKEN_GRACE_HOURS: int = 24
+    TOKEN_GC_SESSION_GRACE_DAYS: int = 90
+    TOKEN_GC_PARTITIONED: bool = False  # Drop whole <table>_pYYYYMMDD partitions first
+
     # Integration settings
     INTEGRATION_TIMEOUT_SECONDS: int = 30
     INTEGRATION_RETRY_ATTEMPTS: int = 3
 
+    # Presented item sync (bulk ingestion)
+    SYNC_PAGE_SIZE: int = 1000  # Items requested from the adapter per page
+    SYNC_INSERT_CHUNK_SIZE: int = 500  # Rows per bulk INSERT
+    SYNC_CONTEXT_CONCURRENCY: int = 10  # Concurrent account context lookups
+
+    # PDF rendering
+    PDF_RENDER_WORKERS: int = 2  # Worker processes for ReportLab layout (0 = thread, no pool)
+
     # AI settings
     AI_ENABLED: bool = False
     AI_CONFIDENCE_THRESHOLD: float = 0.7
@@ -218,7 +271,8 @@ class Settings(BaseSettings):
     HSTS_PRELOAD: bool = False  # Set True to enable HSTS preload (requires commitment)
 
     # Image Connector (Connector A) - JWT token signing
-    # RSA private key for signing JWT tokens for image connector requests
+    # Private key for signing JWT tokens for image connector requests; its
+    # type picks the algorithm (RSA: RS256, P-256: ES256, Ed25519: EdDSA)
     CONNECTOR_JWT_PRIVATE_KEY: str = ""  # Set in production
     CONNECTOR_JWT_ISSUER: str = "check-review-saas"
     CONNECTOR_JWT_DEFAULT_EXPIRY_SECONDS: int = 120
@@ -247,7 +301,7 @@ def _validate_production_secrets(s: Settings) -> None:
     - SECRET_KEY: JWT signing key (min 32 chars)
     - CSRF_SECRET_KEY: CSRF token signing (min 32 chars)
     - NETWORK_PEPPER: Fraud indicator hashing (min 32 chars)
-    - CONNECTOR_JWT_PRIVATE_KEY: Connector A RS256 signing key (min 100 chars for RSA)
+    - CONNECTOR_JWT_PRIVATE_KEY: Connector A JWT signing key (min 100 chars of PEM)
 
     Validates:
     - Minimum length for adequate entropy
@@ -264,7 +318,7 @@ def _validate_production_secrets(s: Settings) -> None:
         "SECRET_KEY": 32,
         "CSRF_SECRET_KEY": 32,
         "NETWORK_PEPPER": 32,
-        "CONNECTOR_JWT_PRIVATE_KEY": 100,  # RSA private key minimum length
+        "CONNECTOR_JWT_PRIVATE_KEY": 100,  # PEM private key minimum length
         "IMAGE_SIGNING_KEY": 32,  # Dedicated key for image URL signing
     }
 
@@ -1,6 +1,7 @@
 """Field-level encryption for sensitive data at rest.
 
-Provides AES-256-GCM encryption for sensitive fields like MFA secrets.
+Provides AES-256-GCM encryption for sensitive fields like MFA secrets,
+and for binary values held outside the database (cached check images).
 Each encrypted value includes a unique nonce and authentication tag.
 
 Security considerations:
@@ -17,6 +18,10 @@ Usage:
 
     # Decrypt when reading
     plaintext = decrypt_field(encrypted)
+
+    # Binary values, bound to a context such as a cache key
+    blob = encrypt_bytes(image_bytes, associated_data=b"tenant-1:image-1")
+    image_bytes = decrypt_bytes(blob, associated_data=b"tenant-1:image-1")
 """
 
 import base64
@@ -52,6 +57,21 @@ def _get_encryption_key() -> bytes:
     return hkdf.derive(settings.SECRET_KEY.encode("utf-8"))
 
 
+@lru_cache(maxsize=1)
+def _get_bytes_encryption_key() -> bytes:
+    """Derive the key for encrypt_bytes, separate from the field key."""
+    from app.core.config import settings
+
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"check-review-field-encryption",
+        info=b"binary-cache-encryption",
+    )
+
+    return hkdf.derive(settings.SECRET_KEY.encode("utf-8"))
+
+
 def encrypt_field(plaintext: str) -> str:
     """Encrypt a string value for storage.
 
@@ -123,6 +143,40 @@ def decrypt_field(encrypted: str) -> str:
         raise ValueError(f"Decryption failed: {type(e).__name__}")
 
 
+def encrypt_bytes(plaintext: bytes, associated_data: bytes | None = None) -> bytes:
+    """Encrypt a binary value, e.g. image bytes written to a shared cache.
+
+    Args:
+        plaintext: The bytes to encrypt
+        associated_data: Authenticated but unencrypted context (such as the
+            cache key); decryption fails unless the same value is given
+
+    Returns:
+        Version prefix + nonce + ciphertext, as raw bytes
+    """
+    aesgcm = AESGCM(_get_bytes_encryption_key())
+    nonce = os.urandom(NONCE_SIZE)
+    return ENCRYPTION_VERSION + nonce + aesgcm.encrypt(nonce, plaintext, associated_data)
+
+
+def decrypt_bytes(encrypted: bytes, associated_data: bytes | None = None) -> bytes:
+    """Decrypt a value from encrypt_bytes().
+
+    Raises:
+        ValueError: If decryption fails (wrong key or context, tampered data)
+    """
+    if not encrypted.startswith(ENCRYPTION_VERSION):
+        raise ValueError("Unknown encryption version")
+
+    encrypted = encrypted[len(ENCRYPTION_VERSION) :]
+    try:
+        aesgcm = AESGCM(_get_bytes_encryption_key())
+        return aesgcm.decrypt(encrypted[:NONCE_SIZE], encrypted[NONCE_SIZE:], associated_data)
+    except Exception as e:
+        # Don't leak specific crypto errors
+        raise ValueError(f"Decryption failed: {type(e).__name__}")
+
+
 def is_encrypted(value: str) -> bool:
     """Check if a value appears to be encrypted.
 
@@ -72,6 +72,56 @@ queue_depth = Gauge("queue_depth", "Number of items in each queue", ["queue_name
 
 decisions_total = Counter("decisions_total", "Total decisions made", ["decision_type", "action"])
 
+# Presented item sync metrics
+sync_stage_duration_seconds = Histogram(
+    "sync_stage_duration_seconds",
+    "Time spent per presented item sync run in each pipeline stage",
+    ["stage"],  # fetch, dedupe, context, insert
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0],
+)
+
+# PDF rendering metrics
+pdf_render_queue_depth = Gauge(
+    "pdf_render_queue_depth", "PDF documents waiting for or being rendered by the worker pool"
+)
+
+pdf_render_duration_seconds = Histogram(
+    "pdf_render_duration_seconds",
+    "Time to lay out and render a PDF document (excluding data loading)",
+    ["kind"],  # audit_packet, daily_activity, daily_summary, executive_overview
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+
+audit_packet_jobs_total = Counter(
+    "audit_packet_jobs_total",
+    "Audit packet job submissions",
+    ["result"],  # rendered, reused, failed
+)
+
+image_prefetch_total = Counter(
+    "image_prefetch_total",
+    "Background image cache warm-up fetches",
+    ["result"],  # fetched, rate_limited, failed
+)
+
+gc_rows_deleted_total = Counter(
+    "gc_rows_deleted_total",
+    "Rows removed by the expired token/session GC job",
+    ["table"],
+)
+
+gc_batches_total = Counter(
+    "gc_batches_total", "Chunked DELETE batches run by the GC job", ["table"]
+)
+
+gc_partitions_dropped_total = Counter(
+    "gc_partitions_dropped_total", "Daily partitions dropped by the GC job", ["table"]
+)
+
+gc_last_run_timestamp = Gauge(
+    "gc_last_run_timestamp", "Unix time the GC job last finished a table", ["table"]
+)
+
 # Database metrics
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
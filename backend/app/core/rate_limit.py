@@ -110,7 +110,7 @@ class RateLimits:
     # Image endpoints (bandwidth intensive)
     IMAGE_VIEW = "120/minute;1000/hour"  # Viewing images
     IMAGE_MINT_TOKEN = "60/minute;500/hour"  # Minting one-time tokens
-    IMAGE_MINT_BATCH = "10/minute;50/hour"  # Batch token minting (up to 10 per call)
+    IMAGE_MINT_BATCH = "10/minute;50/hour"  # Batch token minting (up to 100 per call)
 
     # Export/report endpoints (CPU/memory intensive)
     EXPORT_CSV = "5/minute;20/hour"
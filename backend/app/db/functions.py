@@ -0,0 +1,46 @@
+"""SQL function constructs shared by reporting queries."""
+
+from sqlalchemy import DateTime, literal_column
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# strftime formats used to emulate date_trunc on SQLite (tests only)
+_SQLITE_TRUNC_FORMATS = {
+    "hour": "%Y-%m-%d %H:00:00",
+    "day": "%Y-%m-%d 00:00:00",
+}
+
+
+class utc_date_trunc(FunctionElement):
+    """Truncate a timestamptz to the start of its UTC hour or day.
+
+    Renders as ``date_trunc(precision, timezone('UTC', column))`` on
+    PostgreSQL, so buckets do not depend on the session time zone. The
+    result is a naive UTC datetime.
+
+    Usage:
+        select(utc_date_trunc("day", CheckItem.presented_date), func.count())
+    """
+
+    type = DateTime()
+    inherit_cache = True
+    name = "utc_date_trunc"
+
+    def __init__(self, precision: str, column):
+        if precision not in _SQLITE_TRUNC_FORMATS:
+            raise ValueError(f"Unsupported precision: {precision}")
+        self.precision = precision
+        # Precision is passed as a clause so it is part of the statement cache key
+        super().__init__(literal_column(f"'{precision}'"), column)
+
+
+@compiles(utc_date_trunc, "postgresql")
+def _utc_date_trunc_postgresql(element, compiler, **kw):
+    precision, column = (compiler.process(c, **kw) for c in element.clauses)
+    return f"date_trunc({precision}, timezone('UTC', {column}))"
+
+
+@compiles(utc_date_trunc, "sqlite")
+def _utc_date_trunc_sqlite(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[1], **kw)
+    return f"strftime('{_SQLITE_TRUNC_FORMATS[element.precision]}', {column})"
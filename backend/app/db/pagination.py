@@ -0,0 +1,149 @@
+"""Keyset (cursor) pagination helpers shared by search endpoints.
+
+OFFSET pagination re-reads every skipped row, so deep pages get linearly
+slower. Keyset pagination instead resumes after the last row of the
+previous page using a row-value comparison on the sort key, which an
+index on the same columns answers directly.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the sort key
+values of the last row returned.
+
+The total is counted on the first keyset page only; later pages would
+repeat the same full COUNT(*) on every request, so they report no total
+unless the client asks for one (see resolve_count_mode).
+
+Usage:
+    order = (CheckItem.priority, CheckItem.presented_date, CheckItem.id)
+    if cursor:
+        values = decode_cursor(cursor, int, datetime.fromisoformat, str)
+        query = query.where(keyset_after(order, values))
+    query = query.order_by(*(c.desc() for c in order)).limit(page_size + 1)
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+# Upper bound for CountMode.CAPPED; beyond this the total is reported as an estimate
+CAPPED_COUNT_LIMIT = 10_000
+
+
+class CountMode(str, Enum):
+    """How the total row count of a search is computed."""
+
+    EXACT = "exact"  # COUNT(*) over the full result
+    CAPPED = "capped"  # COUNT(*) over at most CAPPED_COUNT_LIMIT rows
+    NONE = "none"  # No count; total is None (keyset pages only)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of a keyset-paginated search."""
+
+    items: list[T]
+    total: int | None
+    total_is_estimate: bool
+    has_next: bool
+    next_cursor: str | None
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort key values as an opaque cursor."""
+    payload = json.dumps([_json_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor back into sort key values.
+
+    Args:
+        cursor: Cursor from a previous page
+        parsers: One parser per sort key column (e.g. int, datetime.fromisoformat)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or has the wrong shape
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise InvalidCursorError("Invalid cursor")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def keyset_after(columns: Sequence[ColumnElement], values: Sequence[Any]) -> ColumnElement:
+    """Condition selecting rows after `values` in descending `columns` order."""
+    return tuple_(*columns) < tuple_(*values)
+
+
+def resolve_count_mode(requested: CountMode | None, cursor: str | None) -> CountMode:
+    """Count mode for one page of a search endpoint.
+
+    Args:
+        requested: The client's `count` parameter (None when not given)
+        cursor: The raw `cursor` parameter - None for offset paging, empty
+            for the first keyset page
+
+    Offset pages always need a total. Keyset pages are counted exactly on
+    the first page and not at all afterwards, unless a mode is requested.
+    """
+    if cursor is None:
+        return CountMode.EXACT if requested in (None, CountMode.NONE) else requested
+    if requested is None:
+        return CountMode.NONE if cursor else CountMode.EXACT
+    return requested
+
+
+def page_count(total: int | None, page_size: int) -> int | None:
+    """Number of pages for a total (None when the total was not counted)."""
+    return None if total is None else (total + page_size - 1) // page_size
+
+
+async def count_rows(
+    db: AsyncSession, query: Select, mode: CountMode = CountMode.EXACT
+) -> tuple[int | None, bool]:
+    """Count the rows a search query would return.
+
+    Returns:
+        (total, is_estimate) - is_estimate is True when a capped count hit the
+        cap; total is None for CountMode.NONE
+    """
+    if mode == CountMode.NONE:
+        return None, False
+    if mode == CountMode.CAPPED:
+        query = query.limit(CAPPED_COUNT_LIMIT + 1)
+    result = await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))
+    total = result.scalar() or 0
+    if mode == CountMode.CAPPED and total > CAPPED_COUNT_LIMIT:
+        return CAPPED_COUNT_LIMIT, True
+    return total, False
@@ -13,7 +13,12 @@ from slowapi.errors import RateLimitExceeded
 from app.api.v1 import api_router
 from app.core.client_ip import get_client_ip
 from app.core.config import settings
-from app.core.errors import APIException, api_exception_handler, generic_exception_handler, http_exception_handler
+from app.core.errors import (
+    APIException,
+    api_exception_handler,
+    generic_exception_handler,
+    http_exception_handler,
+)
 from app.core.logging_config import configure_logging
 
 logger = logging.getLogger("app.startup")
@@ -158,10 +163,28 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Production mode: Skipping auto-create. Use Alembic migrations.")
 
+    # Background jobs: connector imports, rollup repair, token/session GC.
+    # Only for a single-process API; production runs a dedicated scheduler
+    from app.scheduler import shutdown_scheduler, start_scheduler
+
+    if settings.SCHEDULER_ENABLED:
+        try:
+            await start_scheduler()
+        except Exception as e:
+            logger.warning("Failed to start background scheduler: %s", e)
+            # Don't fail startup - the jobs can also run from cron
+
     yield
     # Shutdown
     logger.info("Shutting down...")
 
+    from app.services.image_prefetch import image_prefetcher
+    from app.services.pdf_render_pool import shutdown_render_pool
+
+    await shutdown_scheduler()
+    await image_prefetcher.shutdown()
+    shutdown_render_pool()
+
 
 # Conditionally expose API docs based on settings
 # In production, docs are disabled by default for security
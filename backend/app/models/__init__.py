@@ -52,6 +52,7 @@ from app.models.item_context_connector import (
 from app.models.item_context_connector import RecordStatus as ContextRecordStatus
 from app.models.policy import Policy, PolicyRule, PolicyVersion
 from app.models.queue import ApprovalEntitlement, ApprovalEntitlementType, Queue, QueueAssignment
+from app.models.rollup import ActivityRollup, ItemStateRollup
 from app.models.user import Permission, Role, User, UserSession
 
 __all__ = [
@@ -111,6 +112,9 @@ __all__ = [
     "QueueAssignment",
     "ApprovalEntitlement",
     "ApprovalEntitlementType",
+    # Rollups
+    "ActivityRollup",
+    "ItemStateRollup",
     # User
     "User",
     "Role",
@@ -203,6 +203,8 @@ class AuditLog(Base, UUIDMixin):
         Index("ix_audit_logs_resource", "resource_type", "resource_id"),
         Index("ix_audit_logs_user_action", "user_id", "action"),
         Index("ix_audit_logs_timestamp_action", "timestamp", "action"),
+        # Keyset pagination for audit log search (timestamp, id)
+        Index("ix_audit_logs_tenant_timestamp", "tenant_id", "timestamp", "id"),
     )
 
     def compute_integrity_hash(self) -> str:
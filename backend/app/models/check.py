@@ -286,6 +286,15 @@ class CheckItem(Base, UUIDMixin, TimestampMixin):
     __table_args__ = (
         Index("ix_check_items_status_priority", "status", "priority"),
         Index("ix_check_items_queue_status", "queue_id", "status"),
+        # Keyset pagination: search (priority, presented_date, id), archive (updated_at, id)
+        Index(
+            "ix_check_items_tenant_priority_presented",
+            "tenant_id",
+            "priority",
+            "presented_date",
+            "id",
+        ),
+        Index("ix_check_items_tenant_updated", "tenant_id", "updated_at", "id"),
         # Per-tenant uniqueness for external IDs (Bank A and Bank B can have same external_item_id)
         UniqueConstraint("tenant_id", "external_item_id", name="uq_check_items_tenant_external_id"),
         # Note: presented_date index is created via index=True on the column
@@ -81,8 +81,11 @@ class ImageAccessToken(Base, UUIDMixin, TimestampMixin):
 
     @property
     def is_expired(self) -> bool:
-        """Check if token has expired."""
-        return datetime.now(timezone.utc) > self.expires_at
+        """Check if token has expired (a naive expires_at is treated as UTC)."""
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > expires_at
 
     @property
     def is_used(self) -> bool:
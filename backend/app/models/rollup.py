@@ -0,0 +1,67 @@
+"""Operational rollup models.
+
+Pre-aggregated hourly counters that let reports read O(buckets) rows
+instead of recounting check_items and decisions. Maintained incrementally
+by app.services.rollup_service and rebuilt by the rollup repair job.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from app.db.session import Base
+from sqlalchemy import Boolean, DateTime, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Stored instead of NULL so queue_id can be part of the primary key
+NO_QUEUE = ""
+
+
+class ItemStateRollup(Base):
+    """Count of check items per state, bucketed by presented hour.
+
+    Each item contributes to exactly one row: the (queue, presented hour,
+    status, risk level, SLA breach) it is currently in. State changes move
+    the count between rows, so summing any set of buckets gives current
+    counts for items presented in that window.
+    """
+
+    __tablename__ = "item_state_rollups"
+
+    tenant_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    queue_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=NO_QUEUE)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    status: Mapped[str] = mapped_column(String(30), primary_key=True)
+    risk_level: Mapped[str] = mapped_column(String(20), primary_key=True)
+    sla_breached: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+
+    item_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index("ix_item_state_rollups_tenant_bucket", "tenant_id", "bucket_start"),
+        Index("ix_item_state_rollups_tenant_queue", "tenant_id", "queue_id"),
+    )
+
+
+class ActivityRollup(Base):
+    """Count (and amount) of workflow events, bucketed by event hour.
+
+    Metrics:
+        processed: item moved into a final status (value = status)
+        sla_breached: item flagged as SLA breached (value = "")
+        decision: decision recorded (value = action)
+    """
+
+    __tablename__ = "activity_rollups"
+
+    tenant_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    queue_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=NO_QUEUE)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    metric: Mapped[str] = mapped_column(String(30), primary_key=True)
+    value: Mapped[str] = mapped_column(String(50), primary_key=True, default="")
+
+    event_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amount_total: Mapped[Decimal] = mapped_column(Numeric(16, 2), default=0, nullable=False)
+
+    __table_args__ = (
+        Index("ix_activity_rollups_tenant_metric_bucket", "tenant_id", "metric", "bucket_start"),
+    )
@@ -0,0 +1,171 @@
+"""
+Cached compiled policy programs.
+
+Resolving the active policy for an item costs a query with a rules
+selectinload, and compiling it costs a JSON parse per rule. Both are cached:
+
+1. Compiled programs, keyed by policy_version_id. Versions are immutable
+   once created (changes create a new version), so programs never go stale
+   and are only evicted by LRU.
+2. Active version resolution per (tenant_id, account_type), held in-process
+   with a short TTL and in Redis via CacheService.get/set_active_policy.
+   Serialized version data is shared through CacheService.get/set_policy_version
+   so other workers can compile without touching the database.
+
+Activating, updating or deleting a policy calls invalidate_tenant, which
+clears the local resolutions for the tenant and calls
+CacheService.invalidate_policy. Other workers may keep resolving to the
+previous version until their local entry expires
+(POLICY_CACHE_LOCAL_TTL_SECONDS).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+from app.policy.compiler import CompiledPolicy, compile_policy_data
+from app.services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+# Marker stored when a tenant has no active policy for an account type
+NO_ACTIVE_POLICY = ""
+
+
+class PolicyProgramCache:
+    """Two-tier cache of compiled policy programs per tenant and account type."""
+
+    def __init__(
+        self,
+        cache: CacheService | None = None,
+        max_programs: int | None = None,
+        local_ttl_seconds: int | None = None,
+    ):
+        self._cache = cache or cache_service
+        self._max_programs = max_programs or settings.POLICY_CACHE_MAX_PROGRAMS
+        self._local_ttl = local_ttl_seconds or settings.POLICY_CACHE_LOCAL_TTL_SECONDS
+        # policy_version_id -> CompiledPolicy
+        self._programs: OrderedDict[str, CompiledPolicy] = OrderedDict()
+        # (tenant_id, account_type) -> (expires_at monotonic, policy_version_id)
+        self._active: dict[tuple[str, str], tuple[float, str]] = {}
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.compilations = 0
+
+    async def get(self, tenant_id: str, account_type: str) -> tuple[bool, CompiledPolicy | None]:
+        """Get the compiled active program for a tenant and account type.
+
+        Returns:
+            (found, program) - program is None when found is True and the
+            tenant has no active policy; found is False on a miss, in which
+            case the caller resolves from the database and calls set()
+        """
+        key = (tenant_id, account_type)
+        entry = self._active.get(key)
+        if entry is not None:
+            expires_at, version_id = entry
+            if expires_at > time.monotonic():
+                if version_id == NO_ACTIVE_POLICY:
+                    self.local_hits += 1
+                    return True, None
+                program = self._programs.get(version_id)
+                if program is not None:
+                    self._programs.move_to_end(version_id)
+                    self.local_hits += 1
+                    return True, program
+            else:
+                del self._active[key]
+
+        active = await self._cache.get_active_policy(tenant_id)
+        if active and account_type in active:
+            version_id = active[account_type]
+            if version_id == NO_ACTIVE_POLICY:
+                self._store_active(key, NO_ACTIVE_POLICY)
+                self.redis_hits += 1
+                return True, None
+            program = await self._get_program(version_id)
+            if program is not None:
+                self._store_active(key, version_id)
+                self.redis_hits += 1
+                return True, program
+
+        self.misses += 1
+        return False, None
+
+    async def set(
+        self,
+        tenant_id: str,
+        account_type: str,
+        version_data: dict[str, Any] | None,
+    ) -> CompiledPolicy | None:
+        """Compile and cache the active version for a tenant and account type.
+
+        Args:
+            tenant_id: Tenant ID
+            account_type: Account type the version was resolved for
+            version_data: Serialized version (see serialize_policy_version),
+                or None if no policy is active
+
+        Returns:
+            The compiled program, or None if no policy is active
+        """
+        if version_data is None:
+            version_id = NO_ACTIVE_POLICY
+            program = None
+        else:
+            version_id = version_data["policy_version_id"]
+            program = self._programs.get(version_id)
+            if program is None:
+                program = self._compile(version_data)
+                await self._cache.set_policy_version(version_id, version_data)
+
+        self._store_active((tenant_id, account_type), version_id)
+
+        active = await self._cache.get_active_policy(tenant_id) or {}
+        active[account_type] = version_id
+        await self._cache.set_active_policy(tenant_id, active)
+        return program
+
+    async def invalidate_tenant(self, tenant_id: str, policy_id: str | None = None) -> None:
+        """Drop a tenant's active version resolutions in both tiers."""
+        for key in [key for key in self._active if key[0] == tenant_id]:
+            del self._active[key]
+        await self._cache.invalidate_policy(tenant_id, policy_id)
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier."""
+        self._programs.clear()
+        self._active.clear()
+
+    async def _get_program(self, version_id: str) -> CompiledPolicy | None:
+        program = self._programs.get(version_id)
+        if program is not None:
+            self._programs.move_to_end(version_id)
+            return program
+
+        data = await self._cache.get_policy_version(version_id)
+        if data is None:
+            return None
+        try:
+            return self._compile(data)
+        except (KeyError, TypeError) as e:
+            logger.warning("Discarding malformed cached policy version %s: %s", version_id, e)
+            return None
+
+    def _compile(self, version_data: dict[str, Any]) -> CompiledPolicy:
+        program = compile_policy_data(version_data)
+        self.compilations += 1
+        self._programs[program.policy_version_id] = program
+        while len(self._programs) > self._max_programs:
+            self._programs.popitem(last=False)
+        return program
+
+    def _store_active(self, key: tuple[str, str], version_id: str) -> None:
+        self._active[key] = (time.monotonic() + self._local_ttl, version_id)
+
+
+# Global policy program cache instance
+policy_program_cache = PolicyProgramCache()
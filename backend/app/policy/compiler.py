@@ -0,0 +1,416 @@
+"""
+Compile policy versions into immutable rule programs.
+
+A policy version's rules are stored as JSON text. Parsing that JSON,
+validating it into RuleCondition/RuleAction models and converting target
+values is the same work for every item evaluated against the version, so it
+is done once here. The resulting CompiledPolicy holds pre-parsed conditions
+with pre-resolved field accessors and pre-converted target values, and
+pre-reduced action effects, and can be evaluated against any number of items.
+
+Evaluation semantics match the interpreted engine: rules are evaluated in
+stored order, all conditions of a rule must hold (AND), a missing field value
+never matches, and later rules override earlier ones for single-valued
+actions (risk level, routing queue).
+"""
+
+import json
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.models.check import CheckItem
+from app.models.policy import PolicyRule, PolicyVersion, RuleConditionOperator
+from app.schemas.policy import PolicyEvaluationResult, RuleAction, RuleCondition
+
+logger = logging.getLogger(__name__)
+
+FieldAccessor = Callable[[Any], Any]
+Predicate = Callable[[Any], bool]
+
+
+# =============================================================================
+# Field accessors
+# =============================================================================
+
+
+def _float_field(name: str) -> FieldAccessor:
+    # Numeric fields are converted to float for consistent comparisons
+    def accessor(item: Any) -> float | None:
+        value = getattr(item, name)
+        return float(value) if value is not None else None
+
+    return accessor
+
+
+def _enum_field(name: str) -> FieldAccessor:
+    def accessor(item: Any) -> Any:
+        value = getattr(item, name)
+        return value.value if value else None
+
+    return accessor
+
+
+def _plain_field(name: str) -> FieldAccessor:
+    def accessor(item: Any) -> Any:
+        return getattr(item, name)
+
+    return accessor
+
+
+def _ratio_field(numerator: str, denominator: str) -> FieldAccessor:
+    def accessor(item: Any) -> float | None:
+        divisor = getattr(item, denominator)
+        if divisor and divisor > 0:
+            return float(getattr(item, numerator)) / float(divisor)
+        return None
+
+    return accessor
+
+
+_FLOAT_FIELDS = (
+    "amount",
+    "current_balance",
+    "average_balance_30d",
+    "avg_check_amount_30d",
+    "avg_check_amount_90d",
+    "avg_check_amount_365d",
+    "check_std_dev_30d",
+    "max_check_amount_90d",
+    "total_check_amount_7d",
+    "total_check_amount_14d",
+    "relationship_tenure_years",
+)
+
+_ENUM_FIELDS = ("account_type", "item_type", "risk_level")
+
+_PLAIN_FIELDS = (
+    "payee_name",
+    "memo",
+    "account_tenure_days",
+    "check_frequency_30d",
+    "check_count_7d",
+    "check_count_14d",
+    "returned_item_count_90d",
+    "exception_count_90d",
+    "overdraft_count_30d",
+    "overdraft_count_90d",
+    "nsf_count_90d",
+    "is_payroll_account",
+    "has_direct_deposit",
+    "deposit_regularity_score",
+    "check_number_gap",
+    "is_duplicate_check_number",
+    "is_out_of_sequence",
+    "check_age_days",
+    "is_stale_dated",
+    "is_post_dated",
+    "has_micr_anomaly",
+    "micr_confidence_score",
+    "has_alteration_flag",
+    "signature_match_score",
+    "prior_review_count",
+    "prior_approval_count",
+    "prior_rejection_count",
+)
+
+FIELD_ACCESSORS: dict[str, FieldAccessor] = {
+    **{name: _float_field(name) for name in _FLOAT_FIELDS},
+    **{name: _enum_field(name) for name in _ENUM_FIELDS},
+    **{name: _plain_field(name) for name in _PLAIN_FIELDS},
+    # Computed fields
+    "amount_vs_avg_ratio": _ratio_field("amount", "avg_check_amount_30d"),
+    "amount_vs_max_ratio": _ratio_field("amount", "max_check_amount_90d"),
+    "amount_vs_balance_ratio": _ratio_field("amount", "current_balance"),
+    "velocity_7d_ratio": _ratio_field("amount", "total_check_amount_7d"),
+}
+
+
+def convert_value(value: Any, value_type: str) -> Any:
+    """Convert a condition target value to the appropriate type.
+
+    Note: We use float for numeric comparisons to ensure consistency
+    with computed fields (like ratios) which return float values.
+    Using Decimal would cause TypeError when comparing float >= Decimal.
+    """
+    if value is None:
+        return None
+
+    if value_type == "number":
+        if isinstance(value, list):
+            return [float(v) for v in value]
+        return float(value)
+
+    if value_type == "boolean":
+        return bool(value)
+
+    if value_type == "array":
+        if isinstance(value, list):
+            return value
+        return [value]
+
+    return value
+
+
+# =============================================================================
+# Conditions
+# =============================================================================
+
+
+def _never(field_value: Any) -> bool:
+    return False
+
+
+def _membership(target: list) -> Callable[[Any], bool]:
+    """Build a membership test, using a set when every target is hashable."""
+    try:
+        members: frozenset | tuple = frozenset(target)
+    except TypeError:
+        members = tuple(target)
+    return members.__contains__
+
+
+def _build_predicate(operator: RuleConditionOperator, target: Any) -> Predicate:
+    """Build a predicate on a non-None field value for one operator/target."""
+    if operator == RuleConditionOperator.EQUALS:
+        return lambda v: v == target
+
+    if operator == RuleConditionOperator.NOT_EQUALS:
+        return lambda v: v != target
+
+    if operator == RuleConditionOperator.GREATER_THAN:
+        return lambda v: v > target
+
+    if operator == RuleConditionOperator.LESS_THAN:
+        return lambda v: v < target
+
+    if operator == RuleConditionOperator.GREATER_OR_EQUAL:
+        return lambda v: v >= target
+
+    if operator == RuleConditionOperator.LESS_OR_EQUAL:
+        return lambda v: v <= target
+
+    if operator == RuleConditionOperator.IN:
+        if isinstance(target, list):
+            return _membership(target)
+        return _never
+
+    if operator == RuleConditionOperator.NOT_IN:
+        if isinstance(target, list):
+            contains = _membership(target)
+            return lambda v: not contains(v)
+        return _never
+
+    if operator == RuleConditionOperator.CONTAINS:
+        if isinstance(target, str):
+            needle = target.lower()
+            return lambda v: isinstance(v, str) and needle in v.lower()
+        return _never
+
+    if operator == RuleConditionOperator.BETWEEN:
+        if isinstance(target, list) and len(target) == 2:
+            low, high = target
+            return lambda v: low <= v <= high
+        return _never
+
+    return _never
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCondition:
+    """A single condition with its field accessor and predicate resolved."""
+
+    field: str
+    accessor: FieldAccessor
+    predicate: Predicate
+
+    def matches(self, item: Any) -> bool:
+        """Evaluate the condition against an item."""
+        field_value = self.accessor(item)
+        if field_value is None:
+            return False
+        return self.predicate(field_value)
+
+
+def compile_condition(condition: RuleCondition) -> CompiledCondition:
+    """Compile a validated rule condition.
+
+    Unknown fields compile to a condition that never matches, mirroring a
+    missing field value.
+    """
+    accessor = FIELD_ACCESSORS.get(condition.field)
+    if accessor is None:
+        return CompiledCondition(
+            field=condition.field, accessor=lambda item: None, predicate=_never
+        )
+
+    target = convert_value(condition.value, condition.value_type)
+    return CompiledCondition(
+        field=condition.field,
+        accessor=accessor,
+        predicate=_build_predicate(condition.operator, target),
+    )
+
+
+# =============================================================================
+# Rules and programs
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """An enabled rule with parsed conditions and reduced action effects."""
+
+    id: str
+    conditions: tuple[CompiledCondition, ...]
+    requires_dual_control: bool = False
+    risk_level: str | None = None
+    routing_queue_id: str | None = None
+    reason_categories: tuple[str, ...] = ()
+    flags: tuple[str, ...] = ()
+
+    def matches(self, item: Any) -> bool:
+        """All conditions must be true (AND logic)."""
+        for condition in self.conditions:
+            if not condition.matches(item):
+                return False
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPolicy:
+    """Immutable rule program for one policy version."""
+
+    policy_id: str
+    policy_version_id: str
+    rules: tuple[CompiledRule, ...]
+
+    def evaluate(self, item: CheckItem) -> PolicyEvaluationResult:
+        """Evaluate the program against a check item."""
+        rules_triggered = []
+        requires_dual_control = False
+        risk_level = item.risk_level.value
+        routing_queue_id = None
+        required_reason_categories: list[str] = []
+        flags: list[str] = []
+
+        for rule in self.rules:
+            if not rule.matches(item):
+                continue
+
+            rules_triggered.append(rule.id)
+            if rule.requires_dual_control:
+                requires_dual_control = True
+            if rule.risk_level is not None:
+                risk_level = rule.risk_level
+            if rule.routing_queue_id is not None:
+                routing_queue_id = rule.routing_queue_id
+            required_reason_categories.extend(rule.reason_categories)
+            flags.extend(rule.flags)
+
+        return PolicyEvaluationResult(
+            policy_id=self.policy_id,
+            policy_version_id=self.policy_version_id,
+            rules_triggered=rules_triggered,
+            requires_dual_control=requires_dual_control,
+            risk_level=risk_level,
+            routing_queue_id=routing_queue_id,
+            required_reason_categories=required_reason_categories,
+            flags=flags,
+        )
+
+
+def _load_json_list(raw: str) -> list[dict]:
+    data = json.loads(raw)
+    return data if isinstance(data, list) else [data]
+
+
+def compile_rule(rule_id: str, conditions_json: str, actions_json: str) -> CompiledRule | None:
+    """Compile one rule from its stored JSON.
+
+    Returns:
+        CompiledRule, or None if the rule is malformed and can never trigger
+    """
+    try:
+        conditions = tuple(
+            compile_condition(RuleCondition(**c)) for c in _load_json_list(conditions_json)
+        )
+        actions = [RuleAction(**a) for a in _load_json_list(actions_json)]
+    except (json.JSONDecodeError, TypeError, ValueError, ValidationError) as e:
+        logger.warning("Skipping malformed policy rule %s: %s", rule_id, e)
+        return None
+
+    requires_dual_control = False
+    risk_level = None
+    routing_queue_id = None
+    reason_categories = []
+    flags = []
+
+    for action in actions:
+        params = action.params or {}
+        if action.action == "require_dual_control":
+            requires_dual_control = True
+        elif action.action == "set_risk_level" and "level" in params:
+            risk_level = params["level"]
+        elif action.action == "route_to_queue" and "queue_id" in params:
+            routing_queue_id = params["queue_id"]
+        elif action.action == "require_reason" and "category" in params:
+            reason_categories.append(params["category"])
+        elif action.action == "add_flag" and "flag" in params:
+            flags.append(params["flag"])
+
+    return CompiledRule(
+        id=rule_id,
+        conditions=conditions,
+        requires_dual_control=requires_dual_control,
+        risk_level=risk_level,
+        routing_queue_id=routing_queue_id,
+        reason_categories=tuple(reason_categories),
+        flags=tuple(flags),
+    )
+
+
+def _compile_rules(rules: Iterable[dict[str, Any]]) -> tuple[CompiledRule, ...]:
+    compiled = []
+    for rule in rules:
+        if not rule["is_enabled"]:
+            continue
+        program_rule = compile_rule(rule["id"], rule["conditions"], rule["actions"])
+        if program_rule is not None:
+            compiled.append(program_rule)
+    return tuple(compiled)
+
+
+def serialize_policy_version(version: PolicyVersion) -> dict[str, Any]:
+    """Serialize a policy version loaded with rules for the Redis tier."""
+    return {
+        "policy_id": version.policy_id,
+        "policy_version_id": version.id,
+        "rules": [_serialize_rule(rule) for rule in version.rules],
+    }
+
+
+def _serialize_rule(rule: PolicyRule) -> dict[str, Any]:
+    return {
+        "id": rule.id,
+        "is_enabled": rule.is_enabled,
+        "conditions": rule.conditions,
+        "actions": rule.actions,
+    }
+
+
+def compile_policy_data(data: dict[str, Any]) -> CompiledPolicy:
+    """Compile a serialized policy version (see serialize_policy_version)."""
+    return CompiledPolicy(
+        policy_id=data["policy_id"],
+        policy_version_id=data["policy_version_id"],
+        rules=_compile_rules(data["rules"]),
+    )
+
+
+def compile_policy_version(version: PolicyVersion) -> CompiledPolicy:
+    """Compile a policy version loaded with its rules."""
+    return compile_policy_data(serialize_policy_version(version))
@@ -12,13 +12,15 @@ Usage in main application startup:
         yield
         await shutdown_scheduler()
 
-Or run standalone:
+(the API lifespan does this when SCHEDULER_ENABLED is set). Or run it as
+its own process, which is how production runs it so that several API
+workers do not each run every job:
     python -m app.scheduler.item_context_scheduler
 """
 
 import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from app.core.config import settings
@@ -28,6 +30,8 @@ from app.models.item_context_connector import (
     ItemContextConnector,
 )
 from app.services.item_context_service import ItemContextImportService
+from app.services.rollup_service import run_rollup_repair_job
+from app.services.token_gc import run_token_gc_job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import select
@@ -81,6 +85,16 @@ async def run_scheduled_import(connector_id: str) -> None:
             logger.exception(f"Scheduled import failed for connector {connector_id}: {e}")
 
 
+async def run_scheduled_rollup_repair() -> None:
+    """Rebuild the operational rollups over the trailing repair window."""
+    since = datetime.now(timezone.utc) - timedelta(hours=settings.ROLLUP_REPAIR_WINDOW_HOURS)
+    try:
+        rebuilt = await run_rollup_repair_job(since=since)
+        logger.info(f"Rollup repair completed for {len(rebuilt)} tenants")
+    except Exception as e:
+        logger.exception(f"Scheduled rollup repair failed: {e}")
+
+
 def create_cron_trigger(cron_expression: str, timezone_str: str) -> CronTrigger:
     """
     Create an APScheduler CronTrigger from a cron expression.
@@ -198,6 +212,28 @@ async def start_scheduler() -> None:
         name="Sync Connector Schedules",
     )
 
+    # Reconcile rollup counters with writes that bypassed the flush listener
+    _scheduler.add_job(
+        run_scheduled_rollup_repair,
+        "interval",
+        minutes=settings.ROLLUP_REPAIR_INTERVAL_MINUTES,
+        id="rollup_repair",
+        name="Operational Rollup Repair",
+        max_instances=1,
+        coalesce=True,
+    )
+
+    # Delete expired image tokens and sessions in bounded chunks
+    _scheduler.add_job(
+        run_token_gc_job,
+        "interval",
+        minutes=settings.TOKEN_GC_INTERVAL_MINUTES,
+        id="token_gc",
+        name="Expired Token/Session GC",
+        max_instances=1,
+        coalesce=True,
+    )
+
     _scheduler.start()
     logger.info("Item context scheduler started")
 
@@ -252,7 +288,7 @@ def get_scheduler_status() -> dict[str, Any]:
     }
 
 
-# Standalone execution for testing
+# Standalone execution (the dedicated scheduler process)
 if __name__ == "__main__":
     import sys
 
@@ -74,3 +74,18 @@ class AuditPacketResponse(BaseModel):
     format: str
     download_url: str
     expires_at: datetime
+
+
+class AuditPacketJobResponse(BaseModel):
+    """Audit packet rendering job status."""
+
+    job_id: str
+    check_item_id: str
+    status: str  # pending, completed, failed
+    reused: bool = False  # True if an identical packet was already rendered
+    submitted_at: datetime
+    completed_at: datetime | None = None
+    packet_id: str | None = None
+    download_url: str | None = None
+    expires_at: datetime | None = None
+    error: str | None = None
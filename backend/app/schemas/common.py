@@ -25,15 +25,23 @@ class TimestampSchema(BaseSchema):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response."""
+    """Generic paginated response.
+
+    Keyset-paginated endpoints also return next_cursor; total is capped
+    (and total_is_estimate set) when a capped count was requested. Keyset
+    pages after the first are not counted unless `count` is passed, and
+    return total and total_pages as None.
+    """
 
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
     has_next: bool
     has_previous: bool
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class MessageResponse(BaseModel):
@@ -0,0 +1,274 @@
+"""
+Audit packet rendering jobs.
+
+Submitting a packet request returns a job immediately. The packet is
+built in the background - data loaded on the event loop, layout in the
+PDF worker pool (see app.services.pdf_render_pool) - and stored with
+CacheService.store_audit_packet. Clients poll the job (optionally
+long-polling) and download the packet once it has completed.
+
+Jobs are deduplicated on (tenant, user, check item, options, latest
+audit timestamp for the item): a repeated request while nothing about
+the item has changed reuses the already rendered packet. Packet
+generation entries are excluded from the timestamp, otherwise every
+packet would invalidate itself.
+
+Job state lives in Redis so any API worker can answer a poll; jobs
+started by this process can also be awaited directly.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.audit.service import AuditService
+from app.core.metrics import audit_packet_jobs_total
+from app.db.session import AsyncSessionLocal
+from app.models.audit import AuditAction, AuditLog
+from app.services.cache_service import CacheService
+from app.services.pdf_generator import AuditPacketGenerator
+
+logger = logging.getLogger(__name__)
+
+# Seconds between job state reads when waiting on a job owned by another process
+POLL_INTERVAL_SECONDS = 0.25
+
+
+class AuditPacketJobStatus(str, Enum):
+    """Lifecycle of an audit packet job."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AuditPacketJobError(Exception):
+    """Raised when a job cannot be submitted (e.g. the cache is unavailable)."""
+
+
+class AuditPacketJobs:
+    """Submit, track and await audit packet rendering jobs."""
+
+    # Background tasks started by this process, by job ID
+    _tasks: dict[str, asyncio.Task] = {}
+
+    def __init__(self, cache: CacheService, session_factory=AsyncSessionLocal):
+        self.cache = cache
+        self._session_factory = session_factory
+
+    async def submit(
+        self,
+        db: AsyncSession,
+        check_item_id: str,
+        tenant_id: str,
+        user_id: str,
+        username: str,
+        options: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Submit a packet job, reusing an identical rendered packet if one exists.
+
+        The caller must already have verified that the item belongs to the tenant.
+
+        Args:
+            db: Request session (used for the dedupe lookup and reuse audit entry)
+            check_item_id: Check item ID
+            tenant_id: Requesting tenant
+            user_id: Requesting user (packets are bound to this user)
+            username: Name shown as "generated by" on the packet
+            options: Rendering options (include_images, include_history, format)
+
+        Raises:
+            AuditPacketJobError: If the job state cannot be stored
+        """
+        dedupe_key = await self._dedupe_key(db, check_item_id, tenant_id, user_id, options)
+        existing = await self._find_reusable(dedupe_key, tenant_id, user_id)
+        if existing:
+            audit_packet_jobs_total.labels(result="reused").inc()
+            await AuditService(db).log(
+                action=AuditAction.AUDIT_PACKET_GENERATED,
+                resource_type="check_item",
+                resource_id=check_item_id,
+                user_id=user_id,
+                username=username,
+                tenant_id=tenant_id,
+                description=f"Reused audit packet {existing['packet_id']}",
+                metadata={
+                    "packet_id": existing["packet_id"],
+                    "job_id": existing["job_id"],
+                    "reused": True,
+                    **options,
+                },
+            )
+            return {**existing, "reused": True}
+
+        job = {
+            "job_id": str(uuid4()),
+            "packet_id": str(uuid4()),
+            "check_item_id": check_item_id,
+            "tenant_id": tenant_id,
+            "user_id": user_id,
+            "status": AuditPacketJobStatus.PENDING.value,
+            "submitted_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+            "error": None,
+            "reused": False,
+        }
+        if not await self._save(job):
+            raise AuditPacketJobError("Failed to store audit packet job")
+        await self.cache.set(
+            f"{CacheService.PREFIX_AUDIT_PACKET_DEDUPE}{dedupe_key}",
+            job["job_id"],
+            ttl=CacheService.TTL_AUDIT_PACKET,
+        )
+
+        task = asyncio.create_task(self._run(job, username, options))
+        self._tasks[job["job_id"]] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job["job_id"], None))
+        return job
+
+    async def get(self, job_id: str, tenant_id: str, user_id: str) -> dict[str, Any] | None:
+        """Get a job's state.
+
+        SECURITY: Returns None for BOTH "not found" and "owned by someone
+        else", like retrieve_audit_packet.
+        """
+        data = await self.cache.get(f"{CacheService.PREFIX_AUDIT_PACKET_JOB}{job_id}")
+        if not data:
+            return None
+        job = json.loads(data)
+        if job.get("tenant_id") != tenant_id or job.get("user_id") != user_id:
+            logger.warning(
+                "Audit packet job access denied: job=%s requesting_tenant=%s requesting_user=%s",
+                job_id,
+                tenant_id,
+                user_id,
+            )
+            return None
+        return job
+
+    async def wait(
+        self, job_id: str, tenant_id: str, user_id: str, timeout: float
+    ) -> dict[str, Any] | None:
+        """Wait up to `timeout` seconds for a job to finish, then return its state."""
+        job = await self.get(job_id, tenant_id, user_id)
+        if job is None or job["status"] != AuditPacketJobStatus.PENDING.value or timeout <= 0:
+            return job
+
+        task = self._tasks.get(job_id)
+        if task is not None:
+            # Started here: wake as soon as it finishes
+            await asyncio.wait({task}, timeout=timeout)
+            return await self.get(job_id, tenant_id, user_id)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while job is not None and job["status"] == AuditPacketJobStatus.PENDING.value:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(POLL_INTERVAL_SECONDS, remaining))
+            job = await self.get(job_id, tenant_id, user_id)
+        return job
+
+    async def _run(self, job: dict[str, Any], username: str, options: dict[str, Any]) -> None:
+        """Render and store a packet, then record the job outcome."""
+        try:
+            async with self._session_factory() as db:
+                pdf_bytes = await AuditPacketGenerator(db).generate(
+                    check_item_id=job["check_item_id"],
+                    include_images=options.get("include_images", True),
+                    include_history=options.get("include_history", True),
+                    generated_by=username,
+                )
+
+                # SECURITY: Packets can only be retrieved by the same tenant+user
+                stored = await self.cache.store_audit_packet(
+                    packet_id=job["packet_id"],
+                    pdf_bytes=pdf_bytes,
+                    tenant_id=job["tenant_id"],
+                    user_id=job["user_id"],
+                    check_item_id=job["check_item_id"],
+                )
+                if not stored:
+                    raise RuntimeError("Failed to store audit packet")
+
+                await AuditService(db).log(
+                    action=AuditAction.AUDIT_PACKET_GENERATED,
+                    resource_type="check_item",
+                    resource_id=job["check_item_id"],
+                    user_id=job["user_id"],
+                    username=username,
+                    tenant_id=job["tenant_id"],
+                    description=f"Generated audit packet {job['packet_id']}",
+                    metadata={"packet_id": job["packet_id"], "job_id": job["job_id"], **options},
+                )
+                await db.commit()
+
+            job["status"] = AuditPacketJobStatus.COMPLETED.value
+            audit_packet_jobs_total.labels(result="rendered").inc()
+        except Exception:
+            logger.exception("Audit packet job %s failed", job["job_id"])
+            job["status"] = AuditPacketJobStatus.FAILED.value
+            job["error"] = "Failed to generate audit packet"
+            audit_packet_jobs_total.labels(result="failed").inc()
+
+        job["completed_at"] = datetime.now(timezone.utc).isoformat()
+        await self._save(job)
+
+    async def _dedupe_key(
+        self,
+        db: AsyncSession,
+        check_item_id: str,
+        tenant_id: str,
+        user_id: str,
+        options: dict[str, Any],
+    ) -> str:
+        result = await db.execute(
+            select(func.max(AuditLog.timestamp)).where(
+                AuditLog.tenant_id == tenant_id,
+                AuditLog.resource_id == check_item_id,
+                AuditLog.action != AuditAction.AUDIT_PACKET_GENERATED,
+            )
+        )
+        latest = result.scalar()
+        material = json.dumps(
+            [
+                tenant_id,
+                user_id,
+                check_item_id,
+                sorted(options.items()),
+                latest.isoformat() if latest else None,
+            ]
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    async def _find_reusable(
+        self, dedupe_key: str, tenant_id: str, user_id: str
+    ) -> dict[str, Any] | None:
+        """A pending job, or a completed one whose packet has not expired."""
+        job_id = await self.cache.get(f"{CacheService.PREFIX_AUDIT_PACKET_DEDUPE}{dedupe_key}")
+        if not job_id:
+            return None
+        job = await self.get(job_id, tenant_id, user_id)
+        if job is None or job["status"] == AuditPacketJobStatus.FAILED.value:
+            return None
+        if job["status"] == AuditPacketJobStatus.COMPLETED.value and not await self.cache.exists(
+            f"{CacheService.PREFIX_AUDIT_PACKET}{job['packet_id']}"
+        ):
+            return None
+        return job
+
+    async def _save(self, job: dict[str, Any]) -> bool:
+        return await self.cache.set(
+            f"{CacheService.PREFIX_AUDIT_PACKET_JOB}{job['job_id']}",
+            json.dumps(job),
+            ttl=CacheService.TTL_AUDIT_PACKET,
+        )
@@ -3,14 +3,22 @@ Redis caching service for policies and permissions.
 
 Provides caching layer to reduce database load for frequently accessed data:
 - User permissions (per session)
+- Authenticated principals (user, tenant, flattened permissions)
 - Policy rules (per tenant)
 - Role definitions
 - Audit packet downloads (with tenant/user ownership enforcement)
+- Check image bytes (encrypted by ImageCache before they get here)
+
+Audit packets are binary and can be several megabytes, so they do not go
+through the decoded (str) client used for everything else. Ownership
+metadata is a small hash; the PDF bytes are a list of fixed-size chunks
+written and read over a second connection with decode_responses=False,
+so downloads stream chunk by chunk instead of loading the whole packet.
 """
 
-import base64
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -26,17 +34,29 @@ class CacheService:
 
     # Cache key prefixes
     PREFIX_USER_PERMISSIONS = "perms:user:"
+    PREFIX_PRINCIPAL = "principal:user:"
+    PREFIX_TENANT_PRINCIPALS = "principal:tenant:"
     PREFIX_TENANT_POLICIES = "policies:tenant:"
     PREFIX_ROLE = "role:"
     PREFIX_POLICY_VERSION = "policy:version:"
     PREFIX_RATE_LIMIT = "ratelimit:"
     PREFIX_AUDIT_PACKET = "audit:packet:"
+    PREFIX_AUDIT_PACKET_JOB = "audit:packetjob:"
+    PREFIX_AUDIT_PACKET_DEDUPE = "audit:packetdedupe:"
+    PREFIX_IMAGE = "image:"
+    SUFFIX_AUDIT_PACKET_DATA = ":data"
+
+    # Audit packet bytes are stored and streamed in chunks of this size
+    AUDIT_PACKET_CHUNK_SIZE = 256 * 1024
 
     # Default TTLs
     TTL_USER_PERMISSIONS = timedelta(minutes=15)
+    TTL_PRINCIPAL = timedelta(minutes=15)
     TTL_POLICIES = timedelta(minutes=30)
     TTL_ROLES = timedelta(hours=1)
     TTL_AUDIT_PACKET = timedelta(hours=1)
+    # Opening a packet for download keeps it alive at least this long
+    AUDIT_PACKET_DOWNLOAD_GRACE = timedelta(minutes=5)
 
     def __init__(self, redis_url: str | None = None):
         """Initialize cache service.
@@ -46,9 +66,11 @@ class CacheService:
         """
         self._redis_url = redis_url or settings.REDIS_URL
         self._redis: redis.Redis | None = None
+        # Same server, no response decoding - for binary values (audit packets)
+        self._raw_redis: redis.Redis | None = None
 
     async def connect(self) -> None:
-        """Establish Redis connection."""
+        """Establish Redis connections."""
         if self._redis is None:
             try:
                 self._redis = await redis.from_url(
@@ -56,18 +78,23 @@ class CacheService:
                     encoding="utf-8",
                     decode_responses=True,
                 )
+                self._raw_redis = await redis.from_url(self._redis_url, decode_responses=False)
                 # Test connection
                 await self._redis.ping()
                 logger.info("Redis cache connected successfully")
             except Exception as e:
                 logger.warning("Failed to connect to Redis cache: %s", e)
                 self._redis = None
+                self._raw_redis = None
 
     async def disconnect(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connections."""
         if self._redis:
             await self._redis.close()
             self._redis = None
+            if self._raw_redis:
+                await self._raw_redis.close()
+                self._raw_redis = None
             logger.info("Redis cache disconnected")
 
     @property
@@ -77,6 +104,9 @@ class CacheService:
 
     async def _ensure_connected(self) -> bool:
         """Ensure Redis is connected, attempt reconnect if needed."""
+        if not self._redis_url:
+            # Redis not configured - don't attempt (and log) a connect on every call
+            return False
         if not self._redis:
             await self.connect()
         return self._redis is not None
@@ -183,6 +213,111 @@ class CacheService:
             logger.warning("Failed to invalidate tenant permissions: %s", e)
             return False
 
+    # ==========================================================================
+    # Principal Cache
+    # ==========================================================================
+
+    async def get_principal(self, user_id: str) -> dict[str, Any] | None:
+        """Get a cached authentication principal.
+
+        Args:
+            user_id: User ID (the access token subject)
+
+        Returns:
+            Principal data dict or None if not cached
+        """
+        if not await self._ensure_connected():
+            return None
+
+        try:
+            data = await self._redis.get(f"{self.PREFIX_PRINCIPAL}{user_id}")
+            if data:
+                return json.loads(data)
+            return None
+        except Exception as e:
+            logger.warning("Failed to get principal from cache: %s", e)
+            return None
+
+    async def set_principal(
+        self,
+        user_id: str,
+        tenant_id: str,
+        principal_data: dict[str, Any],
+        ttl: timedelta | None = None,
+    ) -> bool:
+        """Cache an authentication principal.
+
+        The user ID is also added to a per-tenant index so that a role or
+        permission change can invalidate every principal in the tenant.
+
+        Args:
+            user_id: User ID
+            tenant_id: Tenant ID
+            principal_data: Serialized principal
+            ttl: Cache TTL (defaults to TTL_PRINCIPAL)
+
+        Returns:
+            True if cached successfully
+        """
+        if not await self._ensure_connected():
+            return False
+
+        try:
+            ttl = ttl or self.TTL_PRINCIPAL
+            index_key = f"{self.PREFIX_TENANT_PRINCIPALS}{tenant_id}"
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.setex(f"{self.PREFIX_PRINCIPAL}{user_id}", ttl, json.dumps(principal_data))
+                pipe.sadd(index_key, user_id)
+                pipe.expire(index_key, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning("Failed to set principal in cache: %s", e)
+            return False
+
+    async def invalidate_principal(self, user_id: str, tenant_id: str) -> bool:
+        """Invalidate a cached principal.
+
+        Args:
+            user_id: User ID
+            tenant_id: Tenant ID
+
+        Returns:
+            True if invalidated successfully
+        """
+        if not await self._ensure_connected():
+            return False
+
+        try:
+            await self._redis.delete(f"{self.PREFIX_PRINCIPAL}{user_id}")
+            await self._redis.srem(f"{self.PREFIX_TENANT_PRINCIPALS}{tenant_id}", user_id)
+            return True
+        except Exception as e:
+            logger.warning("Failed to invalidate principal: %s", e)
+            return False
+
+    async def invalidate_tenant_principals(self, tenant_id: str) -> bool:
+        """Invalidate all cached principals for a tenant.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            True if invalidated successfully
+        """
+        if not await self._ensure_connected():
+            return False
+
+        try:
+            index_key = f"{self.PREFIX_TENANT_PRINCIPALS}{tenant_id}"
+            user_ids = await self._redis.smembers(index_key)
+            keys = [f"{self.PREFIX_PRINCIPAL}{user_id}" for user_id in user_ids]
+            await self._redis.delete(index_key, *keys)
+            return True
+        except Exception as e:
+            logger.warning("Failed to invalidate tenant principals: %s", e)
+            return False
+
     # ==========================================================================
     # Policy Cache
     # ==========================================================================
@@ -481,10 +616,58 @@ class CacheService:
             logger.warning("Failed to check cache existence: %s", e)
             return False
 
+    # ==========================================================================
+    # Check Image Cache (binary, opaque to this service)
+    # ==========================================================================
+
+    async def get_image_blob(self, key: str) -> bytes | None:
+        """Get cached image bytes.
+
+        Args:
+            key: Cache key (tenant-scoped, built by ImageCache)
+
+        Returns:
+            Stored bytes or None if not cached
+        """
+        if not await self._ensure_connected():
+            return None
+
+        try:
+            return await self._raw_redis.get(f"{self.PREFIX_IMAGE}{key}")
+        except Exception as e:
+            logger.warning("Failed to get image from cache: %s", e)
+            return None
+
+    async def set_image_blob(self, key: str, blob: bytes, ttl: timedelta) -> bool:
+        """Cache image bytes.
+
+        Args:
+            key: Cache key (tenant-scoped, built by ImageCache)
+            blob: Bytes to store (already encrypted)
+            ttl: Cache TTL
+
+        Returns:
+            True if cached successfully
+        """
+        if not await self._ensure_connected():
+            return False
+
+        try:
+            await self._raw_redis.set(f"{self.PREFIX_IMAGE}{key}", blob, ex=ttl)
+            return True
+        except Exception as e:
+            logger.warning("Failed to cache image: %s", e)
+            return False
+
     # ==========================================================================
     # Audit Packet Cache (with tenant/user ownership enforcement)
     # ==========================================================================
 
+    def _audit_packet_keys(self, packet_id: str) -> tuple[str, str]:
+        """(metadata hash key, data list key) for a packet."""
+        key = f"{self.PREFIX_AUDIT_PACKET}{packet_id}"
+        return key, f"{key}{self.SUFFIX_AUDIT_PACKET_DATA}"
+
     async def store_audit_packet(
         self,
         packet_id: str,
@@ -499,6 +682,10 @@ class CacheService:
         SECURITY: Packets are stored with tenant_id and user_id binding.
         On retrieval, both must match to prevent cross-tenant/cross-user access.
 
+        The bytes are written as a list of AUDIT_PACKET_CHUNK_SIZE chunks and
+        the metadata hash in the same transaction, so a packet whose metadata
+        exists always has all of its data.
+
         Args:
             packet_id: Unique packet identifier (UUID)
             pdf_bytes: PDF content bytes
@@ -514,23 +701,35 @@ class CacheService:
             return False
 
         try:
-            key = f"{self.PREFIX_AUDIT_PACKET}{packet_id}"
+            meta_key, data_key = self._audit_packet_keys(packet_id)
             ttl = ttl or self.TTL_AUDIT_PACKET
+            view = memoryview(pdf_bytes)
+            chunk_size = self.AUDIT_PACKET_CHUNK_SIZE
+            chunks = [view[i : i + chunk_size] for i in range(0, len(view), chunk_size)]
+
+            async with self._raw_redis.pipeline(transaction=True) as pipe:
+                pipe.delete(meta_key, data_key)
+                for chunk in chunks:
+                    pipe.rpush(data_key, bytes(chunk))
+                pipe.hset(
+                    meta_key,
+                    mapping={
+                        "tenant_id": tenant_id,
+                        "user_id": user_id,
+                        "check_item_id": check_item_id,
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "size": len(pdf_bytes),
+                        "chunks": len(chunks),
+                    },
+                )
+                pipe.expire(data_key, ttl)
+                pipe.expire(meta_key, ttl)
+                await pipe.execute()
 
-            # Store PDF as base64 with ownership metadata
-            # Base64 is required since Redis client uses decode_responses=True
-            packet_data = {
-                "pdf_base64": base64.b64encode(pdf_bytes).decode("ascii"),
-                "tenant_id": tenant_id,
-                "user_id": user_id,
-                "check_item_id": check_item_id,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            await self._redis.setex(key, ttl, json.dumps(packet_data))
             logger.debug(
-                "Stored audit packet %s for tenant=%s user=%s item=%s",
+                "Stored audit packet %s (%d bytes) for tenant=%s user=%s item=%s",
                 packet_id,
+                len(pdf_bytes),
                 tenant_id,
                 user_id,
                 check_item_id,
@@ -540,13 +739,13 @@ class CacheService:
             logger.error("Failed to store audit packet %s: %s", packet_id, e)
             return False
 
-    async def retrieve_audit_packet(
+    async def open_audit_packet(
         self,
         packet_id: str,
         tenant_id: str,
         user_id: str,
-    ) -> tuple[bytes | None, str | None]:
-        """Retrieve an audit packet with ownership verification.
+    ) -> dict[str, Any] | None:
+        """Look up an audit packet's metadata with ownership verification.
 
         SECURITY: Enforces that the requesting user matches the user who
         generated the packet, AND they belong to the same tenant.
@@ -556,30 +755,32 @@ class CacheService:
             tenant_id: Tenant ID of the requesting user
             user_id: User ID of the requesting user
 
+        The stored chunks are checked to be complete and the packet's TTL is
+        extended to at least AUDIT_PACKET_DOWNLOAD_GRACE, so a download
+        started from this metadata does not fail after its headers are sent.
+
         Returns:
-            Tuple of (pdf_bytes, check_item_id) if found and authorized,
-            (None, None) if not found or unauthorized.
+            Metadata dict (check_item_id, created_at, size, chunks) if found
+            and authorized, None otherwise. Read the bytes with
+            iter_audit_packet.
 
-            IMPORTANT: Returns (None, None) for BOTH "not found" and
-            "unauthorized" to prevent information disclosure about
-            which packets exist.
+            IMPORTANT: Returns None for BOTH "not found" and "unauthorized"
+            to prevent information disclosure about which packets exist.
         """
         if not await self._ensure_connected():
-            return None, None
+            return None
 
         try:
-            key = f"{self.PREFIX_AUDIT_PACKET}{packet_id}"
-            data = await self._redis.get(key)
+            meta_key, _ = self._audit_packet_keys(packet_id)
+            meta = await self._redis.hgetall(meta_key)
 
-            if not data:
+            if not meta:
                 logger.debug("Audit packet %s not found in cache", packet_id)
-                return None, None
-
-            packet_data = json.loads(data)
+                return None
 
             # CRITICAL: Verify ownership - must match BOTH tenant AND user
-            stored_tenant_id = packet_data.get("tenant_id")
-            stored_user_id = packet_data.get("user_id")
+            stored_tenant_id = meta.get("tenant_id")
+            stored_user_id = meta.get("user_id")
 
             if stored_tenant_id != tenant_id:
                 logger.warning(
@@ -589,7 +790,7 @@ class CacheService:
                     stored_tenant_id,
                     tenant_id,
                 )
-                return None, None
+                return None
 
             if stored_user_id != user_id:
                 logger.warning(
@@ -599,20 +800,89 @@ class CacheService:
                     stored_user_id,
                     user_id,
                 )
-                return None, None
+                return None
+
+            chunks = int(meta["chunks"])
+            _, data_key = self._audit_packet_keys(packet_id)
+            async with self._raw_redis.pipeline(transaction=False) as pipe:
+                pipe.llen(data_key)
+                pipe.ttl(data_key)
+                stored_chunks, remaining = await pipe.execute()
+
+            if stored_chunks != chunks:
+                logger.warning(
+                    "Audit packet %s incomplete: %d of %d chunks stored",
+                    packet_id,
+                    stored_chunks,
+                    chunks,
+                )
+                return None
 
-            # Ownership verified - decode and return PDF
-            pdf_bytes = base64.b64decode(packet_data["pdf_base64"])
-            check_item_id = packet_data.get("check_item_id")
+            grace = int(self.AUDIT_PACKET_DOWNLOAD_GRACE.total_seconds())
+            if 0 <= remaining < grace:
+                async with self._raw_redis.pipeline(transaction=True) as pipe:
+                    pipe.expire(meta_key, grace)
+                    pipe.expire(data_key, grace)
+                    await pipe.execute()
 
             logger.debug(
-                "Retrieved audit packet %s for tenant=%s user=%s",
+                "Opened audit packet %s for tenant=%s user=%s",
                 packet_id,
                 tenant_id,
                 user_id,
             )
-            return pdf_bytes, check_item_id
+            return {
+                "check_item_id": meta.get("check_item_id"),
+                "created_at": meta.get("created_at"),
+                "size": int(meta["size"]),
+                "chunks": chunks,
+            }
+
+        except Exception as e:
+            logger.error("Failed to open audit packet %s: %s", packet_id, e)
+            return None
+
+    async def iter_audit_packet(self, packet_id: str, chunks: int) -> AsyncIterator[bytes]:
+        """Yield a packet's bytes one chunk at a time.
+
+        Only call this with the chunk count from open_audit_packet, which
+        performs the ownership check and validates the stored data.
 
+        Raises:
+            LookupError: If the packet is deleted mid-stream (the client sees
+                a response shorter than its Content-Length)
+        """
+        _, data_key = self._audit_packet_keys(packet_id)
+        for index in range(chunks):
+            chunk = await self._raw_redis.lindex(data_key, index)
+            if chunk is None:
+                raise LookupError(f"Audit packet {packet_id} expired while streaming")
+            yield chunk
+
+    async def retrieve_audit_packet(
+        self,
+        packet_id: str,
+        tenant_id: str,
+        user_id: str,
+    ) -> tuple[bytes | None, str | None]:
+        """Retrieve a whole audit packet with ownership verification.
+
+        Prefer open_audit_packet + iter_audit_packet, which do not hold the
+        full packet in memory.
+
+        Returns:
+            Tuple of (pdf_bytes, check_item_id) if found and authorized,
+            (None, None) if not found or unauthorized.
+        """
+        meta = await self.open_audit_packet(packet_id, tenant_id, user_id)
+        if meta is None:
+            return None, None
+
+        try:
+            buffer = bytearray()
+            async for chunk in self.iter_audit_packet(packet_id, meta["chunks"]):
+                buffer.extend(chunk)
+            return bytes(buffer), meta["check_item_id"]
         except Exception as e:
             logger.error("Failed to retrieve audit packet %s: %s", packet_id, e)
             return None, None
@@ -630,8 +900,7 @@ class CacheService:
             return False
 
         try:
-            key = f"{self.PREFIX_AUDIT_PACKET}{packet_id}"
-            await self._redis.delete(key)
+            await self._redis.delete(*self._audit_packet_keys(packet_id))
             return True
         except Exception as e:
             logger.warning("Failed to delete audit packet %s: %s", packet_id, e)
@@ -1,15 +1,43 @@
 """Check item service."""
 
+import asyncio
 import json
+import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-
-from sqlalchemy import and_, func, or_, select
+from uuid import uuid4
+
+from sqlalchemy import (
+    String,
+    and_,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
+from app.core.metrics import sync_stage_duration_seconds
+from app.db.pagination import (
+    CountMode,
+    KeysetPage,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+)
 from app.integrations.adapters.factory import get_adapter
+from app.integrations.interfaces.base import PresentedItem
 from app.models.check import AccountType, CheckImage, CheckItem, CheckStatus, RiskLevel
 from app.schemas.check import (
     AccountContextResponse,
@@ -21,6 +49,63 @@ from app.schemas.check import (
     CheckItemResponse,
     CheckSearchRequest,
 )
+from app.services.rollup_service import ItemState, RollupDeltas
+
+logger = logging.getLogger(__name__)
+
+# CheckBehaviorStats fields copied verbatim onto new CheckItems
+_BEHAVIOR_STAT_FIELDS = (
+    "avg_check_amount_30d",
+    "avg_check_amount_90d",
+    "avg_check_amount_365d",
+    "check_std_dev_30d",
+    "max_check_amount_90d",
+    "check_frequency_30d",
+    "returned_item_count_90d",
+    "exception_count_90d",
+)
+
+# Check search sort key (descending); id breaks ties so keyset cursors are unique
+SEARCH_ORDER = (CheckItem.priority, CheckItem.presented_date, CheckItem.id)
+
+
+@dataclass
+class PresentedItemSyncStats:
+    """Throughput and per-stage timings for a presented item sync run."""
+
+    fetched: int = 0
+    created: int = 0
+    duplicates: int = 0
+    accounts_loaded: int = 0
+    elapsed_seconds: float = 0.0
+    stage_seconds: dict[str, float] = field(
+        default_factory=lambda: {"fetch": 0.0, "dedupe": 0.0, "context": 0.0, "insert": 0.0}
+    )
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Accumulate time spent in a pipeline stage."""
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    @property
+    def items_per_second(self) -> float:
+        """Fetched items processed per second of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.fetched / self.elapsed_seconds
+
+    def to_dict(self) -> dict:
+        """Serialize for API responses and logs."""
+        return {
+            "fetched": self.fetched,
+            "created": self.created,
+            "duplicates": self.duplicates,
+            "accounts_loaded": self.accounts_loaded,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "items_per_second": round(self.items_per_second, 1),
+            "stage_seconds": {
+                stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()
+            },
+        }
 
 
 class CheckService:
@@ -48,6 +133,50 @@ class CheckService:
             date_from: Start date for sync (default: last 24 hours)
             date_to: End date for sync (default: now)
             amount_min: Minimum amount threshold (default: dual control threshold)
+
+        Returns:
+            Number of check items created
+        """
+        stats = await self.ingest_presented_items(
+            tenant_id=tenant_id,
+            date_from=date_from,
+            date_to=date_to,
+            amount_min=amount_min,
+        )
+        return stats.created
+
+    async def ingest_presented_items(
+        self,
+        tenant_id: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        amount_min: Decimal | None = None,
+        page_size: int | None = None,
+        chunk_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> PresentedItemSyncStats:
+        """
+        Stream presented items from the adapter into check_items in bulk.
+
+        Items are pulled from the adapter one page at a time. Each page is
+        deduplicated with a single set-based query, account context and
+        behavior stats are fetched once per distinct account (bounded
+        concurrency), and rows are bulk-inserted in chunks with
+        ON CONFLICT DO NOTHING on (tenant_id, external_item_id) so a
+        concurrent sync cannot create duplicates. Each page is committed
+        before the next one is fetched.
+
+        Args:
+            tenant_id: Required tenant ID for multi-tenant isolation
+            date_from: Start date for sync (default: last 24 hours)
+            date_to: End date for sync (default: now)
+            amount_min: Minimum amount threshold (default: dual control threshold)
+            page_size: Items requested from the adapter per page
+            chunk_size: Rows per bulk INSERT statement
+            concurrency: Maximum concurrent account context lookups
+
+        Returns:
+            PresentedItemSyncStats with counts, items/sec and per-stage timings
         """
         if not tenant_id:
             raise ValueError("tenant_id is required for multi-tenant isolation")
@@ -59,115 +188,245 @@ class CheckService:
         if amount_min is None:
             amount_min = Decimal(settings.DUAL_CONTROL_THRESHOLD)
 
-        items, total = await self.adapter.get_presented_items(
-            date_from=date_from,
-            date_to=date_to,
-            amount_min=amount_min,
-        )
+        page_size = page_size or settings.SYNC_PAGE_SIZE
+        chunk_size = chunk_size or settings.SYNC_INSERT_CHUNK_SIZE
+        concurrency = concurrency or settings.SYNC_CONTEXT_CONCURRENCY
+
+        stats = PresentedItemSyncStats()
+        started = time.perf_counter()
+
+        # account_id -> (AccountContext, CheckBehaviorStats), shared across pages
+        account_cache: dict[str, tuple] = {}
+        seen_ids: set[str] = set()
+        offset = 0
+
+        while True:
+            stage_start = time.perf_counter()
+            items, total = await self.adapter.get_presented_items(
+                date_from=date_from,
+                date_to=date_to,
+                amount_min=amount_min,
+                limit=page_size,
+                offset=offset,
+            )
+            stats.record_stage("fetch", time.perf_counter() - stage_start)
 
-        created_count = 0
+            if not items:
+                break
 
-        for item in items:
-            # Check if item already exists within this tenant
-            existing = await self.db.execute(
-                select(CheckItem).where(
-                    CheckItem.tenant_id == tenant_id,
-                    CheckItem.external_item_id == item.external_item_id,
+            offset += len(items)
+            stats.fetched += len(items)
+
+            stage_start = time.perf_counter()
+            new_items = await self._filter_new_items(tenant_id, items, seen_ids)
+            stats.duplicates += len(items) - len(new_items)
+            stats.record_stage("dedupe", time.perf_counter() - stage_start)
+
+            if new_items:
+                stage_start = time.perf_counter()
+                stats.accounts_loaded += await self._load_account_context(
+                    {item.account_id for item in new_items}, account_cache, concurrency
                 )
-            )
-            if existing.scalar_one_or_none():
+                stats.record_stage("context", time.perf_counter() - stage_start)
+
+                stage_start = time.perf_counter()
+                for i in range(0, len(new_items), chunk_size):
+                    created = await self._insert_presented_chunk(
+                        tenant_id, new_items[i : i + chunk_size], account_cache
+                    )
+                    stats.created += created
+                    stats.duplicates += len(new_items[i : i + chunk_size]) - created
+                await self.db.commit()
+                stats.record_stage("insert", time.perf_counter() - stage_start)
+
+            if offset >= total:
+                break
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        for stage, seconds in stats.stage_seconds.items():
+            sync_stage_duration_seconds.labels(stage=stage).observe(seconds)
+
+        logger.info(
+            "Presented item sync for tenant %s: fetched=%d created=%d duplicates=%d "
+            "accounts=%d elapsed=%.2fs (%.1f items/sec) stages=%s",
+            tenant_id,
+            stats.fetched,
+            stats.created,
+            stats.duplicates,
+            stats.accounts_loaded,
+            stats.elapsed_seconds,
+            stats.items_per_second,
+            {stage: round(seconds, 3) for stage, seconds in stats.stage_seconds.items()},
+        )
+        return stats
+
+    async def _filter_new_items(
+        self, tenant_id: str, items: list[PresentedItem], seen_ids: set[str]
+    ) -> list[PresentedItem]:
+        """Drop items that already exist for the tenant with one set-based query."""
+        candidates = []
+        for item in items:
+            if item.external_item_id in seen_ids:
                 continue
+            seen_ids.add(item.external_item_id)
+            candidates.append(item)
+
+        if not candidates:
+            return []
 
-            # Get account context
-            account_context = await self.adapter.get_account_context(item.account_id)
-            behavior_stats = await self.adapter.get_check_behavior_stats(item.account_id)
+        result = await self.db.execute(
+            select(CheckItem.external_item_id).where(
+                CheckItem.tenant_id == tenant_id,
+                CheckItem.external_item_id.in_([item.external_item_id for item in candidates]),
+            )
+        )
+        existing = set(result.scalars().all())
+        return [item for item in candidates if item.external_item_id not in existing]
+
+    async def _load_account_context(
+        self, account_ids: set[str], account_cache: dict[str, tuple], concurrency: int
+    ) -> int:
+        """Fetch account context and behavior stats once per account, concurrently."""
+        missing = [account_id for account_id in account_ids if account_id not in account_cache]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(account_id: str) -> None:
+            async with semaphore:
+                account_cache[account_id] = await asyncio.gather(
+                    self.adapter.get_account_context(account_id),
+                    self.adapter.get_check_behavior_stats(account_id),
+                )
+
+        await asyncio.gather(*(fetch(account_id) for account_id in missing))
+        return len(missing)
+
+    async def _insert_presented_chunk(
+        self,
+        tenant_id: str,
+        items: list[PresentedItem],
+        account_cache: dict[str, tuple],
+    ) -> int:
+        """Bulk insert one chunk of check items and their image references.
+
+        Returns:
+            Number of check items actually inserted (conflicts are skipped)
+        """
+        now = datetime.now(timezone.utc)
+        threshold = Decimal(settings.DUAL_CONTROL_THRESHOLD)
+        rows = []
+
+        for item in items:
+            account_context, behavior_stats = account_cache.get(item.account_id, (None, None))
 
             # Determine risk level based on amount and context
             risk_level = self._calculate_risk_level(item, account_context, behavior_stats)
 
-            # Check if dual control is required
-            requires_dual_control = item.amount >= Decimal(settings.DUAL_CONTROL_THRESHOLD)
-
             # Calculate SLA due time
             sla_hours = settings.DEFAULT_SLA_HOURS
             if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
                 sla_hours = 2
-            sla_due_at = datetime.now(timezone.utc) + timedelta(hours=sla_hours)
-
-            # Create check item with tenant isolation
-            check_item = CheckItem(
-                tenant_id=tenant_id,
-                external_item_id=item.external_item_id,
-                source_system=item.source_system,
-                # Fiserv Director compatibility fields
-                batch_id=item.batch_id,
-                captured_at=item.captured_at,
-                source_status=item.source_status,
-                item_type_code=item.item_type_code,
-                # Account and check details
-                account_id=item.account_id,
-                account_number_masked=item.account_number_masked,
-                account_type=AccountType(item.account_type),
-                routing_number=item.routing_number,
-                check_number=item.check_number,
-                amount=item.amount,
-                currency=item.currency,
-                payee_name=item.payee_name,
-                memo=item.memo,
-                micr_line=item.micr_line,
-                micr_account=item.micr_account,
-                micr_routing=item.micr_routing,
-                micr_check_number=item.micr_check_number,
-                presented_date=item.presented_date,
-                check_date=item.check_date,
-                status=CheckStatus.NEW,
-                risk_level=risk_level,
-                priority=self._calculate_priority(item.amount, risk_level),
-                requires_dual_control=requires_dual_control,
-                sla_due_at=sla_due_at,
-                risk_flags=json.dumps(item.upstream_flags) if item.upstream_flags else None,
-                upstream_flags=json.dumps(item.upstream_flags) if item.upstream_flags else None,
+
+            upstream_flags = json.dumps(item.upstream_flags) if item.upstream_flags else None
+
+            rows.append(
+                {
+                    "id": str(uuid4()),
+                    "tenant_id": tenant_id,
+                    "external_item_id": item.external_item_id,
+                    "source_system": item.source_system,
+                    # Fiserv Director compatibility fields
+                    "batch_id": item.batch_id,
+                    "captured_at": item.captured_at,
+                    "source_status": item.source_status,
+                    "item_type_code": item.item_type_code,
+                    # Account and check details
+                    "account_id": item.account_id,
+                    "account_number_masked": item.account_number_masked,
+                    "account_type": AccountType(item.account_type),
+                    "routing_number": item.routing_number,
+                    "check_number": item.check_number,
+                    "amount": item.amount,
+                    "currency": item.currency,
+                    "payee_name": item.payee_name,
+                    "memo": item.memo,
+                    "micr_line": item.micr_line,
+                    "micr_account": item.micr_account,
+                    "micr_routing": item.micr_routing,
+                    "micr_check_number": item.micr_check_number,
+                    "presented_date": item.presented_date,
+                    "check_date": item.check_date,
+                    "status": CheckStatus.NEW,
+                    "risk_level": risk_level,
+                    "priority": self._calculate_priority(item.amount, risk_level),
+                    "requires_dual_control": item.amount >= threshold,
+                    "sla_due_at": now + timedelta(hours=sla_hours),
+                    "risk_flags": upstream_flags,
+                    "upstream_flags": upstream_flags,
+                    # Account context
+                    "account_tenure_days": (
+                        account_context.account_tenure_days if account_context else None
+                    ),
+                    "current_balance": account_context.current_balance if account_context else None,
+                    "average_balance_30d": (
+                        account_context.average_balance_30d if account_context else None
+                    ),
+                    "relationship_id": account_context.relationship_id if account_context else None,
+                    # Behavior stats
+                    **{
+                        field_name: getattr(behavior_stats, field_name) if behavior_stats else None
+                        for field_name in _BEHAVIOR_STAT_FIELDS
+                    },
+                }
             )
 
-            # Add account context
-            if account_context:
-                check_item.account_tenure_days = account_context.account_tenure_days
-                check_item.current_balance = account_context.current_balance
-                check_item.average_balance_30d = account_context.average_balance_30d
-                check_item.relationship_id = account_context.relationship_id
-
-            if behavior_stats:
-                check_item.avg_check_amount_30d = behavior_stats.avg_check_amount_30d
-                check_item.avg_check_amount_90d = behavior_stats.avg_check_amount_90d
-                check_item.avg_check_amount_365d = behavior_stats.avg_check_amount_365d
-                check_item.check_std_dev_30d = behavior_stats.check_std_dev_30d
-                check_item.max_check_amount_90d = behavior_stats.max_check_amount_90d
-                check_item.check_frequency_30d = behavior_stats.check_frequency_30d
-                check_item.returned_item_count_90d = behavior_stats.returned_item_count_90d
-                check_item.exception_count_90d = behavior_stats.exception_count_90d
-
-            # Create image references
-            if item.front_image_id:
-                front_image = CheckImage(
-                    check_item=check_item,
-                    image_type="front",
-                    external_image_id=item.front_image_id,
-                )
-                self.db.add(front_image)
+        result = await self.db.execute(
+            pg_insert(CheckItem)
+            .on_conflict_do_nothing(index_elements=["tenant_id", "external_item_id"])
+            .returning(CheckItem.id, CheckItem.external_item_id),
+            rows,
+        )
+        inserted = {external_item_id: item_id for item_id, external_item_id in result.all()}
 
-            if item.back_image_id:
-                back_image = CheckImage(
-                    check_item=check_item,
-                    image_type="back",
-                    external_image_id=item.back_image_id,
-                )
-                self.db.add(back_image)
+        image_rows = []
+        for item in items:
+            check_item_id = inserted.get(item.external_item_id)
+            if check_item_id is None:
+                continue
+            for image_type, external_image_id in (
+                ("front", item.front_image_id),
+                ("back", item.back_image_id),
+            ):
+                if external_image_id:
+                    image_rows.append(
+                        {
+                            "id": str(uuid4()),
+                            "check_item_id": check_item_id,
+                            "image_type": image_type,
+                            "external_image_id": external_image_id,
+                        }
+                    )
 
-            self.db.add(check_item)
-            created_count += 1
+        if image_rows:
+            await self.db.execute(insert(CheckImage), image_rows)
+
+        # Core inserts bypass the ORM flush listener, so record rollups here
+        deltas = RollupDeltas()
+        for row in rows:
+            if row["external_item_id"] in inserted:
+                deltas.add_item(
+                    ItemState.of(
+                        tenant_id,
+                        None,
+                        row["presented_date"],
+                        row["status"],
+                        row["risk_level"],
+                        False,
+                    ),
+                    1,
+                )
+        await deltas.apply_async(self.db)
 
-        await self.db.commit()
-        return created_count
+        return len(inserted)
 
     def _calculate_risk_level(self, item, account_context, behavior_stats) -> RiskLevel:
         """Calculate risk level based on item and context."""
@@ -599,6 +858,74 @@ class CheckService:
             page: Page number
             page_size: Items per page
         """
+        query = self._search_query(search, tenant_id)
+
+        # Get total count
+        total, _ = await count_rows(self.db, query)
+
+        # Apply pagination and ordering
+        query = query.order_by(*(column.desc() for column in SEARCH_ORDER))
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+        result = await self.db.execute(query)
+        items = result.scalars().all()
+
+        return self._build_list_responses(items, user_id), total
+
+    async def search_items_keyset(
+        self,
+        search: CheckSearchRequest,
+        user_id: str,
+        tenant_id: str,
+        cursor: str | None = None,
+        page_size: int = 20,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> KeysetPage[CheckItemListResponse]:
+        """Search check items, resuming after a cursor instead of an offset.
+
+        Same filters and ordering as search_items; cost per page does not
+        grow with depth.
+
+        Args:
+            search: Search criteria
+            user_id: The requesting user's ID (for user-bound signed URLs)
+            tenant_id: Required for multi-tenant isolation
+            cursor: next_cursor of the previous page (None for the first page)
+            page_size: Items per page
+            count_mode: Exact, capped or no total count
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        query = self._search_query(search, tenant_id)
+        total, total_is_estimate = await count_rows(self.db, query, count_mode)
+
+        if cursor:
+            values = decode_cursor(cursor, int, datetime.fromisoformat, str)
+            query = query.where(keyset_after(SEARCH_ORDER, values))
+        query = query.order_by(*(column.desc() for column in SEARCH_ORDER))
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(query.limit(page_size + 1))
+        items = list(result.scalars().all())
+        has_next = len(items) > page_size
+        items = items[:page_size]
+
+        next_cursor = None
+        if has_next:
+            last = items[-1]
+            next_cursor = encode_cursor(last.priority, last.presented_date, last.id)
+
+        return KeysetPage(
+            items=self._build_list_responses(items, user_id),
+            total=total,
+            total_is_estimate=total_is_estimate,
+            has_next=has_next,
+            next_cursor=next_cursor,
+        )
+
+    def _search_query(self, search: CheckSearchRequest, tenant_id: str):
+        """Build the filtered (unordered) check item search query."""
         query = select(CheckItem).options(selectinload(CheckItem.images))
 
         # Apply filters - always filter by tenant_id first (CRITICAL for security)
@@ -653,22 +980,12 @@ class CheckService:
         # Always apply conditions (tenant_id is always included)
         query = query.where(and_(*conditions))
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-
-        # Apply pagination and ordering
-        query = query.order_by(
-            CheckItem.priority.desc(),
-            CheckItem.presented_date.desc(),
-        )
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self.db.execute(query)
-        items = result.scalars().all()
+        return query
 
-        # Build response
+    def _build_list_responses(
+        self, items: list[CheckItem], user_id: str
+    ) -> list[CheckItemListResponse]:
+        """Build list responses with user-bound thumbnail URLs."""
         responses = []
         for item in items:
             # Get thumbnail URL for first front image (user-bound)
@@ -708,7 +1025,7 @@ class CheckService:
                 )
             )
 
-        return responses, total
+        return responses
 
     async def get_check_history(
         self,
@@ -770,11 +1087,18 @@ class CheckService:
         tenant_id: str,
         status: list[CheckStatus] | None = None,
         risk_level: list[RiskLevel] | None = None,
+        prefetch: int = 0,
     ) -> dict:
         """Get IDs of adjacent items in queue for navigation.
 
-        Returns previous and next item IDs based on priority/date ordering,
-        allowing reviewers to navigate directly between items.
+        Returns previous and next item IDs based on the search ordering
+        (priority, presented_date, id - all descending), allowing reviewers
+        to navigate directly between items.
+
+        Everything is answered by one statement: keyset probes before and
+        after the current item's sort key (which need not match the filters,
+        e.g. right after it was decided) plus the position and total counts,
+        combined with UNION ALL.
 
         Args:
             item_id: Current item ID
@@ -782,19 +1106,8 @@ class CheckService:
             tenant_id: Required for multi-tenant isolation
             status: Filter by statuses (default: reviewable statuses)
             risk_level: Filter by risk levels (optional)
+            prefetch: Number of upcoming item IDs to return in next_ids
         """
-        # Get the current item first
-        result = await self.db.execute(
-            select(CheckItem).where(
-                CheckItem.id == item_id,
-                CheckItem.tenant_id == tenant_id,
-            )
-        )
-        current_item = result.scalar_one_or_none()
-
-        if not current_item:
-            return {"previous_id": None, "next_id": None, "position": 0, "total": 0}
-
         # Build base conditions
         conditions = [CheckItem.tenant_id == tenant_id]
 
@@ -804,87 +1117,73 @@ class CheckService:
         if risk_level:
             conditions.append(CheckItem.risk_level.in_(risk_level))
 
-        # Get total count
-        count_query = select(func.count()).where(and_(*conditions))
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Find items with higher priority (previous in the queue)
-        # Items are ordered by priority DESC, presented_date DESC
-        # "Previous" = higher priority or same priority with later date
-        prev_conditions = conditions + [
-            or_(
-                CheckItem.priority > current_item.priority,
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date > current_item.presented_date,
-                ),
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date == current_item.presented_date,
-                    CheckItem.id < current_item.id,  # Tie-breaker
-                ),
-            )
-        ]
-        prev_query = (
-            select(CheckItem.id)
-            .where(and_(*prev_conditions))
-            .order_by(CheckItem.priority.asc(), CheckItem.presented_date.asc())
-            .limit(1)
+        current = (
+            select(*SEARCH_ORDER)
+            .where(CheckItem.id == item_id, CheckItem.tenant_id == tenant_id)
+            .cte("current_item")
         )
-        prev_result = await self.db.execute(prev_query)
-        prev_id = prev_result.scalar_one_or_none()
-
-        # Find items with lower priority (next in the queue)
-        # "Next" = lower priority or same priority with earlier date
-        next_conditions = conditions + [
-            or_(
-                CheckItem.priority < current_item.priority,
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date < current_item.presented_date,
-                ),
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date == current_item.presented_date,
-                    CheckItem.id > current_item.id,  # Tie-breaker
-                ),
+        item_key = tuple_(*SEARCH_ORDER)
+        current_key = tuple_(*(current.c[column.key] for column in SEARCH_ORDER))
+
+        def probe(kind: str, *criteria, order=None, limit=None):
+            query = (
+                select(literal(kind).label("kind"), CheckItem.id.label("item_id"))
+                .join(current, true())
+                .where(*conditions, *criteria)
             )
-        ]
-        next_query = (
-            select(CheckItem.id)
-            .where(and_(*next_conditions))
-            .order_by(CheckItem.priority.desc(), CheckItem.presented_date.desc())
-            .limit(1)
-        )
-        next_result = await self.db.execute(next_query)
-        next_id = next_result.scalar_one_or_none()
-
-        # Calculate position (1-indexed)
-        position_conditions = conditions + [
-            or_(
-                CheckItem.priority > current_item.priority,
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date > current_item.presented_date,
+            if order is not None:
+                query = query.order_by(*order).limit(limit)
+            return select(query.subquery())
+
+        def counter(kind: str, *criteria, join_current: bool = True):
+            query = select(literal(kind).label("kind"), cast(func.count(), String).label("item_id"))
+            query = query.select_from(CheckItem)
+            if join_current:
+                query = query.join(current, true())
+            return query.where(*conditions, *criteria)
+
+        rows = await self.db.execute(
+            union_all(
+                select(literal("current").label("kind"), current.c.id.label("item_id")),
+                # "Previous" = earlier in the ordering (sort key greater than the current item's)
+                probe(
+                    "previous",
+                    item_key > current_key,
+                    order=[column.asc() for column in SEARCH_ORDER],
+                    limit=1,
                 ),
-                and_(
-                    CheckItem.priority == current_item.priority,
-                    CheckItem.presented_date == current_item.presented_date,
-                    CheckItem.id <= current_item.id,
+                probe(
+                    "next",
+                    item_key < current_key,
+                    order=[column.desc() for column in SEARCH_ORDER],
+                    limit=max(prefetch, 1),
                 ),
+                counter("position", item_key >= current_key),
+                counter("total", join_current=False),
             )
-        ]
-        position_query = select(func.count()).where(and_(*position_conditions))
-        position_result = await self.db.execute(position_query)
-        position = position_result.scalar() or 1
+        )
 
-        return {
-            "previous_id": prev_id,
-            "next_id": next_id,
-            "position": position,
-            "total": total,
-        }
+        found = False
+        next_ids: list[str] = []
+        adjacent = {"previous_id": None, "next_id": None, "position": 0, "total": 0}
+        for kind, value in rows.all():
+            if kind == "current":
+                found = True
+            elif kind == "previous":
+                adjacent["previous_id"] = value
+            elif kind == "next":
+                next_ids.append(value)
+            else:
+                adjacent[kind] = int(value)
+
+        if not found:
+            return {"previous_id": None, "next_id": None, "position": 0, "total": 0, "next_ids": []}
+
+        adjacent["next_id"] = next_ids[0] if next_ids else None
+        adjacent["next_ids"] = next_ids[:prefetch]
+        # Position is 1-indexed
+        adjacent["position"] = adjacent["position"] or 1
+        return adjacent
 
     async def update_status(
         self,
@@ -0,0 +1,90 @@
+"""
+Streaming CSV exports.
+
+Exports can cover a year of activity, so rows are never collected into a
+list or a single string. Endpoints stream the query with a server-side
+cursor (AsyncSession.stream / stream_scalars with yield_per) in a session
+of their own - the request session is closed before a StreamingResponse
+body runs - and hand the rows to csv_response, which encodes them in
+chunks of roughly CSV_CHUNK_BYTES, optionally gzip-compressed.
+"""
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+# Rows fetched per server-side cursor round trip
+EXPORT_BATCH_SIZE = 1000
+
+# Approximate size of each chunk written to the response
+CSV_CHUNK_BYTES = 64 * 1024
+
+
+async def iter_csv(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV, yielding UTF-8 (or gzip) chunks.
+
+    Args:
+        header: Column names written as the first row
+        rows: Row values, one sequence per row
+        compress: Gzip the output
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # wbits=31: zlib stream with a gzip header and trailer
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def drain(final: bool = False) -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        if compressor is not None:
+            data = compressor.compress(data)
+            if final:
+                data += compressor.flush()
+        return data
+
+    writer.writerow(header)
+    async for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CSV_CHUNK_BYTES:
+            chunk = drain()
+            if chunk:
+                yield chunk
+
+    chunk = drain(final=True)
+    if chunk:
+        yield chunk
+
+
+def csv_response(
+    filename: str,
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    compress: bool = False,
+) -> StreamingResponse:
+    """Build a streaming CSV attachment response.
+
+    Args:
+        filename: Attachment name, without extension
+        header: Column names
+        rows: Row values; consumed while the response is sent
+        compress: Send a .csv.gz file instead of plain CSV
+    """
+    if compress:
+        filename, media_type = f"{filename}.csv.gz", "application/gzip"
+    else:
+        filename, media_type = f"{filename}.csv", "text/csv"
+
+    return StreamingResponse(
+        iter_csv(header, rows, compress=compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -5,7 +5,7 @@ from decimal import Decimal
 
 from app.models.check import CheckItem
 from app.models.queue import ApprovalEntitlement, ApprovalEntitlementType
-from app.models.user import User
+from app.services.principal_cache import Principal
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -51,14 +51,14 @@ class EntitlementService:
 
     async def get_user_entitlements(
         self,
-        user: User,
+        user: Principal,
         entitlement_type: ApprovalEntitlementType,
     ) -> list[ApprovalEntitlement]:
         """Get all active entitlements for a user (direct + role-based)."""
         now = datetime.now(timezone.utc)
 
         # Get role IDs for user
-        role_ids = [role.id for role in user.roles] if user.roles else []
+        role_ids = list(user.role_ids)
 
         # Build query for user's entitlements (direct or via role)
         conditions = [
@@ -89,7 +89,7 @@ class EntitlementService:
 
     async def check_review_entitlement(
         self,
-        user: User,
+        user: Principal,
         check_item: CheckItem,
     ) -> EntitlementCheckResult:
         """Check if user can make a review recommendation for this item."""
@@ -102,7 +102,7 @@ class EntitlementService:
         if not entitlements:
             # No explicit entitlements - check basic permissions
             # By default, users with "review" permission can review
-            if any(p.name == "review" for r in (user.roles or []) for p in (r.permissions or [])):
+            if "review" in user.permission_names:
                 return EntitlementCheckResult(allowed=True)
             return EntitlementCheckResult(
                 allowed=False,
@@ -114,7 +114,7 @@ class EntitlementService:
 
     async def check_approval_entitlement(
         self,
-        user: User,
+        user: Principal,
         check_item: CheckItem,
     ) -> EntitlementCheckResult:
         """
@@ -139,7 +139,7 @@ class EntitlementService:
 
     async def check_override_entitlement(
         self,
-        user: User,
+        user: Principal,
         check_item: CheckItem,
     ) -> EntitlementCheckResult:
         """Check if user can override policy for this item."""
@@ -246,7 +246,7 @@ class EntitlementService:
         # All checks passed
         return EntitlementCheckResult(allowed=True, entitlement_id=entitlement.id)
 
-    async def get_max_approval_amount(self, user: User) -> Decimal | None:
+    async def get_max_approval_amount(self, user: Principal) -> Decimal | None:
         """Get the maximum amount a user can approve (across all entitlements)."""
         entitlements = await self.get_user_entitlements(user, ApprovalEntitlementType.APPROVE)
 
@@ -259,7 +259,7 @@ class EntitlementService:
 
         return max(max_amounts)
 
-    async def get_entitlement_summary(self, user: User) -> dict:
+    async def get_entitlement_summary(self, user: Principal) -> dict:
         """Get a summary of user's entitlements for UI display."""
         review_entitlements = await self.get_user_entitlements(user, ApprovalEntitlementType.REVIEW)
         approve_entitlements = await self.get_user_entitlements(
@@ -0,0 +1,207 @@
+"""
+Tenant-scoped cache of check image bytes in front of the integration adapter.
+
+Reviewers flip between the front, back and thumbnail of the same items, and
+without a cache every view goes back to the adapter: a connector round trip
+plus decode, or a PIL redraw with MockAdapter. Images are cached in two tiers:
+
+1. In-process LRU, bounded by total bytes (per worker, no round trip)
+2. Redis via CacheService, encrypted with core.encryption. The cache key is
+   the associated data, so a stored blob only decrypts for the tenant and
+   image it was written for.
+
+Entries live IMAGE_CACHE_TTL_SECONDS in both tiers, by default as long as a
+signed image URL. Only the bytes are cached: callers still check access and
+write the audit log on every request.
+"""
+
+import asyncio
+import json
+import logging
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from app.core.config import settings
+from app.core.encryption import decrypt_bytes, encrypt_bytes
+from app.integrations.interfaces.base import CheckImageData, CheckImageProvider
+from app.services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+# Redis blob layout (before encryption): metadata length, JSON metadata, bytes
+_META_LENGTH = struct.Struct(">I")
+
+
+class ImageCache:
+    """Two-tier image cache: in-process LRU in front of encrypted Redis."""
+
+    def __init__(
+        self,
+        cache: CacheService | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: int | None = None,
+        use_redis: bool | None = None,
+    ):
+        self._cache = cache or cache_service
+        self._max_bytes = (
+            max_bytes if max_bytes is not None else settings.IMAGE_CACHE_MAX_MB * 1024 * 1024
+        )
+        self._ttl = ttl_seconds or settings.IMAGE_CACHE_TTL_SECONDS
+        self._use_redis = settings.IMAGE_CACHE_REDIS if use_redis is None else use_redis
+        # key -> (expires_at monotonic, CheckImageData)
+        self._local: OrderedDict[str, tuple[float, CheckImageData]] = OrderedDict()
+        self._local_bytes = 0
+        # Loads in progress, so concurrent misses for one image share a fetch
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get_image(
+        self, adapter: CheckImageProvider, tenant_id: str, image_id: str
+    ) -> CheckImageData | None:
+        """Get a full-size image, fetching it from the adapter on a miss."""
+        return await self._get(f"{tenant_id}:full:{image_id}", lambda: adapter.get_image(image_id))
+
+    async def get_thumbnail(
+        self,
+        adapter: CheckImageProvider,
+        tenant_id: str,
+        image_id: str,
+        width: int = 200,
+        height: int = 100,
+    ) -> bytes | None:
+        """Get a thumbnail, fetching it from the adapter on a miss."""
+
+        async def fetch() -> CheckImageData | None:
+            data = await adapter.get_thumbnail(image_id, width, height)
+            if data is None:
+                return None
+            return CheckImageData(
+                image_id=image_id,
+                image_type="thumbnail",
+                content=data,
+                content_type="image/png",
+                width=width,
+                height=height,
+                dpi=None,
+            )
+
+        image = await self._get(f"{tenant_id}:thumb:{width}x{height}:{image_id}", fetch)
+        return image.content if image else None
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counters and in-process tier usage."""
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "local_entries": len(self._local),
+            "local_bytes": self._local_bytes,
+        }
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier."""
+        self._local.clear()
+        self._local_bytes = 0
+
+    async def _get(
+        self, key: str, fetch: Callable[[], Awaitable[CheckImageData | None]]
+    ) -> CheckImageData | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, image = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                self.local_hits += 1
+                return image
+            self._drop_local(key)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # shield: a cancelled request must not cancel a load others await
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: str, fetch: Callable[[], Awaitable[CheckImageData | None]]
+    ) -> CheckImageData | None:
+        """Load from Redis or the adapter, and fill the tiers that missed."""
+        image = await self._get_redis(key)
+        if image is not None:
+            self.redis_hits += 1
+        else:
+            self.misses += 1
+            image = await fetch()
+            if image is None:
+                return None
+            await self._set_redis(key, image)
+
+        self._store_local(key, image)
+        return image
+
+    async def _get_redis(self, key: str) -> CheckImageData | None:
+        if not self._use_redis:
+            return None
+        blob = await self._cache.get_image_blob(key)
+        if blob is None:
+            return None
+
+        try:
+            blob = decrypt_bytes(blob, associated_data=key.encode())
+            (meta_length,) = _META_LENGTH.unpack_from(blob)
+            meta_end = _META_LENGTH.size + meta_length
+            meta = json.loads(blob[_META_LENGTH.size : meta_end])
+            return CheckImageData(content=blob[meta_end:], **meta)
+        except (ValueError, TypeError, struct.error) as e:
+            logger.warning("Discarding unreadable cached image %s: %s", key, e)
+            return None
+
+    async def _set_redis(self, key: str, image: CheckImageData) -> None:
+        if not self._use_redis or len(image.content) > settings.MAX_IMAGE_SIZE_MB * 1024 * 1024:
+            return
+
+        meta = json.dumps(
+            {
+                "image_id": image.image_id,
+                "image_type": image.image_type,
+                "content_type": image.content_type,
+                "width": image.width,
+                "height": image.height,
+                "dpi": image.dpi,
+            }
+        ).encode()
+        blob = _META_LENGTH.pack(len(meta)) + meta + image.content
+        await self._cache.set_image_blob(
+            key,
+            encrypt_bytes(blob, associated_data=key.encode()),
+            timedelta(seconds=self._ttl),
+        )
+
+    def _store_local(self, key: str, image: CheckImageData) -> None:
+        size = len(image.content)
+        if size > self._max_bytes:
+            return
+
+        self._drop_local(key)
+        self._local[key] = (time.monotonic() + self._ttl, image)
+        self._local_bytes += size
+        while self._local_bytes > self._max_bytes:
+            _, (_, evicted) = self._local.popitem(last=False)
+            self._local_bytes -= len(evicted.content)
+
+    def _drop_local(self, key: str) -> None:
+        entry = self._local.pop(key, None)
+        if entry is not None:
+            self._local_bytes -= len(entry[1].content)
+
+
+# Global image cache instance
+image_cache = ImageCache()
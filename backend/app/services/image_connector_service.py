@@ -15,6 +15,7 @@ import secrets
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
 
 import httpx
@@ -28,7 +29,7 @@ from app.models.image_connector import (
 )
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -455,8 +456,12 @@ class ImageConnectorService:
 
         # Sign with the SaaS private key
         # NOTE: In production, the SaaS has a private key that corresponds
-        # to the public key configured on each connector
-        token = jwt.encode(payload, settings.CONNECTOR_JWT_PRIVATE_KEY, algorithm="RS256")
+        # to the public key configured on each connector. The kid tells the
+        # connector which of its active keys verifies the token.
+        signing_key, algorithm = _load_signing_key(settings.CONNECTOR_JWT_PRIVATE_KEY)
+        token = jwt.encode(
+            payload, signing_key, algorithm=algorithm, headers={"kid": connector.public_key_id}
+        )
 
         return token
 
@@ -532,16 +537,54 @@ class ImageConnectorService:
         self._db.add(log_entry)
 
 
-def generate_key_pair() -> tuple:
+@lru_cache(maxsize=4)
+def _load_signing_key(private_key_pem: str) -> tuple:
     """
-    Generate a new RSA key pair.
+    Parse the connector JWT signing key once.
+
+    Passing the PEM to jwt.encode re-parses it for every token, and
+    loading an RSA private key takes tens of milliseconds.
+
+    Args:
+        private_key_pem: PEM private key (RSA, P-256 or Ed25519)
 
     Returns:
-        Tuple of (private_key_pem, public_key_pem)
+        Tuple of (private key object, JWT algorithm)
     """
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=2048, backend=default_backend()
+    private_key = serialization.load_pem_private_key(
+        private_key_pem.encode(), password=None, backend=default_backend()
     )
+    if isinstance(private_key, rsa.RSAPrivateKey):
+        return private_key, "RS256"
+    if isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(
+        private_key.curve, ec.SECP256R1
+    ):
+        return private_key, "ES256"
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return private_key, "EdDSA"
+    raise ImageConnectorError(f"Unsupported connector signing key: {type(private_key).__name__}")
+
+
+def generate_key_pair(algorithm: str = "RS256") -> tuple:
+    """
+    Generate a new key pair.
+
+    Args:
+        algorithm: JWT algorithm the key is for: RS256, ES256 or EdDSA
+
+    Returns:
+        Tuple of (private_key_pem, public_key_pem)
+    """
+    if algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
+    elif algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm == "RS256":
+        private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048, backend=default_backend()
+        )
+    else:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
 
     private_pem = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
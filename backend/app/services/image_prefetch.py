@@ -0,0 +1,160 @@
+"""
+Background image prefetch for items a reviewer is about to look at.
+
+Item responses only carry signed URLs; the bytes are fetched when the
+browser asks, so the first view of every item waits on a cold adapter
+round trip. When an item is opened or assigned, or the queue navigation
+reports the upcoming items, the front, back and thumbnail renditions are
+fetched into the image cache (app.services.image_cache) in the background.
+
+Prefetch is best effort and never delays the request that scheduled it:
+
+- fetches share a bounded number of slots per worker
+  (IMAGE_PREFETCH_CONCURRENCY)
+- each tenant has a token bucket of IMAGE_PREFETCH_TENANT_PER_MINUTE
+  fetches; over budget, work is dropped rather than queued
+- a reviewer's look-ahead batch replaces their previous one, cancelling
+  whatever of it has not started yet
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.metrics import image_prefetch_total
+from app.db.session import AsyncSessionLocal
+from app.integrations.adapters.factory import get_adapter
+from app.models.check import CheckImage, CheckItem
+from app.services.image_cache import ImageCache, image_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePrefetcher:
+    """Schedule, bound and cancel image cache warm-ups."""
+
+    def __init__(
+        self,
+        cache: ImageCache | None = None,
+        session_factory=AsyncSessionLocal,
+        adapter_factory=get_adapter,
+        concurrency: int | None = None,
+        tenant_per_minute: int | None = None,
+    ):
+        self._cache = cache or image_cache
+        self._session_factory = session_factory
+        self._adapter_factory = adapter_factory
+        self._concurrency = concurrency or settings.IMAGE_PREFETCH_CONCURRENCY
+        self._rate = (tenant_per_minute or settings.IMAGE_PREFETCH_TENANT_PER_MINUTE) / 60.0
+        self._burst = float(tenant_per_minute or settings.IMAGE_PREFETCH_TENANT_PER_MINUTE)
+        # Created lazily, on the running loop
+        self._slots: asyncio.Semaphore | None = None
+        # tenant_id -> (tokens, last refill monotonic)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        # Running batches, and the latest batch per owner
+        self._tasks: set[asyncio.Task] = set()
+        self._owned: dict[str, asyncio.Task] = {}
+
+    def schedule(
+        self, tenant_id: str, item_ids: Iterable[str], owner: str | None = None
+    ) -> asyncio.Task | None:
+        """Warm the image cache for items in the background.
+
+        Args:
+            tenant_id: Tenant the items belong to (images are looked up
+                within this tenant only)
+            item_ids: Check item IDs
+            owner: Optional owner of the batch (e.g. the reviewer). A new
+                batch for the same owner cancels the previous one.
+
+        Returns:
+            The background task, or None if there was nothing to schedule
+        """
+        item_ids = [item_id for item_id in dict.fromkeys(item_ids) if item_id]
+        if not settings.IMAGE_PREFETCH_ENABLED or not item_ids:
+            return None
+
+        if owner is not None:
+            self.cancel(owner)
+
+        task = asyncio.create_task(self._run(tenant_id, item_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if owner is not None:
+            self._owned[owner] = task
+            task.add_done_callback(lambda done: self._forget(owner, done))
+        return task
+
+    def cancel(self, owner: str) -> None:
+        """Cancel the owner's pending batch, if any."""
+        task = self._owned.pop(owner, None)
+        if task is not None:
+            task.cancel()
+
+    def _forget(self, owner: str, task: asyncio.Task) -> None:
+        if self._owned.get(owner) is task:
+            del self._owned[owner]
+
+    async def shutdown(self) -> None:
+        """Cancel all batches and wait for them to stop."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, tenant_id: str, item_ids: list[str]) -> None:
+        try:
+            # CRITICAL: images are only looked up within the tenant
+            async with self._session_factory() as db:
+                result = await db.execute(
+                    select(CheckImage.external_image_id, CheckImage.id)
+                    .join(CheckItem, CheckImage.check_item_id == CheckItem.id)
+                    .where(CheckItem.tenant_id == tenant_id, CheckItem.id.in_(item_ids))
+                )
+                image_ids = [external_id or image_id for external_id, image_id in result.all()]
+        except Exception as e:
+            logger.warning("Image prefetch lookup failed for tenant %s: %s", tenant_id, e)
+            return
+
+        adapter = self._adapter_factory()
+        fetches: list[Callable[[], Awaitable[object]]] = []
+        for image_id in image_ids:
+            fetches.append(lambda i=image_id: self._cache.get_image(adapter, tenant_id, i))
+            fetches.append(lambda i=image_id: self._cache.get_thumbnail(adapter, tenant_id, i))
+
+        await asyncio.gather(*(self._fetch(tenant_id, fetch) for fetch in fetches))
+
+    async def _fetch(self, tenant_id: str, fetch: Callable[[], Awaitable[object]]) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._concurrency)
+
+        async with self._slots:
+            # Checked once a slot is free; over budget the fetch is dropped
+            if not self._take(tenant_id):
+                image_prefetch_total.labels(result="rate_limited").inc()
+                return
+            try:
+                await fetch()
+                image_prefetch_total.labels(result="fetched").inc()
+            except Exception as e:
+                logger.debug("Image prefetch failed for tenant %s: %s", tenant_id, e)
+                image_prefetch_total.labels(result="failed").inc()
+
+    def _take(self, tenant_id: str) -> bool:
+        """Take one fetch from the tenant's token bucket."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(tenant_id, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+        if tokens < 1:
+            self._buckets[tenant_id] = (tokens, now)
+            return False
+        self._buckets[tenant_id] = (tokens - 1, now)
+        return True
+
+
+# Global prefetcher instance
+image_prefetcher = ImagePrefetcher()
@@ -1,12 +1,12 @@
 """PDF Audit Packet Generator Service."""
 
-import io
 from datetime import datetime, timezone
 from typing import Any
 
 from app.models.audit import AuditLog, ItemView
 from app.models.check import CheckItem
 from app.models.decision import Decision
+from app.services.pdf_render_pool import render_pdf
 from PIL import Image as PILImage
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
@@ -18,7 +18,6 @@ from reportlab.platypus import (
     Image,
     PageBreak,
     Paragraph,
-    SimpleDocTemplate,
     Spacer,
     Table,
     TableStyle,
@@ -115,17 +114,6 @@ class AuditPacketGenerator:
         # Fetch view records
         view_records = await self._get_view_records(check_item_id)
 
-        # Create PDF
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
-
         # Build content
         story = []
 
@@ -154,10 +142,16 @@ class AuditPacketGenerator:
         # Footer
         story.extend(self._build_footer(item))
 
-        # Generate PDF
-        doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
+        # Generate PDF (layout and rendering run in the PDF worker pool)
+        return await render_pdf(
+            "audit_packet",
+            story,
+            pagesize=letter,
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
+        )
 
     async def _get_check_item(self, item_id: str) -> CheckItem | None:
         """Fetch check item with all related data."""
@@ -0,0 +1,121 @@
+"""
+Bounded worker pool for PDF layout and rendering.
+
+ReportLab's doc.build() is CPU-bound and can take seconds for a large
+audit packet. Running it on the event loop stalls every other request
+on that worker, so callers assemble the story (cheap, may need the DB)
+and hand it here; layout and rendering run in a process pool sized by
+settings.PDF_RENDER_WORKERS.
+
+Stories are pickled up front. If a story cannot be pickled (e.g. a
+flowable holding an open file), it is rendered in a thread instead,
+which still keeps the event loop responsive.
+
+A worker that dies (OOM kill, segfault in a C extension) breaks the whole
+pool; the broken pool is discarded and the render retried once on a new one.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from reportlab.platypus import SimpleDocTemplate
+
+from app.core.config import settings
+from app.core.metrics import pdf_render_duration_seconds, pdf_render_queue_depth
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def _build_document(story: list, doc_options: dict[str, Any]) -> bytes:
+    """Lay out and render a story to PDF bytes."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, **doc_options)
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def _build_pickled_document(payload: bytes) -> bytes:
+    """Process pool entry point: unpickle (story, doc_options) and render."""
+    story, doc_options = pickle.loads(payload)
+    return _build_document(story, doc_options)
+
+
+def _get_executor() -> ProcessPoolExecutor | None:
+    global _executor
+
+    if settings.PDF_RENDER_WORKERS <= 0:
+        return None
+    if _executor is None:
+        # spawn: workers must not inherit the event loop, DB or Redis connections
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info("PDF render pool started with %d workers", settings.PDF_RENDER_WORKERS)
+    return _executor
+
+
+def _discard_executor(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next render starts a fresh one."""
+    global _executor
+
+    # Concurrent renders on the same pool all fail; only the first replaces it
+    if _executor is broken:
+        _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def render_pdf(kind: str, story: list, **doc_options: Any) -> bytes:
+    """Render a story to PDF bytes off the event loop.
+
+    Args:
+        kind: Document kind, used as the metrics label
+        story: ReportLab flowables
+        doc_options: SimpleDocTemplate keyword arguments (pagesize, margins)
+
+    Returns:
+        PDF bytes
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+
+    pdf_render_queue_depth.inc()
+    started = time.perf_counter()
+    try:
+        payload = None
+        if executor is not None:
+            try:
+                payload = pickle.dumps((story, doc_options), protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                logger.warning("PDF story for %s not picklable, rendering in thread: %s", kind, e)
+
+        if payload is not None:
+            try:
+                return await loop.run_in_executor(executor, _build_pickled_document, payload)
+            except BrokenProcessPool:
+                logger.warning("PDF render pool broken, retrying %s on a new pool", kind)
+                _discard_executor(executor)
+                return await loop.run_in_executor(_get_executor(), _build_pickled_document, payload)
+        return await asyncio.to_thread(_build_document, story, doc_options)
+    finally:
+        pdf_render_queue_depth.dec()
+        pdf_render_duration_seconds.labels(kind=kind).observe(time.perf_counter() - started)
+
+
+def shutdown_render_pool() -> None:
+    """Stop the worker processes. Call during application shutdown."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        logger.info("PDF render pool stopped")
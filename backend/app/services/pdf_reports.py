@@ -1,6 +1,5 @@
 """PDF Report Generation Service using ReportLab."""
 
-import io
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
@@ -9,6 +8,13 @@ from app.models.audit import AuditAction, AuditLog
 from app.models.check import CheckItem, CheckStatus, RiskLevel
 from app.models.decision import Decision, DecisionAction
 from app.models.user import User
+from app.services.pdf_render_pool import render_pdf
+from app.services.rollup_service import (
+    METRIC_DECISION,
+    METRIC_PROCESSED,
+    METRIC_SLA_BREACHED,
+    RollupService,
+)
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import letter
@@ -16,7 +22,6 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     Paragraph,
-    SimpleDocTemplate,
     Spacer,
     Table,
     TableStyle,
@@ -173,15 +178,6 @@ class PDFReportService:
         tenant_name: str = "Financial Institution",
     ) -> bytes:
         """Generate Daily Activity Log PDF report."""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.5 * inch,
-            leftMargin=0.5 * inch,
-            topMargin=0.5 * inch,
-            bottomMargin=0.5 * inch,
-        )
         elements = []
 
         # Header
@@ -287,9 +283,16 @@ class PDFReportService:
             )
         )
 
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer.getvalue()
+        # Generate PDF (layout and rendering run in the PDF worker pool)
+        return await render_pdf(
+            "daily_activity",
+            elements,
+            pagesize=letter,
+            rightMargin=0.5 * inch,
+            leftMargin=0.5 * inch,
+            topMargin=0.5 * inch,
+            bottomMargin=0.5 * inch,
+        )
 
     async def generate_daily_summary(
         self,
@@ -299,66 +302,31 @@ class PDFReportService:
         tenant_name: str = "Financial Institution",
     ) -> bytes:
         """Generate Daily Summary PDF report."""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
         elements = []
 
         # Header
         date_range = f"{date_from.strftime('%B %d, %Y')} - {date_to.strftime('%B %d, %Y')}"
         elements.extend(self._create_header("Daily Summary Report", date_range, tenant_name))
 
-        # Get summary statistics
-        # Total items received
-        received_result = await self.db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.presented_date >= date_from,
-                CheckItem.presented_date <= date_to,
-            )
-        )
-        total_received = received_result.scalar() or 0
-
-        # Total items processed
-        processed_result = await self.db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.status.in_(
-                    [CheckStatus.APPROVED, CheckStatus.RETURNED, CheckStatus.REJECTED]
-                ),
-                CheckItem.updated_at >= date_from,
-                CheckItem.updated_at <= date_to,
-            )
-        )
-        total_processed = processed_result.scalar() or 0
-
-        # Total amount processed
-        amount_result = await self.db.execute(
-            select(func.sum(CheckItem.amount)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.status == CheckStatus.APPROVED,
-                CheckItem.updated_at >= date_from,
-                CheckItem.updated_at <= date_to,
-            )
-        )
-        total_amount = amount_result.scalar() or Decimal(0)
+        # Get summary statistics from the operational rollups (hourly buckets)
+        rollups = RollupService(self.db)
+
+        # Items received, by risk level
+        risk_counts: dict[str, int] = {}
+        for _, risk, _, count in await rollups.item_state_counts(
+            tenant_id, presented_from=date_from, presented_to=date_to
+        ):
+            risk_counts[risk] = risk_counts.get(risk, 0) + count
+        total_received = sum(risk_counts.values())
+
+        # Items processed, and amount approved
+        processed = await rollups.activity_totals(tenant_id, METRIC_PROCESSED, date_from, date_to)
+        total_processed = sum(count for count, _ in processed.values())
+        total_amount = processed.get(CheckStatus.APPROVED.value, (0, Decimal(0)))[1]
 
         # SLA breaches
-        sla_result = await self.db.execute(
-            select(func.count(CheckItem.id)).where(
-                CheckItem.tenant_id == tenant_id,
-                CheckItem.sla_breached == True,
-                CheckItem.updated_at >= date_from,
-                CheckItem.updated_at <= date_to,
-            )
-        )
-        sla_breaches = sla_result.scalar() or 0
+        breaches = await rollups.activity_totals(tenant_id, METRIC_SLA_BREACHED, date_from, date_to)
+        sla_breaches = sum(count for count, _ in breaches.values())
 
         # Key Metrics section
         elements.append(Paragraph("Key Metrics", self.styles["SectionHeader"]))
@@ -374,18 +342,10 @@ class PDFReportService:
         # Decision breakdown
         elements.append(Paragraph("Decision Breakdown", self.styles["SectionHeader"]))
 
-        decision_result = await self.db.execute(
-            select(Decision.action, func.count(Decision.id))
-            .where(
-                Decision.tenant_id == tenant_id,
-                Decision.created_at >= date_from,
-                Decision.created_at <= date_to,
-            )
-            .group_by(Decision.action)
+        decision_totals = await rollups.activity_totals(
+            tenant_id, METRIC_DECISION, date_from, date_to
         )
-        decision_counts = {
-            (a.value if hasattr(a, "value") else str(a)): c for a, c in decision_result.all()
-        }
+        decision_counts = {action: count for action, (count, _) in decision_totals.items()}
 
         decision_data = [
             ["Action", "Count", "Percentage"],
@@ -404,15 +364,7 @@ class PDFReportService:
 
         risk_data = [["Risk Level", "Count", "Percentage"]]
         for risk in RiskLevel:
-            risk_result = await self.db.execute(
-                select(func.count(CheckItem.id)).where(
-                    CheckItem.tenant_id == tenant_id,
-                    CheckItem.risk_level == risk,
-                    CheckItem.presented_date >= date_from,
-                    CheckItem.presented_date <= date_to,
-                )
-            )
-            count = risk_result.scalar() or 0
+            count = risk_counts.get(risk.value, 0)
             pct = (count / total_received * 100) if total_received > 0 else 0
             risk_data.append([risk.value.title(), str(count), f"{pct:.1f}%"])
 
@@ -454,9 +406,16 @@ class PDFReportService:
             )
         )
 
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer.getvalue()
+        # Generate PDF (layout and rendering run in the PDF worker pool)
+        return await render_pdf(
+            "daily_summary",
+            elements,
+            pagesize=letter,
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
+        )
 
     async def generate_executive_overview(
         self,
@@ -464,15 +423,6 @@ class PDFReportService:
         tenant_name: str = "Financial Institution",
     ) -> bytes:
         """Generate Executive Overview PDF with QoQ/MoM/YoY KPIs."""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
         elements = []
 
         now = datetime.now(timezone.utc)
@@ -751,9 +701,16 @@ class PDFReportService:
             )
         )
 
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer.getvalue()
+        # Generate PDF (layout and rendering run in the PDF worker pool)
+        return await render_pdf(
+            "executive_overview",
+            elements,
+            pagesize=letter,
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
+        )
 
     def _get_quarter_dates(self, date: datetime) -> dict:
         """Get start and end dates for the quarter containing the given date."""
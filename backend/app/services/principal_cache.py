@@ -0,0 +1,206 @@
+"""
+Cached authentication principal for the request hot path.
+
+Every authenticated request needs the caller's identity, tenant and
+permissions. Loading them from the database costs three queries
+(user -> roles -> permissions), so the flattened result is cached as an
+immutable Principal in two tiers:
+
+1. In-process LRU (per worker, short TTL, no network round trip)
+2. Redis via CacheService (shared across workers, invalidated on change)
+
+Invalidation clears both tiers in the current worker and the Redis tier for
+everyone. Other workers may serve a stale principal until their local entry
+expires (PRINCIPAL_CACHE_LOCAL_TTL_SECONDS).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.user import Role, User
+from app.services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user with flattened roles and permissions.
+
+    Exposes the same authorization helpers as User (has_permission, has_role)
+    so it can be used wherever endpoints only need identity and access checks.
+    """
+
+    id: str
+    tenant_id: str
+    username: str
+    is_active: bool
+    is_superuser: bool
+    role_ids: frozenset[str]
+    role_names: frozenset[str]
+    permissions: frozenset[str]  # "resource:action"
+    permission_names: frozenset[str]
+
+    def has_permission(self, resource: str, action: str) -> bool:
+        """Check if the principal has a specific permission."""
+        return self.is_superuser or f"{resource}:{action}" in self.permissions
+
+    def has_role(self, role_name: str) -> bool:
+        """Check if the principal has a specific role."""
+        return role_name in self.role_names
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Flatten a User loaded with roles and permissions."""
+        permissions = [p for role in user.roles for p in role.permissions]
+        return cls(
+            id=user.id,
+            tenant_id=user.tenant_id,
+            username=user.username,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            role_ids=frozenset(role.id for role in user.roles),
+            role_names=frozenset(role.name for role in user.roles),
+            permissions=frozenset(f"{p.resource}:{p.action}" for p in permissions),
+            permission_names=frozenset(p.name for p in permissions),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the Redis tier."""
+        return {
+            "id": self.id,
+            "tenant_id": self.tenant_id,
+            "username": self.username,
+            "is_active": self.is_active,
+            "is_superuser": self.is_superuser,
+            "role_ids": sorted(self.role_ids),
+            "role_names": sorted(self.role_names),
+            "permissions": sorted(self.permissions),
+            "permission_names": sorted(self.permission_names),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Principal":
+        """Deserialize from the Redis tier."""
+        return cls(
+            id=data["id"],
+            tenant_id=data["tenant_id"],
+            username=data["username"],
+            is_active=data["is_active"],
+            is_superuser=data["is_superuser"],
+            role_ids=frozenset(data["role_ids"]),
+            role_names=frozenset(data["role_names"]),
+            permissions=frozenset(data["permissions"]),
+            permission_names=frozenset(data["permission_names"]),
+        )
+
+
+async def load_principal(db: AsyncSession, user_id: str) -> Principal | None:
+    """Load an active user's principal from the database."""
+    result = await db.execute(
+        select(User)
+        .options(selectinload(User.roles).selectinload(Role.permissions))
+        .where(User.id == user_id, User.is_active == True)
+    )
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+    return Principal.from_user(user)
+
+
+class PrincipalCache:
+    """Two-tier principal cache: in-process LRU in front of Redis."""
+
+    def __init__(
+        self,
+        cache: CacheService | None = None,
+        max_entries: int | None = None,
+        local_ttl_seconds: int | None = None,
+    ):
+        self._cache = cache or cache_service
+        self._max_entries = max_entries or settings.PRINCIPAL_CACHE_MAX_ENTRIES
+        self._local_ttl = local_ttl_seconds or settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS
+        # user_id -> (expires_at monotonic, Principal)
+        self._local: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get(self, user_id: str) -> Principal | None:
+        """Get a principal from the local tier, falling back to Redis."""
+        entry = self._local.get(user_id)
+        if entry is not None:
+            expires_at, principal = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(user_id)
+                self.local_hits += 1
+                return principal
+            del self._local[user_id]
+
+        data = await self._cache.get_principal(user_id)
+        if data is not None:
+            try:
+                principal = Principal.from_dict(data)
+            except (KeyError, TypeError) as e:
+                logger.warning("Discarding malformed cached principal for %s: %s", user_id, e)
+            else:
+                self._store_local(principal)
+                self.redis_hits += 1
+                return principal
+
+        self.misses += 1
+        return None
+
+    async def get_or_load(self, db: AsyncSession, user_id: str) -> Principal | None:
+        """Get a principal, loading and caching it on a miss.
+
+        Returns None if the user does not exist or is inactive.
+        """
+        principal = await self.get(user_id)
+        if principal is None:
+            principal = await load_principal(db, user_id)
+            if principal is not None:
+                await self.set(principal)
+        return principal
+
+    async def set(self, principal: Principal) -> None:
+        """Store a principal in both tiers."""
+        self._store_local(principal)
+        await self._cache.set_principal(principal.id, principal.tenant_id, principal.to_dict())
+
+    async def invalidate_user(self, user_id: str, tenant_id: str) -> None:
+        """Drop one user's principal (e.g. deactivation or role change)."""
+        self._local.pop(user_id, None)
+        await self._cache.invalidate_principal(user_id, tenant_id)
+
+    async def invalidate_tenant(self, tenant_id: str) -> None:
+        """Drop every principal in a tenant (e.g. role permission change)."""
+        for user_id in [
+            user_id
+            for user_id, (_, principal) in self._local.items()
+            if principal.tenant_id == tenant_id
+        ]:
+            del self._local[user_id]
+        await self._cache.invalidate_tenant_principals(tenant_id)
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier."""
+        self._local.clear()
+
+    def _store_local(self, principal: Principal) -> None:
+        self._local[principal.id] = (time.monotonic() + self._local_ttl, principal)
+        self._local.move_to_end(principal.id)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
@@ -0,0 +1,560 @@
+"""
+Operational rollup maintenance and queries.
+
+Reports read hourly counters from item_state_rollups and activity_rollups
+(see app.models.rollup) instead of recounting check_items and decisions.
+
+Counters are maintained incrementally:
+- An after_flush listener turns CheckItem inserts/updates/deletes and
+  Decision inserts into deltas and upserts them in the same transaction.
+- Bulk paths that bypass the ORM (presented item ingestion) record their
+  deltas explicitly with RollupDeltas.
+
+The listener is registered on every Session, so any database that check
+items or decisions are written to must have the rollup tables.
+
+Writes that bypass both (raw UPDATE/DELETE statements, manual fixes) are
+reconciled by RollupService.rebuild, run by the rollup repair job (on the
+background scheduler, or scripts/run_rollup_repair.py from cron).
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.util import identity_key
+
+from app.db.functions import utc_date_trunc
+from app.models.check import CheckItem, CheckStatus
+from app.models.decision import Decision
+from app.models.rollup import NO_QUEUE, ActivityRollup, ItemStateRollup
+
+logger = logging.getLogger(__name__)
+
+FINAL_STATUSES = frozenset(
+    {CheckStatus.APPROVED.value, CheckStatus.RETURNED.value, CheckStatus.REJECTED.value}
+)
+
+METRIC_PROCESSED = "processed"
+METRIC_SLA_BREACHED = "sla_breached"
+METRIC_DECISION = "decision"
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """Floor a timestamp to its UTC hour (naive values are treated as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _enum_value(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+class ItemState(NamedTuple):
+    """Key of one item_state_rollups row."""
+
+    tenant_id: str
+    queue_id: str
+    bucket_start: datetime
+    status: str
+    risk_level: str
+    sla_breached: bool
+
+    @classmethod
+    def of(
+        cls,
+        tenant_id: str,
+        queue_id: str | None,
+        presented_date: datetime,
+        status: Any,
+        risk_level: Any,
+        sla_breached: bool | None,
+    ) -> "ItemState":
+        return cls(
+            tenant_id=tenant_id,
+            queue_id=queue_id or NO_QUEUE,
+            bucket_start=hour_bucket(presented_date),
+            status=_enum_value(status),
+            risk_level=_enum_value(risk_level),
+            sla_breached=bool(sla_breached),
+        )
+
+
+class ActivityKey(NamedTuple):
+    """Key of one activity_rollups row."""
+
+    tenant_id: str
+    queue_id: str
+    bucket_start: datetime
+    metric: str
+    value: str
+
+
+class RollupDeltas:
+    """Accumulated counter changes, applied as batched upserts."""
+
+    # Rows per upsert statement (keeps bind parameters well under driver limits)
+    CHUNK_SIZE = 1000
+
+    def __init__(self):
+        self.item_states: dict[ItemState, int] = defaultdict(int)
+        self.activity: dict[ActivityKey, list] = defaultdict(lambda: [0, Decimal(0)])
+
+    def add_item(self, state: ItemState, delta: int) -> None:
+        self.item_states[state] += delta
+
+    def add_activity(
+        self,
+        tenant_id: str,
+        queue_id: str | None,
+        occurred_at: datetime,
+        metric: str,
+        value: str = "",
+        amount: Decimal | None = None,
+    ) -> None:
+        key = ActivityKey(tenant_id, queue_id or NO_QUEUE, hour_bucket(occurred_at), metric, value)
+        self.activity[key][0] += 1
+        self.activity[key][1] += amount or Decimal(0)
+
+    def __bool__(self) -> bool:
+        return any(self.item_states.values()) or bool(self.activity)
+
+    def statements(self, dialect_name: str) -> list:
+        """Build upsert statements for the given dialect."""
+        if dialect_name == "postgresql":
+            insert = postgresql.insert
+        elif dialect_name == "sqlite":
+            insert = sqlite.insert
+        else:
+            raise NotImplementedError(f"Rollups are not supported on {dialect_name}")
+
+        statements = []
+        item_rows = [
+            {**state._asdict(), "item_count": delta}
+            for state, delta in self.item_states.items()
+            if delta
+        ]
+        for chunk in self._chunks(item_rows):
+            stmt = insert(ItemStateRollup).values(chunk)
+            statements.append(
+                stmt.on_conflict_do_update(
+                    index_elements=list(ItemState._fields),
+                    set_={"item_count": ItemStateRollup.item_count + stmt.excluded.item_count},
+                )
+            )
+
+        activity_rows = [
+            {**key._asdict(), "event_count": count, "amount_total": amount}
+            for key, (count, amount) in self.activity.items()
+        ]
+        for chunk in self._chunks(activity_rows):
+            stmt = insert(ActivityRollup).values(chunk)
+            statements.append(
+                stmt.on_conflict_do_update(
+                    index_elements=list(ActivityKey._fields),
+                    set_={
+                        "event_count": ActivityRollup.event_count + stmt.excluded.event_count,
+                        "amount_total": ActivityRollup.amount_total + stmt.excluded.amount_total,
+                    },
+                )
+            )
+        return statements
+
+    def _chunks(self, rows: list[dict]) -> list[list[dict]]:
+        return [rows[i : i + self.CHUNK_SIZE] for i in range(0, len(rows), self.CHUNK_SIZE)]
+
+    def apply(self, connection: Connection) -> None:
+        """Apply the deltas on a (sync) connection."""
+        for stmt in self.statements(connection.dialect.name):
+            connection.execute(stmt)
+
+    async def apply_async(self, db: AsyncSession) -> None:
+        """Apply the deltas in an async session's transaction."""
+        if self:
+            await db.run_sync(lambda session: self.apply(session.connection()))
+
+
+# =============================================================================
+# Incremental maintenance (ORM flush listener)
+# =============================================================================
+
+
+def _previous(obj: Any, attr: str) -> Any:
+    """Value of an attribute before the pending flush."""
+    history = attributes.get_history(obj, attr)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, attr)
+
+
+def _current_state(item: CheckItem) -> ItemState:
+    return ItemState.of(
+        item.tenant_id,
+        item.queue_id,
+        item.presented_date,
+        item.status,
+        item.risk_level,
+        item.sla_breached,
+    )
+
+
+def _previous_state(item: CheckItem) -> ItemState:
+    return ItemState.of(
+        _previous(item, "tenant_id"),
+        _previous(item, "queue_id"),
+        _previous(item, "presented_date"),
+        _previous(item, "status"),
+        _previous(item, "risk_level"),
+        _previous(item, "sla_breached"),
+    )
+
+
+def _decision_queue_ids(session: Session, decisions: list[Decision]) -> dict[str, str | None]:
+    """Queue of each decided item, so decisions land in the same bucket as a rebuild.
+
+    Items already loaded in the session are read from the identity map; the
+    rest are looked up in one query on the flush's connection.
+    """
+    queue_ids: dict[str, str | None] = {}
+    missing = set()
+    for decision in decisions:
+        item = session.identity_map.get(identity_key(CheckItem, decision.check_item_id))
+        if item is not None and "queue_id" not in attributes.instance_state(item).unloaded:
+            queue_ids[decision.check_item_id] = item.queue_id
+        else:
+            missing.add(decision.check_item_id)
+
+    if missing:
+        result = session.connection().execute(
+            select(CheckItem.id, CheckItem.queue_id).where(CheckItem.id.in_(missing))
+        )
+        queue_ids.update(result.all())
+    return queue_ids
+
+
+def collect_flush_deltas(session: Session) -> RollupDeltas:
+    """Compute rollup deltas for the objects in a flush."""
+    deltas = RollupDeltas()
+    now = datetime.now(timezone.utc)
+    decisions = []
+
+    for obj in session.new:
+        if isinstance(obj, CheckItem):
+            state = _current_state(obj)
+            deltas.add_item(state, 1)
+            occurred_at = obj.updated_at or now
+            if state.status in FINAL_STATUSES:
+                deltas.add_activity(
+                    obj.tenant_id,
+                    obj.queue_id,
+                    occurred_at,
+                    METRIC_PROCESSED,
+                    state.status,
+                    obj.amount,
+                )
+            if state.sla_breached:
+                deltas.add_activity(obj.tenant_id, obj.queue_id, occurred_at, METRIC_SLA_BREACHED)
+        elif isinstance(obj, Decision):
+            decisions.append(obj)
+
+    queue_ids = _decision_queue_ids(session, decisions)
+    for obj in decisions:
+        deltas.add_activity(
+            obj.tenant_id,
+            queue_ids.get(obj.check_item_id),
+            obj.created_at or now,
+            METRIC_DECISION,
+            _enum_value(obj.action),
+        )
+
+    for obj in session.dirty:
+        if not isinstance(obj, CheckItem):
+            continue
+        old, new = _previous_state(obj), _current_state(obj)
+        if old == new:
+            continue
+        deltas.add_item(old, -1)
+        deltas.add_item(new, 1)
+        if new.status in FINAL_STATUSES and old.status not in FINAL_STATUSES:
+            deltas.add_activity(
+                obj.tenant_id, obj.queue_id, now, METRIC_PROCESSED, new.status, obj.amount
+            )
+        if new.sla_breached and not old.sla_breached:
+            deltas.add_activity(obj.tenant_id, obj.queue_id, now, METRIC_SLA_BREACHED)
+
+    for obj in session.deleted:
+        if isinstance(obj, CheckItem):
+            deltas.add_item(_previous_state(obj), -1)
+
+    return deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_rollups(session: Session, flush_context) -> None:
+    deltas = collect_flush_deltas(session)
+    if deltas:
+        deltas.apply(session.connection())
+
+
+# =============================================================================
+# Queries and repair
+# =============================================================================
+
+
+class RollupService:
+    """Read and rebuild operational rollups."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def item_state_counts(
+        self,
+        tenant_id: str,
+        queue_id: str | None = None,
+        presented_from: datetime | None = None,
+        presented_to: datetime | None = None,
+    ) -> list[tuple[str, str, bool, int]]:
+        """Current item counts grouped by (status, risk_level, sla_breached).
+
+        Args:
+            tenant_id: Tenant ID
+            queue_id: Restrict to one queue
+            presented_from: Include items presented at or after this time (hour granularity)
+            presented_to: Include items presented before this time (hour granularity)
+
+        Returns:
+            List of (status, risk_level, sla_breached, count)
+        """
+        query = select(
+            ItemStateRollup.status,
+            ItemStateRollup.risk_level,
+            ItemStateRollup.sla_breached,
+            func.sum(ItemStateRollup.item_count),
+        ).where(ItemStateRollup.tenant_id == tenant_id)
+
+        if queue_id is not None:
+            query = query.where(ItemStateRollup.queue_id == queue_id)
+        if presented_from is not None:
+            query = query.where(ItemStateRollup.bucket_start >= hour_bucket(presented_from))
+        if presented_to is not None:
+            query = query.where(ItemStateRollup.bucket_start < presented_to)
+
+        result = await self.db.execute(
+            query.group_by(
+                ItemStateRollup.status, ItemStateRollup.risk_level, ItemStateRollup.sla_breached
+            )
+        )
+        return [(s, r, bool(b), int(c)) for s, r, b, c in result.all() if c]
+
+    async def received_by_day(
+        self, tenant_id: str, date_from: datetime, date_to: datetime
+    ) -> dict[datetime, int]:
+        """Items presented per UTC day in [date_from, date_to)."""
+        day = utc_date_trunc("day", ItemStateRollup.bucket_start)
+        result = await self.db.execute(
+            select(day, func.sum(ItemStateRollup.item_count))
+            .where(
+                ItemStateRollup.tenant_id == tenant_id,
+                ItemStateRollup.bucket_start >= hour_bucket(date_from),
+                ItemStateRollup.bucket_start < date_to,
+            )
+            .group_by(day)
+        )
+        return {bucket: int(count) for bucket, count in result.all()}
+
+    async def activity_totals(
+        self,
+        tenant_id: str,
+        metric: str,
+        date_from: datetime,
+        date_to: datetime | None = None,
+    ) -> dict[str, tuple[int, Decimal]]:
+        """Event count and amount per value of a metric since date_from.
+
+        Returns:
+            Mapping of value -> (event_count, amount_total)
+        """
+        query = select(
+            ActivityRollup.value,
+            func.sum(ActivityRollup.event_count),
+            func.sum(ActivityRollup.amount_total),
+        ).where(
+            ActivityRollup.tenant_id == tenant_id,
+            ActivityRollup.metric == metric,
+            ActivityRollup.bucket_start >= hour_bucket(date_from),
+        )
+        if date_to is not None:
+            query = query.where(ActivityRollup.bucket_start < date_to)
+
+        result = await self.db.execute(query.group_by(ActivityRollup.value))
+        return {value: (int(count), Decimal(amount or 0)) for value, count, amount in result.all()}
+
+    async def activity_by_day(
+        self, tenant_id: str, metric: str, date_from: datetime, date_to: datetime
+    ) -> dict[datetime, int]:
+        """Event count per UTC day for a metric in [date_from, date_to)."""
+        day = utc_date_trunc("day", ActivityRollup.bucket_start)
+        result = await self.db.execute(
+            select(day, func.sum(ActivityRollup.event_count))
+            .where(
+                ActivityRollup.tenant_id == tenant_id,
+                ActivityRollup.metric == metric,
+                ActivityRollup.bucket_start >= hour_bucket(date_from),
+                ActivityRollup.bucket_start < date_to,
+            )
+            .group_by(day)
+        )
+        return {bucket: int(count) for bucket, count in result.all()}
+
+    async def rebuild(self, tenant_id: str, since: datetime | None = None) -> RollupDeltas:
+        """Recompute a tenant's rollups from the source tables.
+
+        Item state rows are rebuilt for items presented since `since`;
+        activity rows for events since `since`. Finalization and SLA breach
+        times are approximated by the item's updated_at.
+
+        Args:
+            tenant_id: Tenant ID
+            since: Only rebuild buckets from this time (None rebuilds everything)
+
+        Returns:
+            The rebuilt counters (for logging/inspection)
+        """
+        since_bucket = hour_bucket(since) if since else None
+        deltas = RollupDeltas()
+
+        # Item state: one row per (queue, presented hour, status, risk, SLA)
+        presented_hour = utc_date_trunc("hour", CheckItem.presented_date)
+        query = (
+            select(
+                CheckItem.queue_id,
+                presented_hour,
+                CheckItem.status,
+                CheckItem.risk_level,
+                CheckItem.sla_breached,
+                func.count(CheckItem.id),
+            )
+            .where(CheckItem.tenant_id == tenant_id)
+            .group_by(
+                CheckItem.queue_id,
+                presented_hour,
+                CheckItem.status,
+                CheckItem.risk_level,
+                CheckItem.sla_breached,
+            )
+        )
+        if since_bucket:
+            query = query.where(CheckItem.presented_date >= since_bucket)
+        for queue_id, bucket, status, risk, sla, count in (await self.db.execute(query)).all():
+            deltas.add_item(ItemState.of(tenant_id, queue_id, bucket, status, risk, sla), count)
+
+        # Activity: finalized items and SLA breaches by updated hour
+        updated_hour = utc_date_trunc("hour", CheckItem.updated_at)
+        query = (
+            select(
+                CheckItem.queue_id,
+                updated_hour,
+                CheckItem.status,
+                CheckItem.sla_breached,
+                func.count(CheckItem.id),
+                func.sum(CheckItem.amount),
+            )
+            .where(
+                CheckItem.tenant_id == tenant_id,
+                CheckItem.status.in_([CheckStatus(s) for s in FINAL_STATUSES])
+                | (CheckItem.sla_breached == True),
+            )
+            .group_by(CheckItem.queue_id, updated_hour, CheckItem.status, CheckItem.sla_breached)
+        )
+        if since_bucket:
+            query = query.where(CheckItem.updated_at >= since_bucket)
+        for queue_id, bucket, status, sla, count, amount in (await self.db.execute(query)).all():
+            status = _enum_value(status)
+            if status in FINAL_STATUSES:
+                key = ActivityKey(
+                    tenant_id, queue_id or NO_QUEUE, hour_bucket(bucket), METRIC_PROCESSED, status
+                )
+                deltas.activity[key][0] += count
+                deltas.activity[key][1] += Decimal(amount or 0)
+            if sla:
+                key = ActivityKey(
+                    tenant_id, queue_id or NO_QUEUE, hour_bucket(bucket), METRIC_SLA_BREACHED, ""
+                )
+                deltas.activity[key][0] += count
+
+        # Activity: decisions by action, attributed to the item's queue
+        created_hour = utc_date_trunc("hour", Decision.created_at)
+        query = (
+            select(CheckItem.queue_id, created_hour, Decision.action, func.count(Decision.id))
+            .join(CheckItem, CheckItem.id == Decision.check_item_id)
+            .where(Decision.tenant_id == tenant_id)
+            .group_by(CheckItem.queue_id, created_hour, Decision.action)
+        )
+        if since_bucket:
+            query = query.where(Decision.created_at >= since_bucket)
+        for queue_id, bucket, action, count in (await self.db.execute(query)).all():
+            key = ActivityKey(
+                tenant_id,
+                queue_id or NO_QUEUE,
+                hour_bucket(bucket),
+                METRIC_DECISION,
+                _enum_value(action),
+            )
+            deltas.activity[key][0] += count
+
+        # Replace existing rows in the rebuilt range
+        item_delete = delete(ItemStateRollup).where(ItemStateRollup.tenant_id == tenant_id)
+        activity_delete = delete(ActivityRollup).where(ActivityRollup.tenant_id == tenant_id)
+        if since_bucket:
+            item_delete = item_delete.where(ItemStateRollup.bucket_start >= since_bucket)
+            activity_delete = activity_delete.where(ActivityRollup.bucket_start >= since_bucket)
+        await self.db.execute(item_delete)
+        await self.db.execute(activity_delete)
+        await deltas.apply_async(self.db)
+
+        logger.info(
+            "Rebuilt rollups for tenant %s since %s: %d item state rows, %d activity rows",
+            tenant_id,
+            since_bucket.isoformat() if since_bucket else "beginning",
+            len(deltas.item_states),
+            len(deltas.activity),
+        )
+        return deltas
+
+    async def rebuild_all(self, since: datetime | None = None) -> dict[str, int]:
+        """Rebuild rollups for every tenant that has check items.
+
+        Each tenant is committed separately so a long repair does not hold
+        one transaction across all tenants.
+
+        Returns:
+            Mapping of tenant_id -> rebuilt row count
+        """
+        result = await self.db.execute(select(CheckItem.tenant_id).distinct())
+        tenant_ids = [tenant_id for (tenant_id,) in result.all()]
+
+        rebuilt = {}
+        for tenant_id in tenant_ids:
+            deltas = await self.rebuild(tenant_id, since=since)
+            await self.db.commit()
+            rebuilt[tenant_id] = len(deltas.item_states) + len(deltas.activity)
+        return rebuilt
+
+
+async def run_rollup_repair_job(since: datetime | None = None) -> dict[str, int]:
+    """Run the rollup repair job as a standalone task.
+
+    This can be called from cron or a scheduled task runner.
+    """
+    from app.db.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        return await RollupService(db).rebuild_all(since=since)
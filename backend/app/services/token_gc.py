@@ -0,0 +1,279 @@
+"""
+Garbage collection of expired image access tokens and user sessions.
+
+A one-time image token is minted for every image view and a session row
+for every login and refresh, and neither was ever deleted: expired and used
+tokens are dead weight for get_image_by_token, and sessions that simply
+expired are never revoked, so the retention job (which only removes
+inactive sessions) never removes them either.
+
+This job deletes them in bounded chunks:
+
+    DELETE FROM t WHERE id IN (SELECT id FROM t WHERE ... LIMIT n FOR UPDATE SKIP LOCKED)
+
+committing after every chunk, so no long transaction or lock is held and
+concurrent runs (or a token being redeemed) are skipped rather than waited
+on. Rows are kept for a grace period after they stop being usable, so
+reuse attempts within it are still answered with 410 and audited.
+
+Date-partitioned layout (TOKEN_GC_PARTITIONED): tables partitioned by day
+on expires_at, with partitions named <table>_pYYYYMMDD, have whole
+partitions past the cutoff detached and dropped first; the chunked delete
+then only touches the partitions still in use.
+
+Run it from cron (scripts/run_token_gc.py) or the background scheduler.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import (
+    gc_batches_total,
+    gc_last_run_timestamp,
+    gc_partitions_dropped_total,
+    gc_rows_deleted_total,
+)
+from app.db.session import AsyncSessionLocal
+from app.models.image_token import ImageAccessToken
+from app.models.user import UserSession
+
+logger = logging.getLogger(__name__)
+
+# Log progress every this many chunks
+PROGRESS_LOG_BATCHES = 20
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{8})$")
+
+
+class GCResult(NamedTuple):
+    """Result of collecting one table."""
+
+    table: str
+    deleted_count: int
+    batches: int
+    partitions_dropped: int
+    cutoff_date: datetime
+    duration_seconds: float
+    error: str | None = None
+
+
+def expired_partitions(partition_names: list[str], table: str, cutoff: datetime) -> list[str]:
+    """Daily partitions of `table` whose whole day lies before the cutoff.
+
+    Partitions are named <table>_pYYYYMMDD; other names are ignored.
+    """
+    expired = []
+    for name in partition_names:
+        match = _PARTITION_SUFFIX.search(name)
+        if not match or name != f"{table}{match.group(0)}":
+            continue
+        try:
+            day = datetime.strptime(match.group(1), "%Y%m%d").date()
+        except ValueError:
+            continue
+        if day + timedelta(days=1) <= cutoff.date():
+            expired.append(name)
+    return sorted(expired)
+
+
+class TokenGCService:
+    """Delete expired and used image tokens and expired sessions in chunks."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int | None = None,
+        partitioned: bool | None = None,
+        pause_seconds: float | None = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or settings.TOKEN_GC_BATCH_SIZE
+        self.partitioned = settings.TOKEN_GC_PARTITIONED if partitioned is None else partitioned
+        self.pause_seconds = (
+            settings.TOKEN_GC_BATCH_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+        )
+
+    def _targets(self, now: datetime) -> list[tuple[type, datetime, object]]:
+        """(model, cutoff, condition) for every collected table."""
+        token_cutoff = now - timedelta(hours=settings.TOKEN_GC_IMAGE_TOKEN_GRACE_HOURS)
+        session_cutoff = now - timedelta(days=settings.TOKEN_GC_SESSION_GRACE_DAYS)
+        return [
+            (
+                ImageAccessToken,
+                token_cutoff,
+                or_(
+                    ImageAccessToken.expires_at < token_cutoff,
+                    ImageAccessToken.used_at < token_cutoff,
+                ),
+            ),
+            (UserSession, session_cutoff, UserSession.expires_at < session_cutoff),
+        ]
+
+    async def run(self, dry_run: bool = False, max_batches: int | None = None) -> list[GCResult]:
+        """Collect every table.
+
+        Args:
+            dry_run: Only count what would be deleted.
+            max_batches: Stop each table after this many chunks (the next run
+                continues where this one stopped).
+        """
+        results = []
+        for model, cutoff, condition in self._targets(datetime.now(timezone.utc)):
+            table = model.__tablename__
+            try:
+                result = await self._collect(model, cutoff, condition, dry_run, max_batches)
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(
+                    f"Token GC failed for {table}: {e}",
+                    extra={"event_type": "token_gc.error", "table": table, "error": str(e)},
+                )
+                result = GCResult(
+                    table=table,
+                    deleted_count=0,
+                    batches=0,
+                    partitions_dropped=0,
+                    cutoff_date=cutoff,
+                    duration_seconds=0,
+                    error=str(e),
+                )
+            results.append(result)
+        return results
+
+    async def _collect(
+        self,
+        model: type,
+        cutoff: datetime,
+        condition,
+        dry_run: bool,
+        max_batches: int | None,
+    ) -> GCResult:
+        table = model.__tablename__
+        start_time = datetime.now(timezone.utc)
+
+        if dry_run:
+            result = await self.db.execute(select(func.count(model.id)).where(condition))
+            return GCResult(
+                table=table,
+                deleted_count=result.scalar() or 0,
+                batches=0,
+                partitions_dropped=0,
+                cutoff_date=cutoff,
+                duration_seconds=0,
+            )
+
+        partitions_dropped = 0
+        total_deleted = 0
+        if self.partitioned:
+            partitions_dropped, total_deleted = await self._drop_partitions(table, cutoff)
+
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            chunk = (
+                select(model.id)
+                .where(condition)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await self.db.execute(
+                delete(model)
+                .where(model.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+
+            deleted = result.rowcount or 0
+            if deleted == 0:
+                break
+
+            batches += 1
+            total_deleted += deleted
+            gc_batches_total.labels(table=table).inc()
+            gc_rows_deleted_total.labels(table=table).inc(deleted)
+            if batches % PROGRESS_LOG_BATCHES == 0:
+                logger.info(
+                    f"Token GC progress for {table}: {total_deleted} rows in {batches} batches",
+                    extra={
+                        "event_type": "token_gc.progress",
+                        "table": table,
+                        "deleted_count": total_deleted,
+                        "batches": batches,
+                    },
+                )
+            if deleted < self.batch_size:
+                break
+            if self.pause_seconds:
+                await asyncio.sleep(self.pause_seconds)
+
+        duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+        gc_last_run_timestamp.labels(table=table).set_to_current_time()
+        logger.info(
+            f"Token GC completed for {table}: {total_deleted} rows",
+            extra={
+                "event_type": "token_gc.complete",
+                "table": table,
+                "deleted_count": total_deleted,
+                "batches": batches,
+                "partitions_dropped": partitions_dropped,
+                "cutoff_date": cutoff.isoformat(),
+                "duration_seconds": duration,
+            },
+        )
+        return GCResult(
+            table=table,
+            deleted_count=total_deleted,
+            batches=batches,
+            partitions_dropped=partitions_dropped,
+            cutoff_date=cutoff,
+            duration_seconds=duration,
+        )
+
+    async def _drop_partitions(self, table: str, cutoff: datetime) -> tuple[int, int]:
+        """Detach and drop whole daily partitions before the cutoff.
+
+        Returns:
+            (partitions dropped, rows they held)
+        """
+        result = await self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+        names = [row[0] for row in result.all()]
+
+        dropped = 0
+        rows = 0
+        # Names are matched against <table>_pYYYYMMDD, so they are safe to quote
+        for name in expired_partitions(names, table, cutoff):
+            count = await self.db.execute(text(f'SELECT count(*) FROM "{name}"'))
+            rows += count.scalar() or 0
+            await self.db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+            await self.db.execute(text(f'DROP TABLE "{name}"'))
+            await self.db.commit()
+            dropped += 1
+            gc_partitions_dropped_total.labels(table=table).inc()
+            logger.info(
+                f"Token GC dropped partition {name}",
+                extra={"event_type": "token_gc.partition_dropped", "table": table},
+            )
+
+        if rows:
+            gc_rows_deleted_total.labels(table=table).inc(rows)
+        return dropped, rows
+
+
+async def run_token_gc_job(dry_run: bool = False, max_batches: int | None = None) -> list[GCResult]:
+    """Run the GC job as a standalone task (cron or scheduler)."""
+    async with AsyncSessionLocal() as db:
+        return await TokenGCService(db).run(dry_run=dry_run, max_batches=max_batches)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Operational Rollup Repair Job Script
+
+Rebuilds the hourly item_state_rollups and activity_rollups counters from
+check_items and decisions. Counters are maintained incrementally on every
+write; this job backfills them after deployment and reconciles any drift
+from writes that bypass the ORM (raw SQL fixes, manual imports).
+
+Usage:
+    # Backfill everything (first deployment):
+    python scripts/run_rollup_repair.py --all
+
+    # Reconcile the last 48 hours:
+    python scripts/run_rollup_repair.py --hours 48
+
+The API's background scheduler runs the same repair every
+ROLLUP_REPAIR_INTERVAL_MINUTES over the last ROLLUP_REPAIR_WINDOW_HOURS;
+use cron instead when the scheduler is not running.
+
+Cron Entry (recommended - run hourly, reconciling the last two days):
+    15 * * * * cd /app && python scripts/run_rollup_repair.py --hours 48 >> /var/log/rollups.log 2>&1
+
+Environment Variables:
+    DATABASE_URL: PostgreSQL connection string (required)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rollup_service import run_rollup_repair_job
+
+# Configure logging for cron output
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("rollups.cron")
+
+
+async def run_repair(since: datetime | None) -> int:
+    """Rebuild rollups for all tenants."""
+    logger.info(f"Starting rollup repair since {since.isoformat() if since else 'beginning'}...")
+
+    try:
+        rebuilt = await run_rollup_repair_job(since=since)
+    except Exception as e:
+        logger.exception(f"Rollup repair failed: {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("ROLLUP REPAIR RESULTS")
+    print("=" * 60)
+    print(f"Completed: {datetime.now(timezone.utc).isoformat()}")
+    print()
+    for tenant_id, rows in rebuilt.items():
+        print(f"{tenant_id}: {rows:,} rollup rows")
+    print("-" * 60)
+    print(f"Tenants rebuilt: {len(rebuilt):,}")
+    print("=" * 60)
+
+    logger.info("Rollup repair completed successfully")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild operational rollups from check items and decisions.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--all",
+        action="store_true",
+        help="Rebuild every bucket (backfill)",
+    )
+    group.add_argument(
+        "--hours",
+        type=int,
+        help="Rebuild buckets from the last N hours",
+    )
+
+    args = parser.parse_args()
+
+    since = None if args.all else datetime.now(timezone.utc) - timedelta(hours=args.hours)
+    sys.exit(asyncio.run(run_repair(since)))
+
+
+if __name__ == "__main__":
+    main()
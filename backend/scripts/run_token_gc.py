@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Expired Token/Session GC Cron Job Script
+
+Deletes expired or used one-time image tokens and expired user sessions
+past their grace period, in bounded chunks (see app.services.token_gc).
+
+Usage:
+    # Show what would be deleted:
+    python scripts/run_token_gc.py --dry-run
+
+    # Actual cleanup:
+    python scripts/run_token_gc.py --run
+
+    # Cleanup, at most 100 chunks per table (the next run continues):
+    python scripts/run_token_gc.py --run --max-batches 100
+
+Cron Entry (recommended - every 15 minutes):
+    */15 * * * * cd /app && python scripts/run_token_gc.py --run >> /var/log/token_gc.log 2>&1
+
+    The scheduler process (python -m app.scheduler.item_context_scheduler)
+    runs the same job every TOKEN_GC_INTERVAL_MINUTES; cron is for
+    deployments that run without it.
+
+Environment Variables:
+    DATABASE_URL: PostgreSQL connection string (required)
+    TOKEN_GC_BATCH_SIZE: Rows per chunk (default: 5000)
+    TOKEN_GC_IMAGE_TOKEN_GRACE_HOURS: Keep tokens this long after expiry/use (default: 24)
+    TOKEN_GC_SESSION_GRACE_DAYS: Keep sessions this long after expiry (default: 90)
+    TOKEN_GC_PARTITIONED: Drop whole daily partitions first (default: false)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.token_gc import run_token_gc_job
+
+# Configure logging for cron output
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("token_gc.cron")
+
+
+async def run_gc(dry_run: bool, max_batches: int | None) -> int:
+    """Run the GC job and print a summary."""
+    mode = "DRY RUN" if dry_run else "CLEANUP"
+    logger.info(f"Starting token GC {mode}...")
+
+    results = await run_token_gc_job(dry_run=dry_run, max_batches=max_batches)
+
+    print("\n" + "=" * 60)
+    print(f"TOKEN/SESSION GC {mode} RESULTS")
+    print("=" * 60)
+    print(f"Completed: {datetime.now(timezone.utc).isoformat()}")
+    print()
+
+    status_word = "would delete" if dry_run else "deleted"
+    has_errors = False
+    for result in results:
+        print(f"{result.table}:")
+        print(f"  {status_word.capitalize()}: {result.deleted_count:,} records")
+        if not dry_run:
+            print(f"  Batches: {result.batches:,}")
+            print(f"  Partitions dropped: {result.partitions_dropped}")
+        print(f"  Cutoff date: {result.cutoff_date.isoformat()}")
+        print(f"  Duration: {result.duration_seconds:.2f} seconds")
+        if result.error:
+            print(f"  ERROR: {result.error}")
+            has_errors = True
+        print()
+
+    print("=" * 60)
+
+    if has_errors:
+        logger.error("Token GC completed with errors")
+        return 1
+
+    logger.info(f"Token GC {mode} completed successfully")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Delete expired image tokens and user sessions.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--run", action="store_true", help="Run actual cleanup (deletes data)")
+    group.add_argument(
+        "--dry-run", action="store_true", help="Show what would be deleted without changes"
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Maximum chunks per table in this run (default: until done)",
+    )
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run_gc(dry_run=args.dry_run, max_batches=args.max_batches)))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,8 @@ from app.core.security import create_access_token, get_password_hash
 from app.db.session import Base, get_db
 from app.main import app
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import ARRAY, JSON, MetaData, create_engine, event, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -83,6 +84,82 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+def _sqlite_metadata(*tables) -> tuple[MetaData, list]:
+    """Copy tables into a fresh MetaData with JSONB and ARRAY columns rendered as JSON."""
+    metadata = MetaData()
+    for table in Base.metadata.tables.values():
+        copy = table.to_metadata(metadata)
+        for column in copy.columns:
+            if isinstance(column.type, (JSONB, ARRAY)):
+                column.type = JSON()
+    return metadata, [metadata.tables[t.name] for t in tables]
+
+
+@pytest.fixture(scope="function")
+def sql_statements() -> list[str]:
+    """Every statement sqlite_engine issues, in order."""
+    return []
+
+
+@pytest_asyncio.fixture(scope="function")
+async def sqlite_engine(request, sql_statements):
+    """In-memory engine with only the tables named by the module's sqlite_tables marker.
+
+    Usage::
+
+        pytestmark = pytest.mark.sqlite_tables(CheckItem, ItemStateRollup, ActivityRollup)
+    """
+    marker = request.node.get_closest_marker("sqlite_tables")
+    assert marker is not None, "sqlite_engine needs a sqlite_tables marker"
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=StaticPool)
+    metadata, tables = _sqlite_metadata(*(model.__table__ for model in marker.args))
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all, tables=tables)
+
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: sql_statements.append(statement),
+    )
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def sqlite_session_factory(sqlite_engine) -> async_sessionmaker:
+    """Session factory bound to sqlite_engine."""
+    return async_sessionmaker(sqlite_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db(sqlite_session_factory) -> AsyncGenerator[AsyncSession, None]:
+    """Session on sqlite_engine, for tests that only need a few tables."""
+    async with sqlite_session_factory() as session:
+        yield session
+
+
+class QueryCounter:
+    """Count the statements issued while the block runs (whatever their first keyword)."""
+
+    def __init__(self, statements: list[str]):
+        self.statements = statements
+
+    def __enter__(self):
+        self.start = len(self.statements)
+        return self
+
+    def __exit__(self, *exc):
+        self.count = len(self.statements) - self.start
+
+
+@pytest.fixture(scope="function")
+def query_counter(sql_statements):
+    """Build QueryCounters over sql_statements."""
+    return lambda: QueryCounter(sql_statements)
+
+
 @pytest.fixture(scope="function")
 def override_get_db(db_session):
     """Override the get_db dependency for tests."""
@@ -292,28 +292,37 @@ class TestSecureImageEndpoint:
         # The endpoint commits used_at before returning the image
         # to prevent race conditions where the same token is used twice
 
-        # Verify the endpoint logic marks used_at before serving
-        # by checking the source code order (used_at set, then commit, then serve)
+        # Verify the endpoint claims the token (conditional UPDATE setting
+        # used_at), commits, and only then fetches the image
         import inspect
 
         from app.api.v1.endpoints.images import get_image_by_token
 
         source = inspect.getsource(get_image_by_token)
 
-        # Search for ASSIGNMENT of used_at, not just any reference
-        used_at_assign = source.find("token.used_at =")
-        assert used_at_assign > 0, "token.used_at assignment should be in function"
+        claim = source.find("used_at=now")
+        assert claim > 0, "token should be claimed by setting used_at"
+        assert (
+            "ImageAccessToken.used_at.is_(None)" in source[:claim]
+        ), "claim should only match unused tokens"
 
-        # Find commit AFTER the assignment
-        commit_after = source.find("await db.commit()", used_at_assign)
-        assert commit_after > used_at_assign, "commit should happen after used_at assignment"
+        # Find commit AFTER the claim
+        commit_after = source.find("await db.commit()", claim)
+        assert commit_after > claim, "commit should happen after the claim"
 
-        # Find image serving AFTER the commit
-        get_image_after = source.find("adapter.get_image", commit_after)
-        get_thumbnail_after = source.find("adapter.get_thumbnail", commit_after)
+        # Find image serving AFTER the commit. Bytes come from the image
+        # cache, scoped to the tenant the token was minted for
+        get_image_after = source.find(
+            "image_cache.get_image(adapter, token.tenant_id, token.image_id)", commit_after
+        )
+        get_thumbnail_after = source.find(
+            "image_cache.get_thumbnail(adapter, token.tenant_id, token.image_id)", commit_after
+        )
 
         assert get_image_after > commit_after, "get_image should happen after commit"
         assert get_thumbnail_after > commit_after, "get_thumbnail should happen after commit"
+        assert "adapter.get_image" not in source, "images should come from the cache"
+        assert "adapter.get_thumbnail" not in source, "thumbnails should come from the cache"
 
 
 class TestTenantIsolation:
@@ -343,11 +352,12 @@ class TestTenantIsolation:
         """Batch token request should have a maximum limit."""
         import inspect
 
-        from app.api.v1.endpoints.images import mint_image_tokens_batch
+        from app.api.v1.endpoints.images import MAX_BATCH_TOKENS, mint_image_tokens_batch
 
         source = inspect.getsource(mint_image_tokens_batch)
         # Verify there's a limit check for batch size
-        assert "len(data.image_ids) > 10" in source or "Maximum 10 tokens" in source
+        assert "len(data.image_ids) > MAX_BATCH_TOKENS" in source
+        assert 0 < MAX_BATCH_TOKENS <= 100
 
 
 class TestAuditTrail:
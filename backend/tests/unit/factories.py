@@ -0,0 +1,61 @@
+"""Model builders shared by the SQLite-backed unit tests."""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.models.check import AccountType, CheckItem, CheckStatus, RiskLevel
+from app.models.decision import Decision, DecisionAction, DecisionType
+from app.models.user import User
+
+TENANT = "tenant-1"
+OTHER_TENANT = "tenant-2"
+
+
+def make_user(index: int, tenant_id: str = TENANT) -> User:
+    return User(
+        id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        email=f"reviewer{index}@example.com",
+        username=f"reviewer{index}",
+        hashed_password="x",
+        full_name=f"Reviewer {index}",
+    )
+
+
+def make_item(
+    status: CheckStatus = CheckStatus.NEW,
+    risk: RiskLevel = RiskLevel.LOW,
+    presented_date: datetime | None = None,
+    updated_at: datetime | None = None,
+    tenant_id: str = TENANT,
+    queue_id: str | None = None,
+    sla_breached: bool = False,
+) -> CheckItem:
+    now = datetime.now(timezone.utc)
+    return CheckItem(
+        tenant_id=tenant_id,
+        external_item_id=str(uuid.uuid4()),
+        source_system="mock",
+        account_id="ACC1",
+        account_number_masked="****1234",
+        account_type=AccountType.CONSUMER,
+        amount=Decimal("100.00"),
+        presented_date=presented_date or now,
+        updated_at=updated_at or now,
+        status=status,
+        risk_level=risk,
+        queue_id=queue_id,
+        sla_breached=sla_breached,
+    )
+
+
+def make_decision(item: CheckItem, user: User, action: DecisionAction, **kwargs) -> Decision:
+    return Decision(
+        tenant_id=item.tenant_id,
+        check_item_id=item.id,
+        user_id=user.id,
+        decision_type=DecisionType.REVIEW_RECOMMENDATION,
+        action=action,
+        **kwargs,
+    )
@@ -0,0 +1,222 @@
+"""Tests for the PDF render pool and audit packet jobs."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from app.api.v1.endpoints import audit as audit_endpoints
+from app.core.config import settings
+from app.models.audit import AuditAction, AuditLog
+from app.models.check import CheckItem
+from app.models.rollup import ItemStateRollup
+from app.schemas.audit import AuditPacketRequest
+from app.services import audit_packet_jobs, pdf_render_pool
+from app.services.audit_packet_jobs import AuditPacketJobs, AuditPacketJobStatus
+from app.services.cache_service import CacheService
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, Spacer
+from sqlalchemy import select
+
+from tests.unit.factories import TENANT, make_item
+
+pytestmark = pytest.mark.sqlite_tables(AuditLog, CheckItem, ItemStateRollup)
+
+OPTIONS = {"format": "pdf", "include_images": True, "include_history": True}
+
+
+def _story() -> list:
+    styles = getSampleStyleSheet()
+    return [Paragraph("Audit packet", styles["Title"]), Spacer(1, 12)]
+
+
+class InMemoryCache(CacheService):
+    """CacheService backed by a dict."""
+
+    def __init__(self):
+        super().__init__(redis_url="memory://")
+        self.values: dict[str, str] = {}
+        self.packets: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+        return True
+
+    async def exists(self, key):
+        packet_id = key.removeprefix(self.PREFIX_AUDIT_PACKET)
+        return key in self.values or packet_id in self.packets
+
+    async def store_audit_packet(self, packet_id, pdf_bytes, *args, **kwargs):
+        self.packets[packet_id] = pdf_bytes
+        return True
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Count packet renders instead of querying check items."""
+    calls = []
+
+    async def generate(self, check_item_id, **kwargs):
+        calls.append(check_item_id)
+        return await pdf_render_pool.render_pdf("audit_packet", _story(), pagesize=letter)
+
+    monkeypatch.setattr(audit_packet_jobs.AuditPacketGenerator, "generate", generate)
+    monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", 0)
+    return calls
+
+
+class TestRenderPool:
+    """Tests for render_pdf."""
+
+    @pytest.mark.asyncio
+    async def test_renders_in_thread_without_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", 0)
+        pdf = await pdf_render_pool.render_pdf("test", _story(), pagesize=letter)
+        assert pdf.startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_renders_in_worker_process(self, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", 1)
+        try:
+            pdf = await pdf_render_pool.render_pdf("test", _story(), pagesize=letter)
+        finally:
+            pdf_render_pool.shutdown_render_pool()
+        assert pdf.startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced(self, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", 1)
+        try:
+            await pdf_render_pool.render_pdf("test", _story(), pagesize=letter)
+            broken = pdf_render_pool._executor
+            for process in list(broken._processes.values()):
+                process.kill()
+                process.join()
+
+            pdf = await pdf_render_pool.render_pdf("test", _story(), pagesize=letter)
+            assert pdf_render_pool._executor is not broken
+        finally:
+            pdf_render_pool.shutdown_render_pool()
+        assert pdf.startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, monkeypatch):
+        monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", 0)
+        styles = getSampleStyleSheet()
+        story = [Paragraph(f"Line {i}", styles["Normal"]) for i in range(3000)]
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await pdf_render_pool.render_pdf("test", story, pagesize=letter)
+        task.cancel()
+        assert ticks > 1
+
+
+class TestAuditPacketJobs:
+    """Tests for AuditPacketJobs."""
+
+    @pytest.mark.asyncio
+    async def test_submit_and_wait(self, sqlite_session_factory, renders):
+        jobs = AuditPacketJobs(InMemoryCache(), sqlite_session_factory)
+        async with sqlite_session_factory() as db:
+            job = await jobs.submit(db, "item-1", TENANT, "user-1", "reviewer", OPTIONS)
+        assert job["status"] == AuditPacketJobStatus.PENDING.value
+
+        done = await jobs.wait(job["job_id"], TENANT, "user-1", timeout=10)
+        assert done["status"] == AuditPacketJobStatus.COMPLETED.value
+        assert jobs.cache.packets[done["packet_id"]].startswith(b"%PDF")
+
+        # Jobs are bound to their tenant and user
+        assert await jobs.get(job["job_id"], TENANT, "user-2") is None
+        assert await jobs.get(job["job_id"], "tenant-2", "user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_identical_request_reuses_packet(self, sqlite_session_factory, renders):
+        jobs = AuditPacketJobs(InMemoryCache(), sqlite_session_factory)
+        async with sqlite_session_factory() as db:
+            first = await jobs.submit(db, "item-1", TENANT, "user-1", "reviewer", OPTIONS)
+            await jobs.wait(first["job_id"], TENANT, "user-1", timeout=10)
+
+            again = await jobs.submit(db, "item-1", TENANT, "user-1", "reviewer", OPTIONS)
+            other_options = await jobs.submit(
+                db, "item-1", TENANT, "user-1", "reviewer", {**OPTIONS, "include_images": False}
+            )
+            await jobs.wait(other_options["job_id"], TENANT, "user-1", timeout=10)
+
+        assert again["reused"] and again["packet_id"] == first["packet_id"]
+        assert other_options["packet_id"] != first["packet_id"]
+        assert renders == ["item-1", "item-1"]
+
+    @pytest.mark.asyncio
+    async def test_new_audit_activity_invalidates_reuse(self, sqlite_session_factory, renders):
+        jobs = AuditPacketJobs(InMemoryCache(), sqlite_session_factory)
+        async with sqlite_session_factory() as db:
+            first = await jobs.submit(db, "item-1", TENANT, "user-1", "reviewer", OPTIONS)
+            await jobs.wait(first["job_id"], TENANT, "user-1", timeout=10)
+
+            db.add(
+                AuditLog(
+                    tenant_id=TENANT,
+                    timestamp=datetime.now(timezone.utc),
+                    action=AuditAction.ITEM_VIEWED,
+                    resource_type="check_item",
+                    resource_id="item-1",
+                )
+            )
+            await db.commit()
+
+            second = await jobs.submit(db, "item-1", TENANT, "user-1", "reviewer", OPTIONS)
+
+        assert not second["reused"]
+        assert second["packet_id"] != first["packet_id"]
+
+
+class TestSubmitEndpoint:
+    """Tests for POST /audit/packet/jobs."""
+
+    @pytest.mark.asyncio
+    async def test_reuse_audit_entry_is_committed(
+        self, sqlite_session_factory, renders, monkeypatch
+    ):
+        cache = InMemoryCache()
+        monkeypatch.setattr(audit_endpoints, "get_cache", AsyncMock(return_value=cache))
+        user = SimpleNamespace(id="user-1", tenant_id=TENANT, username="reviewer")
+        async with sqlite_session_factory() as db:
+            item = make_item()
+            db.add(item)
+            await db.commit()
+            first = await AuditPacketJobs(cache, sqlite_session_factory).submit(
+                db, item.id, TENANT, user.id, user.username, OPTIONS
+            )
+            await AuditPacketJobs(cache, sqlite_session_factory).wait(
+                first["job_id"], TENANT, user.id, timeout=10
+            )
+
+        async with sqlite_session_factory() as db:
+            response = await audit_endpoints.submit_audit_packet_job(
+                AuditPacketRequest(check_item_id=item.id), db=db, current_user=user
+            )
+            # The request session is closed without a commit of its own
+            await db.rollback()
+
+        assert response.packet_id == first["packet_id"]
+        async with sqlite_session_factory() as db:
+            result = await db.execute(
+                select(AuditLog.description).where(
+                    AuditLog.action == AuditAction.AUDIT_PACKET_GENERATED
+                )
+            )
+            descriptions = result.scalars().all()
+        assert f"Reused audit packet {first['packet_id']}" in descriptions
@@ -0,0 +1,166 @@
+"""Tests for chunked binary audit packet storage in CacheService."""
+
+import pytest
+from app.services.cache_service import CacheService
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the audit packet hash + list layout."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.ttls: dict[str, object] = {}
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    async def hgetall(self, key):
+        value = self.data.get(key, {})
+        # The decoded client returns str values
+        return {k: str(v) for k, v in value.items()}
+
+    async def lindex(self, key, index):
+        items = self.data.get(key, [])
+        return items[index] if 0 <= index < len(items) else None
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+        return len(keys)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def delete(self, *keys):
+        self.ops.append(lambda: [self.redis.data.pop(k, None) for k in keys])
+
+    def rpush(self, key, value):
+        assert isinstance(value, bytes)
+        self.ops.append(lambda: self.redis.data.setdefault(key, []).append(value))
+
+    def hset(self, key, mapping):
+        self.ops.append(lambda: self.redis.data.setdefault(key, {}).update(mapping))
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: self.redis.ttls.__setitem__(key, ttl))
+
+    def llen(self, key):
+        self.ops.append(lambda: len(self.redis.data.get(key, [])))
+
+    def ttl(self, key):
+        def remaining():
+            if key not in self.redis.data:
+                return -2
+            ttl = self.redis.ttls.get(key, -1)
+            return int(ttl.total_seconds()) if hasattr(ttl, "total_seconds") else ttl
+
+        self.ops.append(remaining)
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(CacheService, "AUDIT_PACKET_CHUNK_SIZE", 4)
+    service = CacheService(redis_url="redis://fake")
+    fake = FakeRedis()
+    service._redis = fake
+    service._raw_redis = fake
+    return service, fake
+
+
+async def _store(service, pdf_bytes=b"%PDF-1.4 body"):
+    return await service.store_audit_packet(
+        packet_id="p1",
+        pdf_bytes=pdf_bytes,
+        tenant_id="tenant-1",
+        user_id="user-1",
+        check_item_id="item-1",
+    )
+
+
+class TestAuditPacketStorage:
+    """Tests for store/open/iter audit packet."""
+
+    @pytest.mark.asyncio
+    async def test_stores_raw_chunks_and_metadata_hash(self, cache):
+        service, fake = cache
+        assert await _store(service) is True
+
+        assert fake.data["audit:packet:p1:data"] == [b"%PDF", b"-1.4", b" bod", b"y"]
+        meta = fake.data["audit:packet:p1"]
+        assert meta["size"] == 13
+        assert meta["chunks"] == 4
+        assert set(fake.ttls) == {"audit:packet:p1", "audit:packet:p1:data"}
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_for_owner(self, cache):
+        service, _ = cache
+        await _store(service)
+
+        packet = await service.open_audit_packet("p1", "tenant-1", "user-1")
+        assert packet["size"] == 13
+        assert packet["check_item_id"] == "item-1"
+
+        chunks = [c async for c in service.iter_audit_packet("p1", packet["chunks"])]
+        assert b"".join(chunks) == b"%PDF-1.4 body"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tenant_id,user_id", [("tenant-2", "user-1"), ("tenant-1", "user-2")])
+    async def test_other_tenant_or_user_sees_nothing(self, cache, tenant_id, user_id):
+        service, _ = cache
+        await _store(service)
+
+        assert await service.open_audit_packet("p1", tenant_id, user_id) is None
+        assert await service.retrieve_audit_packet("p1", tenant_id, user_id) == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_retrieve_joins_chunks(self, cache):
+        service, _ = cache
+        await _store(service)
+
+        assert await service.retrieve_audit_packet("p1", "tenant-1", "user-1") == (
+            b"%PDF-1.4 body",
+            "item-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_incomplete_data_is_rejected_before_streaming(self, cache):
+        service, fake = cache
+        await _store(service)
+        fake.data["audit:packet:p1:data"].pop()
+
+        assert await service.open_audit_packet("p1", "tenant-1", "user-1") is None
+
+    @pytest.mark.asyncio
+    async def test_open_extends_ttl_for_download(self, cache):
+        service, fake = cache
+        await _store(service)
+        fake.ttls["audit:packet:p1:data"] = 10
+
+        assert await service.open_audit_packet("p1", "tenant-1", "user-1") is not None
+        grace = int(CacheService.AUDIT_PACKET_DOWNLOAD_GRACE.total_seconds())
+        assert fake.ttls["audit:packet:p1"] == grace
+        assert fake.ttls["audit:packet:p1:data"] == grace
+
+    @pytest.mark.asyncio
+    async def test_expiry_mid_stream_raises(self, cache):
+        service, fake = cache
+        await _store(service)
+        packet = await service.open_audit_packet("p1", "tenant-1", "user-1")
+
+        stream = service.iter_audit_packet("p1", packet["chunks"])
+        assert await stream.__anext__() == b"%PDF"
+        await service.delete_audit_packet("p1")
+        with pytest.raises(LookupError):
+            await stream.__anext__()
@@ -0,0 +1,76 @@
+"""Tests for streaming CSV export encoding."""
+
+import csv
+import gzip
+import io
+
+import pytest
+from app.services import csv_export
+from app.services.csv_export import csv_response, iter_csv
+
+
+async def _rows(count: int):
+    for i in range(count):
+        yield [i, f"payee, {i}", "note\nwith newline"]
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+class TestIterCsv:
+    """Tests for iter_csv."""
+
+    @pytest.mark.asyncio
+    async def test_writes_header_and_quoted_rows(self):
+        chunks = await _collect(iter_csv(("ID", "Payee", "Notes"), _rows(2)))
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows == [
+            ["ID", "Payee", "Notes"],
+            ["0", "payee, 0", "note\nwith newline"],
+            ["1", "payee, 1", "note\nwith newline"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_emits_bounded_chunks(self, monkeypatch):
+        monkeypatch.setattr(csv_export, "CSV_CHUNK_BYTES", 256)
+
+        chunks = await _collect(iter_csv(("ID", "Payee", "Notes"), _rows(100)))
+
+        assert len(chunks) > 10
+        # A chunk is flushed as soon as it reaches the threshold, so it can
+        # only overshoot by one row
+        assert max(len(chunk) for chunk in chunks) < 256 + 64
+
+    @pytest.mark.asyncio
+    async def test_gzip_round_trips(self, monkeypatch):
+        monkeypatch.setattr(csv_export, "CSV_CHUNK_BYTES", 256)
+
+        plain = b"".join(await _collect(iter_csv(("ID", "Payee", "Notes"), _rows(100))))
+        packed = b"".join(
+            await _collect(iter_csv(("ID", "Payee", "Notes"), _rows(100), compress=True))
+        )
+
+        assert gzip.decompress(packed) == plain
+
+    @pytest.mark.asyncio
+    async def test_empty_export_has_header(self):
+        chunks = await _collect(iter_csv(("ID",), _rows(0)))
+        assert b"".join(chunks).decode().splitlines() == ["ID"]
+
+
+class TestCsvResponse:
+    """Tests for csv_response."""
+
+    def test_plain_attachment(self):
+        response = csv_response("decisions_20260101", ("ID",), _rows(0))
+        assert response.media_type == "text/csv"
+        assert response.headers["content-disposition"] == (
+            "attachment; filename=decisions_20260101.csv"
+        )
+
+    def test_compressed_attachment(self):
+        response = csv_response("decisions_20260101", ("ID",), _rows(0), compress=True)
+        assert response.media_type == "application/gzip"
+        assert response.headers["content-disposition"].endswith("decisions_20260101.csv.gz")
@@ -0,0 +1,126 @@
+"""Tests for the tenant-scoped image byte cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.integrations.interfaces.base import CheckImageData
+from app.services.image_cache import ImageCache
+
+
+def _image(image_id: str = "img-1", size: int = 100) -> CheckImageData:
+    return CheckImageData(
+        image_id=image_id,
+        image_type="front",
+        content=bytes(size),
+        content_type="image/png",
+        width=800,
+        height=400,
+        dpi=200,
+    )
+
+
+def _adapter() -> MagicMock:
+    adapter = MagicMock()
+    adapter.get_image = AsyncMock(side_effect=lambda image_id: _image(image_id))
+    adapter.get_thumbnail = AsyncMock(return_value=b"thumb")
+    return adapter
+
+
+def _redis_tier() -> MagicMock:
+    """A Redis tier backed by a dict, so writes can be read back."""
+    stored: dict[str, bytes] = {}
+    cache = MagicMock()
+    cache.stored = stored
+    cache.get_image_blob = AsyncMock(side_effect=lambda key: stored.get(key))
+    cache.set_image_blob = AsyncMock(
+        side_effect=lambda key, blob, ttl: stored.__setitem__(key, blob) or True
+    )
+    return cache
+
+
+class TestImageCache:
+    """Tests for the in-process and Redis tiers."""
+
+    @pytest.mark.asyncio
+    async def test_miss_fetches_once_then_hits_locally(self):
+        adapter = _adapter()
+        cache = ImageCache(cache=_redis_tier(), max_bytes=1024, ttl_seconds=60)
+
+        first = await cache.get_image(adapter, "tenant-1", "img-1")
+        second = await cache.get_image(adapter, "tenant-1", "img-1")
+
+        assert first is second
+        adapter.get_image.assert_awaited_once_with("img-1")
+        assert (cache.misses, cache.local_hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_encrypted_and_shared(self):
+        redis = _redis_tier()
+        await ImageCache(cache=redis, max_bytes=1024, ttl_seconds=60).get_image(
+            _adapter(), "tenant-1", "img-1"
+        )
+
+        blob = redis.stored["tenant-1:full:img-1"]
+        assert b"image/png" not in blob
+
+        # Another worker reads it back without calling the adapter
+        adapter = _adapter()
+        other = ImageCache(cache=redis, max_bytes=1024, ttl_seconds=60)
+        image = await other.get_image(adapter, "tenant-1", "img-1")
+
+        assert image == _image("img-1")
+        adapter.get_image.assert_not_awaited()
+        assert other.redis_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_blob_does_not_decrypt_under_another_tenant(self):
+        redis = _redis_tier()
+        await ImageCache(cache=redis, max_bytes=1024, ttl_seconds=60).get_image(
+            _adapter(), "tenant-1", "img-1"
+        )
+        redis.stored["tenant-2:full:img-1"] = redis.stored["tenant-1:full:img-1"]
+
+        adapter = _adapter()
+        cache = ImageCache(cache=redis, max_bytes=1024, ttl_seconds=60)
+        await cache.get_image(adapter, "tenant-2", "img-1")
+
+        adapter.get_image.assert_awaited_once()
+        assert (cache.redis_hits, cache.misses) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_local_tier_evicts_by_bytes(self):
+        adapter = _adapter()
+        cache = ImageCache(cache=_redis_tier(), max_bytes=250, ttl_seconds=60, use_redis=False)
+
+        for image_id in ("img-1", "img-2", "img-3"):
+            await cache.get_image(adapter, "tenant-1", image_id)
+
+        assert cache.stats()["local_bytes"] == 200
+        await cache.get_image(adapter, "tenant-1", "img-1")
+        assert adapter.get_image.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        adapter = _adapter()
+        cache = ImageCache(cache=_redis_tier(), max_bytes=1024, ttl_seconds=60)
+
+        results = await asyncio.gather(
+            *(cache.get_thumbnail(adapter, "tenant-1", "img-1") for _ in range(5))
+        )
+
+        assert results == [b"thumb"] * 5
+        adapter.get_thumbnail.assert_awaited_once_with("img-1", 200, 100)
+
+    @pytest.mark.asyncio
+    async def test_missing_image_is_not_cached(self):
+        adapter = _adapter()
+        adapter.get_image = AsyncMock(return_value=None)
+        redis = _redis_tier()
+        cache = ImageCache(cache=redis, max_bytes=1024, ttl_seconds=60)
+
+        assert await cache.get_image(adapter, "tenant-1", "img-1") is None
+        assert await cache.get_image(adapter, "tenant-1", "img-1") is None
+
+        assert adapter.get_image.await_count == 2
+        redis.set_image_blob.assert_not_awaited()
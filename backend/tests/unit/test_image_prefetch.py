@@ -0,0 +1,106 @@
+"""Tests for background image cache warm-up."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.services.image_prefetch import ImagePrefetcher
+
+
+def _session_factory(rows: list[tuple[str | None, str]]):
+    """Session factory whose image lookup returns (external_image_id, id) rows."""
+    result = MagicMock()
+    result.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    factory.db = db
+    return factory
+
+
+def _image_cache() -> MagicMock:
+    cache = MagicMock()
+    cache.get_image = AsyncMock(return_value=None)
+    cache.get_thumbnail = AsyncMock(return_value=None)
+    return cache
+
+
+class TestImagePrefetcher:
+    """Tests for scheduling, rate limiting and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_full_image_and_thumbnail(self):
+        cache = _image_cache()
+        adapter = MagicMock()
+        prefetcher = ImagePrefetcher(
+            cache=cache,
+            session_factory=_session_factory([("ext-front", "img-1"), (None, "img-2")]),
+            adapter_factory=lambda: adapter,
+            concurrency=2,
+            tenant_per_minute=100,
+        )
+
+        await prefetcher.schedule("tenant-1", ["item-1", "item-1", "item-2"])
+
+        fetched = {call.args for call in cache.get_image.await_args_list}
+        assert fetched == {(adapter, "tenant-1", "ext-front"), (adapter, "tenant-1", "img-2")}
+        assert cache.get_thumbnail.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_over_tenant_budget_is_dropped(self):
+        cache = _image_cache()
+        factory = _session_factory([(None, f"img-{n}") for n in range(5)])
+        prefetcher = ImagePrefetcher(
+            cache=cache,
+            session_factory=factory,
+            adapter_factory=MagicMock,
+            concurrency=4,
+            tenant_per_minute=4,
+        )
+
+        await prefetcher.schedule("tenant-1", ["item-1"])
+        assert cache.get_image.await_count + cache.get_thumbnail.await_count == 4
+
+        # Another tenant has its own budget
+        await prefetcher.schedule("tenant-2", ["item-2"])
+        assert cache.get_image.await_count + cache.get_thumbnail.await_count == 8
+
+    @pytest.mark.asyncio
+    async def test_new_batch_cancels_owners_previous_batch(self):
+        started = asyncio.Event()
+        cache = _image_cache()
+
+        async def slow_fetch(*args):
+            started.set()
+            await asyncio.sleep(60)
+
+        cache.get_image = AsyncMock(side_effect=slow_fetch)
+        prefetcher = ImagePrefetcher(
+            cache=cache,
+            session_factory=_session_factory([(None, "img-1")]),
+            adapter_factory=MagicMock,
+            concurrency=1,
+            tenant_per_minute=100,
+        )
+
+        first = prefetcher.schedule("tenant-1", ["item-1"], owner="user-1")
+        await started.wait()
+        prefetcher.schedule("tenant-1", ["item-2"], owner="user-1")
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await prefetcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_schedule(self):
+        prefetcher = ImagePrefetcher(
+            cache=_image_cache(),
+            session_factory=_session_factory([]),
+            adapter_factory=MagicMock,
+        )
+        assert prefetcher.schedule("tenant-1", [None]) is None
@@ -0,0 +1,173 @@
+"""Tests for bulk one-time image token minting and single-statement redemption."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.api.v1.endpoints import images
+from app.api.v1.endpoints.images import (
+    BatchTokenMintRequest,
+    get_image_by_token,
+    mint_image_tokens_batch,
+)
+from app.models.audit import AuditAction, AuditLog
+from app.models.check import CheckImage, CheckItem
+from app.models.image_token import ImageAccessToken
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.models.user import User
+from fastapi import HTTPException
+from sqlalchemy import select
+from starlette.requests import Request
+
+from tests.unit.factories import OTHER_TENANT, TENANT, make_item, make_user
+
+pytestmark = pytest.mark.sqlite_tables(
+    User, CheckItem, CheckImage, ImageAccessToken, AuditLog, ItemStateRollup, ActivityRollup
+)
+
+
+@pytest.fixture
+def served(monkeypatch):
+    """Image cache stub serving fixed thumbnail and image bytes."""
+    cache = SimpleNamespace(
+        get_thumbnail=AsyncMock(return_value=b"thumb"),
+        get_image=AsyncMock(
+            return_value=SimpleNamespace(content=b"image", content_type="image/png")
+        ),
+    )
+    monkeypatch.setattr(images, "image_cache", cache)
+    monkeypatch.setattr(images, "get_adapter", MagicMock())
+    return cache
+
+
+def _request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"user-agent", b"pytest")],
+            "client": ("10.0.0.1", 50000),
+        }
+    )
+
+
+def _image(item: CheckItem) -> CheckImage:
+    return CheckImage(check_item_id=item.id, image_type="front", external_image_id="ext-1")
+
+
+async def _seed(db) -> tuple[User, CheckImage, CheckImage]:
+    """A reviewer, one of their tenant's images and one of another tenant's."""
+    user = make_user(1)
+    own_item, other_item = make_item(), make_item(tenant_id=OTHER_TENANT)
+    db.add_all([user, own_item, other_item])
+    await db.flush()
+    own, other = _image(own_item), _image(other_item)
+    db.add_all([own, other])
+    await db.commit()
+    return user, own, other
+
+
+async def _mint(db, user: User, image_ids: list[str]) -> list[str]:
+    response = await mint_image_tokens_batch.__wrapped__(
+        request=_request(),
+        data=BatchTokenMintRequest(image_ids=image_ids, is_thumbnail=True),
+        db=db,
+        current_user=user,
+    )
+    return [token.token_id for token in response.tokens]
+
+
+async def _redeem(db, token_id: str):
+    return await get_image_by_token.__wrapped__(request=_request(), token_id=token_id, db=db)
+
+
+async def _audit_actions(db) -> list[AuditAction]:
+    result = await db.execute(select(AuditLog.action).order_by(AuditLog.timestamp))
+    return list(result.scalars().all())
+
+
+class TestBatchMint:
+    """Tests for mint_image_tokens_batch."""
+
+    @pytest.mark.asyncio
+    async def test_skips_other_tenant_and_missing_images(self, db, served):
+        user, own, other = await _seed(db)
+
+        token_ids = await _mint(db, user, [own.id, other.id, "no-such-image"])
+
+        assert len(token_ids) == 1
+        rows = (await db.execute(select(ImageAccessToken))).scalars().all()
+        assert [(row.id, row.image_id, row.tenant_id) for row in rows] == [
+            (token_ids[0], own.id, TENANT)
+        ]
+        assert await _audit_actions(db) == [AuditAction.IMAGE_TOKEN_CREATED]
+
+    @pytest.mark.asyncio
+    async def test_nothing_owned_writes_nothing(self, db, served):
+        user, _, other = await _seed(db)
+
+        assert await _mint(db, user, [other.id]) == []
+        assert (await db.execute(select(ImageAccessToken))).scalars().all() == []
+        assert await _audit_actions(db) == []
+
+
+class TestRedemption:
+    """Tests for get_image_by_token."""
+
+    @pytest.mark.asyncio
+    async def test_minted_token_is_redeemable_once(self, db, served):
+        user, own, _ = await _seed(db)
+        [token_id] = await _mint(db, user, [own.id])
+
+        response = await _redeem(db, token_id)
+
+        assert response.status_code == 200
+        assert response.body == b"thumb"
+        served.get_thumbnail.assert_awaited_once()
+        assert served.get_thumbnail.await_args.args[1:] == (TENANT, own.id)
+        token = await db.get(ImageAccessToken, token_id)
+        assert token.used_at is not None
+        assert token.used_by_ip == "10.0.0.1"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _redeem(db, token_id)
+
+        assert exc_info.value.status_code == 410
+        assert served.get_thumbnail.await_count == 1
+        assert await _audit_actions(db) == [
+            AuditAction.IMAGE_TOKEN_CREATED,
+            AuditAction.IMAGE_TOKEN_USED,
+            AuditAction.IMAGE_TOKEN_REUSE_ATTEMPTED,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_gone(self, db, served):
+        user, own, _ = await _seed(db)
+        token = ImageAccessToken(
+            tenant_id=TENANT,
+            image_id=own.id,
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+            created_by_user_id=user.id,
+            is_thumbnail=True,
+        )
+        db.add(token)
+        await db.commit()
+        db.expunge(token)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _redeem(db, token.id)
+
+        assert exc_info.value.status_code == 410
+        assert exc_info.value.detail == "Token has expired"
+        served.get_thumbnail.assert_not_awaited()
+        assert (await db.get(ImageAccessToken, token.id)).used_at is None
+        assert await _audit_actions(db) == [AuditAction.IMAGE_TOKEN_EXPIRED]
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_is_not_found(self, db, served):
+        with pytest.raises(HTTPException) as exc_info:
+            await _redeem(db, "no-such-token")
+
+        assert exc_info.value.status_code == 404
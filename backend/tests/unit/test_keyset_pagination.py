@@ -0,0 +1,137 @@
+"""Tests for keyset (cursor) pagination of check and audit log searches."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.audit.service import AuditService
+from app.db import pagination
+from app.db.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    resolve_count_mode,
+)
+from app.models.audit import AuditAction, AuditLog
+from app.models.check import CheckImage, CheckItem
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.schemas.check import CheckSearchRequest
+from app.services.check import CheckService
+from sqlalchemy import select
+
+from tests.unit.factories import OTHER_TENANT, TENANT, make_item
+
+pytestmark = pytest.mark.sqlite_tables(
+    CheckItem, CheckImage, AuditLog, ItemStateRollup, ActivityRollup
+)
+
+
+class TestCursorEncoding:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        presented = datetime(2026, 5, 1, 12, 30, tzinfo=timezone.utc)
+        cursor = encode_cursor(7, presented, "item-1")
+        assert decode_cursor(cursor, int, datetime.fromisoformat, str) == (7, presented, "item-1")
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(1), encode_cursor("x", "y")])
+    def test_invalid(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, int, str)
+
+
+class TestCheckSearchKeyset:
+    """Keyset pages cover the same rows, in the same order, as offset pages."""
+
+    @pytest.mark.asyncio
+    async def test_pages_match_offset_order(self, db):
+        base = datetime.now(timezone.utc)
+        items = [make_item(presented_date=base - timedelta(hours=i % 4)) for i in range(11)]
+        for index, item in enumerate(items):
+            item.priority = index % 3
+        db.add_all([*items, make_item(tenant_id=OTHER_TENANT)])
+        await db.commit()
+
+        service = CheckService(db)
+        search = CheckSearchRequest()
+        expected, total = await service.search_items(search, "user", TENANT, page_size=100)
+        assert total == 11
+
+        seen, cursor = [], None
+        while True:
+            page = await service.search_items_keyset(
+                search, "user", TENANT, cursor=cursor, page_size=4
+            )
+            assert page.total == 11
+            seen.extend(item.id for item in page.items)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert seen == [item.id for item in expected]
+        assert page.next_cursor is None
+
+
+class TestAuditSearchKeyset:
+    """Tests for AuditService.search_audit_logs_keyset."""
+
+    @pytest.mark.asyncio
+    async def test_walks_all_logs_newest_first(self, db):
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            db.add(
+                AuditLog(
+                    tenant_id=TENANT,
+                    timestamp=now - timedelta(minutes=i // 2),
+                    action=AuditAction.ITEM_VIEWED,
+                    resource_type="check_item",
+                )
+            )
+        await db.commit()
+
+        service = AuditService(db)
+        first = await service.search_audit_logs_keyset(TENANT, page_size=3)
+        second = await service.search_audit_logs_keyset(
+            TENANT, cursor=first.next_cursor, page_size=3
+        )
+
+        assert first.has_next and not second.has_next
+        logs = first.items + second.items
+        assert len({log.id for log in logs}) == 5
+        keys = [(log.timestamp, log.id) for log in logs]
+        assert keys == sorted(keys, reverse=True)
+
+
+class TestCountRows:
+    """Tests for count_rows."""
+
+    @pytest.mark.asyncio
+    async def test_capped_count_reports_estimate(self, db, monkeypatch):
+        db.add_all([make_item() for _ in range(4)])
+        await db.commit()
+        monkeypatch.setattr(pagination, "CAPPED_COUNT_LIMIT", 2)
+
+        query = select(CheckItem).where(CheckItem.tenant_id == TENANT)
+        assert await count_rows(db, query) == (4, False)
+        assert await count_rows(db, query, CountMode.CAPPED) == (2, True)
+        assert await count_rows(db, query, CountMode.NONE) == (None, False)
+
+
+class TestResolveCountMode:
+    """Only the first keyset page is counted unless the client asks."""
+
+    @pytest.mark.parametrize(
+        "requested,cursor,expected",
+        [
+            (None, None, CountMode.EXACT),
+            (CountMode.NONE, None, CountMode.EXACT),
+            (CountMode.CAPPED, None, CountMode.CAPPED),
+            (None, "", CountMode.EXACT),
+            (None, "abc", CountMode.NONE),
+            (CountMode.EXACT, "abc", CountMode.EXACT),
+            (CountMode.NONE, "", CountMode.NONE),
+        ],
+    )
+    def test_resolve(self, requested, cursor, expected):
+        assert resolve_count_mode(requested, cursor) == expected
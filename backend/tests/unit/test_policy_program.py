@@ -0,0 +1,255 @@
+"""Tests for compiled, cached policy programs."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from app.models.check import AccountType, RiskLevel
+from app.models.policy import Policy, PolicyRule, PolicyStatus, PolicyVersion
+from app.policy.cache import PolicyProgramCache
+from app.policy.compiler import compile_policy_data, compile_rule
+from app.policy.engine import PolicyEngine
+
+pytestmark = pytest.mark.sqlite_tables(Policy, PolicyVersion, PolicyRule)
+
+
+class FakeRedisTier:
+    """Dict-backed stand-in for the CacheService policy methods."""
+
+    def __init__(self):
+        self.active: dict[str, dict] = {}
+        self.versions: dict[str, dict] = {}
+
+    async def get_active_policy(self, tenant_id):
+        return dict(self.active[tenant_id]) if tenant_id in self.active else None
+
+    async def set_active_policy(self, tenant_id, policy_data, ttl=None):
+        self.active[tenant_id] = dict(policy_data)
+        return True
+
+    async def get_policy_version(self, policy_version_id):
+        return self.versions.get(policy_version_id)
+
+    async def set_policy_version(self, policy_version_id, version_data, ttl=None):
+        self.versions[policy_version_id] = version_data
+        return True
+
+    async def invalidate_policy(self, tenant_id, policy_id=None):
+        self.active.pop(tenant_id, None)
+        return True
+
+
+def _item(tenant_id="tenant-1", **overrides):
+    data = {
+        "tenant_id": tenant_id,
+        "amount": Decimal("12000"),
+        "account_type": AccountType.CONSUMER,
+        "risk_level": RiskLevel.LOW,
+        "account_tenure_days": 365,
+        "avg_check_amount_30d": Decimal("1000"),
+        "returned_item_count_90d": 0,
+        "payee_name": "Acme Supplies",
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+def _rule(rule_id, conditions, actions, is_enabled=True):
+    return {
+        "id": rule_id,
+        "is_enabled": is_enabled,
+        "conditions": json.dumps(conditions),
+        "actions": json.dumps(actions),
+    }
+
+
+def _condition(field, operator, value, value_type="number"):
+    return {"field": field, "operator": operator, "value": value, "value_type": value_type}
+
+
+def _add_policy(session, tenant_id, amount_threshold, version_number=1):
+    policy = Policy(tenant_id=tenant_id, name=f"Policy {tenant_id}", status=PolicyStatus.ACTIVE)
+    session.add(policy)
+    return _add_version(session, policy, amount_threshold, version_number)
+
+
+def _add_version(session, policy, amount_threshold, version_number, is_current=True):
+    version = PolicyVersion(
+        policy=policy,
+        version_number=version_number,
+        effective_date=datetime.now(timezone.utc) - timedelta(days=1),
+        is_current=is_current,
+    )
+    version.rules = [
+        PolicyRule(
+            name="Dual control",
+            rule_type="dual_control",
+            conditions=json.dumps([_condition("amount", "greater_or_equal", amount_threshold)]),
+            actions=json.dumps([{"action": "require_dual_control", "params": None}]),
+        )
+    ]
+    session.add(version)
+    return version
+
+
+def _policy_queries(statements: list[str]) -> int:
+    return sum(1 for s in statements if "FROM policy_versions" in s)
+
+
+class TestCompiledPolicy:
+    """Tests for compiling and evaluating rule programs."""
+
+    def test_evaluates_actions_in_rule_order(self):
+        program = compile_policy_data(
+            {
+                "policy_id": "p1",
+                "policy_version_id": "v1",
+                "rules": [
+                    _rule(
+                        "r1",
+                        [_condition("amount", "greater_or_equal", 10000)],
+                        [
+                            {"action": "require_dual_control", "params": None},
+                            {"action": "set_risk_level", "params": {"level": "medium"}},
+                        ],
+                    ),
+                    _rule(
+                        "r2",
+                        [_condition("amount_vs_avg_ratio", "greater_or_equal", 5)],
+                        [
+                            {"action": "set_risk_level", "params": {"level": "high"}},
+                            {"action": "add_flag", "params": {"flag": "UNUSUAL_AMOUNT"}},
+                            {"action": "route_to_queue", "params": {"queue_id": "q-high"}},
+                        ],
+                    ),
+                    _rule(
+                        "r3",
+                        [_condition("returned_item_count_90d", "greater_than", 0)],
+                        [{"action": "add_flag", "params": {"flag": "PRIOR_RETURNS"}}],
+                    ),
+                ],
+            }
+        )
+
+        result = program.evaluate(_item())
+
+        assert result.rules_triggered == ["r1", "r2"]
+        assert result.requires_dual_control is True
+        assert result.risk_level == "high"
+        assert result.routing_queue_id == "q-high"
+        assert result.flags == ["UNUSUAL_AMOUNT"]
+
+    def test_disabled_and_malformed_rules_never_trigger(self):
+        program = compile_policy_data(
+            {
+                "policy_id": "p1",
+                "policy_version_id": "v1",
+                "rules": [
+                    _rule(
+                        "disabled",
+                        [_condition("amount", "greater_than", 0)],
+                        [{"action": "add_flag", "params": {"flag": "X"}}],
+                        is_enabled=False,
+                    ),
+                    {"id": "bad-json", "is_enabled": True, "conditions": "{", "actions": "[]"},
+                    _rule("bad-operator", [_condition("amount", "approximately", 1)], []),
+                ],
+            }
+        )
+
+        assert program.rules == ()
+        assert program.evaluate(_item()).rules_triggered == []
+
+    def test_string_operators(self):
+        rule = compile_rule(
+            "r1",
+            json.dumps(
+                [
+                    _condition("payee_name", "contains", "ACME", "string"),
+                    _condition("account_type", "in", ["consumer", "business"], "array"),
+                ]
+            ),
+            "[]",
+        )
+
+        assert rule.matches(_item()) is True
+        assert rule.matches(_item(payee_name="Other Co")) is False
+        assert rule.matches(_item(account_type=AccountType.COMMERCIAL)) is False
+
+
+class TestPolicyProgramCaching:
+    """Tests for PolicyEngine program resolution and caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_evaluation_does_not_query(self, db, sql_statements):
+        _add_policy(db, "tenant-1", 10000)
+        await db.commit()
+        engine = PolicyEngine(db, PolicyProgramCache(cache=FakeRedisTier()))
+
+        first = await engine.evaluate(_item())
+        second = await engine.evaluate(_item(amount=Decimal("500")))
+
+        assert first.requires_dual_control is True
+        assert second.requires_dual_control is False
+        assert _policy_queries(sql_statements) == 1
+        assert engine.program_cache.compilations == 1
+
+    @pytest.mark.asyncio
+    async def test_policies_are_tenant_scoped(self, db):
+        _add_policy(db, "tenant-2", 100)
+        await db.commit()
+        engine = PolicyEngine(db, PolicyProgramCache(cache=FakeRedisTier()))
+
+        result = await engine.evaluate(_item(amount=Decimal("1000")))
+
+        assert result.policy_version_id == ""
+        assert result.requires_dual_control is False
+
+    @pytest.mark.asyncio
+    async def test_evaluate_many_resolves_once_per_tenant_and_account_type(
+        self, db, sql_statements
+    ):
+        _add_policy(db, "tenant-1", 10000)
+        _add_policy(db, "tenant-2", 100)
+        await db.commit()
+        engine = PolicyEngine(db, PolicyProgramCache(cache=FakeRedisTier()))
+        items = [_item("tenant-1"), _item("tenant-2", amount=Decimal("500"))] * 50
+
+        results = await engine.evaluate_many(items)
+
+        assert len(results) == 100
+        assert [r.requires_dual_control for r in results[:2]] == [True, True]
+        assert results[0].policy_version_id != results[1].policy_version_id
+        assert _policy_queries(sql_statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_picks_up_activated_version(self, db):
+        version = _add_policy(db, "tenant-1", 10000)
+        await db.commit()
+        engine = PolicyEngine(db, PolicyProgramCache(cache=FakeRedisTier()))
+        assert (await engine.evaluate(_item(amount=Decimal("5000")))).requires_dual_control is False
+
+        version.is_current = False
+        new_version = _add_version(db, version.policy, 1000, version_number=2)
+        await db.commit()
+        await engine.program_cache.invalidate_tenant("tenant-1", version.policy_id)
+
+        result = await engine.evaluate(_item(amount=Decimal("5000")))
+        assert result.policy_version_id == new_version.id
+        assert result.requires_dual_control is True
+
+    @pytest.mark.asyncio
+    async def test_other_workers_compile_from_redis_tier(self, db, sql_statements):
+        _add_policy(db, "tenant-1", 10000)
+        await db.commit()
+        redis_tier = FakeRedisTier()
+        await PolicyEngine(db, PolicyProgramCache(cache=redis_tier)).evaluate(_item())
+
+        other_worker = PolicyEngine(db, PolicyProgramCache(cache=redis_tier))
+        result = await other_worker.evaluate(_item())
+
+        assert result.requires_dual_control is True
+        assert other_worker.program_cache.redis_hits == 1
+        assert _policy_queries(sql_statements) == 1
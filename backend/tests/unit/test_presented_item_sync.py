@@ -0,0 +1,146 @@
+"""Tests for the bulk presented item ingestion pipeline."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from app.integrations.interfaces.base import AccountContext, CheckBehaviorStats, PresentedItem
+from app.models.check import CheckImage, CheckItem
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.services.check import CheckService
+from sqlalchemy import func, select
+
+pytestmark = pytest.mark.sqlite_tables(CheckItem, CheckImage, ItemStateRollup, ActivityRollup)
+
+
+def _presented_item(index: int, account_id: str) -> PresentedItem:
+    return PresentedItem(
+        external_item_id=f"EXT-{index:05d}",
+        source_system="mock",
+        account_id=account_id,
+        account_number_masked="****1234",
+        account_type="consumer",
+        routing_number="123456789",
+        check_number=str(1000 + index),
+        amount=Decimal("7500.00"),
+        currency="USD",
+        payee_name="Test Payee",
+        memo=None,
+        micr_line=None,
+        micr_account=None,
+        micr_routing=None,
+        micr_check_number=None,
+        presented_date=datetime.now(timezone.utc) - timedelta(hours=1),
+        check_date=None,
+        front_image_id=f"IMG-{index:05d}-F",
+        back_image_id=f"IMG-{index:05d}-B",
+        upstream_flags=None,
+    )
+
+
+class FakeAdapter:
+    """Adapter that pages through a fixed item list and counts context lookups."""
+
+    def __init__(self, items: list[PresentedItem]):
+        self.items = items
+        self.page_calls = 0
+        self.context_calls: list[str] = []
+        self.stats_calls: list[str] = []
+
+    async def get_presented_items(self, date_from, date_to, amount_min=None, limit=100, offset=0):
+        self.page_calls += 1
+        return self.items[offset : offset + limit], len(self.items)
+
+    async def get_account_context(self, account_id: str) -> AccountContext:
+        self.context_calls.append(account_id)
+        return AccountContext(
+            account_id=account_id,
+            account_type="consumer",
+            account_tenure_days=400,
+            current_balance=Decimal("20000"),
+            average_balance_30d=Decimal("15000"),
+            relationship_id="REL-1",
+            branch_code=None,
+            market_code=None,
+        )
+
+    async def get_check_behavior_stats(self, account_id: str) -> CheckBehaviorStats:
+        self.stats_calls.append(account_id)
+        return CheckBehaviorStats(
+            account_id=account_id,
+            avg_check_amount_30d=Decimal("1000"),
+            avg_check_amount_90d=Decimal("1000"),
+            avg_check_amount_365d=Decimal("1000"),
+            check_std_dev_30d=Decimal("100"),
+            max_check_amount_90d=Decimal("3000"),
+            check_frequency_30d=4,
+            returned_item_count_90d=0,
+            exception_count_90d=0,
+        )
+
+
+async def _ingest(db, adapter, tenant_id="tenant-1", **kwargs):
+    with patch("app.services.check.get_adapter", return_value=adapter):
+        service = CheckService(db)
+    return await service.ingest_presented_items(tenant_id=tenant_id, **kwargs)
+
+
+class TestPresentedItemIngestion:
+    """Tests for CheckService.ingest_presented_items."""
+
+    @pytest.mark.asyncio
+    async def test_creates_items_and_images_across_pages(self, db):
+        items = [_presented_item(i, f"ACC{i % 3}") for i in range(25)]
+        adapter = FakeAdapter(items)
+
+        stats = await _ingest(db, adapter, page_size=10, chunk_size=4)
+
+        assert stats.fetched == 25
+        assert stats.created == 25
+        assert stats.duplicates == 0
+        assert adapter.page_calls == 3
+        assert await db.scalar(select(func.count()).select_from(CheckItem)) == 25
+        assert await db.scalar(select(func.count()).select_from(CheckImage)) == 50
+        assert await db.scalar(select(func.sum(ItemStateRollup.item_count))) == 25
+
+    @pytest.mark.asyncio
+    async def test_context_fetched_once_per_account(self, db):
+        items = [_presented_item(i, f"ACC{i % 3}") for i in range(25)]
+        adapter = FakeAdapter(items)
+
+        stats = await _ingest(db, adapter, page_size=10)
+
+        assert sorted(adapter.context_calls) == ["ACC0", "ACC1", "ACC2"]
+        assert sorted(adapter.stats_calls) == ["ACC0", "ACC1", "ACC2"]
+        assert stats.accounts_loaded == 3
+
+        item = await db.scalar(select(CheckItem).where(CheckItem.account_id == "ACC1"))
+        assert item.account_tenure_days == 400
+        assert item.avg_check_amount_30d == Decimal("1000")
+        assert item.requires_dual_control is True
+
+    @pytest.mark.asyncio
+    async def test_existing_items_are_skipped(self, db):
+        items = [_presented_item(i, "ACC0") for i in range(10)]
+
+        await _ingest(db, FakeAdapter(items[:4]))
+        stats = await _ingest(db, FakeAdapter(items))
+
+        assert stats.created == 6
+        assert stats.duplicates == 4
+        assert await db.scalar(select(func.count()).select_from(CheckItem)) == 10
+
+    @pytest.mark.asyncio
+    async def test_reports_throughput_and_stage_timings(self, db):
+        stats = await _ingest(db, FakeAdapter([_presented_item(1, "ACC0")]))
+
+        result = stats.to_dict()
+        assert set(result["stage_seconds"]) == {"fetch", "dedupe", "context", "insert"}
+        assert result["items_per_second"] >= 0
+        assert result["created"] == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_tenant_id(self, db):
+        with pytest.raises(ValueError):
+            await _ingest(db, FakeAdapter([]), tenant_id="")
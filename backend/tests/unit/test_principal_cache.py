@@ -0,0 +1,217 @@
+"""Tests for the two-tier authentication principal cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.api.deps import get_current_principal, get_current_user
+from app.services.principal_cache import Principal, PrincipalCache
+from fastapi import HTTPException
+
+
+def _principal(user_id: str = "user-1", tenant_id: str = "tenant-1", **overrides) -> Principal:
+    data = {
+        "id": user_id,
+        "tenant_id": tenant_id,
+        "username": f"{user_id}-name",
+        "is_active": True,
+        "is_superuser": False,
+        "role_ids": frozenset({"role-1"}),
+        "role_names": frozenset({"reviewer"}),
+        "permissions": frozenset({"check_item:view", "check_item:review"}),
+        "permission_names": frozenset({"check_item:view", "check_item:review"}),
+    }
+    data.update(overrides)
+    return Principal(**data)
+
+
+def _redis_tier(stored: dict | None = None) -> MagicMock:
+    cache = MagicMock()
+    cache.get_principal = AsyncMock(return_value=stored)
+    cache.set_principal = AsyncMock(return_value=True)
+    cache.invalidate_principal = AsyncMock(return_value=True)
+    cache.invalidate_tenant_principals = AsyncMock(return_value=True)
+    return cache
+
+
+class TestPrincipal:
+    """Tests for Principal permission checks and serialization."""
+
+    def test_has_permission_is_set_lookup(self):
+        principal = _principal()
+        assert principal.has_permission("check_item", "view") is True
+        assert principal.has_permission("check_item", "approve") is False
+
+    def test_superuser_has_every_permission(self):
+        principal = _principal(is_superuser=True, permissions=frozenset())
+        assert principal.has_permission("anything", "at_all") is True
+
+    def test_has_role(self):
+        principal = _principal()
+        assert principal.has_role("reviewer") is True
+        assert principal.has_role("admin") is False
+
+    def test_round_trips_through_dict(self):
+        principal = _principal()
+        assert Principal.from_dict(principal.to_dict()) == principal
+
+    def test_from_user_flattens_roles(self):
+        permission = MagicMock(resource="queue", action="view")
+        permission.name = "queue:view"
+        role = MagicMock(id="role-9", permissions=[permission])
+        role.name = "supervisor"
+        user = MagicMock(
+            id="user-9",
+            tenant_id="tenant-9",
+            username="sup",
+            is_active=True,
+            is_superuser=False,
+            roles=[role],
+        )
+
+        principal = Principal.from_user(user)
+
+        assert principal.role_ids == frozenset({"role-9"})
+        assert principal.role_names == frozenset({"supervisor"})
+        assert principal.has_permission("queue", "view")
+
+
+class TestPrincipalCache:
+    """Tests for PrincipalCache tiering, eviction and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self):
+        redis_tier = _redis_tier()
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=60)
+
+        await cache.set(_principal())
+        assert await cache.get("user-1") == _principal()
+
+        redis_tier.get_principal.assert_not_awaited()
+        assert cache.local_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_local_tier(self):
+        redis_tier = _redis_tier(stored=_principal().to_dict())
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=60)
+
+        assert await cache.get("user-1") == _principal()
+        assert await cache.get("user-1") == _principal()
+
+        redis_tier.get_principal.assert_awaited_once()
+        assert cache.redis_hits == 1
+        assert cache.local_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        cache = PrincipalCache(cache=_redis_tier(), max_entries=10, local_ttl_seconds=60)
+
+        assert await cache.get("unknown") is None
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest(self):
+        cache = PrincipalCache(cache=_redis_tier(), max_entries=2, local_ttl_seconds=60)
+
+        await cache.set(_principal("a"))
+        await cache.set(_principal("b"))
+        await cache.get("a")  # a becomes most recently used
+        await cache.set(_principal("c"))
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+
+    @pytest.mark.asyncio
+    async def test_expired_local_entry_falls_through(self, monkeypatch):
+        redis_tier = _redis_tier()
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=30)
+        clock = [1000.0]
+        monkeypatch.setattr("app.services.principal_cache.time.monotonic", lambda: clock[0])
+
+        await cache.set(_principal())
+        clock[0] += 31
+
+        assert await cache.get("user-1") is None
+        redis_tier.get_principal.assert_awaited_once_with("user-1")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_clears_both_tiers(self):
+        redis_tier = _redis_tier()
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=60)
+        await cache.set(_principal())
+
+        await cache.invalidate_user("user-1", "tenant-1")
+
+        assert await cache.get("user-1") is None
+        redis_tier.invalidate_principal.assert_awaited_once_with("user-1", "tenant-1")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant_only_drops_that_tenant(self):
+        redis_tier = _redis_tier()
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=60)
+        await cache.set(_principal("a", tenant_id="tenant-1"))
+        await cache.set(_principal("b", tenant_id="tenant-2"))
+
+        await cache.invalidate_tenant("tenant-1")
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") is not None
+        redis_tier.invalidate_tenant_principals.assert_awaited_once_with("tenant-1")
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_hit_skips_database(self, monkeypatch):
+        cache = PrincipalCache(cache=_redis_tier(), max_entries=10, local_ttl_seconds=60)
+        await cache.set(_principal())
+        load = AsyncMock()
+        monkeypatch.setattr("app.services.principal_cache.load_principal", load)
+
+        assert await cache.get_or_load(MagicMock(), "user-1") == _principal()
+        load.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_miss_loads_and_caches(self, monkeypatch):
+        redis_tier = _redis_tier()
+        cache = PrincipalCache(cache=redis_tier, max_entries=10, local_ttl_seconds=60)
+        load = AsyncMock(return_value=_principal())
+        monkeypatch.setattr("app.services.principal_cache.load_principal", load)
+        db = MagicMock()
+
+        assert await cache.get_or_load(db, "user-1") == _principal()
+        assert await cache.get_or_load(db, "user-1") == _principal()
+
+        load.assert_awaited_once_with(db, "user-1")
+        redis_tier.set_principal.assert_awaited_once()
+
+
+class TestInactiveUsers:
+    """Inactive users are rejected with 401 on both authentication paths."""
+
+    @pytest.fixture(autouse=True)
+    def access_token(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.api.deps.decode_token", lambda token: {"type": "access", "sub": "user-1"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_principal_path(self, monkeypatch):
+        cache = PrincipalCache(cache=_redis_tier(), max_entries=10, local_ttl_seconds=60)
+        monkeypatch.setattr("app.api.deps.principal_cache", cache)
+        # load_principal only returns active users
+        monkeypatch.setattr(
+            "app.services.principal_cache.load_principal", AsyncMock(return_value=None)
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_principal(MagicMock(), MagicMock(credentials="token"))
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_user_path(self):
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = None
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(db, MagicMock(credentials="token"))
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,92 @@
+"""Tests for single-statement queue navigation (CheckService.get_adjacent_items)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from app.models.check import CheckItem, CheckStatus
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.services.check import CheckService
+
+from tests.unit.factories import OTHER_TENANT, TENANT, make_item
+
+pytestmark = pytest.mark.sqlite_tables(CheckItem, ItemStateRollup, ActivityRollup)
+
+REVIEWABLE = [CheckStatus.NEW, CheckStatus.IN_REVIEW]
+
+
+@pytest.fixture
+async def queue(db):
+    """IDs of five reviewable items in queue order, plus noise outside the filters."""
+    now = datetime.now(timezone.utc)
+    items = [make_item(presented_date=now - timedelta(hours=i)) for i in range(5)]
+    for index, item in enumerate(items):
+        item.priority = 10 - (index // 2)
+    db.add_all(
+        [
+            *items,
+            make_item(CheckStatus.APPROVED),
+            make_item(tenant_id=OTHER_TENANT),
+        ]
+    )
+    await db.commit()
+
+    # Priority descending, then newest first
+    return [item.id for item in items]
+
+
+class TestAdjacentItems:
+    """Tests for get_adjacent_items."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement(self, db, queue, query_counter):
+        with query_counter() as queries:
+            result = await CheckService(db).get_adjacent_items(
+                queue[2], "user", TENANT, status=REVIEWABLE, prefetch=2
+            )
+
+        assert queries.count == 1
+        assert result == {
+            "previous_id": queue[1],
+            "next_id": queue[3],
+            "next_ids": queue[3:5],
+            "position": 3,
+            "total": 5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_ends_of_queue(self, db, queue):
+        service = CheckService(db)
+
+        first = await service.get_adjacent_items(queue[0], "user", TENANT, status=REVIEWABLE)
+        assert first["previous_id"] is None
+        assert first["next_id"] == queue[1]
+        assert first["position"] == 1
+
+        last = await service.get_adjacent_items(
+            queue[-1], "user", TENANT, status=REVIEWABLE, prefetch=3
+        )
+        assert last["next_id"] is None
+        assert last["next_ids"] == []
+        assert last["position"] == 5
+
+    @pytest.mark.asyncio
+    async def test_decided_item_keeps_its_place(self, db, queue):
+        service = CheckService(db)
+        await service.update_status(queue[2], CheckStatus.APPROVED, "user", TENANT)
+        await db.commit()
+
+        result = await service.get_adjacent_items(queue[2], "user", TENANT, status=REVIEWABLE)
+        assert result["previous_id"] == queue[1]
+        assert result["next_id"] == queue[3]
+        assert result["total"] == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_or_other_tenant_item(self, db, queue):
+        result = await CheckService(db).get_adjacent_items("missing", "user", TENANT)
+        assert result == {
+            "previous_id": None,
+            "next_id": None,
+            "position": 0,
+            "total": 0,
+            "next_ids": [],
+        }
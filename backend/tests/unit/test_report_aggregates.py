@@ -0,0 +1,180 @@
+"""Regression tests for constant-query report and queue statistics endpoints."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from app.api.v1.endpoints.queues import get_queue_stats
+from app.api.v1.endpoints.reports import (
+    get_dashboard_stats,
+    get_decision_report,
+    get_reviewer_performance,
+    get_throughput_report,
+)
+from app.models.check import CheckImage, CheckItem, CheckStatus, RiskLevel
+from app.models.decision import Decision, DecisionAction
+from app.models.fraud import FraudEvent, NetworkMatchAlert
+from app.models.queue import Queue, QueueType
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.models.user import User
+
+from tests.unit.factories import OTHER_TENANT, TENANT, make_decision, make_item, make_user
+
+pytestmark = pytest.mark.sqlite_tables(
+    User,
+    Queue,
+    CheckItem,
+    CheckImage,
+    Decision,
+    FraudEvent,
+    NetworkMatchAlert,
+    ItemStateRollup,
+    ActivityRollup,
+)
+
+CURRENT_USER = SimpleNamespace(id="admin", tenant_id=TENANT, username="admin")
+
+
+class TestDashboardStats:
+    """Tests for /reports/dashboard."""
+
+    @pytest.mark.asyncio
+    async def test_counts_with_constant_queries(self, db, query_counter):
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        db.add_all(
+            [
+                make_item(CheckStatus.NEW, RiskLevel.HIGH, sla_breached=True),
+                make_item(CheckStatus.IN_REVIEW, RiskLevel.LOW),
+                make_item(CheckStatus.ESCALATED, RiskLevel.CRITICAL),
+                make_item(CheckStatus.APPROVED, RiskLevel.LOW),
+                make_item(CheckStatus.REJECTED, RiskLevel.LOW, updated_at=yesterday),
+                make_item(CheckStatus.NEW, RiskLevel.HIGH, tenant_id=OTHER_TENANT),
+            ]
+        )
+        await db.commit()
+
+        with query_counter() as queries:
+            result = await get_dashboard_stats.__wrapped__(
+                request=None, db=db, current_user=CURRENT_USER
+            )
+
+        # Item state rollups, processed activity rollups, dual control
+        assert queries.count == 3
+        assert result["summary"] == {
+            "pending_items": 3,
+            "processed_today": 1,
+            "sla_breached": 1,
+            "dual_control_pending": 0,
+        }
+        assert result["items_by_risk"] == {"low": 1, "medium": 0, "high": 1, "critical": 0}
+        assert result["items_by_status"] == {
+            "new": 1,
+            "in_review": 1,
+            "escalated": 1,
+            "approved": 1,
+            "rejected": 1,
+        }
+
+
+class TestThroughputReport:
+    """Tests for /reports/throughput."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("days", [7, 90])
+    async def test_query_count_independent_of_period(self, db, days, query_counter):
+        now = datetime.now(timezone.utc)
+        two_days_ago = now - timedelta(days=2)
+        db.add_all(
+            [
+                make_item(
+                    CheckStatus.APPROVED, presented_date=two_days_ago, updated_at=two_days_ago
+                ),
+                make_item(CheckStatus.NEW, presented_date=two_days_ago),
+                make_item(CheckStatus.NEW, presented_date=two_days_ago, tenant_id=OTHER_TENANT),
+            ]
+        )
+        await db.commit()
+
+        with query_counter() as queries:
+            result = await get_throughput_report(db=db, current_user=CURRENT_USER, days=days)
+
+        assert queries.count == 2
+        assert len(result["daily"]) == days
+        by_date = {d["date"]: d for d in result["daily"]}
+        bucket = by_date[two_days_ago.date().isoformat()]
+        assert bucket == {"date": two_days_ago.date().isoformat(), "processed": 1, "received": 2}
+        assert sum(d["received"] for d in result["daily"]) == 2
+
+
+class TestDecisionReports:
+    """Tests for /reports/decisions and /reports/reviewer-performance."""
+
+    @pytest.fixture
+    async def decisions(self, db):
+        reviewers = [make_user(i) for i in range(5)]
+        item = make_item()
+        db.add_all([*reviewers, item])
+        await db.flush()
+
+        actions = [DecisionAction.APPROVE, DecisionAction.APPROVE, DecisionAction.RETURN]
+        for index, reviewer in enumerate(reviewers):
+            for action in actions[: index % 3 + 1]:
+                db.add(make_decision(item, reviewer, action))
+        db.add(make_decision(item, reviewers[0], DecisionAction.ESCALATE))
+        await db.commit()
+        return reviewers
+
+    @pytest.mark.asyncio
+    async def test_decision_report_single_query(self, db, decisions, query_counter):
+        with query_counter() as queries:
+            result = await get_decision_report(db=db, current_user=CURRENT_USER, days=30)
+
+        assert queries.count == 1
+        assert result["by_action"] == {"approve": 8, "return": 1, "escalate": 1}
+        assert result["total_decisions"] == 9
+        assert result["approval_rate"] == 88.89
+
+    @pytest.mark.asyncio
+    async def test_reviewer_performance_single_query(self, db, decisions, query_counter):
+        with query_counter() as queries:
+            result = await get_reviewer_performance(db=db, current_user=CURRENT_USER, days=30)
+
+        assert queries.count == 1
+        reviewers = result["reviewers"]
+        assert len(reviewers) == 5
+        assert [r["total_decisions"] for r in reviewers] == sorted(
+            (r["total_decisions"] for r in reviewers), reverse=True
+        )
+        top = reviewers[0]
+        assert top["total_decisions"] == 3
+        assert sum(top["by_action"].values()) == 3
+
+
+class TestQueueStats:
+    """Tests for /queues/{id}/stats."""
+
+    @pytest.mark.asyncio
+    async def test_queue_stats_two_queries(self, db, query_counter):
+        queue = Queue(tenant_id=TENANT, name="Main", queue_type=QueueType.STANDARD)
+        db.add(queue)
+        await db.flush()
+        db.add_all(
+            [
+                make_item(CheckStatus.NEW, RiskLevel.HIGH, queue_id=queue.id, sla_breached=True),
+                make_item(CheckStatus.PENDING_APPROVAL, RiskLevel.HIGH, queue_id=queue.id),
+                make_item(CheckStatus.APPROVED, RiskLevel.LOW, queue_id=queue.id),
+                make_item(CheckStatus.NEW, RiskLevel.LOW),
+            ]
+        )
+        await db.commit()
+
+        with query_counter() as queries:
+            result = await get_queue_stats.__wrapped__(
+                request=None, queue_id=queue.id, db=db, current_user=CURRENT_USER
+            )
+
+        assert queries.count == 2
+        assert result.total_items == 2
+        assert result.items_by_status == {"new": 1, "pending_approval": 1, "approved": 1}
+        assert result.items_by_risk_level == {"high": 2}
+        assert result.sla_breached_count == 1
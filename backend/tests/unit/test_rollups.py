@@ -0,0 +1,192 @@
+"""Tests for incremental maintenance and repair of operational rollups."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from app.models.check import CheckImage, CheckItem, CheckStatus, RiskLevel
+from app.models.decision import Decision, DecisionAction
+from app.models.fraud import FraudEvent, NetworkMatchAlert
+from app.models.rollup import ActivityRollup, ItemStateRollup
+from app.models.user import User
+from app.services.rollup_service import (
+    METRIC_DECISION,
+    METRIC_PROCESSED,
+    METRIC_SLA_BREACHED,
+    ItemState,
+    RollupDeltas,
+    RollupService,
+    hour_bucket,
+)
+from sqlalchemy import select
+
+from tests.unit.factories import TENANT, make_decision, make_item, make_user
+
+pytestmark = pytest.mark.sqlite_tables(
+    User,
+    CheckItem,
+    CheckImage,
+    Decision,
+    FraudEvent,
+    NetworkMatchAlert,
+    ItemStateRollup,
+    ActivityRollup,
+)
+
+
+async def _snapshot(db) -> tuple[set, set]:
+    """Non-zero rollup rows, for comparing incremental and rebuilt counters."""
+    items = await db.execute(select(ItemStateRollup).where(ItemStateRollup.item_count != 0))
+    activity = await db.execute(select(ActivityRollup))
+    return (
+        {
+            (r.queue_id, r.bucket_start, r.status, r.risk_level, r.sla_breached, r.item_count)
+            for r in items.scalars()
+        },
+        {
+            (r.queue_id, r.bucket_start, r.metric, r.value, r.event_count, r.amount_total)
+            for r in activity.scalars()
+        },
+    )
+
+
+class TestHourBucket:
+    """Tests for hour_bucket."""
+
+    def test_floors_to_utc_hour(self):
+        value = datetime(2026, 3, 1, 10, 45, 12, tzinfo=timezone(timedelta(hours=-5)))
+        assert hour_bucket(value) == datetime(2026, 3, 1, 15, tzinfo=timezone.utc)
+
+    def test_naive_treated_as_utc(self):
+        assert hour_bucket(datetime(2026, 3, 1, 10, 59)) == datetime(
+            2026, 3, 1, 10, tzinfo=timezone.utc
+        )
+
+
+class TestRollupDeltas:
+    """Tests for RollupDeltas."""
+
+    def test_zero_net_change_is_empty(self):
+        state = ItemState.of(TENANT, None, datetime.now(timezone.utc), "new", "low", False)
+        deltas = RollupDeltas()
+        deltas.add_item(state, 1)
+        deltas.add_item(state, -1)
+        assert not deltas
+
+    def test_unsupported_dialect(self):
+        with pytest.raises(NotImplementedError):
+            RollupDeltas().statements("mysql")
+
+
+class TestIncrementalMaintenance:
+    """Flushes keep the rollups in step with check_items and decisions."""
+
+    @pytest.mark.asyncio
+    async def test_status_change_moves_count(self, db):
+        item = make_item(CheckStatus.NEW, RiskLevel.HIGH)
+        db.add(item)
+        await db.commit()
+
+        rollups = RollupService(db)
+        assert await rollups.item_state_counts(TENANT) == [("new", "high", False, 1)]
+
+        item.status = CheckStatus.APPROVED
+        item.sla_breached = True
+        await db.commit()
+
+        assert await rollups.item_state_counts(TENANT) == [("approved", "high", True, 1)]
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert await rollups.activity_totals(TENANT, METRIC_PROCESSED, since) == {
+            "approved": (1, Decimal("100.00"))
+        }
+        assert await rollups.activity_totals(TENANT, METRIC_SLA_BREACHED, since) == {
+            "": (1, Decimal(0))
+        }
+
+    @pytest.mark.asyncio
+    async def test_delete_decrements(self, db):
+        item = make_item()
+        db.add(item)
+        await db.commit()
+
+        await db.delete(item)
+        await db.commit()
+
+        assert await RollupService(db).item_state_counts(TENANT) == []
+
+    @pytest.mark.asyncio
+    async def test_decisions_counted_by_action(self, db):
+        reviewer = make_user(1)
+        item = make_item()
+        db.add_all([reviewer, item])
+        await db.flush()
+        db.add_all(
+            [
+                make_decision(item, reviewer, DecisionAction.APPROVE),
+                make_decision(item, reviewer, DecisionAction.APPROVE),
+                make_decision(item, reviewer, DecisionAction.ESCALATE),
+            ]
+        )
+        await db.commit()
+
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        totals = await RollupService(db).activity_totals(TENANT, METRIC_DECISION, since)
+        assert {action: count for action, (count, _) in totals.items()} == {
+            "approve": 2,
+            "escalate": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_decision_on_unloaded_item_uses_its_queue(self, db):
+        reviewer = make_user(1)
+        item = make_item(queue_id="queue-1")
+        db.add_all([reviewer, item])
+        await db.commit()
+        db.expunge(item)
+
+        db.add(make_decision(item, reviewer, DecisionAction.APPROVE))
+        await db.commit()
+
+        result = await db.execute(
+            select(ActivityRollup.queue_id).where(ActivityRollup.metric == METRIC_DECISION)
+        )
+        assert result.scalars().all() == ["queue-1"]
+
+
+class TestRebuild:
+    """The repair job reproduces the incrementally maintained counters."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, db):
+        reviewer = make_user(1)
+        earlier = datetime.now(timezone.utc) - timedelta(days=3)
+        items = [
+            make_item(CheckStatus.NEW, RiskLevel.HIGH, presented_date=earlier),
+            make_item(CheckStatus.IN_REVIEW, RiskLevel.LOW, sla_breached=True),
+            make_item(CheckStatus.NEW, RiskLevel.MEDIUM),
+        ]
+        db.add_all([reviewer, *items])
+        await db.flush()
+        db.add(make_decision(items[1], reviewer, DecisionAction.RETURN))
+        await db.commit()
+
+        items[2].status = CheckStatus.REJECTED
+        await db.commit()
+
+        incremental = await _snapshot(db)
+        await RollupService(db).rebuild(TENANT)
+        await db.commit()
+
+        assert await _snapshot(db) == incremental
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_drift(self, db):
+        db.add(make_item(CheckStatus.NEW, RiskLevel.LOW))
+        await db.commit()
+        await db.execute(ItemStateRollup.__table__.delete())
+
+        rollups = RollupService(db)
+        assert await rollups.item_state_counts(TENANT) == []
+
+        await rollups.rebuild(TENANT, since=datetime.now(timezone.utc) - timedelta(days=1))
+        assert await rollups.item_state_counts(TENANT) == [("new", "low", False, 1)]
@@ -0,0 +1,144 @@
+"""Tests for the expired image token / session GC job."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.core.config import settings
+from app.models.check import CheckImage, CheckItem
+from app.models.image_token import ImageAccessToken
+from app.models.user import User, UserSession
+from app.services.token_gc import TokenGCService, expired_partitions
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.factories import TENANT, make_user
+
+pytestmark = pytest.mark.sqlite_tables(User, CheckItem, CheckImage, ImageAccessToken, UserSession)
+
+
+def _db(rowcounts: list[int]) -> MagicMock:
+    """Session whose successive DELETEs report the given row counts."""
+    results = [MagicMock(rowcount=count) for count in rowcounts]
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=results)
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    return db
+
+
+class TestExpiredPartitions:
+    """Tests for picking whole daily partitions to drop."""
+
+    def test_only_days_entirely_before_cutoff(self):
+        cutoff = datetime(2024, 3, 10, 6, 0, tzinfo=timezone.utc)
+        names = [
+            "image_access_tokens_p20240308",
+            "image_access_tokens_p20240309",
+            "image_access_tokens_p20240310",
+            "image_access_tokens_default",
+            "user_sessions_p20240301",
+            "image_access_tokens_p20241399",
+        ]
+
+        assert expired_partitions(names, "image_access_tokens", cutoff) == [
+            "image_access_tokens_p20240308",
+            "image_access_tokens_p20240309",
+        ]
+
+
+class TestTokenGCService:
+    """Tests for chunked deletion."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_bounded_chunks_until_short_batch(self):
+        db = _db([100, 100, 40, 0])
+        service = TokenGCService(db, batch_size=100, partitioned=False, pause_seconds=0)
+
+        results = await service.run()
+
+        tokens, sessions = results
+        assert (tokens.table, tokens.deleted_count, tokens.batches) == (
+            "image_access_tokens",
+            240,
+            3,
+        )
+        assert (sessions.deleted_count, sessions.batches) == (0, 0)
+        assert db.commit.await_count == 4
+
+        sql = str(db.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM image_access_tokens WHERE image_access_tokens.id IN")
+        assert "LIMIT" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+
+    @pytest.mark.asyncio
+    async def test_max_batches_stops_early(self):
+        db = _db([10, 10, 10])
+        service = TokenGCService(db, batch_size=10, partitioned=False, pause_seconds=0)
+
+        results = await service.run(max_batches=1)
+
+        assert [result.deleted_count for result in results] == [10, 10]
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_per_table(self):
+        db = _db([])
+        db.execute = AsyncMock(side_effect=[RuntimeError("lock timeout"), MagicMock(rowcount=0)])
+        service = TokenGCService(db, batch_size=10, partitioned=False, pause_seconds=0)
+
+        tokens, sessions = await service.run()
+
+        assert tokens.error == "lock timeout"
+        db.rollback.assert_awaited_once()
+        assert sessions.error is None
+
+
+class TestGracePeriod:
+    """Chunked deletion against a database: only rows past the grace period go."""
+
+    @pytest.mark.asyncio
+    async def test_rows_within_grace_period_survive(self, db):
+        now = datetime.now(timezone.utc)
+        token_grace = timedelta(hours=settings.TOKEN_GC_IMAGE_TOKEN_GRACE_HOURS)
+        session_grace = timedelta(days=settings.TOKEN_GC_SESSION_GRACE_DAYS)
+        user = make_user(1)
+        db.add(user)
+
+        def token(label: str, expires_at: datetime, used_at: datetime | None = None):
+            return ImageAccessToken(
+                id=label,
+                tenant_id=TENANT,
+                image_id=str(uuid.uuid4()),
+                expires_at=expires_at,
+                used_at=used_at,
+                created_by_user_id=user.id,
+            )
+
+        def session(label: str, expires_at: datetime):
+            return UserSession(id=label, user_id=user.id, token_hash=label, expires_at=expires_at)
+
+        hour = timedelta(hours=1)
+        db.add_all(
+            [
+                token("live", now + hour),
+                token("expired-in-grace", now - token_grace + hour),
+                token("used-in-grace", now + hour, used_at=now - token_grace + hour),
+                token("expired-past-grace", now - token_grace - hour),
+                token("used-past-grace", now + hour, used_at=now - token_grace - hour),
+                session("session-in-grace", now - session_grace + hour),
+                session("session-past-grace", now - session_grace - hour),
+            ]
+        )
+        await db.commit()
+        db.expunge_all()
+
+        tokens, sessions = await TokenGCService(db, batch_size=1, pause_seconds=0).run()
+
+        assert (tokens.deleted_count, tokens.batches, tokens.error) == (2, 2, None)
+        assert (sessions.deleted_count, sessions.error) == (1, None)
+        remaining_tokens = (await db.execute(select(ImageAccessToken.id))).scalars().all()
+        assert sorted(remaining_tokens) == ["expired-in-grace", "live", "used-in-grace"]
+        remaining_sessions = (await db.execute(select(UserSession.id))).scalars().all()
+        assert remaining_sessions == ["session-in-grace"]
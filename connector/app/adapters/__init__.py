@@ -13,6 +13,9 @@ from .interfaces import (
     ImageSide,
     ItemMetadata,
     ItemResolver,
+    Rendition,
+    ResizeFit,
+    SourceVersion,
     StorageProvider,
 )
 
@@ -24,4 +27,7 @@ __all__ = [
     "ItemMetadata",
     "DecodedImage",
     "ImageSide",
+    "Rendition",
+    "ResizeFit",
+    "SourceVersion",
 ]
@@ -10,7 +10,7 @@ NOTE: This is a stub implementation. Real implementation requires:
 """
 from typing import Tuple
 
-from ..interfaces import ImageHandle, StorageAccessError, StorageProvider
+from ..interfaces import ImageHandle, SourceVersion, StorageAccessError, StorageProvider
 
 
 class BankStorageProvider(StorageProvider):
@@ -98,6 +98,20 @@ class BankStorageProvider(StorageProvider):
             "BankStorageProvider.get_size() requires production implementation"
         )
 
+    async def stat(self, handle: ImageHandle) -> SourceVersion:
+        """
+        Get the size and modification time of an image file.
+
+        Args:
+            handle: The image handle to check
+
+        Returns:
+            SourceVersion (smbclient.stat: st_size, st_mtime_ns)
+        """
+        raise NotImplementedError(
+            "BankStorageProvider.stat() requires production implementation"
+        )
+
     async def health_check(self) -> Tuple[bool, str]:
         """
         Check connectivity to file shares.
@@ -5,6 +5,12 @@ These adapters use local filesystem to simulate the bank's UNC share environment
 """
 from .decoder import TiffImageDecoder
 from .resolver import DemoItemResolver
+from .sqlite_resolver import SqliteItemResolver
 from .storage import DemoStorageProvider
 
-__all__ = ["DemoStorageProvider", "DemoItemResolver", "TiffImageDecoder"]
+__all__ = [
+    "DemoStorageProvider",
+    "DemoItemResolver",
+    "SqliteItemResolver",
+    "TiffImageDecoder",
+]
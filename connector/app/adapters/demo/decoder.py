@@ -3,17 +3,30 @@ TIFF Image Decoder.
 
 Handles decoding of .IMG files (TIFF format) to PNG.
 Supports single-page and multi-page TIFF files.
+
+Each decode parses the file once: the page count and the requested page
+come from the same Image.open(). Bitonal (CCITT) and grayscale pages are
+encoded in their own mode rather than expanded to RGB, which keeps both
+encode time and output size down for typical check images.
+
+Reduced renditions (thumbnails, previews) are scaled while decoding:
+JPEG sources use draft() to decode directly at 1/2, 1/4 or 1/8 scale,
+and every source is shrunk with reduce() by an integer factor before
+the final resample, so a thumbnail never pays for a full-size filter
+pass or a full-size encode.
 """
 import asyncio
 import io
-from typing import Tuple
+from typing import List, Optional, Tuple
 
-from PIL import Image
+from PIL import Image, features
 
 from ..interfaces import (
     DecodedImage,
     DecodeError,
     ImageDecoder,
+    OutputProfile,
+    Rendition,
     UnsupportedFormatError,
 )
 
@@ -27,6 +40,27 @@ MAGIC_BYTES = {
     b"BM": "BMP",            # BMP
 }
 
+# Image modes each output format stores as-is; anything else becomes RGB
+NATIVE_MODES = {
+    "PNG": ("1", "L", "P", "RGB", "RGBA"),
+    "JPEG": ("L", "RGB"),
+    "WEBP": ("RGB", "RGBA"),
+}
+
+# Pillow save() options per output format and profile
+ENCODE_OPTIONS = {
+    ("PNG", OutputProfile.FAST): {"compress_level": 1},
+    ("PNG", OutputProfile.COMPACT): {"optimize": True},
+    ("JPEG", OutputProfile.FAST): {"quality": 95},
+    ("JPEG", OutputProfile.COMPACT): {"quality": 95, "optimize": True},
+    ("WEBP", OutputProfile.FAST): {"lossless": True, "quality": 0, "method": 0},
+    ("WEBP", OutputProfile.COMPACT): {"lossless": True, "quality": 100, "method": 4},
+}
+
+# resize() shrinks by an integer factor with reduce() until the page is
+# within this multiple of the target size, then resamples the remainder
+RESIZE_REDUCING_GAP = 2.0
+
 
 class TiffImageDecoder(ImageDecoder):
     """
@@ -52,7 +86,9 @@ class TiffImageDecoder(ImageDecoder):
         self,
         data: bytes,
         page: int = 1,
-        target_format: str = "PNG"
+        target_format: str = "PNG",
+        profile: OutputProfile = OutputProfile.FAST,
+        rendition: Optional[Rendition] = None
     ) -> DecodedImage:
         """
         Decode an image file to PNG.
@@ -60,10 +96,12 @@ class TiffImageDecoder(ImageDecoder):
         Args:
             data: Raw image data
             page: Page number to extract (1-indexed)
-            target_format: Output format (default PNG)
+            target_format: Output format (PNG, JPEG or WEBP)
+            profile: Compression speed/size trade-off
+            rendition: Output size; full resolution if None
 
         Returns:
-            DecodedImage with the decoded PNG data
+            DecodedImage with the decoded data and the file's page count
 
         Raises:
             ValueError: If the page number is invalid
@@ -73,17 +111,76 @@ class TiffImageDecoder(ImageDecoder):
         if page < 1:
             raise ValueError("Page number must be >= 1")
 
+        target_format, detected_format = await self._check_formats(data, target_format)
+
+        # Decode in thread pool to avoid blocking
+        def _decode():
+            return self._decode_sync(
+                data, page, target_format, detected_format, profile, rendition
+            )
+
+        return await self._run(_decode)
+
+    async def decode_all(
+        self,
+        data: bytes,
+        target_format: str = "PNG",
+        profile: OutputProfile = OutputProfile.FAST,
+        rendition: Optional[Rendition] = None
+    ) -> List[DecodedImage]:
+        """
+        Decode every page of an image file from a single parse.
+
+        Args:
+            data: Raw image data
+            target_format: Output format (PNG, JPEG or WEBP)
+            profile: Compression speed/size trade-off
+            rendition: Output size; full resolution if None
+
+        Returns:
+            DecodedImage per page, in page order
+
+        Raises:
+            UnsupportedFormatError: If the image format is not supported
+            DecodeError: If decoding fails
+        """
+        target_format, detected_format = await self._check_formats(data, target_format)
+
+        def _decode():
+            return self._decode_pages_sync(
+                data, None, target_format, detected_format, profile, rendition
+            )
+
+        return await self._run(_decode)
+
+    async def _check_formats(self, data: bytes, target_format: str) -> Tuple[str, str]:
+        """
+        Validate the output format and detect the input format.
+
+        Returns:
+            Tuple of (normalized target format, detected input format)
+        """
+        target_format = target_format.upper()
+        if target_format not in NATIVE_MODES:
+            raise UnsupportedFormatError(
+                target_format,
+                f"Unsupported output format: {target_format}"
+            )
+        if target_format == "WEBP" and not features.check("webp"):
+            raise UnsupportedFormatError(target_format, "Pillow built without WebP support")
+
         # Detect format
         detected_format = await self.detect_format(data)
         if detected_format == "UNKNOWN":
             raise UnsupportedFormatError("UNKNOWN", "Cannot detect image format")
 
-        # Decode in thread pool to avoid blocking
-        def _decode():
-            return self._decode_sync(data, page, target_format, detected_format)
+        return target_format, detected_format
 
+    @staticmethod
+    async def _run(func):
+        """Run a synchronous decode in the thread pool, wrapping unexpected errors."""
         try:
-            return await asyncio.get_event_loop().run_in_executor(None, _decode)
+            return await asyncio.get_event_loop().run_in_executor(None, func)
         except (UnsupportedFormatError, DecodeError, ValueError):
             raise
         except Exception as e:
@@ -94,7 +191,9 @@ class TiffImageDecoder(ImageDecoder):
         data: bytes,
         page: int,
         target_format: str,
-        detected_format: str
+        detected_format: str,
+        profile: OutputProfile = OutputProfile.FAST,
+        rendition: Optional[Rendition] = None
     ) -> DecodedImage:
         """
         Synchronous image decoding.
@@ -102,75 +201,69 @@ class TiffImageDecoder(ImageDecoder):
         Args:
             data: Raw image data
             page: Page number (1-indexed)
-            target_format: Output format
+            target_format: Output format (upper case)
             detected_format: Detected input format
+            profile: Compression speed/size trade-off
+            rendition: Output size; full resolution if None
 
         Returns:
             DecodedImage with decoded data
         """
-        try:
-            # Open image with Pillow
-            img = Image.open(io.BytesIO(data))
-
-            # Get page count for multi-page images
-            page_count = 1
-            if hasattr(img, "n_frames"):
-                page_count = img.n_frames
-
-            # Validate page number
-            if page > page_count:
-                raise ValueError(
-                    f"Page {page} requested but image only has {page_count} page(s)"
-                )
-
-            # Seek to requested page (0-indexed)
-            if page_count > 1:
-                img.seek(page - 1)
-
-            # Check dimensions
-            width, height = img.size
-            if width > self._max_dimension or height > self._max_dimension:
-                raise DecodeError(
-                    f"Image dimensions ({width}x{height}) exceed maximum "
-                    f"allowed ({self._max_dimension})"
-                )
-
-            # Convert to RGB if necessary (for PNG output)
-            if img.mode in ("1", "L", "P"):
-                # Convert grayscale/palette to RGB for better compatibility
-                img = img.convert("RGB")
-            elif img.mode == "RGBA":
-                # Keep RGBA as-is
-                pass
-            elif img.mode != "RGB":
-                # Convert other modes to RGB
-                img = img.convert("RGB")
+        return self._decode_pages_sync(
+            data, page, target_format, detected_format, profile, rendition
+        )[0]
 
-            # Encode to target format
-            output = io.BytesIO()
-            if target_format.upper() == "PNG":
-                img.save(output, format="PNG", optimize=True)
-            elif target_format.upper() == "JPEG":
-                # Convert RGBA to RGB for JPEG
-                if img.mode == "RGBA":
-                    img = img.convert("RGB")
-                img.save(output, format="JPEG", quality=95)
-            else:
-                raise UnsupportedFormatError(
-                    target_format,
-                    f"Unsupported output format: {target_format}"
-                )
-
-            output.seek(0)
-            png_data = output.read()
-
-            return DecodedImage(
-                data=png_data,
-                width=width,
-                height=height,
-                original_format=detected_format,
-                page_number=page
-            )
+    def _decode_pages_sync(
+        self,
+        data: bytes,
+        page: Optional[int],
+        target_format: str,
+        detected_format: str,
+        profile: OutputProfile,
+        rendition: Optional[Rendition] = None
+    ) -> List[DecodedImage]:
+        """
+        Decode one page (or every page if page is None) from a single parse.
+        """
+        try:
+            # Open once; page count and the pages themselves come from this parse
+            with Image.open(io.BytesIO(data)) as img:
+                page_count = getattr(img, "n_frames", 1)
+
+                # Validate page number
+                if page is not None and page > page_count:
+                    raise ValueError(
+                        f"Page {page} requested but image only has {page_count} page(s)"
+                    )
+
+                pages = [page] if page is not None else range(1, page_count + 1)
+                decoded = []
+                for number in pages:
+                    # Seek to requested page (0-indexed)
+                    if page_count > 1:
+                        img.seek(number - 1)
+
+                    # Check dimensions before decoding any pixel data
+                    width, height = img.size
+                    if width > self._max_dimension or height > self._max_dimension:
+                        raise DecodeError(
+                            f"Image dimensions ({width}x{height}) exceed maximum "
+                            f"allowed ({self._max_dimension})"
+                        )
+
+                    frame = self._resize(img, rendition)
+
+                    decoded.append(DecodedImage(
+                        data=self._encode(frame, target_format, profile),
+                        width=frame.width,
+                        height=frame.height,
+                        original_format=detected_format,
+                        page_number=number,
+                        page_count=page_count,
+                        output_format=target_format
+                    ))
+
+            return decoded
 
         except UnsupportedFormatError:
             raise
@@ -181,10 +274,69 @@ class TiffImageDecoder(ImageDecoder):
         except Exception as e:
             raise DecodeError(f"Image decode error: {str(e)}", e)
 
+    @staticmethod
+    def _resize(img: Image.Image, rendition: Optional[Rendition]) -> Image.Image:
+        """
+        Scale the current page of an open image to a rendition.
+
+        Returns the open image itself when no scaling is needed.
+        """
+        if rendition is None or rendition.is_full:
+            return img
+
+        width, height = img.size
+        size, crop = rendition.box(width, height)
+        if size == img.size:
+            return img
+
+        # JPEG can decode at a fraction of full scale; other formats ignore
+        # draft(). Ask for enough pixels that the crop still covers size.
+        crop_width, crop_height = crop[2] - crop[0], crop[3] - crop[1]
+        if img.draft(None, (-(-size[0] * width // crop_width),
+                            -(-size[1] * height // crop_height))):
+            size, crop = rendition.box(*img.size)
+
+        # Bitonal pages resample as grayscale: scaling in mode "1" falls back
+        # to nearest-neighbour and drops thin strokes
+        if img.mode == "1":
+            img = img.convert("L")
+        elif img.mode == "P":
+            img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+
+        return img.resize(
+            size,
+            Image.Resampling.LANCZOS,
+            box=crop,
+            reducing_gap=RESIZE_REDUCING_GAP
+        )
+
+    @staticmethod
+    def _encode(img: Image.Image, target_format: str, profile: OutputProfile) -> bytes:
+        """
+        Encode the current page of an open image.
+
+        Bitonal ("1") and grayscale ("L") pages stay in their own mode
+        where the output format supports it.
+        """
+        if img.mode not in NATIVE_MODES[target_format]:
+            if img.mode == "1" and "L" in NATIVE_MODES[target_format]:
+                img = img.convert("L")
+            elif img.mode in ("RGBA", "LA", "PA") and "RGBA" in NATIVE_MODES[target_format]:
+                img = img.convert("RGBA")
+            else:
+                img = img.convert("RGB")
+
+        output = io.BytesIO()
+        img.save(output, format=target_format, **ENCODE_OPTIONS[(target_format, profile)])
+        return output.getvalue()
+
     async def get_page_count(self, data: bytes) -> int:
         """
         Get the number of pages in an image file.
 
+        Prefer DecodedImage.page_count when the page is decoded anyway;
+        this parses the file a second time.
+
         Args:
             data: Raw image data
 
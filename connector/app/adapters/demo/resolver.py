@@ -1,7 +1,8 @@
 """
 Demo mode item resolver.
 
-Resolves check items using a JSON or SQLite index file.
+Resolves check items using a JSON index file, loaded whole into memory.
+See sqlite_resolver for large indexes.
 """
 import asyncio
 import json
@@ -19,6 +20,52 @@ from ..interfaces import (
 )
 
 
+def parse_item(data: Dict[str, Any]) -> Optional[ItemMetadata]:
+    """
+    Parse one item of an index file.
+
+    Args:
+        data: Item as found in the JSON index
+
+    Returns:
+        ItemMetadata, or None if the item is malformed
+    """
+    try:
+        # Parse date
+        date_str = data.get("date")
+        if isinstance(date_str, str):
+            check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        else:
+            check_date = date_str
+
+        # Get image path
+        image_path = data.get("image_path", "")
+        is_multi_page = data.get("is_multi_page", True)
+        has_back = data.get("has_back_image", True)
+
+        # Create image handle
+        handle = ImageHandle(
+            path=image_path,
+            trace_number=data.get("trace_number"),
+            check_date=check_date,
+            is_multi_page=is_multi_page,
+            page_count=2 if is_multi_page and has_back else 1
+        )
+
+        return ItemMetadata(
+            trace_number=data.get("trace_number", ""),
+            check_date=check_date,
+            amount_cents=data.get("amount_cents", 0),
+            check_number=data.get("check_number"),
+            account_last4=data.get("account_last4", "****"),
+            is_onus=data.get("is_onus", False),
+            image_handle=handle,
+            has_back_image=has_back
+        )
+    except Exception:
+        return None
+
+
 class DemoItemResolver(ItemResolver):
     """
     Item resolver for demo mode.
@@ -100,40 +147,7 @@ class DemoItemResolver(ItemResolver):
 
     def _parse_item(self, data: Dict[str, Any]) -> Optional[ItemMetadata]:
         """Parse an item from the JSON index."""
-        try:
-            # Parse date
-            date_str = data.get("date")
-            if isinstance(date_str, str):
-                check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                check_date = date_str
-
-            # Get image path
-            image_path = data.get("image_path", "")
-            is_multi_page = data.get("is_multi_page", True)
-            has_back = data.get("has_back_image", True)
-
-            # Create image handle
-            handle = ImageHandle(
-                path=image_path,
-                trace_number=data.get("trace_number"),
-                check_date=check_date,
-                is_multi_page=is_multi_page,
-                page_count=2 if is_multi_page and has_back else 1
-            )
-
-            return ItemMetadata(
-                trace_number=data.get("trace_number", ""),
-                check_date=check_date,
-                amount_cents=data.get("amount_cents", 0),
-                check_number=data.get("check_number"),
-                account_last4=data.get("account_last4", "****"),
-                is_onus=data.get("is_onus", False),
-                image_handle=handle,
-                has_back_image=has_back
-            )
-        except Exception:
-            return None
+        return parse_item(data)
 
     async def resolve(
         self,
@@ -0,0 +1,445 @@
+"""
+SQLite-backed item resolver.
+
+For indexes too large to hold in memory. Items live in a local SQLite
+database keyed by (trace_number, check_date), so opening the resolver
+is constant time and a lookup is one B-tree search; nothing is loaded
+up front.
+
+The database is fed from the index file at ITEM_INDEX_PATH:
+- A JSON Lines file (.jsonl, one item per line) is imported
+  incrementally. The byte offset imported so far is stored with the
+  items, so an import only reads lines appended since the previous one.
+- The JSON document format of DemoItemResolver is re-imported in full,
+  but only when the file has changed.
+The file is checked for changes on first use and then at most every
+reload_seconds; reload() imports straight away. Only the first import can
+fail a lookup: a later catch-up that fails (say, a document being rewritten)
+is logged and retried when next due, and the rows already imported are
+served meanwhile.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ...core.config import get_settings
+from ..interfaces import ImageHandle, ImageSide, ItemMetadata, ItemResolver
+from .resolver import parse_item
+
+logger = logging.getLogger("connector.resolver")
+
+# Rows written per transaction during an import
+IMPORT_BATCH_SIZE = 10000
+
+# Leading bytes of a JSON Lines feed compared to detect a rewritten file
+FEED_HEAD_BYTES = 4096
+
+ITEM_COLUMNS = (
+    "trace_number, check_date, image_path, amount_cents, check_number, "
+    "account_last4, is_onus, is_multi_page, has_back_image"
+)
+
+
+class SqliteItemResolver(ItemResolver):
+    """
+    Item resolver over an on-disk SQLite index.
+
+    Lookups use a per-thread read connection, so reads run in parallel
+    (WAL mode) and never wait for an import in progress.
+    """
+
+    def __init__(
+        self,
+        db_path: str = None,
+        index_path: str = None,
+        reload_seconds: float = None
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            db_path: SQLite database file.
+                     Defaults to settings.ITEM_INDEX_DB_PATH
+            index_path: JSON or JSON Lines index file to import.
+                        Defaults to settings.ITEM_INDEX_PATH
+            reload_seconds: Minimum interval between checks of the index
+                            file; 0 checks only on first use.
+                            Defaults to settings.ITEM_INDEX_RELOAD_SECONDS
+        """
+        settings = get_settings()
+        self._db_path = Path(db_path or settings.ITEM_INDEX_DB_PATH)
+        self._index_path = Path(index_path or settings.ITEM_INDEX_PATH)
+        if reload_seconds is None:
+            reload_seconds = settings.ITEM_INDEX_RELOAD_SECONDS
+        self._reload_seconds = reload_seconds
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "trace_number TEXT NOT NULL, "
+            "check_date TEXT NOT NULL, "
+            "image_path TEXT NOT NULL, "
+            "amount_cents INTEGER NOT NULL, "
+            "check_number TEXT, "
+            "account_last4 TEXT NOT NULL, "
+            "is_onus INTEGER NOT NULL, "
+            "is_multi_page INTEGER NOT NULL, "
+            "has_back_image INTEGER NOT NULL, "
+            "PRIMARY KEY (trace_number, check_date)"
+            ") WITHOUT ROWID"
+        )
+        # Import progress per source file, committed with the items
+        self._writer.execute(
+            "CREATE TABLE IF NOT EXISTS import_state ("
+            "source TEXT PRIMARY KEY, "
+            "offset INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "head TEXT NOT NULL)"
+        )
+        self._write_lock = threading.Lock()
+        self._readers = threading.local()
+
+        self._imported = False
+        self._next_import = 0.0
+        self._import_lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the index database."""
+        conn = sqlite3.connect(
+            str(self._db_path), timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """This thread's read connection."""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only=ON")
+            self._readers.conn = conn
+        return conn
+
+    async def _run(self, func, *args):
+        """Run a blocking database call in the thread pool."""
+        return await asyncio.get_event_loop().run_in_executor(None, func, *args)
+
+    def _import_due(self) -> bool:
+        """Whether the index file should be checked for changes."""
+        if not self._imported:
+            return True
+        return bool(self._reload_seconds) and time.monotonic() >= self._next_import
+
+    async def _ensure_imported(self):
+        """Catch up with the index file on first use and when due."""
+        # Once imported, lookups do not wait for a catch-up in progress
+        if not self._import_due() or (self._imported and self._import_lock.locked()):
+            return
+
+        async with self._import_lock:
+            if self._import_due():
+                await self._import()
+
+    async def _import(self):
+        """Import in the thread pool; the caller holds the import lock."""
+        try:
+            await self._run(self._import_sync)
+        except Exception:
+            # Nothing to serve yet: the lookup has to fail
+            if not self._imported:
+                raise
+            logger.exception("Item index catch-up failed for %s", self._index_path)
+        self._imported = True
+        self._next_import = time.monotonic() + self._reload_seconds
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    @staticmethod
+    def _row_to_metadata(row: Tuple) -> ItemMetadata:
+        """Build ItemMetadata from an items row."""
+        (trace_number, check_date, image_path, amount_cents, check_number,
+         account_last4, is_onus, is_multi_page, has_back_image) = row
+        check_date = date.fromisoformat(check_date)
+        return ItemMetadata(
+            trace_number=trace_number,
+            check_date=check_date,
+            amount_cents=amount_cents,
+            check_number=check_number,
+            account_last4=account_last4,
+            is_onus=bool(is_onus),
+            image_handle=ImageHandle(
+                path=image_path,
+                trace_number=trace_number,
+                check_date=check_date,
+                is_multi_page=bool(is_multi_page),
+                page_count=2 if is_multi_page and has_back_image else 1
+            ),
+            has_back_image=bool(has_back_image)
+        )
+
+    @staticmethod
+    def _metadata_to_row(metadata: ItemMetadata) -> Tuple:
+        """Build an items row from ItemMetadata."""
+        return (
+            metadata.trace_number,
+            metadata.check_date.isoformat(),
+            metadata.image_handle.path,
+            metadata.amount_cents,
+            metadata.check_number,
+            metadata.account_last4,
+            int(metadata.is_onus),
+            int(metadata.image_handle.is_multi_page),
+            int(metadata.has_back_image),
+        )
+
+    def _resolve_sync(self, trace_number: str, check_date: date) -> Optional[ItemMetadata]:
+        """Look up one item by primary key."""
+        row = self._reader().execute(
+            f"SELECT {ITEM_COLUMNS} FROM items WHERE trace_number = ? AND check_date = ?",
+            (trace_number, check_date.isoformat())
+        ).fetchone()
+        return self._row_to_metadata(row) if row else None
+
+    async def resolve(
+        self,
+        trace_number: str,
+        check_date: date
+    ) -> Optional[ItemMetadata]:
+        """
+        Resolve a check item by trace number and date.
+
+        Args:
+            trace_number: The check's trace number
+            check_date: The date of the check
+
+        Returns:
+            ItemMetadata if found, None otherwise
+        """
+        await self._ensure_imported()
+        return await self._run(self._resolve_sync, trace_number, check_date)
+
+    async def get_image_handle(
+        self,
+        trace_number: str,
+        check_date: date,
+        side: ImageSide
+    ) -> Optional[ImageHandle]:
+        """
+        Get the image handle for a specific side of a check.
+
+        Args:
+            trace_number: The check's trace number
+            check_date: The date of the check
+            side: Which side of the check (front or back)
+
+        Returns:
+            ImageHandle if found, None otherwise
+        """
+        metadata = await self.resolve(trace_number, check_date)
+        if not metadata:
+            return None
+
+        # Check if back side is available
+        if side == ImageSide.BACK and not metadata.has_back_image:
+            return None
+
+        return metadata.image_handle
+
+    async def list_items(self) -> List[ItemMetadata]:
+        """
+        List all items in the index.
+
+        Reads the whole table; meant for small demo indexes only.
+
+        Returns:
+            List of all ItemMetadata
+        """
+        await self._ensure_imported()
+
+        def _list():
+            rows = self._reader().execute(
+                f"SELECT {ITEM_COLUMNS} FROM items ORDER BY trace_number, check_date"
+            ).fetchall()
+            return [self._row_to_metadata(row) for row in rows]
+
+        return await self._run(_list)
+
+    async def health_check(self) -> Tuple[bool, str]:
+        """
+        Check if the item resolver is healthy.
+
+        Returns:
+            Tuple of (is_healthy, status_message)
+        """
+        try:
+            await self._ensure_imported()
+
+            def _probe():
+                # One index probe; COUNT(*) would scan every item
+                return self._reader().execute("SELECT 1 FROM items LIMIT 1").fetchone()
+
+            if await self._run(_probe) is None:
+                return False, f"Item index is empty: {self._db_path}"
+            return True, "SQLite resolver ready"
+        except Exception as e:
+            return False, f"Resolver health check failed: {str(e)}"
+
+    # =========================================================================
+    # Imports
+    # =========================================================================
+
+    async def reload(self):
+        """Import whatever the index file gained since the last import."""
+        async with self._import_lock:
+            await self._import()
+
+    async def append(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or replace items directly, without going through the index file.
+
+        Args:
+            items: Items in the index file format
+
+        Returns:
+            Number of items written (malformed items are skipped)
+        """
+        def _append():
+            with self._write_lock:
+                self._writer.execute("BEGIN IMMEDIATE")
+                try:
+                    written = self._upsert(items)
+                    self._writer.execute("COMMIT")
+                except BaseException:
+                    self._writer.execute("ROLLBACK")
+                    raise
+            return written
+
+        return await self._run(_append)
+
+    def _upsert(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Write items inside the caller's transaction."""
+        rows = []
+        for data in items:
+            metadata = parse_item(data)
+            if metadata and metadata.trace_number and isinstance(metadata.check_date, date):
+                rows.append(self._metadata_to_row(metadata))
+        self._writer.executemany(
+            f"INSERT OR REPLACE INTO items ({ITEM_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        return len(rows)
+
+    def _import_sync(self):
+        """Bring the database up to date with the index file."""
+        try:
+            stat = self._index_path.stat()
+        except FileNotFoundError:
+            # No index file: serve whatever was imported before
+            return
+
+        with self._write_lock:
+            source = str(self._index_path.resolve())
+            state = self._writer.execute(
+                "SELECT offset, size, mtime_ns, head FROM import_state WHERE source = ?",
+                (source,)
+            ).fetchone()
+
+            if self._index_path.suffix.lower() == ".jsonl":
+                self._import_lines(source, stat, state)
+            elif state is None or (state[1], state[2]) != (stat.st_size, stat.st_mtime_ns):
+                self._import_document(source, stat)
+
+    def _import_document(self, source: str, stat):
+        """Replace every item with the contents of a JSON index document."""
+        try:
+            with open(self._index_path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in index file: {e}")
+
+        self._writer.execute("BEGIN IMMEDIATE")
+        try:
+            self._writer.execute("DELETE FROM items")
+            self._upsert(data.get("items", []))
+            self._save_state(source, stat.st_size, stat.st_size, stat.st_mtime_ns, "")
+            self._writer.execute("COMMIT")
+        except BaseException:
+            self._writer.execute("ROLLBACK")
+            raise
+
+    def _import_lines(self, source: str, stat, state: Optional[Tuple]):
+        """Import the lines of a JSON Lines feed past the stored offset."""
+        with open(self._index_path, "rb") as f:
+            head = hashlib.sha256(f.read(FEED_HEAD_BYTES)).hexdigest()
+
+            offset = 0
+            if state is not None:
+                offset, _, _, saved_head = state
+                # Truncated or rewritten rather than appended: start over.
+                # The head is compared only once the feed has grown past it.
+                if stat.st_size < offset or (
+                    offset >= FEED_HEAD_BYTES and saved_head != head
+                ):
+                    offset = -1
+
+            if offset == stat.st_size:
+                return
+
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                if offset == -1:
+                    self._writer.execute("DELETE FROM items")
+                    offset = 0
+
+                f.seek(offset)
+                batch = []
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Partially written last line; the next import gets it
+                        break
+                    offset += len(line)
+                    line = line.strip()
+                    if line:
+                        try:
+                            batch.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            pass
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        self._upsert(batch)
+                        batch = []
+                        # Progress is committed with the rows it covers
+                        self._save_state(source, offset, stat.st_size, stat.st_mtime_ns, head)
+                        self._writer.execute("COMMIT")
+                        self._writer.execute("BEGIN IMMEDIATE")
+
+                self._upsert(batch)
+                self._save_state(source, offset, stat.st_size, stat.st_mtime_ns, head)
+                self._writer.execute("COMMIT")
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+
+    def _save_state(self, source: str, offset: int, size: int, mtime_ns: int, head: str):
+        """Record how much of a source file has been imported."""
+        self._writer.execute(
+            "INSERT OR REPLACE INTO import_state (source, offset, size, mtime_ns, head) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (source, offset, size, mtime_ns, head)
+        )
+
+    def close(self):
+        """Close the write connection."""
+        self._writer.close()
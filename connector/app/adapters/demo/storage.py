@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Tuple
 
 from ...core.config import get_settings
-from ..interfaces import ImageHandle, StorageAccessError, StorageProvider
+from ..interfaces import ImageHandle, SourceVersion, StorageAccessError, StorageProvider
 
 
 class DemoStorageProvider(StorageProvider):
@@ -132,6 +132,26 @@ class DemoStorageProvider(StorageProvider):
 
         return path.stat().st_size
 
+    async def stat(self, handle: ImageHandle) -> SourceVersion:
+        """
+        Get the size and modification time of an image file.
+
+        Args:
+            handle: The image handle to check
+
+        Returns:
+            SourceVersion of the file
+
+        Raises:
+            FileNotFoundError: If the image doesn't exist
+            StorageAccessError: If the path is invalid
+        """
+        path = self._resolve_path(handle)
+
+        # os.stat raises FileNotFoundError for missing files
+        st = path.stat()
+        return SourceVersion(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
     async def health_check(self) -> Tuple[bool, str]:
         """
         Check if the storage provider is healthy.
@@ -6,7 +6,12 @@ Creates DEMO or BANK mode adapters based on configuration.
 from typing import Tuple
 
 from ..core.config import ConnectorMode, get_settings
-from .demo import DemoItemResolver, DemoStorageProvider, TiffImageDecoder
+from .demo import (
+    DemoItemResolver,
+    DemoStorageProvider,
+    SqliteItemResolver,
+    TiffImageDecoder,
+)
 from .interfaces import ImageDecoder, ItemResolver, StorageProvider
 
 
@@ -51,7 +56,17 @@ class AdapterFactory:
         """Create adapters for DEMO mode."""
         settings = get_settings()
 
-        resolver = DemoItemResolver(index_path=settings.ITEM_INDEX_PATH)
+        backend = settings.ITEM_INDEX_BACKEND.lower()
+        if backend == "sqlite":
+            resolver = SqliteItemResolver(
+                db_path=settings.ITEM_INDEX_DB_PATH,
+                index_path=settings.ITEM_INDEX_PATH,
+                reload_seconds=settings.ITEM_INDEX_RELOAD_SECONDS
+            )
+        elif backend == "json":
+            resolver = DemoItemResolver(index_path=settings.ITEM_INDEX_PATH)
+        else:
+            raise ValueError(f"Unknown ITEM_INDEX_BACKEND: {backend}")
         storage = DemoStorageProvider(demo_repo_root=settings.DEMO_REPO_ROOT)
         decoder = TiffImageDecoder()
 
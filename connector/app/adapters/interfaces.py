@@ -18,6 +18,104 @@ class ImageSide(str, Enum):
     BACK = "back"
 
 
+class OutputProfile(str, Enum):
+    """
+    Speed/size trade-off when encoding a decoded page.
+
+    FAST uses the cheapest compression setting of the output format;
+    COMPACT spends more CPU for smaller output.
+    """
+    FAST = "fast"
+    COMPACT = "compact"
+
+
+class ResizeFit(str, Enum):
+    """
+    How a rendition fills its requested box.
+
+    CONTAIN scales the page to fit inside the box, keeping its aspect
+    ratio; COVER fills the box exactly, cropping the centre of the page.
+    """
+    CONTAIN = "contain"
+    COVER = "cover"
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """
+    Requested output size of a decoded page.
+
+    A missing width or height leaves that dimension unconstrained; with
+    neither set the page is served at full resolution. Pages are never
+    upscaled.
+
+    Attributes:
+        width: Maximum output width in pixels
+        height: Maximum output height in pixels
+        fit: How the page fills the width x height box
+    """
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fit: ResizeFit = ResizeFit.CONTAIN
+
+    @property
+    def is_full(self) -> bool:
+        """Whether this is the full-resolution rendition."""
+        return self.width is None and self.height is None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, used to cache renditions separately."""
+        if self.is_full:
+            return "full"
+        return f"{self.width or ''}x{self.height or ''}:{self.fit.value}"
+
+    def box(self, width: int, height: int) -> Tuple[Tuple[int, int], Tuple[int, int, int, int]]:
+        """
+        Compute the output size and source crop box for a page.
+
+        Args:
+            width: Source page width
+            height: Source page height
+
+        Returns:
+            Tuple of ((out_width, out_height), (left, top, right, bottom))
+        """
+        crop = (0, 0, width, height)
+        if self.is_full:
+            return (width, height), crop
+
+        if self.fit == ResizeFit.COVER and self.width and self.height:
+            # Crop the source to the box's aspect ratio, then scale down
+            if width * self.height > height * self.width:
+                crop_width = max(1, round(height * self.width / self.height))
+                left = (width - crop_width) // 2
+                crop = (left, 0, left + crop_width, height)
+            else:
+                crop_height = max(1, round(width * self.height / self.width))
+                top = (height - crop_height) // 2
+                crop = (0, top, width, top + crop_height)
+            crop_width, crop_height = crop[2] - crop[0], crop[3] - crop[1]
+            scale = min(1.0, self.width / crop_width)
+            return (max(1, round(crop_width * scale)), max(1, round(crop_height * scale))), crop
+
+        scales = [1.0]
+        if self.width:
+            scales.append(self.width / width)
+        if self.height:
+            scales.append(self.height / height)
+        scale = min(scales)
+        return (max(1, round(width * scale)), max(1, round(height * scale))), crop
+
+
+# Content type for each supported output format
+OUTPUT_CONTENT_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+}
+
+
 @dataclass
 class ImageHandle:
     """
@@ -37,6 +135,19 @@ class ImageHandle:
     page_count: int = 1
 
 
+@dataclass(frozen=True)
+class SourceVersion:
+    """
+    Version of a stored image file, used to validate cached renditions.
+
+    Attributes:
+        size: File size in bytes
+        mtime_ns: Last modification time in nanoseconds
+    """
+    size: int
+    mtime_ns: int
+
+
 @dataclass
 class ItemMetadata:
     """
@@ -69,10 +180,12 @@ class DecodedImage:
 
     Attributes:
         data: PNG image data as bytes
-        width: Image width in pixels
-        height: Image height in pixels
+        width: Image width in pixels, after any resize
+        height: Image height in pixels, after any resize
         original_format: Original image format (e.g., "TIFF")
         page_number: Page number (1 for front, 2 for back)
+        page_count: Number of pages in the source file
+        output_format: Encoded format of data (e.g., "PNG")
         file_size: Size in bytes
     """
     data: bytes
@@ -80,18 +193,26 @@ class DecodedImage:
     height: int
     original_format: str
     page_number: int
+    page_count: int = 1
+    output_format: str = "PNG"
     file_size: int = field(default=0, init=False)
 
     def __post_init__(self):
         self.file_size = len(self.data)
 
+    @property
+    def content_type(self) -> str:
+        """MIME type of data."""
+        return OUTPUT_CONTENT_TYPES[self.output_format]
+
 
 class ItemResolver(ABC):
     """
     Abstract interface for resolving check items to image handles.
 
     Implementations:
-    - DemoItemResolver: Uses JSON/SQLite index for demo mode
+    - DemoItemResolver: Uses JSON index for demo mode
+    - SqliteItemResolver: Uses an on-disk SQLite index, for large indexes
     - BankItemResolver: Queries bank's item feed or index
     """
 
@@ -204,6 +325,26 @@ class StorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    async def stat(self, handle: ImageHandle) -> SourceVersion:
+        """
+        Get the size and modification time of an image file.
+
+        Called on every image request to validate cached renditions, so
+        it must not read the file contents.
+
+        Args:
+            handle: The image handle to check
+
+        Returns:
+            SourceVersion of the file
+
+        Raises:
+            FileNotFoundError: If the image doesn't exist
+            StorageAccessError: If access is denied or path is invalid
+        """
+        pass
+
     @abstractmethod
     async def health_check(self) -> Tuple[bool, str]:
         """
@@ -230,18 +371,26 @@ class ImageDecoder(ABC):
         self,
         data: bytes,
         page: int = 1,
-        target_format: str = "PNG"
+        target_format: str = "PNG",
+        profile: OutputProfile = OutputProfile.FAST,
+        rendition: Optional[Rendition] = None
     ) -> DecodedImage:
         """
         Decode an image file to the target format.
 
+        Implementations parse the file once per call; the returned
+        DecodedImage carries the page count, so callers do not need a
+        separate get_page_count() call.
+
         Args:
             data: Raw image data
             page: Page number to extract (1-indexed)
-            target_format: Output format (default PNG)
+            target_format: Output format (PNG, JPEG or WEBP)
+            profile: Compression speed/size trade-off
+            rendition: Output size; full resolution if None
 
         Returns:
-            DecodedImage with the decoded data
+            DecodedImage with the decoded data, sized to the rendition
 
         Raises:
             ValueError: If the page number is invalid
@@ -250,6 +399,40 @@ class ImageDecoder(ABC):
         """
         pass
 
+    async def decode_all(
+        self,
+        data: bytes,
+        target_format: str = "PNG",
+        profile: OutputProfile = OutputProfile.FAST,
+        rendition: Optional[Rendition] = None
+    ) -> List[DecodedImage]:
+        """
+        Decode every page of an image file.
+
+        Front and back of a check share one file; decoding both from one
+        read lets callers cache the pair together. Implementations should
+        override this to parse the file once - this default decodes page
+        by page.
+
+        Args:
+            data: Raw image data
+            target_format: Output format (PNG, JPEG or WEBP)
+            profile: Compression speed/size trade-off
+            rendition: Output size; full resolution if None
+
+        Returns:
+            DecodedImage per page, in page order
+
+        Raises:
+            UnsupportedFormatError: If the image format is not supported
+            DecodeError: If decoding fails
+        """
+        first = await self.decode(data, 1, target_format, profile, rendition)
+        pages = [first]
+        for page in range(2, first.page_count + 1):
+            pages.append(await self.decode(data, page, target_format, profile, rendition))
+        return pages
+
     @abstractmethod
     async def get_page_count(self, data: bytes) -> int:
         """
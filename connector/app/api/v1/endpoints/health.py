@@ -6,9 +6,10 @@ No authentication required for health checks.
 """
 from fastapi import APIRouter, Depends
 
+from ....audit import get_audit_logger
 from ....core.config import get_settings
 from ....core.security import get_path_validator
-from ....models import CacheStats, ComponentHealth, HealthResponse
+from ....models import AuditStats, CacheStats, ComponentHealth, DecodeStats, HealthResponse
 from ....services import get_image_service
 from ...deps import get_correlation_id
 
@@ -37,7 +38,9 @@ async def health_check(
     - Connector version
     - Connector ID
     - Component health (resolver, storage, decoder)
-    - Cache statistics
+    - Cache statistics (overall and per tier)
+    - Decode statistics (real decodes vs coalesced waits)
+    - Audit writer statistics (queued, written, dropped)
     - Allowed share roots
     """
     settings = get_settings()
@@ -72,7 +75,8 @@ async def health_check(
         ttl_seconds=cache_data["ttl_seconds"],
         cache_hits=cache_data["cache_hits"],
         cache_misses=cache_data["cache_misses"],
-        hit_rate=cache_data["hit_rate"]
+        hit_rate=cache_data["hit_rate"],
+        tiers=cache_data["tiers"]
     )
 
     return HealthResponse(
@@ -82,5 +86,7 @@ async def health_check(
         connector_id=settings.CONNECTOR_ID,
         components=components,
         cache=cache_stats,
+        decode=DecodeStats(**component_status["decode"]),
+        audit=AuditStats(**get_audit_logger().stats()),
         allowed_roots=path_validator.get_allowed_roots()
     )
@@ -4,21 +4,44 @@ Image endpoints.
 Provides authenticated access to check images via:
 - /v1/images/by-handle: Direct access by UNC path
 - /v1/images/by-item: Access by trace number and date
+- /v1/images/batch: Several images of either kind in one request
+
+All accept a rendition: a named size (thumb, preview, full) or an
+explicit width/height box, so list views can fetch small thumbnails
+instead of full-resolution pages.
 """
+import json
+import logging
+import struct
 import time
+from dataclasses import replace
 from datetime import date
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
-from ....adapters import ImageSide
-from ....audit import get_audit_logger
+from ....adapters import ImageSide, Rendition, ResizeFit
+from ....audit import AuditAction, AuditEvent, get_audit_logger, hash_path
+from ....core.config import get_settings
 from ....core.security import JWTClaims, get_path_validator
-from ....models import ErrorResponse, ImageSideParam
+from ....models import (
+    BatchImageItem,
+    BatchImageRequest,
+    ErrorResponse,
+    ImageFitParam,
+    ImageSideParam,
+    ImageSizeParam,
+)
+from ....models.schemas import MAX_RENDITION_DIMENSION, MIN_RENDITION_DIMENSION
 from ....services import get_image_service
 from ....services.image_service import (
+    NAMED_RENDITIONS,
     ImageDecodeFailedError,
     ImageNotFoundError,
+    ImageRequest,
+    ImageResult,
+    ImageServiceError,
     NoBackImageError,
     PathNotAllowedError,
     UnsupportedImageFormatError,
@@ -37,6 +60,62 @@ SECURE_HEADERS = {
     "X-XSS-Protection": "1; mode=block",
 }
 
+logger = logging.getLogger("connector.images")
+
+# Batch responses: a stream of frames, each two big-endian uint32 lengths
+# (JSON header, body) followed by the header and the body
+BATCH_ENDPOINT = "/v1/images/batch"
+BATCH_MEDIA_TYPE = "application/x-image-batch"
+BATCH_FRAME_LENGTHS = struct.Struct(">II")
+
+# HTTP status reported in a batch frame for each error code
+BATCH_ERROR_STATUS = {
+    "PATH_NOT_ALLOWED": status.HTTP_403_FORBIDDEN,
+    "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "NO_BACK_IMAGE": status.HTTP_404_NOT_FOUND,
+    "UNSUPPORTED_FORMAT": status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    "IMAGE_DECODE_FAILED": status.HTTP_422_UNPROCESSABLE_ENTITY,
+    "UPSTREAM_IO_ERROR": status.HTTP_502_BAD_GATEWAY,
+}
+
+# Client-facing message for each error code, as the single-image endpoints
+# answer; exception details (paths, storage errors) stay in the server log
+BATCH_ERROR_MESSAGE = {
+    "PATH_NOT_ALLOWED": "Path not in allowed share roots",
+    "NOT_FOUND": "Image not found",
+    "NO_BACK_IMAGE": "No back image available for this check",
+    "UNSUPPORTED_FORMAT": "Unsupported image format",
+    "IMAGE_DECODE_FAILED": "Failed to decode image file",
+    "UPSTREAM_IO_ERROR": "Failed to access upstream storage",
+}
+BATCH_INTERNAL_ERROR_MESSAGE = "An unexpected error occurred"
+
+
+def _rendition(
+    size: ImageSizeParam,
+    width: Optional[int],
+    height: Optional[int],
+    fit: ImageFitParam
+) -> Rendition:
+    """Build the requested rendition; an explicit width/height overrides size."""
+    fit = ResizeFit(fit.value)
+    if width is None and height is None:
+        rendition = NAMED_RENDITIONS[size.value]
+        return rendition if rendition.is_full else replace(rendition, fit=fit)
+    return Rendition(width=width, height=height, fit=fit)
+
+
+def _image_headers(correlation_id: str, result: ImageResult, rendition: Rendition) -> dict:
+    """Secure response headers plus image metadata."""
+    return {
+        **SECURE_HEADERS,
+        "X-Correlation-ID": correlation_id,
+        "X-From-Cache": "true" if result.from_cache else "false",
+        "X-Image-Width": str(result.width),
+        "X-Image-Height": str(result.height),
+        "X-Image-Rendition": rendition.key,
+    }
+
 
 @router.get(
     "/by-handle",
@@ -58,6 +137,23 @@ SECURE_HEADERS = {
 async def get_image_by_handle(
     path: str = Query(..., description="UNC path to the image file"),
     side: ImageSideParam = Query(ImageSideParam.FRONT, description="Image side (front or back)"),
+    size: ImageSizeParam = Query(ImageSizeParam.FULL, description="Named rendition size"),
+    width: Optional[int] = Query(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum width in pixels; overrides size"
+    ),
+    height: Optional[int] = Query(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum height in pixels; overrides size"
+    ),
+    fit: ImageFitParam = Query(
+        ImageFitParam.CONTAIN,
+        description="contain: fit inside the box; cover: fill it, cropping the centre"
+    ),
     claims: JWTClaims = Depends(validate_jwt),
     correlation_id: str = Depends(get_correlation_id),
     start_time: float = Depends(get_request_start_time)
@@ -68,6 +164,9 @@ async def get_image_by_handle(
     Requires JWT authentication with appropriate roles.
     Path must be within allowed share roots.
 
+    Pass size=thumb (or width/height) for a reduced rendition; each
+    rendition is cached separately.
+
     Returns PNG image data with secure headers.
     """
     audit_logger = get_audit_logger()
@@ -91,7 +190,8 @@ async def get_image_by_handle(
         image_side = ImageSide.FRONT if side == ImageSideParam.FRONT else ImageSide.BACK
 
         # Get the image
-        result = await image_service.get_by_handle(path, image_side)
+        rendition = _rendition(size, width, height, fit)
+        result = await image_service.get_by_handle(path, image_side, rendition)
 
         # Calculate latency
         latency_ms = int((time.time() - start_time) * 1000)
@@ -109,18 +209,10 @@ async def get_image_by_handle(
         )
 
         # Return image with secure headers
-        headers = {
-            **SECURE_HEADERS,
-            "X-Correlation-ID": correlation_id,
-            "X-From-Cache": "true" if result.from_cache else "false",
-            "X-Image-Width": str(result.width),
-            "X-Image-Height": str(result.height),
-        }
-
         return Response(
             content=result.data,
-            media_type="image/png",
-            headers=headers
+            media_type=result.content_type,
+            headers=_image_headers(correlation_id, result, rendition)
         )
 
     except ImageNotFoundError:
@@ -250,6 +342,23 @@ async def get_image_by_item(
     trace: str = Query(..., description="Check trace number"),
     date: date = Query(..., description="Check date (YYYY-MM-DD)"),
     side: ImageSideParam = Query(ImageSideParam.FRONT, description="Image side (front or back)"),
+    size: ImageSizeParam = Query(ImageSizeParam.FULL, description="Named rendition size"),
+    width: Optional[int] = Query(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum width in pixels; overrides size"
+    ),
+    height: Optional[int] = Query(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum height in pixels; overrides size"
+    ),
+    fit: ImageFitParam = Query(
+        ImageFitParam.CONTAIN,
+        description="contain: fit inside the box; cover: fill it, cropping the centre"
+    ),
     claims: JWTClaims = Depends(validate_jwt),
     correlation_id: str = Depends(get_correlation_id),
     start_time: float = Depends(get_request_start_time)
@@ -260,6 +369,9 @@ async def get_image_by_item(
     Resolves the item to find its storage location, then returns the image.
     Requires JWT authentication with appropriate roles.
 
+    Pass size=thumb (or width/height) for a reduced rendition; each
+    rendition is cached separately.
+
     Returns PNG image data with secure headers.
     """
     audit_logger = get_audit_logger()
@@ -281,7 +393,8 @@ async def get_image_by_item(
         image_side = ImageSide.FRONT if side == ImageSideParam.FRONT else ImageSide.BACK
 
         # Get the image
-        result = await image_service.get_by_item(trace, date, image_side)
+        rendition = _rendition(size, width, height, fit)
+        result = await image_service.get_by_item(trace, date, image_side, rendition)
 
         # Calculate latency
         latency_ms = int((time.time() - start_time) * 1000)
@@ -300,18 +413,10 @@ async def get_image_by_item(
         )
 
         # Return image with secure headers
-        headers = {
-            **SECURE_HEADERS,
-            "X-Correlation-ID": correlation_id,
-            "X-From-Cache": "true" if result.from_cache else "false",
-            "X-Image-Width": str(result.width),
-            "X-Image-Height": str(result.height),
-        }
-
         return Response(
             content=result.data,
-            media_type="image/png",
-            headers=headers
+            media_type=result.content_type,
+            headers=_image_headers(correlation_id, result, rendition)
         )
 
     except ImageNotFoundError:
@@ -413,3 +518,193 @@ async def get_image_by_item(
                 "correlation_id": correlation_id
             }
         )
+
+
+def _batch_frame(header: dict, body: bytes = b"") -> bytes:
+    """Encode one batch response frame."""
+    header_bytes = json.dumps(header).encode("utf-8")
+    return BATCH_FRAME_LENGTHS.pack(len(header_bytes), len(body)) + header_bytes + body
+
+
+def _batch_error_message(error_code: str) -> str:
+    """Fixed client-facing message for a batch item error code."""
+    return BATCH_ERROR_MESSAGE.get(error_code, BATCH_INTERNAL_ERROR_MESSAGE)
+
+
+def _batch_error_frame(index: int, error_code: str) -> bytes:
+    """Encode the frame for an item that could not be served."""
+    return _batch_frame({
+        "index": index,
+        "status": BATCH_ERROR_STATUS.get(error_code, status.HTTP_500_INTERNAL_SERVER_ERROR),
+        "error_code": error_code,
+        "message": _batch_error_message(error_code),
+    })
+
+
+def _batch_event(
+    action: AuditAction,
+    allow: bool,
+    correlation_id: str,
+    claims: JWTClaims,
+    index: int,
+    item: BatchImageItem,
+    **kwargs
+) -> AuditEvent:
+    """Build the audit event for one item of a batch."""
+    return AuditEvent.create(
+        action=action,
+        endpoint=BATCH_ENDPOINT,
+        allow=allow,
+        correlation_id=correlation_id,
+        org_id=claims.org_id,
+        user_id=claims.sub,
+        path_hash=hash_path(item.path),
+        trace_number=item.trace_number,
+        check_date=item.check_date.isoformat() if item.check_date else None,
+        side=item.side.value,
+        metadata={"batch_index": index},
+        **kwargs
+    )
+
+
+@router.post(
+    "/batch",
+    summary="Get Images in a Batch",
+    description="Retrieve several check images, by UNC path or by trace number and date, "
+                "in one request.",
+    responses={
+        200: {
+            "description": "Stream of length-prefixed frames, one per item",
+            "content": {BATCH_MEDIA_TYPE: {}}
+        },
+        401: {"model": ErrorResponse, "description": "Authentication failed"},
+        403: {"model": ErrorResponse, "description": "Forbidden"},
+        413: {"model": ErrorResponse, "description": "Too many items in the batch"},
+    }
+)
+async def get_images_batch(
+    body: BatchImageRequest,
+    claims: JWTClaims = Depends(validate_jwt),
+    correlation_id: str = Depends(get_correlation_id),
+    start_time: float = Depends(get_request_start_time)
+) -> StreamingResponse:
+    """
+    Get several check images in one request.
+
+    The token is validated once for the whole batch. Each item is
+    path-checked, resolved and decoded on its own; at most
+    IMAGE_BATCH_CONCURRENCY items decode at once. Frames are streamed in
+    completion order, so each header carries the item's index:
+
+        uint32 header_length, uint32 body_length (big-endian)
+        header: JSON {"index", "status", ...}
+        body: image data, empty for failed items
+
+    Every item gets its own audit event; the events are written together
+    once the response is complete.
+    """
+    settings = get_settings()
+    audit_logger = get_audit_logger()
+    image_service = get_image_service()
+    path_validator = get_path_validator()
+
+    if len(body.items) > settings.IMAGE_BATCH_MAX_ITEMS:
+        await audit_logger.log_denied(
+            endpoint=BATCH_ENDPOINT,
+            correlation_id=correlation_id,
+            error_code="BATCH_TOO_LARGE",
+            error_message=f"{len(body.items)} items requested",
+            org_id=claims.org_id,
+            user_id=claims.sub
+        )
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error_code": "BATCH_TOO_LARGE",
+                "message": f"At most {settings.IMAGE_BATCH_MAX_ITEMS} items per batch",
+                "correlation_id": correlation_id
+            }
+        )
+
+    events: List[AuditEvent] = [AuditEvent.create(
+        action=AuditAction.IMAGE_REQUEST,
+        endpoint=BATCH_ENDPOINT,
+        allow=True,
+        correlation_id=correlation_id,
+        org_id=claims.org_id,
+        user_id=claims.sub,
+        metadata={"items": len(body.items)}
+    )]
+
+    # Items with a disallowed path are answered without touching storage
+    rejected: List[bytes] = []
+    requests: List[ImageRequest] = []
+    indices: List[int] = []
+    for index, item in enumerate(body.items):
+        if item.path is not None and not path_validator.validate(item.path)[0]:
+            events.append(_batch_event(
+                AuditAction.PATH_BLOCKED, False, correlation_id, claims, index, item,
+                error_code="PATH_NOT_ALLOWED",
+                error_message=_batch_error_message("PATH_NOT_ALLOWED")
+            ))
+            rejected.append(_batch_error_frame(index, "PATH_NOT_ALLOWED"))
+            continue
+
+        requests.append(ImageRequest(
+            side=ImageSide.FRONT if item.side == ImageSideParam.FRONT else ImageSide.BACK,
+            rendition=_rendition(item.size, item.width, item.height, item.fit),
+            path=item.path,
+            trace_number=item.trace_number,
+            check_date=item.check_date
+        ))
+        indices.append(index)
+
+    async def frames():
+        try:
+            for frame in rejected:
+                yield frame
+
+            async for position, outcome in image_service.iter_batch(
+                requests, settings.IMAGE_BATCH_CONCURRENCY
+            ):
+                index = indices[position]
+                item = body.items[index]
+                latency_ms = int((time.time() - start_time) * 1000)
+
+                if isinstance(outcome, ImageServiceError):
+                    logger.warning(
+                        "Batch item %d failed with %s (correlation_id=%s): %s",
+                        index, outcome.error_code, correlation_id, outcome
+                    )
+                    events.append(_batch_event(
+                        AuditAction.IMAGE_DENIED, False, correlation_id, claims, index, item,
+                        error_code=outcome.error_code,
+                        error_message=_batch_error_message(outcome.error_code),
+                        latency_ms=latency_ms
+                    ))
+                    yield _batch_error_frame(index, outcome.error_code)
+                    continue
+
+                events.append(_batch_event(
+                    AuditAction.IMAGE_SERVED, True, correlation_id, claims, index, item,
+                    bytes_sent=len(outcome.data),
+                    latency_ms=latency_ms
+                ))
+                yield _batch_frame({
+                    "index": index,
+                    "status": status.HTTP_200_OK,
+                    "content_type": outcome.content_type,
+                    "width": outcome.width,
+                    "height": outcome.height,
+                    "from_cache": outcome.from_cache,
+                    "rendition": requests[position].rendition.key,
+                }, outcome.data)
+        finally:
+            # One write for the whole batch, even if the client disconnected
+            await audit_logger.log_many(events)
+
+    return StreamingResponse(
+        frames(),
+        media_type=BATCH_MEDIA_TYPE,
+        headers={**SECURE_HEADERS, "X-Correlation-ID": correlation_id}
+    )
@@ -1,4 +1,4 @@
 """Audit logging module."""
-from .logger import AuditEvent, AuditLogger, get_audit_logger
+from .logger import AuditAction, AuditEvent, AuditLogger, get_audit_logger, hash_path
 
-__all__ = ["AuditLogger", "AuditEvent", "get_audit_logger"]
+__all__ = ["AuditAction", "AuditLogger", "AuditEvent", "get_audit_logger", "hash_path"]
@@ -18,7 +18,7 @@ from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..core.config import get_settings
 
@@ -37,6 +37,11 @@ class AuditAction(str, Enum):
     HEALTH_CHECK = "HEALTH_CHECK"
 
 
+def hash_path(path: Optional[str]) -> Optional[str]:
+    """SHA256 of a storage path; raw paths are never logged."""
+    return hashlib.sha256(path.encode()).hexdigest() if path else None
+
+
 @dataclass
 class AuditEvent:
     """
@@ -119,25 +124,67 @@ class AuditEvent:
 
 class AuditLogger:
     """
-    Async-safe structured audit logger.
-
-    Writes JSON Lines format to audit log file.
-    Thread-safe and async-friendly.
+    Async structured audit logger.
+
+    Writes JSON Lines format to audit log file. log() only enqueues the
+    line on a bounded queue; a background writer task owns the open file
+    and writes queued lines in groups, once AUDIT_FLUSH_BYTES have
+    collected or AUDIT_FLUSH_INTERVAL_MS after the first line of a group,
+    optionally followed by fsync. The file is rotated by size and/or at
+    the start of each UTC day.
+
+    When the queue is full, log() waits up to AUDIT_ENQUEUE_TIMEOUT_MS
+    for the writer to catch up, then drops the event to the Python
+    logger and counts it, rather than stalling the request.
     """
 
-    def __init__(self, log_dir: str = None, log_file: str = None):
+    def __init__(
+        self,
+        log_dir: str = None,
+        log_file: str = None,
+        queue_size: int = None,
+        flush_interval_ms: int = None,
+        flush_bytes: int = None,
+        fsync: bool = None,
+        rotate_max_bytes: int = None,
+        rotate_daily: bool = None,
+        enqueue_timeout_ms: int = None
+    ):
         """
         Initialize the audit logger.
 
+        Arguments left as None are taken from settings.
+
         Args:
             log_dir: Directory for log files
             log_file: Log file name
+            queue_size: Maximum events waiting to be written
+            flush_interval_ms: Longest a queued event waits for its group
+            flush_bytes: Group size that triggers an immediate write
+            fsync: fsync the file after every group write
+            rotate_max_bytes: Rotate the file at this size (0 disables)
+            rotate_daily: Rotate the file when the UTC date changes
+            enqueue_timeout_ms: Longest log() waits on a full queue
         """
         settings = get_settings()
         self._log_dir = Path(log_dir or settings.LOG_DIR)
         self._log_file = log_file or settings.AUDIT_LOG_FILE
         self._log_path = self._log_dir / self._log_file
 
+        def _setting(value, default):
+            return default if value is None else value
+
+        self._queue_size = _setting(queue_size, settings.AUDIT_QUEUE_SIZE)
+        self._flush_interval = _setting(
+            flush_interval_ms, settings.AUDIT_FLUSH_INTERVAL_MS) / 1000
+        self._flush_bytes = _setting(flush_bytes, settings.AUDIT_FLUSH_BYTES)
+        self._fsync = _setting(fsync, settings.AUDIT_FSYNC)
+        self._rotate_max_bytes = _setting(
+            rotate_max_bytes, settings.AUDIT_ROTATE_MAX_MB * 1024 * 1024)
+        self._rotate_daily = _setting(rotate_daily, settings.AUDIT_ROTATE_DAILY)
+        self._enqueue_timeout = _setting(
+            enqueue_timeout_ms, settings.AUDIT_ENQUEUE_TIMEOUT_MS) / 1000
+
         # Ensure log directory exists
         self._log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -145,8 +192,21 @@ class AuditLogger:
         self._logger = logging.getLogger("connector.audit")
         self._setup_logger()
 
-        # Write lock for file operations
-        self._write_lock = asyncio.Lock()
+        # Writer task and its queue, bound to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Open file state; only touched by the writer, one group at a time
+        self._file = None
+        self._file_size = 0
+        self._file_day = None
+
+        # Counters
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._rotations = 0
 
     def _setup_logger(self):
         """Configure the Python logger."""
@@ -160,23 +220,168 @@ class AuditLogger:
         """
         Log an audit event.
 
+        Returns once the event is queued; call flush() to wait for it to
+        reach the file.
+
         Args:
             event: The audit event to log
         """
-        json_line = event.to_json()
+        await self._enqueue(event.to_json() + "\n")
 
-        # Write to file
-        async with self._write_lock:
-            try:
-                def _write():
-                    with open(self._log_path, "a") as f:
-                        f.write(json_line + "\n")
+    async def log_many(self, events: List[AuditEvent]):
+        """
+        Log several audit events, in order.
+
+        Used by batch endpoints, which still record one event per item;
+        the events normally land in the same group write.
 
-                await asyncio.get_event_loop().run_in_executor(None, _write)
+        Args:
+            events: The audit events to log, in order
+        """
+        for event in events:
+            await self._enqueue(event.to_json() + "\n")
+
+    async def _enqueue(self, line: str):
+        """Queue a line for the writer, applying backpressure when full."""
+        queue = self._ensure_writer()
+        try:
+            queue.put_nowait(line)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        try:
+            await asyncio.wait_for(queue.put(line), self._enqueue_timeout)
+        except asyncio.TimeoutError:
+            self._dropped += 1
+            self._logger.error("Audit queue full, event not written to audit log")
+            self._logger.info(line.rstrip("\n"))
+
+    def _ensure_writer(self) -> asyncio.Queue:
+        """Start the writer task on the running loop if it isn't running."""
+        loop = asyncio.get_running_loop()
+        if self._writer is None or self._writer.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._queue_size)
+            self._writer = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue):
+        """Writer task: collect lines into groups and write each group."""
+        loop = asyncio.get_running_loop()
+        while True:
+            group = [await queue.get()]
+            size = len(group[0])
+            deadline = loop.time() + self._flush_interval
+
+            while size < self._flush_bytes:
+                try:
+                    line = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        line = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                group.append(line)
+                size += len(line)
+
+            data = "".join(group)
+            try:
+                await loop.run_in_executor(None, self._write_group, data, len(group))
             except Exception as e:
                 # Fallback to Python logger
                 self._logger.error(f"Failed to write audit log: {e}")
-                self._logger.info(json_line)
+                self._logger.info(data.rstrip("\n"))
+            finally:
+                for _ in group:
+                    queue.task_done()
+
+    def _write_group(self, data: str, lines: int):
+        """Write one group of lines (in a worker thread)."""
+        if self._file is None:
+            self._open()
+        self._maybe_rotate(len(data))
+
+        self._file.write(data)
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+        self._file_size += len(data)
+        self._written += lines
+        self._flushes += 1
+
+    def _open(self):
+        """Open the log file for appending, picking up its size and age."""
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._log_path, "a", encoding="utf-8")
+        stat = os.fstat(self._file.fileno())
+        self._file_size = stat.st_size
+        self._file_day = (
+            datetime.fromtimestamp(stat.st_mtime, timezone.utc).date()
+            if stat.st_size else datetime.now(timezone.utc).date()
+        )
+
+    def _maybe_rotate(self, incoming: int):
+        """Rotate the log file if it is too large or from an earlier day."""
+        if not self._file_size:
+            self._file_day = datetime.now(timezone.utc).date()
+            return
+
+        today = datetime.now(timezone.utc).date()
+        too_large = (
+            self._rotate_max_bytes
+            and self._file_size + incoming > self._rotate_max_bytes
+        )
+        if not too_large and not (self._rotate_daily and self._file_day != today):
+            return
+
+        self._file.close()
+        self._file = None
+        # connector_audit.jsonl.20240115.1, .2, ...
+        sequence = 1
+        while True:
+            rotated = self._log_path.with_name(
+                f"{self._log_file}.{self._file_day:%Y%m%d}.{sequence}"
+            )
+            if not rotated.exists():
+                break
+            sequence += 1
+        os.replace(self._log_path, rotated)
+        self._rotations += 1
+        self._open()
+
+    async def flush(self):
+        """Wait until every queued event has been written."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self):
+        """Flush queued events, stop the writer and close the file."""
+        await self.flush()
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> dict:
+        """Writer counters for the health endpoint."""
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self._written,
+            "dropped": self._dropped,
+            "flushes": self._flushes,
+            "rotations": self._rotations
+        }
 
     async def log_image_request(
         self,
@@ -197,7 +402,7 @@ class AuditLogger:
             correlation_id=correlation_id,
             org_id=org_id,
             user_id=user_id,
-            path_hash=hashlib.sha256(path.encode()).hexdigest() if path else None,
+            path_hash=hash_path(path),
             trace_number=trace_number,
             check_date=check_date,
             side=side
@@ -225,7 +430,7 @@ class AuditLogger:
             correlation_id=correlation_id,
             org_id=org_id,
             user_id=user_id,
-            path_hash=hashlib.sha256(path.encode()).hexdigest() if path else None,
+            path_hash=hash_path(path),
             trace_number=trace_number,
             check_date=check_date,
             side=side,
@@ -253,7 +458,7 @@ class AuditLogger:
             correlation_id=correlation_id,
             org_id=org_id,
             user_id=user_id,
-            path_hash=hashlib.sha256(path.encode()).hexdigest() if path else None,
+            path_hash=hash_path(path),
             error_code=error_code,
             error_message=error_message,
             latency_ms=latency_ms
@@ -293,7 +498,7 @@ class AuditLogger:
             correlation_id=correlation_id,
             org_id=org_id,
             user_id=user_id,
-            path_hash=hashlib.sha256(path.encode()).hexdigest(),
+            path_hash=hash_path(path),
             error_code="PATH_NOT_ALLOWED",
             error_message="Path not in allowed share roots"
         )
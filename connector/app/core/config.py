@@ -39,6 +39,12 @@ class Settings(BaseSettings):
     # Demo mode settings
     DEMO_REPO_ROOT: str = "./demo_repo"
     ITEM_INDEX_PATH: str = "./demo_repo/item_index.json"
+    # "json" loads ITEM_INDEX_PATH into memory; "sqlite" imports it into
+    # ITEM_INDEX_DB_PATH and looks items up on disk (large indexes)
+    ITEM_INDEX_BACKEND: str = "json"
+    ITEM_INDEX_DB_PATH: str = "./demo_repo/item_index.db"
+    # How often the sqlite backend checks ITEM_INDEX_PATH for new items
+    ITEM_INDEX_RELOAD_SECONDS: int = 30
 
     # Allowed UNC share roots (production)
     # In demo mode, these are translated to local paths under DEMO_REPO_ROOT
@@ -47,20 +53,40 @@ class Settings(BaseSettings):
         "\\\\tn-director-pro\\Checks\\OnUs\\"
     ]
 
-    # JWT Authentication (RS256)
-    # Public key used to verify tokens from SaaS
+    # JWT Authentication
+    # Public key used to verify tokens from SaaS (RSA, P-256 or Ed25519)
     JWT_PUBLIC_KEY: str = ""
     JWT_PUBLIC_KEY_PATH: Optional[str] = None
+    # Key ID of JWT_PUBLIC_KEY; empty accepts it for tokens of any kid
+    JWT_PUBLIC_KEY_ID: str = ""
+    # Directory of <kid>.pem public keys, for several active keys during
+    # rotation; re-checked for changes every JWT_KEYS_RELOAD_SECONDS
+    JWT_PUBLIC_KEYS_DIR: Optional[str] = None
+    JWT_KEYS_RELOAD_SECONDS: int = 10
+    # Accepted algorithms, comma-separated: RS256, ES256, EdDSA
     JWT_ALGORITHM: str = "RS256"
     JWT_ISSUER: str = "check-review-saas"
 
     # Replay protection
     JWT_REPLAY_CACHE_TTL_SECONDS: int = 300  # 5 minutes
+    # "memory" (per process) or "sqlite" (shared by all workers on the host)
+    JWT_REPLAY_CACHE_BACKEND: str = "memory"
+    JWT_REPLAY_CACHE_DB_PATH: str = "./replay_cache.db"
 
     # Image handling
     MAX_IMAGE_MB: int = 50
     CACHE_TTL_SECONDS: int = 60
     CACHE_MAX_ITEMS: int = 100
+    # Disk tier of the image cache; empty string (the default) disables it.
+    # Files are unencrypted decoded check images: use an encrypted volume
+    CACHE_DISK_DIR: str = ""
+    CACHE_DISK_MAX_MB: int = 1024
+    # Encoding of served images: PNG or WEBP, with profile "fast" or "compact"
+    IMAGE_OUTPUT_FORMAT: str = "PNG"
+    IMAGE_OUTPUT_PROFILE: str = "fast"
+    # /v1/images/batch: items per request, and how many decode at once
+    IMAGE_BATCH_MAX_ITEMS: int = 50
+    IMAGE_BATCH_CONCURRENCY: int = 4
 
     # Rate limiting
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 100
@@ -70,6 +96,17 @@ class Settings(BaseSettings):
     LOG_DIR: str = "./logs"
     LOG_LEVEL: str = "INFO"
     AUDIT_LOG_FILE: str = "connector_audit.jsonl"
+    # Background audit writer: queued events are written in groups, on
+    # whichever of the byte and time thresholds is reached first
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_FLUSH_INTERVAL_MS: int = 100
+    AUDIT_FLUSH_BYTES: int = 64 * 1024
+    AUDIT_FSYNC: bool = False
+    # How long a request waits on a full queue before its event is dropped
+    AUDIT_ENQUEUE_TIMEOUT_MS: int = 50
+    # Rotation: by size (0 disables) and/or at UTC midnight
+    AUDIT_ROTATE_MAX_MB: int = 100
+    AUDIT_ROTATE_DAILY: bool = True
 
     # Required roles for image access
     IMAGE_ACCESS_ROLES: List[str] = ["image_viewer", "check_reviewer", "admin"]
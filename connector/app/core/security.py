@@ -2,19 +2,28 @@
 Security module for JWT validation and path allowlisting.
 
 Implements:
-- RS256 JWT validation with pinned public key
-- Replay protection using JTI cache
+- JWT validation against pinned public keys (RS256, ES256 or EdDSA),
+  parsed once and selected by the token's key ID
+- Replay protection using JTI cache (per process, or shared by every
+  worker on the host through SQLite)
 - Path validation against allowed share roots
 """
 import hashlib
+import logging
+import os
 import re
+import sqlite3
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 from jwt.exceptions import (
     DecodeError,
     ExpiredSignatureError,
@@ -26,6 +35,8 @@ from jwt.exceptions import (
 
 from .config import get_settings
 
+logger = logging.getLogger("connector.security")
+
 
 @dataclass
 class JWTClaims:
@@ -60,12 +71,18 @@ class JWTClaims:
 
 class ReplayCache:
     """
-    LRU cache for JTI replay protection.
+    In-process cache for JTI replay protection.
 
-    Stores recently seen JTIs with expiration timestamps.
-    Uses OrderedDict for O(1) operations with LRU eviction.
+    Stores recently seen JTIs with expiration timestamps, in insertion
+    order for eviction at capacity. Each JTI is also filed in a time wheel
+    slot by expiry; an insert sweeps only the slots that have expired
+    since the previous insert, so expiry costs amortized O(1) per token
+    instead of a scan of the whole cache.
     """
 
+    # Width of a time wheel slot
+    WHEEL_SLOT_SECONDS = 1
+
     def __init__(self, max_size: int = 10000, default_ttl: int = 300):
         """
         Initialize the replay cache.
@@ -78,6 +95,15 @@ class ReplayCache:
         self._max_size = max_size
         self._default_ttl = default_ttl
 
+        # Time wheel: slot number -> JTIs expiring within that slot. Slots
+        # before _swept_slot have been emptied.
+        self._wheel: Dict[int, List[str]] = {}
+        self._swept_slot = self._slot(time.time())
+
+    def _slot(self, timestamp: float) -> int:
+        """Time wheel slot containing a timestamp."""
+        return int(timestamp // self.WHEEL_SLOT_SECONDS)
+
     def contains(self, jti: str) -> bool:
         """Check if a JTI is in the cache (and not expired)."""
         if jti not in self._cache:
@@ -99,36 +125,368 @@ class ReplayCache:
             jti: The JWT ID to cache
             exp_timestamp: When this JTI expires (defaults to now + TTL)
         """
-        # Evict expired entries periodically
-        self._evict_expired()
+        now = time.time()
+        self._evict_expired(now)
 
         # Evict oldest if at capacity
         while len(self._cache) >= self._max_size:
             self._cache.popitem(last=False)
 
-        expiry = exp_timestamp or (time.time() + self._default_ttl)
+        expiry = exp_timestamp or (now + self._default_ttl)
         self._cache[jti] = expiry
         # Move to end (most recently used)
         self._cache.move_to_end(jti)
+        slot = max(self._slot(expiry), self._swept_slot)
+        self._wheel.setdefault(slot, []).append(jti)
 
-    def _evict_expired(self):
-        """Remove expired entries from cache."""
-        now = time.time()
-        expired = [k for k, v in self._cache.items() if v < now]
-        for k in expired:
-            del self._cache[k]
+    def check_and_add(self, jti: str, exp_timestamp: float = None) -> bool:
+        """
+        Record a JTI unless it has already been seen.
+
+        Args:
+            jti: The JWT ID to record
+            exp_timestamp: When this JTI expires (defaults to now + TTL)
+
+        Returns:
+            True if the JTI was new, False if it is a replay
+        """
+        if self.contains(jti):
+            return False
+        self.add(jti, exp_timestamp)
+        return True
+
+    def _evict_expired(self, now: float):
+        """Empty the time wheel slots that have fully expired."""
+        current = self._slot(now)
+        if current <= self._swept_slot:
+            return
+
+        if current - self._swept_slot > len(self._wheel):
+            # Idle for a while: visit occupied slots rather than every slot
+            slots = [slot for slot in self._wheel if slot < current]
+        else:
+            slots = range(self._swept_slot, current)
+
+        for slot in slots:
+            for jti in self._wheel.pop(slot, ()):
+                # Skip JTIs already evicted at capacity or re-added later
+                expiry = self._cache.get(jti)
+                if expiry is not None and expiry < now:
+                    del self._cache[jti]
+
+        self._swept_slot = current
 
     def size(self) -> int:
         """Return current cache size."""
         return len(self._cache)
 
 
+class SqliteReplayCache:
+    """
+    JTI replay cache shared by every worker process on the host.
+
+    A per-process cache lets a token be replayed against another uvicorn
+    worker. This stores JTIs in a SQLite database (WAL mode) instead.
+    check_and_add is a single INSERT ... ON CONFLICT, so two workers
+    racing on one token cannot both accept it. Expired rows are deleted
+    through the expires_at index every PURGE_INTERVAL_SECONDS, never
+    scanned per request.
+    """
+
+    # How often expired JTIs are deleted
+    PURGE_INTERVAL_SECONDS = 30
+
+    def __init__(self, path: str, default_ttl: int = 300):
+        """
+        Initialize the replay cache.
+
+        Args:
+            path: SQLite database file, shared by the workers
+            default_ttl: Default TTL in seconds
+        """
+        self._default_ttl = default_ttl
+        self._next_purge = 0.0
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jti ("
+            "jti TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS seen_jti_expires_at ON seen_jti (expires_at)"
+        )
+
+    def contains(self, jti: str) -> bool:
+        """Check if a JTI is in the cache (and not expired)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_jti WHERE jti = ? AND expires_at >= ?",
+                (jti, time.time())
+            ).fetchone()
+        return row is not None
+
+    def add(self, jti: str, exp_timestamp: float = None):
+        """
+        Add a JTI to the cache.
+
+        Args:
+            jti: The JWT ID to cache
+            exp_timestamp: When this JTI expires (defaults to now + TTL)
+        """
+        now = time.time()
+        expiry = exp_timestamp or (now + self._default_ttl)
+        with self._lock:
+            self._purge(now)
+            self._conn.execute(
+                "INSERT INTO seen_jti (jti, expires_at) VALUES (?, ?) "
+                "ON CONFLICT (jti) DO UPDATE SET expires_at = excluded.expires_at",
+                (jti, expiry)
+            )
+
+    def check_and_add(self, jti: str, exp_timestamp: float = None) -> bool:
+        """
+        Record a JTI unless it has already been seen, by any worker.
+
+        Args:
+            jti: The JWT ID to record
+            exp_timestamp: When this JTI expires (defaults to now + TTL)
+
+        Returns:
+            True if the JTI was new, False if it is a replay
+        """
+        now = time.time()
+        expiry = exp_timestamp or (now + self._default_ttl)
+        with self._lock:
+            self._purge(now)
+            # Inserts a new JTI, or takes over an expired row; a live row
+            # is left alone and rowcount is 0
+            cursor = self._conn.execute(
+                "INSERT INTO seen_jti (jti, expires_at) VALUES (?, ?) "
+                "ON CONFLICT (jti) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE seen_jti.expires_at < ?",
+                (jti, expiry, now)
+            )
+        return cursor.rowcount == 1
+
+    def _purge(self, now: float):
+        """Delete expired JTIs, at most every PURGE_INTERVAL_SECONDS."""
+        if now < self._next_purge:
+            return
+        self._conn.execute("DELETE FROM seen_jti WHERE expires_at < ?", (now,))
+        self._next_purge = now + self.PURGE_INTERVAL_SECONDS
+
+    def size(self) -> int:
+        """Return current cache size."""
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM seen_jti WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()
+        return count
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+
+def key_algorithm(key) -> str:
+    """
+    JWT algorithm a public key verifies.
+
+    Each key verifies exactly one algorithm, so a token cannot choose a
+    weaker one (or HS256 keyed with the public key) through its header.
+
+    Args:
+        key: Parsed public key
+
+    Returns:
+        "RS256", "ES256" or "EdDSA"
+
+    Raises:
+        ValueError: If the key type is not supported
+    """
+    if isinstance(key, rsa.RSAPublicKey):
+        return "RS256"
+    if isinstance(key, ec.EllipticCurvePublicKey) and isinstance(key.curve, ec.SECP256R1):
+        return "ES256"
+    if isinstance(key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported public key type: {type(key).__name__}")
+
+
+@dataclass(frozen=True)
+class VerificationKey:
+    """
+    A parsed public key and the algorithm it verifies.
+
+    Attributes:
+        kid: Key ID matched against the token header, None if unnamed
+        algorithm: JWT algorithm for this key
+        key: cryptography public key object
+    """
+    kid: Optional[str]
+    algorithm: str
+    key: object
+
+    @classmethod
+    def from_pem(cls, pem: str, kid: Optional[str] = None) -> "VerificationKey":
+        """
+        Parse a PEM public key.
+
+        Raises:
+            ValueError: If the PEM is invalid or the key type unsupported
+        """
+        key = load_pem_public_key(pem.encode() if isinstance(pem, str) else pem)
+        return cls(kid=kid, algorithm=key_algorithm(key), key=key)
+
+
+class KeyRing:
+    """
+    Parsed JWT verification keys, by key ID.
+
+    Keys are parsed once, not per request. They come from a single
+    configured PEM (optionally named by a key ID) and from a directory of
+    <kid>.pem files, so the old and new key both verify during a key
+    rotation. The directory is checked for added, changed or removed
+    files at most every reload_seconds; only changed files are re-parsed.
+    """
+
+    def __init__(
+        self,
+        public_key: str = "",
+        public_key_id: str = "",
+        keys_dir: Optional[str] = None,
+        algorithms: List[str] = None,
+        reload_seconds: float = 10
+    ):
+        """
+        Initialize the key ring.
+
+        Args:
+            public_key: Public key in PEM format
+            public_key_id: Key ID of public_key; empty leaves it unnamed
+            keys_dir: Directory of <kid>.pem public keys
+            algorithms: Accepted algorithms; keys for others are skipped
+            reload_seconds: Minimum interval between keys_dir checks
+        """
+        self._algorithms = set(algorithms or ["RS256"])
+        self._keys_dir = Path(keys_dir) if keys_dir else None
+        self._reload_seconds = reload_seconds
+        self._next_reload = 0.0
+
+        self._configured: List[VerificationKey] = []
+        if public_key:
+            key = self._parse(public_key, public_key_id or None, "JWT_PUBLIC_KEY")
+            if key is not None:
+                self._configured.append(key)
+
+        # keys_dir files: kid -> ((mtime_ns, size), key)
+        self._files: Dict[str, Tuple[Tuple[int, int], Optional[VerificationKey]]] = {}
+        self._rebuild()
+        self.reload()
+
+    def _parse(self, pem: str, kid: Optional[str], source: str) -> Optional[VerificationKey]:
+        """Parse a key, logging and skipping it if unusable."""
+        try:
+            key = VerificationKey.from_pem(pem, kid)
+        except ValueError as e:
+            logger.error("Ignoring JWT public key %s: %s", source, e)
+            return None
+        if key.algorithm not in self._algorithms:
+            logger.error(
+                "Ignoring JWT public key %s: %s is not in JWT_ALGORITHM",
+                source, key.algorithm
+            )
+            return None
+        return key
+
+    def reload(self):
+        """Re-read keys_dir, parsing only new or changed files."""
+        self._next_reload = time.monotonic() + self._reload_seconds
+        if self._keys_dir is None:
+            return
+
+        try:
+            entries = [
+                entry for entry in os.scandir(self._keys_dir)
+                if entry.name.endswith(".pem") and entry.is_file()
+            ]
+        except OSError as e:
+            logger.error("Cannot read JWT_PUBLIC_KEYS_DIR: %s", e)
+            return
+
+        files = {}
+        for entry in entries:
+            kid = entry.name[:-len(".pem")]
+            stat = entry.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            known = self._files.get(kid)
+            if known is not None and known[0] == version:
+                files[kid] = known
+                continue
+            try:
+                pem = Path(entry.path).read_text()
+            except OSError as e:
+                logger.error("Cannot read JWT public key %s: %s", entry.name, e)
+                continue
+            files[kid] = (version, self._parse(pem, kid, entry.name))
+
+        if files != self._files:
+            self._files = files
+            self._rebuild()
+
+    def _rebuild(self):
+        """Rebuild the lookup tables from the configured and file keys."""
+        by_kid = {kid: key for kid, (_, key) in self._files.items() if key is not None}
+        for key in self._configured:
+            if key.kid is not None:
+                by_kid[key.kid] = key
+        unnamed = [key for key in self._configured if key.kid is None]
+
+        # Swapped whole, so a concurrent lookup sees old or new tables
+        self._by_kid = by_kid
+        self._unnamed = unnamed
+        self._all = unnamed + list(by_kid.values())
+
+    def candidates(self, kid: Optional[str]) -> List[VerificationKey]:
+        """
+        Keys that may have signed a token.
+
+        Args:
+            kid: Key ID from the token header, if any
+
+        Returns:
+            The key with that ID; otherwise the unnamed configured key
+            (tokens from signers that predate key IDs), or every key when
+            the token names none
+        """
+        if time.monotonic() >= self._next_reload:
+            self.reload()
+        if kid is None:
+            return self._all
+        key = self._by_kid.get(kid)
+        return [key] if key is not None else self._unnamed
+
+    def kids(self) -> List[str]:
+        """Key IDs currently loaded."""
+        return sorted(self._by_kid)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+
 class JWTValidator:
     """
-    JWT validator for RS256 tokens.
+    JWT validator for SaaS-signed tokens.
 
-    Validates tokens signed by the SaaS using a pinned public key.
-    Includes replay protection via JTI caching.
+    Validates tokens signed by the SaaS against pinned public keys,
+    chosen by the token's key ID. Includes replay protection via JTI
+    caching.
     """
 
     def __init__(
@@ -142,21 +500,36 @@ class JWTValidator:
         Initialize the JWT validator.
 
         Args:
-            public_key: RSA public key in PEM format
+            public_key: Public key in PEM format (RSA, P-256 or Ed25519)
             issuer: Expected token issuer
             replay_cache_ttl: TTL for replay cache in seconds
             required_roles: Roles required for image access
         """
         settings = get_settings()
 
-        self._public_key = public_key or settings.JWT_PUBLIC_KEY
+        self._keys = KeyRing(
+            public_key=public_key or settings.JWT_PUBLIC_KEY,
+            public_key_id=settings.JWT_PUBLIC_KEY_ID,
+            keys_dir=settings.JWT_PUBLIC_KEYS_DIR,
+            algorithms=[
+                a.strip() for a in settings.JWT_ALGORITHM.split(",") if a.strip()
+            ],
+            reload_seconds=settings.JWT_KEYS_RELOAD_SECONDS
+        )
         self._issuer = issuer or settings.JWT_ISSUER
-        self._algorithm = settings.JWT_ALGORITHM
         self._required_roles = required_roles or settings.IMAGE_ACCESS_ROLES
 
         # Replay protection cache
         ttl = replay_cache_ttl or settings.JWT_REPLAY_CACHE_TTL_SECONDS
-        self._replay_cache = ReplayCache(default_ttl=ttl)
+        backend = settings.JWT_REPLAY_CACHE_BACKEND.lower()
+        if backend == "sqlite":
+            self._replay_cache = SqliteReplayCache(
+                settings.JWT_REPLAY_CACHE_DB_PATH, default_ttl=ttl
+            )
+        elif backend == "memory":
+            self._replay_cache = ReplayCache(default_ttl=ttl)
+        else:
+            raise ValueError(f"Unknown JWT_REPLAY_CACHE_BACKEND: {backend}")
 
     def validate(self, token: str) -> Tuple[bool, Optional[JWTClaims], Optional[str]]:
         """
@@ -168,23 +541,37 @@ class JWTValidator:
         Returns:
             Tuple of (is_valid, claims, error_message)
         """
-        if not self._public_key:
-            return False, None, "No public key configured"
-
         try:
+            # Only keys for the token's kid and alg are tried
+            header = jwt.get_unverified_header(token)
+            keys = [
+                key for key in self._keys.candidates(header.get("kid"))
+                if key.algorithm == header.get("alg")
+            ]
+            if not keys:
+                if not len(self._keys):
+                    return False, None, "No public key configured"
+                return False, None, "Invalid signature: no key for token kid/alg"
+
             # Decode and verify signature
-            payload = jwt.decode(
-                token,
-                self._public_key,
-                algorithms=[self._algorithm],
-                issuer=self._issuer,
-                options={
-                    "require": ["exp", "iat", "sub", "jti", "org_id"],
-                    "verify_exp": True,
-                    "verify_iat": True,
-                    "verify_iss": True,
-                }
-            )
+            for key in keys:
+                try:
+                    payload = jwt.decode(
+                        token,
+                        key.key,
+                        algorithms=[key.algorithm],
+                        issuer=self._issuer,
+                        options={
+                            "require": ["exp", "iat", "sub", "jti", "org_id"],
+                            "verify_exp": True,
+                            "verify_iat": True,
+                            "verify_iss": True,
+                        }
+                    )
+                    break
+                except InvalidSignatureError:
+                    if key is keys[-1]:
+                        raise
 
             # Extract claims
             claims = JWTClaims(
@@ -197,13 +584,10 @@ class JWTValidator:
                 iss=payload.get("iss", ""),
             )
 
-            # Check for replay attack
-            if self._replay_cache.contains(claims.jti):
+            # Check for replay attack and record the JTI in one step
+            if not self._replay_cache.check_and_add(claims.jti, claims.exp):
                 return False, None, "Token replay detected"
 
-            # Add to replay cache
-            self._replay_cache.add(claims.jti, claims.exp)
-
             return True, claims, None
 
         except ExpiredSignatureError:
@@ -20,6 +20,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .api.v1 import router as api_v1_router
+from .audit import get_audit_logger
 from .core.config import ConnectorMode, get_settings
 
 # Configure logging
@@ -56,6 +57,9 @@ async def lifespan(app: FastAPI):
 
     logger.info("Shutting down Bank-Side Connector")
 
+    # Write out audit events still queued for the background writer
+    await get_audit_logger().close()
+
 
 # Create FastAPI application
 settings = get_settings()
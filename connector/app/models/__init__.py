@@ -1,14 +1,32 @@
 """API models and schemas."""
 from .schemas import (
+    AuditStats,
+    BatchImageItem,
+    BatchImageRequest,
+    CacheStats,
+    CacheTierStats,
+    ComponentHealth,
+    DecodeStats,
     ErrorResponse,
     HealthResponse,
+    ImageFitParam,
     ImageSideParam,
+    ImageSizeParam,
     ItemLookupResponse,
 )
 
 __all__ = [
     "HealthResponse",
+    "ComponentHealth",
+    "CacheStats",
+    "CacheTierStats",
+    "DecodeStats",
+    "AuditStats",
     "ErrorResponse",
     "ItemLookupResponse",
     "ImageSideParam",
+    "ImageSizeParam",
+    "ImageFitParam",
+    "BatchImageItem",
+    "BatchImageRequest",
 ]
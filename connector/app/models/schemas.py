@@ -5,7 +5,11 @@ from datetime import date
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Bounds for an explicit rendition width/height
+MIN_RENDITION_DIMENSION = 16
+MAX_RENDITION_DIMENSION = 4000
 
 
 class ImageSideParam(str, Enum):
@@ -14,6 +18,19 @@ class ImageSideParam(str, Enum):
     BACK = "back"
 
 
+class ImageSizeParam(str, Enum):
+    """Query parameter for a named rendition size."""
+    THUMB = "thumb"
+    PREVIEW = "preview"
+    FULL = "full"
+
+
+class ImageFitParam(str, Enum):
+    """Query parameter for how a rendition fills its width x height box."""
+    CONTAIN = "contain"
+    COVER = "cover"
+
+
 class ErrorCode(str, Enum):
     """Standard error codes."""
     AUTH_FAILED = "AUTH_FAILED"
@@ -25,6 +42,7 @@ class ErrorCode(str, Enum):
     IMAGE_DECODE_FAILED = "IMAGE_DECODE_FAILED"
     UPSTREAM_IO_ERROR = "UPSTREAM_IO_ERROR"
     RATE_LIMITED = "RATE_LIMITED"
+    BATCH_TOO_LARGE = "BATCH_TOO_LARGE"
     INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
@@ -44,12 +62,64 @@ class ErrorResponse(BaseModel):
         }
 
 
+class BatchImageItem(BaseModel):
+    """One image of a batch request: a path, or a trace number and date."""
+    path: Optional[str] = Field(None, description="UNC path to the image file")
+    trace_number: Optional[str] = Field(None, description="Check trace number")
+    check_date: Optional[date] = Field(None, description="Check date (YYYY-MM-DD)")
+    side: ImageSideParam = Field(ImageSideParam.FRONT, description="Image side")
+    size: ImageSizeParam = Field(ImageSizeParam.FULL, description="Named rendition size")
+    width: Optional[int] = Field(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum width in pixels; overrides size"
+    )
+    height: Optional[int] = Field(
+        None,
+        ge=MIN_RENDITION_DIMENSION,
+        le=MAX_RENDITION_DIMENSION,
+        description="Maximum height in pixels; overrides size"
+    )
+    fit: ImageFitParam = Field(ImageFitParam.CONTAIN, description="contain or cover")
+
+    @model_validator(mode="after")
+    def check_locator(self) -> "BatchImageItem":
+        """Require exactly one of path or trace_number + check_date."""
+        by_item = self.trace_number is not None or self.check_date is not None
+        if (self.path is None) == (not by_item):
+            raise ValueError("Give either path or trace_number and check_date")
+        if by_item and (self.trace_number is None or self.check_date is None):
+            raise ValueError("trace_number and check_date are both required")
+        return self
+
+
+class BatchImageRequest(BaseModel):
+    """Batch image request body."""
+    items: List[BatchImageItem] = Field(
+        ..., min_length=1, description="Images to retrieve"
+    )
+
+
 class ComponentHealth(BaseModel):
     """Health status of a single component."""
     healthy: bool = Field(..., description="Whether the component is healthy")
     message: str = Field(..., description="Status message")
 
 
+class CacheTierStats(BaseModel):
+    """Statistics for one cache tier."""
+    items: int = Field(..., description="Number of cached items")
+    bytes: int = Field(..., description="Total bytes cached")
+    max_bytes: int = Field(..., description="Maximum bytes allowed")
+    hits: int = Field(..., description="Hits in this tier")
+    misses: int = Field(..., description="Misses in this tier")
+    hit_rate: float = Field(..., description="Hit rate of this tier (0-1)")
+    invalidations: int = Field(
+        0, description="Entries dropped because the source file changed"
+    )
+
+
 class CacheStats(BaseModel):
     """Cache statistics."""
     items: int = Field(..., description="Number of cached items")
@@ -60,6 +130,29 @@ class CacheStats(BaseModel):
     cache_hits: int = Field(..., description="Total cache hits")
     cache_misses: int = Field(..., description="Total cache misses")
     hit_rate: float = Field(..., description="Cache hit rate (0-1)")
+    tiers: Dict[str, CacheTierStats] = Field(
+        default_factory=dict, description="Per-tier statistics (memory, disk)"
+    )
+
+
+class DecodeStats(BaseModel):
+    """Image decode statistics."""
+    decodes: int = Field(..., description="Storage reads + decodes performed")
+    coalesced_waits: int = Field(
+        ..., description="Requests served by joining an in-flight decode"
+    )
+    in_flight: int = Field(..., description="Decodes currently in progress")
+
+
+class AuditStats(BaseModel):
+    """Background audit writer statistics."""
+    queued: int = Field(..., description="Events waiting to be written")
+    written: int = Field(..., description="Events written to the audit log")
+    dropped: int = Field(
+        ..., description="Events dropped because the queue stayed full"
+    )
+    flushes: int = Field(..., description="Group writes performed")
+    rotations: int = Field(..., description="Audit log file rotations")
 
 
 class HealthResponse(BaseModel):
@@ -72,6 +165,8 @@ class HealthResponse(BaseModel):
         ..., description="Health status of individual components"
     )
     cache: CacheStats = Field(..., description="Cache statistics")
+    decode: Optional[DecodeStats] = Field(None, description="Decode statistics")
+    audit: Optional[AuditStats] = Field(None, description="Audit writer statistics")
     allowed_roots: List[str] = Field(
         ..., description="Allowed UNC share roots"
     )
@@ -98,6 +193,18 @@ class HealthResponse(BaseModel):
                     "cache_misses": 0,
                     "hit_rate": 0.0
                 },
+                "decode": {
+                    "decodes": 0,
+                    "coalesced_waits": 0,
+                    "in_flight": 0
+                },
+                "audit": {
+                    "queued": 0,
+                    "written": 0,
+                    "dropped": 0,
+                    "flushes": 0,
+                    "rotations": 0
+                },
                 "allowed_roots": [
                     "\\\\tn-director-pro\\Checks\\Transit\\",
                     "\\\\tn-director-pro\\Checks\\OnUs\\"
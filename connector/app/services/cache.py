@@ -1,17 +1,44 @@
 """
-In-memory image cache with TTL.
+Two-tier image cache: in-memory LRU with TTL, backed by a disk cache.
 
 Caches decoded PNG images to reduce CPU usage for repeated requests.
+
+Every entry records the SourceVersion (size, mtime) of the file it was
+decoded from. Lookups pass the file's current version and an entry made
+from an older version is dropped instead of served, so a rescanned image
+is never returned stale.
+
+The disk tier survives restarts. Files are addressed by a hash of
+(source path, page, rendition variant), carry the source version and
+dimensions in a small header, and are memory-mapped on read. The tier is
+bounded by total size with LRU eviction.
+
+The disk tier is off by default (settings.CACHE_DISK_DIR). Cached files
+are decoded check images stored unencrypted, so enable it only on an
+encrypted volume. The directory is created 0700 and files are written
+0600, which limits access to the connector's account on POSIX hosts.
+On Windows, restrict the directory with NTFS ACLs instead.
 """
 import asyncio
 import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional, Tuple
 
+from ..adapters.interfaces import SourceVersion
 from ..core.config import get_settings
 
+logger = logging.getLogger("connector.cache")
+
+CacheKey = Tuple[str, int, str]
+
 
 @dataclass
 class CacheEntry:
@@ -21,10 +48,21 @@ class CacheEntry:
     height: int
     created_at: float
     expires_at: float
+    version: Optional[SourceVersion] = None
     hits: int = 0
 
 
-class ImageCache:
+def _tier_stats(hits: int, misses: int, **extra) -> dict:
+    lookups = hits + misses
+    return {
+        **extra,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups > 0 else 0.0,
+    }
+
+
+class MemoryTier:
     """
     LRU cache for decoded images with TTL.
 
@@ -32,22 +70,309 @@ class ImageCache:
     - TTL-based expiration
     - LRU eviction when at capacity
     - Memory-aware (tracks total bytes)
-    - Thread-safe via asyncio Lock
+
+    Every method runs without awaiting, so the event loop already
+    serializes access and no lock is needed. Expired entries are dropped
+    when looked up or when they reach the LRU head, never by a full scan.
+    """
+
+    def __init__(self, ttl_seconds: int, max_items: int, max_bytes: int):
+        self._ttl = ttl_seconds
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+
+        self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+
+        # Stats
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(
+        self, key: CacheKey, version: Optional[SourceVersion]
+    ) -> Optional[CacheEntry]:
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        # Check expiration and source version
+        if time.time() > entry.expires_at or entry.version != version:
+            if entry.version != version:
+                self._invalidations += 1
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        # Update hit count and move to end (LRU)
+        entry.hits += 1
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        data: bytes,
+        width: int,
+        height: int,
+        version: Optional[SourceVersion]
+    ):
+        data_size = len(data)
+        if data_size > self._max_bytes:
+            return
+
+        # Remove existing entry if present
+        if key in self._cache:
+            self._remove(key)
+
+        now = time.time()
+        self._trim_expired_head(now)
+
+        # Evict LRU entries until we have space and are under the item limit
+        while self._cache and (
+            self._total_bytes + data_size > self._max_bytes
+            or len(self._cache) >= self._max_items
+        ):
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+
+        self._cache[key] = CacheEntry(
+            data=data,
+            width=width,
+            height=height,
+            created_at=now,
+            expires_at=now + self._ttl,
+            version=version
+        )
+        self._total_bytes += data_size
+
+    def _remove(self, key: CacheKey):
+        entry = self._cache.pop(key)
+        self._total_bytes -= len(entry.data)
+
+    def _trim_expired_head(self, now: float):
+        """Drop expired entries at the LRU head (amortized O(1) per put)."""
+        while self._cache:
+            oldest_key, oldest = next(iter(self._cache.items()))
+            if oldest.expires_at >= now:
+                break
+            self._remove(oldest_key)
+
+    def clear(self):
+        self._cache.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> dict:
+        return _tier_stats(
+            self._hits,
+            self._misses,
+            items=len(self._cache),
+            bytes=self._total_bytes,
+            max_bytes=self._max_bytes,
+            invalidations=self._invalidations,
+        )
+
+
+class DiskTier:
+    """
+    Bounded on-disk cache of encoded images.
+
+    Layout: <directory>/<hh>/<sha256 of key>, each file a HEADER followed
+    by the image bytes. Files are written to a temporary name and renamed
+    into place, so readers never see a partial file. The LRU index is
+    rebuilt from file mtimes at startup; hits touch the file so the order
+    survives restarts.
+
+    Methods are blocking and run in the default executor; a short
+    threading lock guards the index only, never file I/O.
+    """
+
+    # magic, source size, source mtime_ns, width, height
+    HEADER = struct.Struct("<4sQqII")
+    MAGIC = b"CIC1"
+
+    DIR_MODE = 0o700
+    FILE_MODE = 0o600
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+    def __init__(self, directory: str, max_bytes: int):
+        self._dir = Path(directory)
+        self._max_bytes = max_bytes
+
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # Stats
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+        # Decoded check images: readable by the connector's account only
+        self._dir.mkdir(parents=True, exist_ok=True, mode=self.DIR_MODE)
+        os.chmod(self._dir, self.DIR_MODE)
+        self._load_index()
+
+    def _load_index(self):
+        """Index existing entries, least recently used first."""
+        entries = []
+        for file in self._dir.glob("??/*"):
+            if file.suffix == ".tmp":
+                file.unlink(missing_ok=True)
+                continue
+            try:
+                st = file.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, file.name, st.st_size))
+
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def _name(key: CacheKey) -> str:
+        path, page, variant = key
+        return hashlib.sha256(f"{path}\0{page}\0{variant}".encode()).hexdigest()
+
+    def _file(self, name: str) -> Path:
+        return self._dir / name[:2] / name
+
+    def get(
+        self, key: CacheKey, version: Optional[SourceVersion]
+    ) -> Optional[Tuple[bytes, int, int]]:
+        name = self._name(key)
+        with self._lock:
+            if name not in self._index:
+                self._misses += 1
+                return None
+            self._index.move_to_end(name)
+
+        file = self._file(name)
+        try:
+            with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, size, mtime_ns, width, height = self.HEADER.unpack_from(mm)
+                current = magic == self.MAGIC and (
+                    version is None or (size, mtime_ns) == (version.size, version.mtime_ns)
+                )
+                data = mm[self.HEADER.size:] if current else None
+            if data is None:
+                self._drop(name, invalidated=True)
+                return None
+            os.utime(file)
+        except (OSError, ValueError, struct.error):
+            # Removed by a concurrent eviction, truncated or unreadable
+            self._drop(name)
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return data, width, height
+
+    def put(
+        self,
+        key: CacheKey,
+        data: bytes,
+        width: int,
+        height: int,
+        version: Optional[SourceVersion]
+    ):
+        name = self._name(key)
+        file = self._file(name)
+        header = self.HEADER.pack(
+            self.MAGIC,
+            version.size if version else 0,
+            version.mtime_ns if version else 0,
+            width,
+            height
+        )
+        size = len(header) + len(data)
+        if size > self._max_bytes:
+            return
+
+        tmp = file.with_name(f"{name}.{threading.get_ident()}.tmp")
+        try:
+            file.parent.mkdir(exist_ok=True, mode=self.DIR_MODE)
+            fd = os.open(tmp, self._OPEN_FLAGS, self.FILE_MODE)
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(tmp, file)
+        except OSError as e:
+            logger.warning("Disk cache write failed: %s", e)
+            tmp.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._total_bytes += size - self._index.pop(name, 0)
+            self._index[name] = size
+            self._evict()
+
+    def _drop(self, name: str, invalidated: bool = False):
+        with self._lock:
+            self._misses += 1
+            if invalidated:
+                self._invalidations += 1
+            self._total_bytes -= self._index.pop(name, 0)
+        self._file(name).unlink(missing_ok=True)
+
+    def _evict(self):
+        """Remove least recently used files until under max_bytes (called under lock)."""
+        while self._index and self._total_bytes > self._max_bytes:
+            name, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._file(name).unlink(missing_ok=True)
+
+    def clear(self):
+        with self._lock:
+            names = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for name in names:
+            self._file(name).unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return _tier_stats(
+                self._hits,
+                self._misses,
+                items=len(self._index),
+                bytes=self._total_bytes,
+                max_bytes=self._max_bytes,
+                invalidations=self._invalidations,
+            )
+
+
+class ImageCache:
+    """
+    Image cache with a memory tier and an optional disk tier.
+
+    Lookups try memory, then disk (promoting disk hits to memory); writes
+    go to both.
     """
 
     def __init__(
         self,
         ttl_seconds: int = None,
         max_items: int = None,
-        max_bytes: int = None
+        max_bytes: int = None,
+        disk_dir: str = None,
+        disk_max_bytes: int = None
     ):
         """
         Initialize the image cache.
 
         Args:
-            ttl_seconds: Time-to-live for cache entries
-            max_items: Maximum number of cached images
-            max_bytes: Maximum total bytes to cache (default 100MB)
+            ttl_seconds: Time-to-live for memory entries
+            max_items: Maximum number of images in memory
+            max_bytes: Maximum total bytes in memory (default 100MB)
+            disk_dir: Disk tier directory; "" disables the disk tier
+                      (default settings.CACHE_DISK_DIR)
+            disk_max_bytes: Maximum total bytes on disk
+                            (default settings.CACHE_DISK_MAX_MB)
         """
         settings = get_settings()
 
@@ -55,60 +380,70 @@ class ImageCache:
         self._max_items = max_items or settings.CACHE_MAX_ITEMS
         self._max_bytes = max_bytes or (100 * 1024 * 1024)  # 100MB default
 
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._total_bytes = 0
-        self._lock = asyncio.Lock()
+        self._memory = MemoryTier(self._ttl, self._max_items, self._max_bytes)
 
-        # Stats
+        if disk_dir is None:
+            disk_dir = settings.CACHE_DISK_DIR
+        self._disk: Optional[DiskTier] = None
+        if disk_dir:
+            self._disk = DiskTier(
+                disk_dir,
+                disk_max_bytes or settings.CACHE_DISK_MAX_MB * 1024 * 1024
+            )
+
+        # Stats (either tier)
         self._hits = 0
         self._misses = 0
 
-    def _make_key(self, path: str, page: int) -> str:
-        """Create a cache key from path and page number."""
-        key_str = f"{path}:{page}"
-        return hashlib.sha256(key_str.encode()).hexdigest()
-
-    async def get(self, path: str, page: int) -> Optional[Tuple[bytes, int, int]]:
+    async def get(
+        self,
+        path: str,
+        page: int,
+        version: Optional[SourceVersion] = None,
+        variant: str = ""
+    ) -> Optional[Tuple[bytes, int, int]]:
         """
         Get a cached image.
 
         Args:
             path: Image path
             page: Page number
+            version: Current version of the source file; entries made
+                     from another version are discarded
+            variant: Rendition of the page (e.g. output format, size)
 
         Returns:
             Tuple of (data, width, height) if cached, None otherwise
         """
-        key = self._make_key(path, page)
-
-        async with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
-
-            entry = self._cache[key]
-
-            # Check expiration
-            if time.time() > entry.expires_at:
-                self._total_bytes -= len(entry.data)
-                del self._cache[key]
-                self._misses += 1
-                return None
+        key = (path, page, variant)
 
-            # Update hit count and move to end (LRU)
-            entry.hits += 1
-            self._cache.move_to_end(key)
+        entry = self._memory.get(key, version)
+        if entry is not None:
             self._hits += 1
-
             return entry.data, entry.width, entry.height
 
+        if self._disk is not None:
+            cached = await asyncio.get_event_loop().run_in_executor(
+                None, self._disk.get, key, version
+            )
+            if cached is not None:
+                self._hits += 1
+                data, width, height = cached
+                self._memory.put(key, data, width, height, version)
+                return cached
+
+        self._misses += 1
+        return None
+
     async def put(
         self,
         path: str,
         page: int,
         data: bytes,
         width: int,
-        height: int
+        height: int,
+        version: Optional[SourceVersion] = None,
+        variant: str = ""
     ):
         """
         Cache an image.
@@ -119,75 +454,42 @@ class ImageCache:
             data: PNG image data
             width: Image width
             height: Image height
+            version: Version of the source file the image was decoded from
+            variant: Rendition of the page (e.g. output format, size)
         """
-        key = self._make_key(path, page)
-        data_size = len(data)
+        key = (path, page, variant)
+        self._memory.put(key, data, width, height, version)
 
-        async with self._lock:
-            # Remove existing entry if present
-            if key in self._cache:
-                old_entry = self._cache.pop(key)
-                self._total_bytes -= len(old_entry.data)
-
-            # Evict expired entries
-            self._evict_expired()
-
-            # Evict LRU entries until we have space
-            while self._total_bytes + data_size > self._max_bytes:
-                if not self._cache:
-                    break
-                oldest_key, oldest_entry = self._cache.popitem(last=False)
-                self._total_bytes -= len(oldest_entry.data)
-
-            # Evict if at item limit
-            while len(self._cache) >= self._max_items:
-                oldest_key, oldest_entry = self._cache.popitem(last=False)
-                self._total_bytes -= len(oldest_entry.data)
-
-            # Add new entry
-            now = time.time()
-            entry = CacheEntry(
-                data=data,
-                width=width,
-                height=height,
-                created_at=now,
-                expires_at=now + self._ttl
+        if self._disk is not None:
+            await asyncio.get_event_loop().run_in_executor(
+                None, self._disk.put, key, data, width, height, version
             )
-            self._cache[key] = entry
-            self._total_bytes += data_size
-
-    def _evict_expired(self):
-        """Remove expired entries (called under lock)."""
-        now = time.time()
-        expired_keys = [
-            k for k, v in self._cache.items()
-            if v.expires_at < now
-        ]
-        for key in expired_keys:
-            entry = self._cache.pop(key)
-            self._total_bytes -= len(entry.data)
 
     async def clear(self):
         """Clear all cached entries."""
-        async with self._lock:
-            self._cache.clear()
-            self._total_bytes = 0
+        self._memory.clear()
+        if self._disk is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self._disk.clear)
 
     async def stats(self) -> dict:
-        """Get cache statistics."""
-        async with self._lock:
-            total_hits = sum(e.hits for e in self._cache.values())
-            return {
-                "items": len(self._cache),
-                "bytes": self._total_bytes,
-                "max_items": self._max_items,
-                "max_bytes": self._max_bytes,
-                "ttl_seconds": self._ttl,
-                "cache_hits": self._hits,
-                "cache_misses": self._misses,
-                "hit_rate": self._hits / (self._hits + self._misses)
-                           if (self._hits + self._misses) > 0 else 0.0
-            }
+        """Get cache statistics, overall and per tier."""
+        memory = self._memory.stats()
+        tiers = {"memory": memory}
+        if self._disk is not None:
+            tiers["disk"] = self._disk.stats()
+
+        lookups = self._hits + self._misses
+        return {
+            "items": memory["items"],
+            "bytes": memory["bytes"],
+            "max_items": self._max_items,
+            "max_bytes": self._max_bytes,
+            "ttl_seconds": self._ttl,
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups > 0 else 0.0,
+            "tiers": tiers
+        }
 
 
 # Singleton instance
@@ -3,20 +3,36 @@ Image service that orchestrates storage, decoding, and caching.
 
 Main entry point for image retrieval operations.
 """
+import asyncio
+import logging
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from ..adapters import DecodedImage, ImageHandle, ImageSide
+from ..adapters import DecodedImage, ImageHandle, ImageSide, Rendition
 from ..adapters.factory import get_adapters
 from ..adapters.interfaces import (
+    OUTPUT_CONTENT_TYPES,
     DecodeError,
     ItemNotFoundError,
+    OutputProfile,
+    SourceVersion,
     StorageAccessError,
     UnsupportedFormatError,
 )
+from ..core.config import get_settings
 from .cache import get_image_cache
 
+logger = logging.getLogger("connector.images")
+
+# Named rendition sizes offered by the image endpoints. Check images are
+# roughly 2:1; thumb suits a queue row, preview a side panel.
+FULL_RENDITION = Rendition()
+NAMED_RENDITIONS = {
+    "thumb": Rendition(width=240, height=120),
+    "preview": Rendition(width=960, height=480),
+    "full": FULL_RENDITION,
+}
 
 @dataclass
 class ImageResult:
@@ -28,6 +44,16 @@ class ImageResult:
     from_cache: bool = False
 
 
+@dataclass
+class ImageRequest:
+    """One image of a batch: by storage path, or by trace number and date."""
+    side: ImageSide = ImageSide.FRONT
+    rendition: Optional[Rendition] = None
+    path: Optional[str] = None
+    trace_number: Optional[str] = None
+    check_date: Optional[date] = None
+
+
 class ImageServiceError(Exception):
     """Base exception for image service errors."""
     error_code: str = "INTERNAL_ERROR"
@@ -79,10 +105,26 @@ class ImageService:
         self._resolver, self._storage, self._decoder = get_adapters()
         self._cache = get_image_cache()
 
+        settings = get_settings()
+        self._output_format = settings.IMAGE_OUTPUT_FORMAT.upper()
+        self._output_profile = OutputProfile(settings.IMAGE_OUTPUT_PROFILE.lower())
+        self._content_type = OUTPUT_CONTENT_TYPES[self._output_format]
+        # Cache variant: the disk tier outlives output settings changes
+        self._variant = f"{self._output_format}:{self._output_profile.value}"
+
+        # Single-flight: in-progress loads by (path, version, rendition,
+        # page), and how often they were shared
+        self._inflight: Dict[
+            Tuple[str, SourceVersion, str, Optional[int]], asyncio.Task
+        ] = {}
+        self._decodes = 0
+        self._coalesced_waits = 0
+
     async def get_by_handle(
         self,
         path: str,
-        side: ImageSide = ImageSide.FRONT
+        side: ImageSide = ImageSide.FRONT,
+        rendition: Optional[Rendition] = None
     ) -> ImageResult:
         """
         Get an image by its storage path (UNC handle).
@@ -90,6 +132,7 @@ class ImageService:
         Args:
             path: UNC path to the image file
             side: Which side of the check (front or back)
+            rendition: Output size; full resolution if None
 
         Returns:
             ImageResult with PNG data
@@ -103,66 +146,141 @@ class ImageService:
         # Determine page number
         page = 1 if side == ImageSide.FRONT else 2
 
+        handle = ImageHandle(path=path)
+        rendition = rendition or FULL_RENDITION
+
+        # Each size is cached on its own; full size keeps the plain variant
+        variant = self._variant
+        if not rendition.is_full:
+            variant = f"{variant}:{rendition.key}"
+
+        # Cached renditions are only valid for the file's current version
+        version = await self._stat(handle)
+
         # Check cache first
-        cached = await self._cache.get(path, page)
+        cached = await self._cache.get(path, page, version, variant)
         if cached:
             data, width, height = cached
             return ImageResult(
                 data=data,
                 width=width,
                 height=height,
+                content_type=self._content_type,
                 from_cache=True
             )
 
-        # Create handle for storage access
-        handle = ImageHandle(path=path)
+        # Full size decodes both sides for the review UI; a reduced
+        # rendition (a queue thumbnail) decodes only the side asked for
+        load_page = None if rendition.is_full else page
+
+        # Concurrent misses for the same file share one read and decode
+        key = (path, version, rendition.key, load_page)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_pages(handle, version, rendition, variant, load_page)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._coalesced_waits += 1
+
+        # shield: a cancelled request must not cancel a load others await
+        pages = await asyncio.shield(task)
+
+        decoded = next((p for p in pages if p.page_number == page), None)
+        if decoded is None:
+            raise NoBackImageError("No back image available")
+
+        return ImageResult(
+            data=decoded.data,
+            width=decoded.width,
+            height=decoded.height,
+            content_type=decoded.content_type,
+            from_cache=False
+        )
+
+    async def _stat(self, handle: ImageHandle) -> SourceVersion:
+        """Get the source file's version, mapping storage errors."""
+        try:
+            return await self._storage.stat(handle)
+        except FileNotFoundError:
+            raise ImageNotFoundError("Image not found at path")
+        except StorageAccessError as e:
+            raise UpstreamIOError(str(e))
+        except Exception as e:
+            raise UpstreamIOError(f"Storage access failed: {str(e)}")
+
+    async def _load_pages(
+        self,
+        handle: ImageHandle,
+        version: SourceVersion,
+        rendition: Rendition,
+        variant: str,
+        page: Optional[int] = None
+    ) -> List[DecodedImage]:
+        """
+        Read a file, decode one page (or every page) and cache each one.
+
+        Front and back share the file and the review UI asks for both, so
+        with page None the second request is served from cache.
+        """
+        self._decodes += 1
 
         # Read raw data from storage
         try:
             raw_data = await self._storage.read(handle)
         except FileNotFoundError:
-            raise ImageNotFoundError(f"Image not found at path")
+            raise ImageNotFoundError("Image not found at path")
         except StorageAccessError as e:
             raise UpstreamIOError(str(e))
         except Exception as e:
             raise UpstreamIOError(f"Storage access failed: {str(e)}")
 
-        # Check page count for back side requests
-        page_count = await self._decoder.get_page_count(raw_data)
-        if page > page_count:
-            raise NoBackImageError("No back image available")
-
-        # Decode image
+        # Decode every page (or the one requested) from this one read and parse
         try:
-            decoded = await self._decoder.decode(raw_data, page=page)
+            if page is None:
+                pages = await self._decoder.decode_all(
+                    raw_data,
+                    target_format=self._output_format,
+                    profile=self._output_profile,
+                    rendition=rendition
+                )
+            else:
+                pages = [await self._decoder.decode(
+                    raw_data,
+                    page,
+                    target_format=self._output_format,
+                    profile=self._output_profile,
+                    rendition=rendition
+                )]
+        except ValueError:
+            raise NoBackImageError("No back image available")
         except UnsupportedFormatError as e:
             raise UnsupportedImageFormatError(str(e))
         except DecodeError as e:
             raise ImageDecodeFailedError(str(e))
-        except ValueError as e:
-            raise NoBackImageError(str(e))
 
-        # Cache the result
-        await self._cache.put(
-            path=path,
-            page=page,
-            data=decoded.data,
-            width=decoded.width,
-            height=decoded.height
-        )
+        # Cache every page
+        for decoded_page in pages:
+            await self._cache.put(
+                path=handle.path,
+                page=decoded_page.page_number,
+                data=decoded_page.data,
+                width=decoded_page.width,
+                height=decoded_page.height,
+                version=version,
+                variant=variant
+            )
 
-        return ImageResult(
-            data=decoded.data,
-            width=decoded.width,
-            height=decoded.height,
-            from_cache=False
-        )
+        return pages
 
     async def get_by_item(
         self,
         trace_number: str,
         check_date: date,
-        side: ImageSide = ImageSide.FRONT
+        side: ImageSide = ImageSide.FRONT,
+        rendition: Optional[Rendition] = None
     ) -> ImageResult:
         """
         Get an image by trace number and date.
@@ -171,6 +289,7 @@ class ImageService:
             trace_number: Check trace number
             check_date: Check date
             side: Which side of the check
+            rendition: Output size; full resolution if None
 
         Returns:
             ImageResult with PNG data
@@ -193,7 +312,62 @@ class ImageService:
             raise NoBackImageError("No back image available for this item")
 
         # Get the image by handle
-        return await self.get_by_handle(metadata.image_handle.path, side)
+        return await self.get_by_handle(metadata.image_handle.path, side, rendition)
+
+    async def iter_batch(
+        self,
+        requests: List[ImageRequest],
+        concurrency: int
+    ) -> AsyncIterator[Tuple[int, Union[ImageResult, ImageServiceError]]]:
+        """
+        Retrieve several images, yielding each as soon as it is ready.
+
+        At most `concurrency` requests read and decode at once, so one
+        large batch cannot occupy every decoder thread. Requests for the
+        same file (front and back) share a load through single-flight.
+
+        Args:
+            requests: Images to retrieve
+            concurrency: Maximum requests in progress at once
+
+        Yields:
+            (index into requests, ImageResult or the ImageServiceError it
+            failed with), in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(index: int, request: ImageRequest):
+            async with semaphore:
+                try:
+                    if request.path is not None:
+                        result = await self.get_by_handle(
+                            request.path, request.side, request.rendition
+                        )
+                    else:
+                        result = await self.get_by_item(
+                            request.trace_number,
+                            request.check_date,
+                            request.side,
+                            request.rendition
+                        )
+                except ImageServiceError as e:
+                    return index, e
+                except Exception:
+                    logger.exception("Batch image retrieval failed for item %d", index)
+                    return index, ImageServiceError("Image retrieval failed")
+                return index, result
+
+        tasks = [
+            asyncio.create_task(fetch(index, request))
+            for index, request in enumerate(requests)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The client went away: stop work nobody will receive
+            for task in tasks:
+                task.cancel()
 
     async def lookup_item(
         self,
@@ -243,7 +417,16 @@ class ImageService:
             "resolver": {"healthy": resolver_ok, "message": resolver_msg},
             "storage": {"healthy": storage_ok, "message": storage_msg},
             "decoder": {"healthy": decoder_ok, "message": decoder_msg},
-            "cache": cache_stats
+            "cache": cache_stats,
+            "decode": self.decode_stats()
+        }
+
+    def decode_stats(self) -> dict:
+        """Real decodes versus requests that joined an in-flight decode."""
+        return {
+            "decodes": self._decodes,
+            "coalesced_waits": self._coalesced_waits,
+            "in_flight": len(self._inflight)
         }
 
 
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Decoder benchmark over the demo_repo fixtures.
+
+Reports milliseconds per image and bytes out for each output format and
+profile of TiffImageDecoder, against the previous decode path (separate
+page-count parse, RGB expansion, PNG optimize=True) as a baseline.
+
+The demo fixtures are LZW grayscale. Production check images are
+usually CCITT Group 4 bitonal, so each fixture is also benchmarked after
+re-encoding it that way.
+
+Usage:
+    python scripts/benchmark_decoder.py
+    python scripts/benchmark_decoder.py --iterations 20 --repo ./demo_repo
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from PIL import Image, ImageSequence, features
+except ImportError:
+    print("Pillow is required. Install with: pip install Pillow")
+    sys.exit(1)
+
+from app.adapters.demo.decoder import TiffImageDecoder
+from app.adapters.interfaces import OutputProfile
+
+DEFAULT_REPO = Path(__file__).parent.parent / "demo_repo"
+
+
+def legacy_decode(data: bytes, page: int) -> bytes:
+    """The pre-optimization path: two parses, RGB expansion, optimize=True."""
+    with Image.open(io.BytesIO(data)) as img:
+        page_count = getattr(img, "n_frames", 1)
+    if page > page_count:
+        raise ValueError(page)
+
+    img = Image.open(io.BytesIO(data))
+    if page_count > 1:
+        img.seek(page - 1)
+    img = img.convert("RGB")
+    output = io.BytesIO()
+    img.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def to_group4(data: bytes) -> bytes:
+    """Re-encode every page of a TIFF as CCITT Group 4 bitonal."""
+    with Image.open(io.BytesIO(data)) as img:
+        pages = [frame.convert("1") for frame in ImageSequence.Iterator(img)]
+    output = io.BytesIO()
+    pages[0].save(output, format="TIFF", compression="group4", save_all=True,
+                  append_images=pages[1:])
+    return output.getvalue()
+
+
+def load_fixtures(repo: Path) -> dict:
+    """Load fixtures as {variant: [(name, bytes, page_count)]}."""
+    fixtures = {"lzw-gray": [], "ccitt-g4": []}
+    for path in sorted(repo.rglob("*.IMG")):
+        data = path.read_bytes()
+        with Image.open(io.BytesIO(data)) as img:
+            pages = getattr(img, "n_frames", 1)
+        fixtures["lzw-gray"].append((path.name, data, pages))
+        fixtures["ccitt-g4"].append((path.name, to_group4(data), pages))
+    return fixtures
+
+
+async def run(repo: Path, iterations: int) -> None:
+    decoder = TiffImageDecoder()
+    fixtures = load_fixtures(repo)
+    if not fixtures["lzw-gray"]:
+        print(f"No .IMG fixtures found under {repo}")
+        sys.exit(1)
+
+    formats = ["PNG", "WEBP"] if features.check("webp") else ["PNG"]
+    cases = [("legacy PNG optimize", None, None)]
+    cases += [(f"{fmt} {profile.value}", fmt, profile)
+              for fmt in formats for profile in OutputProfile]
+
+    print(f"{len(fixtures['lzw-gray'])} fixtures, {iterations} iterations, every page decoded\n")
+    print(f"{'source':<10} {'path':<22} {'ms/image':>9} {'bytes out':>10} {'vs legacy':>10}")
+
+    for variant, items in fixtures.items():
+        baseline_ms = None
+        for label, fmt, profile in cases:
+            timings = []
+            sizes = []
+            for _ in range(iterations):
+                for _, data, pages in items:
+                    for page in range(1, pages + 1):
+                        started = time.perf_counter()
+                        if fmt is None:
+                            out = legacy_decode(data, page)
+                        else:
+                            out = decoder._decode_sync(data, page, fmt, "TIFF", profile).data
+                        timings.append((time.perf_counter() - started) * 1000)
+                        sizes.append(len(out))
+
+            ms = statistics.median(timings)
+            baseline_ms = baseline_ms or ms
+            print(f"{variant:<10} {label:<22} {ms:>9.2f} {int(statistics.mean(sizes)):>10} "
+                  f"{baseline_ms / ms:>9.1f}x")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark TIFF decoding over the demo_repo fixtures"
+    )
+    parser.add_argument("--repo", type=Path, default=DEFAULT_REPO,
+                        help="Directory containing .IMG fixtures")
+    parser.add_argument("--iterations", type=int, default=10,
+                        help="Passes over the fixtures per case")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.repo, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+JWT signing and verification benchmark per algorithm.
+
+Reports microseconds per token for RS256 (2048-bit), ES256 and EdDSA:
+signing as the SaaS does it, verifying with the PEM passed to
+jwt.decode on every call (the previous connector path), verifying with
+a parsed key object, and a full JWTValidator.validate (key lookup by
+kid, claims and replay cache included).
+
+Verification is what the connector pays per image request; signing is
+what the SaaS pays per token minted.
+
+Usage:
+    python scripts/benchmark_jwt.py
+    python scripts/benchmark_jwt.py --iterations 5000
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+except ImportError:
+    print("Required packages not installed. Run:")
+    print("  pip install PyJWT cryptography")
+    sys.exit(1)
+
+from app.core.config import get_settings
+from app.core.security import JWTValidator
+
+ISSUER = "check-review-saas"
+
+KEY_GENERATORS = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": lambda: ed25519.Ed25519PrivateKey.generate(),
+}
+
+
+def payload() -> dict:
+    """Claims shaped like a SaaS image token."""
+    now = int(time.time())
+    return {
+        "sub": "bench-user",
+        "org_id": "bench-org",
+        "roles": ["image_viewer"],
+        "iat": now,
+        "exp": now + 120,
+        "jti": str(uuid.uuid4()),
+        "iss": ISSUER,
+    }
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Median microseconds per call, over batches of calls."""
+    batch = max(1, iterations // 20)
+    timings = []
+    for _ in range(20):
+        started = time.perf_counter()
+        for _ in range(batch):
+            func()
+        timings.append((time.perf_counter() - started) * 1e6 / batch)
+    return statistics.median(timings)
+
+
+def run(iterations: int) -> None:
+    settings = get_settings()
+    settings.JWT_ALGORITHM = ",".join(KEY_GENERATORS)
+    settings.JWT_PUBLIC_KEYS_DIR = None
+
+    print(f"{iterations} tokens per case, microseconds per token\n")
+    print(f"{'algorithm':<10} {'sign PEM':>9} {'sign key':>9} "
+          f"{'verify PEM':>11} {'verify key':>11} {'validate':>9} {'token bytes':>12}")
+
+    for algorithm, generate in KEY_GENERATORS.items():
+        private_key = generate()
+        private_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ).decode()
+        public_key = private_key.public_key()
+        public_pem = public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+
+        token = jwt.encode(payload(), private_key, algorithm=algorithm)
+        options = {"verify_exp": True, "verify_iss": True}
+
+        # Parsing an RSA private key is very slow, so fewer iterations
+        sign_pem = per_call_us(
+            lambda: jwt.encode(payload(), private_pem, algorithm=algorithm),
+            max(20, iterations // 50)
+        )
+        sign_key = per_call_us(
+            lambda: jwt.encode(payload(), private_key, algorithm=algorithm), iterations
+        )
+        verify_pem = per_call_us(
+            lambda: jwt.decode(token, public_pem, algorithms=[algorithm],
+                               issuer=ISSUER, options=options),
+            iterations
+        )
+        verify_key = per_call_us(
+            lambda: jwt.decode(token, public_key, algorithms=[algorithm],
+                               issuer=ISSUER, options=options),
+            iterations
+        )
+
+        # Fresh JTIs, so the replay cache accepts every token
+        validator = JWTValidator(public_key=public_pem, issuer=ISSUER)
+        tokens = iter([
+            jwt.encode(payload(), private_key, algorithm=algorithm)
+            for _ in range(max(1, iterations // 20) * 20)
+        ])
+        validate = per_call_us(lambda: validator.validate(next(tokens)), iterations)
+
+        print(f"{algorithm:<10} {sign_pem:>9.0f} {sign_key:>9.0f} "
+              f"{verify_pem:>11.0f} {verify_key:>11.0f} {validate:>9.0f} {len(token):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark JWT signing and verification per algorithm"
+    )
+    parser.add_argument("--iterations", type=int, default=2000,
+                        help="Tokens per case")
+    args = parser.parse_args()
+
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
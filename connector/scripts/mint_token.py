@@ -2,7 +2,8 @@
 """
 Token minting script for testing the Bank-Side Connector.
 
-Generates RS256 JWT tokens for testing image endpoints.
+Generates JWT tokens (RS256, ES256 or EdDSA, by key type) for testing
+image endpoints.
 
 Usage:
     # Generate a test token
@@ -13,6 +14,10 @@ Usage:
 
     # Generate key pair (first time setup)
     python scripts/mint_token.py --generate-keys
+
+    # Ed25519 key pair, and a token naming its key ID
+    python scripts/mint_token.py --generate-keys --algorithm EdDSA
+    python scripts/mint_token.py --kid key-0123456789abcdef
 """
 import argparse
 import json
@@ -26,7 +31,7 @@ try:
     import jwt
     from cryptography.hazmat.backends import default_backend
     from cryptography.hazmat.primitives import serialization
-    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 except ImportError:
     print("Required packages not installed. Run:")
     print("  pip install PyJWT cryptography")
@@ -38,12 +43,13 @@ PRIVATE_KEY_FILE = "connector_private.pem"
 PUBLIC_KEY_FILE = "connector_public.pem"
 
 
-def generate_key_pair(keys_dir: Path) -> tuple:
+def generate_key_pair(keys_dir: Path, algorithm: str = "RS256") -> tuple:
     """
-    Generate a new RSA key pair.
+    Generate a new key pair.
 
     Args:
         keys_dir: Directory to store keys
+        algorithm: RS256 (RSA), ES256 (P-256) or EdDSA (Ed25519)
 
     Returns:
         Tuple of (private_key, public_key) as PEM strings
@@ -51,11 +57,16 @@ def generate_key_pair(keys_dir: Path) -> tuple:
     keys_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-        backend=default_backend()
-    )
+    if algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend=default_backend())
+    elif algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+            backend=default_backend()
+        )
 
     # Serialize private key
     private_pem = private_key.private_bytes(
@@ -88,6 +99,8 @@ def generate_key_pair(keys_dir: Path) -> tuple:
     print("Add this to your .env file for the connector:")
     print("=" * 60)
     print(f'CONNECTOR_JWT_PUBLIC_KEY="{public_pem.strip()}"')
+    if algorithm != "RS256":
+        print(f"CONNECTOR_JWT_ALGORITHM={algorithm}")
     print("=" * 60)
 
     return private_pem, public_pem
@@ -119,18 +132,20 @@ def mint_token(
     org_id: str = "demo-org",
     roles: list = None,
     expiry_seconds: int = 120,
-    issuer: str = "check-review-saas"
+    issuer: str = "check-review-saas",
+    kid: str = None
 ) -> str:
     """
     Mint a JWT token.
 
     Args:
-        private_key: RSA private key in PEM format
+        private_key: RSA, P-256 or Ed25519 private key in PEM format
         subject: Token subject (user ID)
         org_id: Organization ID
         roles: List of roles
         expiry_seconds: Token expiry in seconds
         issuer: Token issuer
+        kid: Key ID for the token header
 
     Returns:
         JWT token string
@@ -150,7 +165,16 @@ def mint_token(
         "iss": issuer
     }
 
-    token = jwt.encode(payload, private_key, algorithm="RS256")
+    key = serialization.load_pem_private_key(private_key.encode(), password=None)
+    if isinstance(key, ec.EllipticCurvePrivateKey):
+        algorithm = "ES256"
+    elif isinstance(key, ed25519.Ed25519PrivateKey):
+        algorithm = "EdDSA"
+    else:
+        algorithm = "RS256"
+
+    headers = {"kid": kid} if kid else None
+    token = jwt.encode(payload, key, algorithm=algorithm, headers=headers)
     return token
 
 
@@ -171,7 +195,7 @@ def decode_token(token: str, public_key: str = None, verify: bool = True) -> dic
         In production code, ALWAYS verify JWT signatures.
     """
     if public_key:
-        return jwt.decode(token, public_key, algorithms=["RS256"])
+        return jwt.decode(token, public_key, algorithms=["RS256", "ES256", "EdDSA"])
     elif not verify:
         # WARNING: Only use verify=False for debugging self-minted tokens
         # Never disable verification for tokens from external sources
@@ -187,7 +211,17 @@ def main():
     parser.add_argument(
         "--generate-keys",
         action="store_true",
-        help="Generate a new RSA key pair"
+        help="Generate a new key pair"
+    )
+    parser.add_argument(
+        "--algorithm",
+        choices=["RS256", "ES256", "EdDSA"],
+        default="RS256",
+        help="Key type for --generate-keys (default: RS256)"
+    )
+    parser.add_argument(
+        "--kid",
+        help="Key ID to put in the token header"
     )
     parser.add_argument(
         "--keys-dir",
@@ -235,7 +269,7 @@ def main():
     args = parser.parse_args()
 
     if args.generate_keys:
-        generate_key_pair(args.keys_dir)
+        generate_key_pair(args.keys_dir, args.algorithm)
         return
 
     if args.decode:
@@ -255,7 +289,8 @@ def main():
         org_id=args.org,
         roles=roles,
         expiry_seconds=args.expiry,
-        issuer=args.issuer
+        issuer=args.issuer,
+        kid=args.kid
     )
 
     print("=" * 60)
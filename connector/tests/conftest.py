@@ -220,6 +220,7 @@ def mock_settings(temp_demo_repo, public_key, monkeypatch):
     monkeypatch.setenv("CONNECTOR_ITEM_INDEX_PATH", str(temp_demo_repo / "item_index.json"))
     monkeypatch.setenv("CONNECTOR_JWT_PUBLIC_KEY", public_key)
     monkeypatch.setenv("CONNECTOR_LOG_DIR", str(temp_demo_repo / "logs"))
+    monkeypatch.setenv("CONNECTOR_CACHE_DISK_DIR", str(temp_demo_repo / "image_cache"))
 
     # Reset singletons
     from app.adapters import factory
@@ -270,6 +271,23 @@ def multi_page_tiff():
     return output.read()
 
 
+@pytest.fixture
+def bitonal_tiff():
+    """Create a two-page CCITT Group 4 bitonal TIFF in memory."""
+    front = Image.new("1", (800, 400), color=1)
+    back = Image.new("1", (800, 400), color=0)
+    output = io.BytesIO()
+    front.save(
+        output,
+        format="TIFF",
+        save_all=True,
+        append_images=[back],
+        compression="group4"
+    )
+    output.seek(0)
+    return output.read()
+
+
 @pytest.fixture
 def png_image():
     """Create a PNG image in memory."""
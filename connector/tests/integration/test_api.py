@@ -367,3 +367,193 @@ class TestSecurityHeaders:
         assert "no-store" in response.headers.get("cache-control", "")
         assert response.headers.get("x-content-type-options") == "nosniff"
         assert response.headers.get("x-frame-options") == "SAMEORIGIN"
+
+
+def parse_batch_frames(content: bytes) -> list:
+    """Split a /v1/images/batch response into (header, body) pairs."""
+    import json
+    import struct
+
+    frames = []
+    offset = 0
+    while offset < len(content):
+        header_length, body_length = struct.unpack_from(">II", content, offset)
+        offset += 8
+        header = json.loads(content[offset:offset + header_length])
+        offset += header_length
+        frames.append((header, content[offset:offset + body_length]))
+        offset += body_length
+    return frames
+
+
+class RecordingAuditLogger:
+    """Audit logger stub recording each write."""
+
+    def __init__(self):
+        self.writes = []
+
+    async def log_many(self, events):
+        self.writes.append(list(events))
+
+    async def log_denied(self, **kwargs):
+        self.writes.append([kwargs])
+
+
+class TestImageBatchEndpoint:
+    """Tests for the /v1/images/batch endpoint."""
+
+    @pytest.fixture
+    def batch_app(self, monkeypatch, multi_page_tiff):
+        """App with JWT validation bypassed and an in-memory image service."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.adapters.demo.decoder import TiffImageDecoder
+        from app.api.deps import validate_jwt
+        from app.api.v1.endpoints import images as images_module
+        from app.core.security import JWTClaims
+        from app.main import app
+        from app.services import image_service as image_service_module
+        from app.services.cache import ImageCache
+        from app.services.image_service import ImageService
+
+        from tests.unit.test_image_service import CountingStorage
+
+        storage = CountingStorage(multi_page_tiff)
+        resolver = MagicMock()
+        resolver.resolve = AsyncMock(return_value=None)
+        monkeypatch.setattr(
+            image_service_module, "get_adapters",
+            lambda: (resolver, storage, TiffImageDecoder())
+        )
+        monkeypatch.setattr(
+            image_service_module, "get_image_cache",
+            lambda: ImageCache(ttl_seconds=60, max_items=10, disk_dir="")
+        )
+        service = ImageService()
+        audit = RecordingAuditLogger()
+        monkeypatch.setattr(images_module, "get_image_service", lambda: service)
+        monkeypatch.setattr(images_module, "get_audit_logger", lambda: audit)
+
+        app.dependency_overrides[validate_jwt] = lambda: JWTClaims(
+            sub="test-user", org_id="test-org", roles=["image_viewer"],
+            exp=0, iat=0, jti="jti", iss="check-review-saas"
+        )
+        yield app, storage, audit
+        app.dependency_overrides.pop(validate_jwt, None)
+
+    @pytest.mark.asyncio
+    async def test_requires_authentication(self, mock_settings):
+        """Test that the batch endpoint requires authentication."""
+        from app.main import app
+        from httpx import ASGITransport, AsyncClient
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/v1/images/batch",
+                json={"items": [{"trace_number": "12374628", "check_date": "2024-01-15"}]}
+            )
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_streams_a_frame_per_item(self, batch_app):
+        """Test that every item gets a frame and one audit write covers them all."""
+        from httpx import ASGITransport, AsyncClient
+
+        app, storage, audit = batch_app
+        path = "\\\\tn-director-pro\\Checks\\Transit\\V406\\580\\12374628.IMG"
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/v1/images/batch",
+                json={"items": [
+                    {"path": path, "side": "front"},
+                    {"path": path, "side": "back", "size": "thumb"},
+                    {"path": "\\\\evil-server\\share\\x.IMG"},
+                    {"trace_number": "99999999", "check_date": "2024-01-15"},
+                ]}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-image-batch"
+        assert response.headers["cache-control"].startswith("private, no-store")
+
+        frames = {header["index"]: (header, body) for header, body in
+                  parse_batch_frames(response.content)}
+        assert sorted(frames) == [0, 1, 2, 3]
+
+        header, body = frames[0]
+        assert header["status"] == 200
+        assert Image.open(io.BytesIO(body)).size == (header["width"], header["height"])
+
+        header, body = frames[1]
+        assert header["rendition"] == "240x120:contain"
+        assert Image.open(io.BytesIO(body)).size == (240, 120)
+
+        assert frames[2][0]["error_code"] == "PATH_NOT_ALLOWED"
+        assert frames[2][0]["status"] == 403
+        assert frames[2][1] == b""
+        assert frames[3][0]["error_code"] == "NOT_FOUND"
+        assert frames[3][0]["status"] == 404
+        # Clients get the fixed message, not the trace number or path
+        assert frames[3][0]["message"] == "Image not found"
+
+        # The blocked path never reached storage
+        assert storage.reads == 2
+
+        assert len(audit.writes) == 1
+        actions = sorted(event.action for event in audit.writes[0])
+        assert actions == [
+            "IMAGE_DENIED", "IMAGE_REQUEST", "IMAGE_SERVED", "IMAGE_SERVED", "PATH_BLOCKED"
+        ]
+        assert all(event.path_hash != path for event in audit.writes[0])
+        denied = next(e for e in audit.writes[0] if e.action == "IMAGE_DENIED")
+        assert denied.error_message == "Image not found"
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(self, batch_app, monkeypatch):
+        """Test that batches over IMAGE_BATCH_MAX_ITEMS are refused up front."""
+        from app.core.config import get_settings
+        from httpx import ASGITransport, AsyncClient
+
+        app, storage, _ = batch_app
+        monkeypatch.setattr(get_settings(), "IMAGE_BATCH_MAX_ITEMS", 2)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/v1/images/batch",
+                json={"items": [
+                    {"trace_number": str(n), "check_date": "2024-01-15"} for n in range(3)
+                ]}
+            )
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["error_code"] == "BATCH_TOO_LARGE"
+        assert storage.reads == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_item_without_locator(self, batch_app):
+        """Test that an item needs a path or a trace number and date."""
+        from httpx import ASGITransport, AsyncClient
+
+        app, _, _ = batch_app
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/v1/images/batch",
+                json={"items": [{"trace_number": "12374628"}]}
+            )
+
+        assert response.status_code == 422
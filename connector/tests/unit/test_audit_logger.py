@@ -0,0 +1,150 @@
+"""
+Unit tests for the buffered audit logger.
+"""
+import asyncio
+import json
+import threading
+from datetime import timedelta
+
+import pytest
+from app.audit.logger import AuditAction, AuditEvent, AuditLogger
+
+
+def make_event(n: int = 0) -> AuditEvent:
+    return AuditEvent.create(
+        action=AuditAction.IMAGE_SERVED,
+        endpoint="/v1/images/by-handle",
+        allow=True,
+        correlation_id=f"corr-{n}"
+    )
+
+
+def read_lines(path) -> list:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    def _make(**kwargs):
+        options = {
+            "log_dir": str(tmp_path),
+            "log_file": "audit.jsonl",
+            "flush_interval_ms": 10,
+            "rotate_max_bytes": 0,
+            "rotate_daily": False,
+        }
+        options.update(kwargs)
+        return AuditLogger(**options)
+
+    return _make
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_written_in_one_group(self, make_logger, tmp_path):
+        """Test that queued events are group-committed."""
+        audit = make_logger()
+
+        await audit.log_many([make_event(n) for n in range(20)])
+        await audit.flush()
+
+        lines = read_lines(tmp_path / "audit.jsonl")
+        assert [line["correlation_id"] for line in lines] == [f"corr-{n}" for n in range(20)]
+        assert audit.stats()["written"] == 20
+        assert audit.stats()["flushes"] == 1
+        await audit.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_writes_without_explicit_flush(self, make_logger, tmp_path):
+        """Test that a lone event reaches the file after the flush interval."""
+        audit = make_logger(flush_interval_ms=5)
+
+        await audit.log(make_event())
+        await asyncio.sleep(0.2)
+
+        assert len(read_lines(tmp_path / "audit.jsonl")) == 1
+        await audit.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_bytes_splits_groups(self, make_logger):
+        """Test that the byte threshold bounds a group."""
+        audit = make_logger(flush_bytes=1, flush_interval_ms=1000)
+
+        await audit.log_many([make_event(n) for n in range(3)])
+        await audit.flush()
+
+        assert audit.stats()["flushes"] == 3
+        await audit.close()
+
+    @pytest.mark.asyncio
+    async def test_rotates_by_size(self, make_logger, tmp_path):
+        """Test that the file is rotated before it exceeds the size limit."""
+        audit = make_logger(rotate_max_bytes=400, flush_bytes=1)
+
+        for n in range(6):
+            await audit.log(make_event(n))
+        await audit.flush()
+
+        rotated = sorted(tmp_path.glob("audit.jsonl.*"))
+        assert rotated
+        assert audit.stats()["rotations"] == len(rotated)
+        total = sum(len(read_lines(path)) for path in [*rotated, tmp_path / "audit.jsonl"])
+        assert total == 6
+        assert all(path.stat().st_size <= 400 for path in rotated)
+        await audit.close()
+
+    @pytest.mark.asyncio
+    async def test_rotates_daily(self, make_logger, tmp_path):
+        """Test that the first write on a new UTC day starts a new file."""
+        audit = make_logger(rotate_daily=True)
+
+        await audit.log(make_event(1))
+        await audit.flush()
+        yesterday = audit._file_day - timedelta(days=1)
+        audit._file_day = yesterday
+        await audit.log(make_event(2))
+        await audit.flush()
+
+        rotated = tmp_path / f"audit.jsonl.{yesterday:%Y%m%d}.1"
+        assert [line["correlation_id"] for line in read_lines(rotated)] == ["corr-1"]
+        assert [line["correlation_id"] for line in
+                read_lines(tmp_path / "audit.jsonl")] == ["corr-2"]
+        await audit.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, make_logger, tmp_path):
+        """Test that a stalled writer causes counted drops instead of blocking."""
+        audit = make_logger(queue_size=1, enqueue_timeout_ms=10)
+        release = threading.Event()
+        write_group = audit._write_group
+
+        def stalled_write(data, lines):
+            release.wait(5)
+            write_group(data, lines)
+
+        audit._write_group = stalled_write
+
+        await audit.log(make_event(1))
+        await asyncio.sleep(0.05)  # writer takes event 1 and stalls
+        await audit.log(make_event(2))  # fills the queue
+        await audit.log(make_event(3))  # dropped after the timeout
+
+        assert audit.stats()["dropped"] == 1
+        release.set()
+        await audit.close()
+
+        ids = [line["correlation_id"] for line in read_lines(tmp_path / "audit.jsonl")]
+        assert ids == ["corr-1", "corr-2"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_and_closes_file(self, make_logger, tmp_path):
+        """Test that close() writes queued events before returning."""
+        audit = make_logger(flush_interval_ms=1000)
+
+        await audit.log(make_event())
+        await audit.close()
+
+        assert len(read_lines(tmp_path / "audit.jsonl")) == 1
+        assert audit._file is None
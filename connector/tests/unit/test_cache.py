@@ -0,0 +1,157 @@
+"""
+Unit tests for the two-tier image cache.
+"""
+import os
+import stat
+import time
+
+import pytest
+from app.adapters import SourceVersion
+from app.services.cache import ImageCache
+
+V1 = SourceVersion(size=100, mtime_ns=1)
+V2 = SourceVersion(size=100, mtime_ns=2)
+
+
+@pytest.fixture
+def disk_dir(tmp_path):
+    return str(tmp_path / "image_cache")
+
+
+class TestMemoryTier:
+    """Tests for the in-memory tier."""
+
+    @pytest.mark.asyncio
+    async def test_hit_requires_matching_version(self):
+        """Test that entries from another source version are dropped."""
+        cache = ImageCache(ttl_seconds=60, max_items=10, disk_dir="")
+        await cache.put("p", 1, b"png", 10, 20, version=V1)
+
+        assert await cache.get("p", 1, V1) == (b"png", 10, 20)
+        assert await cache.get("p", 1, V2) is None
+        # The stale entry is gone, not just skipped
+        assert await cache.get("p", 1, V1) is None
+
+        stats = await cache.stats()
+        assert stats["tiers"]["memory"]["invalidations"] == 1
+        assert "disk" not in stats["tiers"]
+
+    @pytest.mark.asyncio
+    async def test_variants_are_separate_entries(self):
+        """Test that renditions of one page don't collide."""
+        cache = ImageCache(ttl_seconds=60, max_items=10, disk_dir="")
+        await cache.put("p", 1, b"png", 10, 20, version=V1, variant="PNG:fast")
+        await cache.put("p", 1, b"webp", 10, 20, version=V1, variant="WEBP:fast")
+
+        assert (await cache.get("p", 1, V1, "PNG:fast"))[0] == b"png"
+        assert (await cache.get("p", 1, V1, "WEBP:fast"))[0] == b"webp"
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_items_and_bytes(self):
+        """Test that the least recently used entries are evicted first."""
+        cache = ImageCache(ttl_seconds=60, max_items=2, max_bytes=10, disk_dir="")
+        await cache.put("a", 1, b"1234", 1, 1)
+        await cache.put("b", 1, b"1234", 1, 1)
+        await cache.get("a", 1)
+        await cache.put("c", 1, b"1234", 1, 1)
+
+        assert await cache.get("b", 1) is None
+        assert await cache.get("a", 1) is not None
+
+        await cache.put("d", 1, b"12345678", 1, 1)
+        stats = await cache.stats()
+        assert stats["items"] == 1
+        assert stats["bytes"] == 8
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self, monkeypatch):
+        """Test TTL expiry on lookup."""
+        cache = ImageCache(ttl_seconds=60, max_items=10, disk_dir="")
+        await cache.put("p", 1, b"png", 1, 1)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        assert await cache.get("p", 1) is None
+
+
+class TestDiskTier:
+    """Tests for the disk tier."""
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, disk_dir):
+        """Test that a new cache instance reads entries written by an old one."""
+        first = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        await first.put("p", 2, b"back-png", 30, 40, version=V1)
+
+        second = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        assert await second.get("p", 2, V1) == (b"back-png", 30, 40)
+
+        stats = await second.stats()
+        assert stats["tiers"]["disk"]["hits"] == 1
+        assert stats["tiers"]["memory"]["misses"] == 1
+
+        # Promoted to memory
+        await second.get("p", 2, V1)
+        assert (await second.stats())["tiers"]["memory"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_disk_entry_is_removed(self, disk_dir):
+        """Test that a disk entry for an older source version is not served."""
+        first = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        await first.put("p", 1, b"old", 1, 1, version=V1)
+
+        second = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        assert await second.get("p", 1, V2) is None
+
+        disk = (await second.stats())["tiers"]["disk"]
+        assert disk["invalidations"] == 1
+        assert disk["items"] == 0
+        assert disk["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bounded_by_size(self, disk_dir):
+        """Test LRU eviction when the disk tier exceeds its size limit."""
+        cache = ImageCache(
+            ttl_seconds=60, max_items=10, disk_dir=disk_dir, disk_max_bytes=100
+        )
+        await cache.put("a", 1, b"x" * 40, 1, 1)
+        await cache.put("b", 1, b"x" * 40, 1, 1)
+
+        disk = (await cache.stats())["tiers"]["disk"]
+        assert disk["items"] == 1
+        assert disk["bytes"] <= 100
+
+        fresh = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir, disk_max_bytes=100)
+        assert await fresh.get("a", 1) is None
+        assert await fresh.get("b", 1) is not None
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_files(self, disk_dir, tmp_path):
+        """Test that clear() empties both tiers."""
+        cache = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        await cache.put("p", 1, b"png", 1, 1)
+        await cache.clear()
+
+        assert await cache.get("p", 1) is None
+        assert not [f for f in (tmp_path / "image_cache").rglob("*") if f.is_file()]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    async def test_files_are_private(self, disk_dir, tmp_path):
+        """Test that cached images are readable by the owner only."""
+        cache = ImageCache(ttl_seconds=60, max_items=10, disk_dir=disk_dir)
+        await cache.put("p", 1, b"png", 1, 1)
+
+        files = [f for f in (tmp_path / "image_cache").rglob("*") if f.is_file()]
+        assert files
+        assert stat.S_IMODE((tmp_path / "image_cache").stat().st_mode) == 0o700
+        for file in files:
+            assert stat.S_IMODE(file.stat().st_mode) == 0o600
+            assert stat.S_IMODE(file.parent.stat().st_mode) == 0o700
+
+    def test_disk_tier_off_by_default(self, monkeypatch):
+        """Test that the disk tier needs an explicit directory."""
+        from app.core.config import Settings
+
+        monkeypatch.delenv("CONNECTOR_CACHE_DISK_DIR", raising=False)
+        assert Settings(_env_file=None).CACHE_DISK_DIR == ""
@@ -5,8 +5,14 @@ import io
 
 import pytest
 from app.adapters.demo.decoder import TiffImageDecoder
-from app.adapters.interfaces import DecodeError, UnsupportedFormatError
-from PIL import Image
+from app.adapters.interfaces import (
+    DecodeError,
+    OutputProfile,
+    Rendition,
+    ResizeFit,
+    UnsupportedFormatError,
+)
+from PIL import Image, features
 
 
 class TestTiffImageDecoder:
@@ -150,3 +156,130 @@ class TestTiffImageDecoder:
 
         assert result.file_size == len(result.data)
         assert result.file_size > 0
+
+    @pytest.mark.asyncio
+    async def test_decode_reports_page_count(self, decoder, multi_page_tiff):
+        """Test that decode returns the page count from the same parse."""
+        result = await decoder.decode(multi_page_tiff, page=1)
+
+        assert result.page_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bitonal_stays_bitonal(self, decoder, bitonal_tiff):
+        """Test that CCITT bitonal pages are not expanded to RGB."""
+        result = await decoder.decode(bitonal_tiff, page=2)
+
+        img = Image.open(io.BytesIO(result.data))
+        assert img.mode == "1"
+        assert result.content_type == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_grayscale_stays_grayscale(self, decoder, single_page_tiff):
+        """Test that grayscale pages are encoded as grayscale."""
+        result = await decoder.decode(single_page_tiff, page=1)
+
+        assert Image.open(io.BytesIO(result.data)).mode == "L"
+
+    @pytest.mark.asyncio
+    async def test_compact_profile_is_not_larger(self, decoder, multi_page_tiff):
+        """Test that the compact profile trades CPU for size."""
+        fast = await decoder.decode(multi_page_tiff, page=1, profile=OutputProfile.FAST)
+        compact = await decoder.decode(multi_page_tiff, page=1, profile=OutputProfile.COMPACT)
+
+        assert compact.file_size <= fast.file_size
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not features.check("webp"), reason="Pillow built without WebP")
+    async def test_decode_webp_target_format(self, decoder, bitonal_tiff):
+        """Test decoding to lossless WebP."""
+        result = await decoder.decode(bitonal_tiff, page=1, target_format="WEBP")
+
+        assert result.output_format == "WEBP"
+        assert result.content_type == "image/webp"
+        assert Image.open(io.BytesIO(result.data)).format == "WEBP"
+
+    @pytest.mark.asyncio
+    async def test_decode_unsupported_target_format(self, decoder, single_page_tiff):
+        """Test that unknown output formats are rejected."""
+        with pytest.raises(UnsupportedFormatError):
+            await decoder.decode(single_page_tiff, page=1, target_format="BMP")
+
+    @pytest.mark.asyncio
+    async def test_decode_thumbnail_rendition(self, decoder, multi_page_tiff):
+        """Test that a reduced rendition is scaled to fit its box."""
+        full = await decoder.decode(multi_page_tiff, page=1)
+        thumb = await decoder.decode(
+            multi_page_tiff, page=1, rendition=Rendition(width=200, height=200)
+        )
+
+        assert (thumb.width, thumb.height) == (200, 100)
+        assert Image.open(io.BytesIO(thumb.data)).size == (200, 100)
+        assert thumb.file_size < full.file_size
+
+    @pytest.mark.asyncio
+    async def test_decode_cover_rendition(self, decoder, single_page_tiff):
+        """Test that cover fills the box exactly."""
+        result = await decoder.decode(
+            single_page_tiff, page=1,
+            rendition=Rendition(width=100, height=100, fit=ResizeFit.COVER)
+        )
+
+        assert Image.open(io.BytesIO(result.data)).size == (100, 100)
+
+    @pytest.mark.asyncio
+    async def test_rendition_never_upscales(self, decoder, single_page_tiff):
+        """Test that a box larger than the page leaves it at full size."""
+        result = await decoder.decode(
+            single_page_tiff, page=1, rendition=Rendition(width=2000)
+        )
+
+        assert (result.width, result.height) == (800, 400)
+
+    @pytest.mark.asyncio
+    async def test_bitonal_thumbnail_is_grayscale(self, decoder, bitonal_tiff):
+        """Test that bitonal pages are downscaled as anti-aliased grayscale."""
+        result = await decoder.decode(
+            bitonal_tiff, page=1, rendition=Rendition(width=100)
+        )
+
+        assert Image.open(io.BytesIO(result.data)).mode == "L"
+
+    @pytest.mark.asyncio
+    async def test_jpeg_rendition_uses_draft(self, decoder):
+        """Test that JPEG sources are scaled down at decode time."""
+        source = io.BytesIO()
+        Image.new("RGB", (1600, 800), color="white").save(source, format="JPEG")
+
+        result = await decoder.decode(
+            source.getvalue(), page=1, rendition=Rendition(width=200, height=100)
+        )
+
+        assert (result.width, result.height) == (200, 100)
+
+
+class TestRendition:
+    """Tests for rendition size computation."""
+
+    def test_full_rendition(self):
+        assert Rendition().is_full
+        assert Rendition().key == "full"
+        assert Rendition().box(800, 400) == ((800, 400), (0, 0, 800, 400))
+
+    def test_contain_keeps_aspect_ratio(self):
+        assert Rendition(width=200, height=200).box(800, 400)[0] == (200, 100)
+        assert Rendition(height=100).box(800, 400)[0] == (200, 100)
+
+    def test_cover_crops_centre(self):
+        size, crop = Rendition(width=100, height=100, fit=ResizeFit.COVER).box(800, 400)
+
+        assert size == (100, 100)
+        assert crop == (200, 0, 600, 400)
+
+    def test_keys_differ_by_size_and_fit(self):
+        keys = {
+            Rendition(width=200).key,
+            Rendition(height=200).key,
+            Rendition(width=200, height=200).key,
+            Rendition(width=200, height=200, fit=ResizeFit.COVER).key,
+        }
+        assert len(keys) == 4
@@ -0,0 +1,250 @@
+"""
+Unit tests for the image service.
+"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.adapters import ImageSide, Rendition, SourceVersion
+from app.adapters.demo.decoder import TiffImageDecoder
+from app.services import image_service as image_service_module
+from app.services.cache import ImageCache
+from app.services.image_service import (
+    NAMED_RENDITIONS,
+    ImageNotFoundError,
+    ImageRequest,
+    ImageResult,
+    ImageService,
+    ImageServiceError,
+    NoBackImageError,
+    UnsupportedImageFormatError,
+)
+
+
+class CountingStorage:
+    """Storage provider stub serving fixed bytes and counting reads."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.reads = 0
+        self.version = SourceVersion(size=len(data), mtime_ns=1)
+
+    async def stat(self, handle):
+        return self.version
+
+    async def read(self, handle):
+        self.reads += 1
+        # Yield so concurrent requests overlap with the read
+        await asyncio.sleep(0.01)
+        return self.data
+
+
+class CountingDecoder(TiffImageDecoder):
+    """TIFF decoder counting full-file parses."""
+
+    def __init__(self):
+        super().__init__()
+        self.parses = 0
+
+    def _decode_pages_sync(self, *args, **kwargs):
+        self.parses += 1
+        return super()._decode_pages_sync(*args, **kwargs)
+
+
+def make_service(monkeypatch, data: bytes):
+    storage = CountingStorage(data)
+    decoder = CountingDecoder()
+    monkeypatch.setattr(
+        image_service_module, "get_adapters", lambda: (MagicMock(), storage, decoder)
+    )
+    monkeypatch.setattr(
+        image_service_module, "get_image_cache", lambda: ImageCache(ttl_seconds=60, max_items=10, disk_dir="")
+    )
+    return ImageService(), storage, decoder
+
+
+class TestImageService:
+    """Tests for ImageService."""
+
+    @pytest.mark.asyncio
+    async def test_front_and_back_share_one_read_and_parse(self, monkeypatch, multi_page_tiff):
+        """Test that requesting both sides reads and parses the file once."""
+        service, storage, decoder = make_service(monkeypatch, multi_page_tiff)
+
+        front = await service.get_by_handle("\\\\share\\a.IMG", ImageSide.FRONT)
+        back = await service.get_by_handle("\\\\share\\a.IMG", ImageSide.BACK)
+
+        assert front.from_cache is False
+        assert back.from_cache is True
+        assert storage.reads == 1
+        assert decoder.parses == 1
+
+    @pytest.mark.asyncio
+    async def test_back_of_single_page_image(self, monkeypatch, single_page_tiff):
+        """Test that a missing back page raises NoBackImageError."""
+        service, storage, _ = make_service(monkeypatch, single_page_tiff)
+
+        with pytest.raises(NoBackImageError):
+            await service.get_by_handle("\\\\share\\b.IMG", ImageSide.BACK)
+
+        # The front was cached from the same read
+        front = await service.get_by_handle("\\\\share\\b.IMG", ImageSide.FRONT)
+        assert front.from_cache is True
+        assert storage.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_decode(self, monkeypatch, multi_page_tiff):
+        """Test that a burst of requests for one file costs one read and decode."""
+        service, storage, decoder = make_service(monkeypatch, multi_page_tiff)
+        sides = [ImageSide.FRONT, ImageSide.BACK] * 5
+
+        results = await asyncio.gather(
+            *(service.get_by_handle("\\\\share\\c.IMG", side) for side in sides)
+        )
+
+        assert storage.reads == 1
+        assert decoder.parses == 1
+        assert [r.from_cache for r in results] == [False] * len(sides)
+        assert service.decode_stats() == {"decodes": 1, "coalesced_waits": 9, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_share_errors(self, monkeypatch):
+        """Test that a failed load is reported to every waiter and not retained."""
+        service, storage, _ = make_service(monkeypatch, b"not an image")
+
+        results = await asyncio.gather(
+            *(service.get_by_handle("\\\\share\\d.IMG", ImageSide.FRONT) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, UnsupportedImageFormatError) for r in results)
+        assert storage.reads == 1
+        assert service.decode_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_does_not_cancel_shared_load(
+        self, monkeypatch, multi_page_tiff
+    ):
+        """Test that the first requester disconnecting doesn't fail the others."""
+        service, storage, _ = make_service(monkeypatch, multi_page_tiff)
+
+        first = asyncio.create_task(service.get_by_handle("\\\\share\\e.IMG", ImageSide.FRONT))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.get_by_handle("\\\\share\\e.IMG", ImageSide.BACK))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+        assert result.width == 800
+        assert storage.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_source_is_not_served_stale(self, monkeypatch, multi_page_tiff):
+        """Test that a rescanned file is decoded again instead of served from cache."""
+        service, storage, decoder = make_service(monkeypatch, multi_page_tiff)
+
+        await service.get_by_handle("\\\\share\\f.IMG", ImageSide.FRONT)
+        storage.version = SourceVersion(size=len(multi_page_tiff), mtime_ns=2)
+        result = await service.get_by_handle("\\\\share\\f.IMG", ImageSide.FRONT)
+
+        assert result.from_cache is False
+        assert storage.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_renditions_are_cached_separately(self, monkeypatch, multi_page_tiff):
+        """Test that a thumbnail neither serves nor evicts the full-size page."""
+        service, storage, _ = make_service(monkeypatch, multi_page_tiff)
+        thumb = NAMED_RENDITIONS["thumb"]
+
+        small = await service.get_by_handle("\\\\share\\g.IMG", ImageSide.FRONT, thumb)
+        full = await service.get_by_handle("\\\\share\\g.IMG", ImageSide.FRONT)
+        small_again = await service.get_by_handle("\\\\share\\g.IMG", ImageSide.FRONT, thumb)
+
+        assert (small.width, small.height) == (240, 120)
+        assert (full.width, full.height) == (800, 400)
+        assert full.from_cache is False
+        assert small_again.from_cache is True
+        assert small_again.data == small.data
+        assert storage.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_decodes_only_requested_side(self, monkeypatch, multi_page_tiff):
+        """Test that a queue thumbnail does not pay for the back page."""
+        service, _, _ = make_service(monkeypatch, multi_page_tiff)
+        rendition = Rendition(width=100)
+
+        await service.get_by_handle("\\\\share\\h.IMG", ImageSide.FRONT, rendition)
+        back = await service.get_by_handle("\\\\share\\h.IMG", ImageSide.BACK, rendition)
+
+        assert back.from_cache is False
+        assert back.width == 100
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_back_of_single_page_image(self, monkeypatch, single_page_tiff):
+        """Test that a missing back page raises NoBackImageError for renditions too."""
+        service, _, _ = make_service(monkeypatch, single_page_tiff)
+
+        with pytest.raises(NoBackImageError):
+            await service.get_by_handle(
+                "\\\\share\\i.IMG", ImageSide.BACK, NAMED_RENDITIONS["thumb"]
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_yields_every_item(self, monkeypatch, single_page_tiff):
+        """Test that a batch reports results and errors per item."""
+        service, storage, _ = make_service(monkeypatch, single_page_tiff)
+        service._resolver.resolve = AsyncMock(return_value=None)
+        requests = [
+            ImageRequest(path="\\\\share\\j.IMG"),
+            ImageRequest(path="\\\\share\\j.IMG", side=ImageSide.BACK),
+            ImageRequest(trace_number="1", check_date=date(2024, 1, 15)),
+        ]
+
+        outcomes = dict([item async for item in service.iter_batch(requests, concurrency=2)])
+
+        assert isinstance(outcomes[0], ImageResult)
+        assert isinstance(outcomes[1], NoBackImageError)
+        assert isinstance(outcomes[2], ImageNotFoundError)
+        assert storage.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_hides_unexpected_error_details(self, monkeypatch, single_page_tiff):
+        """Test that an unexpected failure is reported without its details."""
+        service, _, _ = make_service(monkeypatch, single_page_tiff)
+        service._cache.get = AsyncMock(side_effect=RuntimeError("\\\\share\\secret.IMG"))
+
+        outcomes = [item async for item in service.iter_batch(
+            [ImageRequest(path="\\\\share\\secret.IMG")], concurrency=1
+        )]
+
+        [(index, error)] = outcomes
+        assert index == 0
+        assert type(error) is ImageServiceError
+        assert error.error_code == "INTERNAL_ERROR"
+        assert str(error) == "Image retrieval failed"
+
+    @pytest.mark.asyncio
+    async def test_batch_bounds_concurrency(self, monkeypatch, single_page_tiff):
+        """Test that no more than `concurrency` items load at once."""
+        service, storage, _ = make_service(monkeypatch, single_page_tiff)
+        active = peak = 0
+        read = storage.read
+
+        async def tracking_read(handle):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                return await read(handle)
+            finally:
+                active -= 1
+
+        storage.read = tracking_read
+        requests = [ImageRequest(path=f"\\\\share\\{n}.IMG") for n in range(8)]
+
+        outcomes = [item async for item in service.iter_batch(requests, concurrency=3)]
+
+        assert len(outcomes) == 8
+        assert storage.reads == 8
+        assert peak == 3
@@ -0,0 +1,179 @@
+"""
+Unit tests for the SQLite item resolver.
+"""
+import json
+from datetime import date
+
+import pytest
+from app.adapters import ImageSide
+from app.adapters.demo import sqlite_resolver
+from app.adapters.demo.sqlite_resolver import SqliteItemResolver
+
+
+def index_item(trace_number: str, has_back_image: bool = True) -> dict:
+    """An item in the index file format."""
+    return {
+        "trace_number": trace_number,
+        "date": "2024-01-15",
+        "image_path": f"\\\\server\\share\\{trace_number}.IMG",
+        "amount_cents": 1000,
+        "check_number": "101",
+        "account_last4": "1234",
+        "is_onus": True,
+        "is_multi_page": has_back_image,
+        "has_back_image": has_back_image,
+    }
+
+
+def append_lines(path, *items):
+    """Append items to a JSON Lines feed."""
+    with open(path, "a") as f:
+        for item in items:
+            f.write(json.dumps(item) + "\n")
+
+
+class TestSqliteItemResolver:
+    """Tests for the on-disk item index."""
+
+    @pytest.mark.asyncio
+    async def test_imports_json_document(self, temp_demo_repo, tmp_path):
+        """Test that the JSON index document resolves like the in-memory resolver."""
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"),
+            index_path=str(temp_demo_repo / "item_index.json"),
+            reload_seconds=0
+        )
+
+        metadata = await resolver.resolve("12374628", date(2024, 1, 15))
+        assert metadata.amount_cents == 125000
+        assert metadata.image_handle.path.endswith("12374628.IMG")
+        assert metadata.image_handle.page_count == 2
+        assert not metadata.is_onus
+
+        assert await resolver.resolve("12374628", date(2024, 1, 16)) is None
+        assert await resolver.get_image_handle(
+            "12374630", date(2024, 1, 16), ImageSide.BACK
+        ) is None
+        assert len(await resolver.list_items()) == 3
+        assert (await resolver.health_check())[0]
+
+    @pytest.mark.asyncio
+    async def test_appended_lines_imported_incrementally(self, tmp_path, monkeypatch):
+        """Test that a reload reads only the lines appended since the last import."""
+        feed = tmp_path / "items.jsonl"
+        append_lines(feed, index_item("1001"), index_item("1002"))
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"), index_path=str(feed), reload_seconds=0
+        )
+        assert await resolver.resolve("1002", date(2024, 1, 15)) is not None
+
+        written = []
+        upsert = resolver._upsert
+        monkeypatch.setattr(
+            resolver, "_upsert", lambda items: written.extend(items) or upsert(items)
+        )
+
+        # A partially written line waits for its newline
+        append_lines(feed, index_item("1003"))
+        with open(feed, "a") as f:
+            f.write(json.dumps(index_item("1004"))[:20])
+        await resolver.reload()
+        assert [item["trace_number"] for item in written] == ["1003"]
+        assert await resolver.resolve("1004", date(2024, 1, 15)) is None
+
+        with open(feed, "a") as f:
+            f.write(json.dumps(index_item("1004"))[20:] + "\n")
+        await resolver.reload()
+        assert [item["trace_number"] for item in written] == ["1003", "1004"]
+        assert await resolver.resolve("1004", date(2024, 1, 15)) is not None
+
+        # Nothing new: nothing read
+        await resolver.reload()
+        assert len(written) == 2
+
+    @pytest.mark.asyncio
+    async def test_rewritten_feed_replaces_items(self, tmp_path):
+        """Test that a truncated feed is imported again from the start."""
+        feed = tmp_path / "items.jsonl"
+        append_lines(feed, index_item("1001"), index_item("1002"))
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"), index_path=str(feed), reload_seconds=0
+        )
+        await resolver.reload()
+
+        feed.write_text(json.dumps(index_item("2001")) + "\n")
+        await resolver.reload()
+
+        assert await resolver.resolve("1001", date(2024, 1, 15)) is None
+        assert await resolver.resolve("2001", date(2024, 1, 15)) is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_catch_up_keeps_serving(self, temp_demo_repo, tmp_path, monkeypatch):
+        """Test that a truncated index document neither breaks lookups nor is re-read each time."""
+        index = tmp_path / "item_index.json"
+        index.write_text((temp_demo_repo / "item_index.json").read_text())
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"), index_path=str(index), reload_seconds=60
+        )
+        assert await resolver.resolve("12374628", date(2024, 1, 15)) is not None
+
+        # Rewritten in place and caught half-way through
+        index.write_text(index.read_text()[:100])
+        imports = []
+        import_sync = resolver._import_sync
+        monkeypatch.setattr(
+            resolver, "_import_sync", lambda: imports.append(1) or import_sync()
+        )
+        resolver._next_import = 0
+
+        metadata = await resolver.resolve("12374628", date(2024, 1, 15))
+        assert metadata.amount_cents == 125000
+        assert await resolver.resolve("12374630", date(2024, 1, 16)) is not None
+        assert len(imports) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_import_failure_is_raised(self, tmp_path):
+        """Test that an unreadable index fails lookups until something was imported."""
+        index = tmp_path / "item_index.json"
+        index.write_text('{"items": [')
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"), index_path=str(index), reload_seconds=60
+        )
+
+        with pytest.raises(ValueError):
+            await resolver.resolve("12374628", date(2024, 1, 15))
+
+    @pytest.mark.asyncio
+    async def test_reopen_does_not_reimport(self, tmp_path, monkeypatch):
+        """Test that a new resolver serves the existing database without re-reading the feed."""
+        feed = tmp_path / "items.jsonl"
+        append_lines(feed, *(index_item(str(n)) for n in range(1000, 1100)))
+        db_path = str(tmp_path / "index.db")
+        await SqliteItemResolver(db_path=db_path, index_path=str(feed)).reload()
+
+        monkeypatch.setattr(
+            sqlite_resolver.SqliteItemResolver, "_upsert",
+            lambda self, items: pytest.fail("items re-imported")
+        )
+        resolver = SqliteItemResolver(db_path=db_path, index_path=str(feed))
+        metadata = await resolver.resolve("1050", date(2024, 1, 15))
+        assert metadata.trace_number == "1050"
+
+    @pytest.mark.asyncio
+    async def test_append(self, tmp_path):
+        """Test adding items directly, skipping malformed ones."""
+        resolver = SqliteItemResolver(
+            db_path=str(tmp_path / "index.db"),
+            index_path=str(tmp_path / "missing.jsonl"),
+            reload_seconds=0
+        )
+
+        written = await resolver.append([
+            index_item("3001", has_back_image=False),
+            {"trace_number": "3002", "date": "not-a-date"},
+        ])
+
+        assert written == 1
+        metadata = await resolver.resolve("3001", date(2024, 1, 15))
+        assert not metadata.has_back_image
+        assert metadata.image_handle.page_count == 1
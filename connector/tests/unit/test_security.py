@@ -6,12 +6,39 @@ import uuid
 
 import jwt
 import pytest
+from app.core import security
 from app.core.security import (
     JWTClaims,
     JWTValidator,
+    KeyRing,
     PathValidator,
     ReplayCache,
+    SqliteReplayCache,
 )
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+
+def public_pem(private_key) -> str:
+    """PEM of a private key's public half."""
+    return private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def claims_payload(jti: str = None) -> dict:
+    """Claims of a valid token."""
+    now = int(time.time())
+    return {
+        "sub": "test-user",
+        "org_id": "test-org",
+        "roles": ["image_viewer"],
+        "iat": now,
+        "exp": now + 120,
+        "jti": jti or str(uuid.uuid4()),
+        "iss": "check-review-saas",
+    }
 
 
 class TestReplayCache:
@@ -48,6 +75,119 @@ class TestReplayCache:
         assert cache.contains("jti3")
         assert cache.contains("jti4")
 
+    def test_time_wheel_sweeps_expired_slots(self, monkeypatch):
+        """Test that inserts evict JTIs whose slot has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cache = ReplayCache(default_ttl=60)
+
+        cache.add("short", 1005.0)
+        cache.add("long", 1100.0)
+        now[0] = 1010.0
+        cache.add("new")
+
+        assert cache.size() == 2
+        assert cache.contains("long")
+        assert not cache.contains("short")
+
+    def test_check_and_add(self):
+        """Test that check_and_add accepts a JTI once."""
+        cache = ReplayCache(default_ttl=60)
+
+        assert cache.check_and_add("jti1")
+        assert not cache.check_and_add("jti1")
+
+
+class TestSqliteReplayCache:
+    """Tests for the SQLite-backed replay cache."""
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test that a JTI seen by one worker is a replay for another."""
+        path = str(tmp_path / "replay.db")
+        worker1 = SqliteReplayCache(path, default_ttl=60)
+        worker2 = SqliteReplayCache(path, default_ttl=60)
+
+        assert worker1.check_and_add("jti1")
+        assert not worker2.check_and_add("jti1")
+        assert worker2.contains("jti1")
+        worker1.close()
+        worker2.close()
+
+    def test_expired_jti_can_be_reused(self, tmp_path):
+        """Test that expired rows neither block nor count."""
+        cache = SqliteReplayCache(str(tmp_path / "replay.db"), default_ttl=60)
+
+        cache.add("old", time.time() - 1)
+        assert not cache.contains("old")
+        assert cache.size() == 0
+        assert cache.check_and_add("old")
+        assert cache.contains("old")
+        cache.close()
+
+    def test_purge_deletes_expired_rows(self, tmp_path):
+        """Test that expired rows are deleted in bulk."""
+        cache = SqliteReplayCache(str(tmp_path / "replay.db"), default_ttl=60)
+        cache.add("old", time.time() - 1)
+
+        cache._next_purge = 0.0
+        cache.check_and_add("new")
+
+        rows = cache._conn.execute("SELECT jti FROM seen_jti").fetchall()
+        assert rows == [("new",)]
+        cache.close()
+
+
+class TestKeyRing:
+    """Tests for the parsed verification keys."""
+
+    def test_algorithm_follows_key_type(self, public_key):
+        """Test that each key verifies only the algorithm of its type."""
+        ed_key = public_pem(ed25519.Ed25519PrivateKey.generate())
+        ec_key = public_pem(ec.generate_private_key(ec.SECP256R1()))
+
+        for pem, algorithm in ((public_key, "RS256"), (ec_key, "ES256"), (ed_key, "EdDSA")):
+            keys = KeyRing(public_key=pem, algorithms=["RS256", "ES256", "EdDSA"])
+            assert [key.algorithm for key in keys.candidates(None)] == [algorithm]
+
+        # Not in the accepted algorithms: skipped
+        assert len(KeyRing(public_key=ed_key, algorithms=["RS256"])) == 0
+
+    def test_lookup_by_kid(self, public_key):
+        """Test that a known kid selects its key and an unknown one the unnamed key."""
+        named = public_pem(ed25519.Ed25519PrivateKey.generate())
+        keys = KeyRing(public_key=public_key, algorithms=["RS256", "EdDSA"])
+        assert keys.candidates("key-a")[0].algorithm == "RS256"
+
+        keys = KeyRing(public_key=named, public_key_id="key-b", algorithms=["EdDSA"])
+        assert keys.kids() == ["key-b"]
+        assert len(keys.candidates("key-b")) == 1
+        assert keys.candidates("key-a") == []
+
+    def test_keys_dir_reload_parses_changed_files_only(self, tmp_path, monkeypatch):
+        """Test that reload adds, replaces and removes keys without re-parsing the rest."""
+        parses = []
+        load = security.load_pem_public_key
+        monkeypatch.setattr(
+            security, "load_pem_public_key", lambda data: parses.append(data) or load(data)
+        )
+
+        (tmp_path / "key-old.pem").write_text(public_pem(ed25519.Ed25519PrivateKey.generate()))
+        keys = KeyRing(keys_dir=str(tmp_path), algorithms=["EdDSA"], reload_seconds=3600)
+        assert keys.kids() == ["key-old"]
+        assert len(parses) == 1
+
+        # Rotation: the new key is added alongside the old one
+        (tmp_path / "key-new.pem").write_text(public_pem(ed25519.Ed25519PrivateKey.generate()))
+        keys.reload()
+        assert keys.kids() == ["key-new", "key-old"]
+        assert len(parses) == 2
+
+        # Overlap over: the old key is removed
+        (tmp_path / "key-old.pem").unlink()
+        keys.reload()
+        assert keys.kids() == ["key-new"]
+        assert len(parses) == 2
+
 
 class TestJWTValidator:
     """Tests for JWT validation."""
@@ -139,6 +279,99 @@ class TestJWTValidator:
         assert not is_valid2
         assert "replay" in error.lower()
 
+    def test_replay_protection_across_workers(
+        self, public_key, private_key, tmp_path, monkeypatch
+    ):
+        """Test that the sqlite backend rejects a token replayed on another worker."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "JWT_REPLAY_CACHE_BACKEND", "sqlite")
+        monkeypatch.setattr(
+            get_settings(), "JWT_REPLAY_CACHE_DB_PATH", str(tmp_path / "replay.db")
+        )
+        worker1 = JWTValidator(public_key=public_key, issuer="check-review-saas")
+        worker2 = JWTValidator(public_key=public_key, issuer="check-review-saas")
+
+        now = int(time.time())
+        token = jwt.encode({
+            "sub": "test-user",
+            "org_id": "test-org",
+            "roles": ["image_viewer"],
+            "iat": now,
+            "exp": now + 120,
+            "jti": "shared-jti-123",
+            "iss": "check-review-saas",
+        }, private_key, algorithm="RS256")
+
+        assert worker1.validate(token)[0]
+        is_valid, _, error = worker2.validate(token)
+        assert not is_valid
+        assert "replay" in error.lower()
+
+    def test_public_key_parsed_once(self, public_key, private_key, monkeypatch):
+        """Test that validating tokens does not re-parse the public key."""
+        parses = []
+        load = security.load_pem_public_key
+        monkeypatch.setattr(
+            security, "load_pem_public_key", lambda data: parses.append(data) or load(data)
+        )
+        validator = JWTValidator(public_key=public_key, issuer="check-review-saas")
+
+        for _ in range(3):
+            token = jwt.encode(claims_payload(), private_key, algorithm="RS256")
+            assert validator.validate(token)[0]
+        assert len(parses) == 1
+
+    def test_eddsa_tokens(self, monkeypatch):
+        """Test Ed25519 verification when EdDSA is accepted."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "JWT_ALGORITHM", "RS256,EdDSA")
+        signing_key = ed25519.Ed25519PrivateKey.generate()
+        validator = JWTValidator(
+            public_key=public_pem(signing_key), issuer="check-review-saas"
+        )
+
+        token = jwt.encode(claims_payload(), signing_key, algorithm="EdDSA")
+        is_valid, claims, error = validator.validate(token)
+        assert is_valid, error
+        assert claims.sub == "test-user"
+
+    def test_rotation_overlap_by_kid(self, tmp_path, monkeypatch):
+        """Test that tokens for either active kid verify with their own key."""
+        from app.core.config import get_settings
+
+        old_key = ec.generate_private_key(ec.SECP256R1())
+        new_key = ec.generate_private_key(ec.SECP256R1())
+        (tmp_path / "key-old.pem").write_text(public_pem(old_key))
+        (tmp_path / "key-new.pem").write_text(public_pem(new_key))
+        monkeypatch.setattr(get_settings(), "JWT_ALGORITHM", "ES256")
+        monkeypatch.setattr(get_settings(), "JWT_PUBLIC_KEYS_DIR", str(tmp_path))
+        validator = JWTValidator(public_key="", issuer="check-review-saas")
+
+        for kid, key in (("key-old", old_key), ("key-new", new_key)):
+            token = jwt.encode(
+                claims_payload(), key, algorithm="ES256", headers={"kid": kid}
+            )
+            assert validator.validate(token)[0]
+
+        # Signed by the new key but naming the old one
+        token = jwt.encode(
+            claims_payload(), new_key, algorithm="ES256", headers={"kid": "key-old"}
+        )
+        is_valid, _, error = validator.validate(token)
+        assert not is_valid
+        assert "signature" in error.lower()
+
+    def test_rejects_algorithm_other_than_key_type(self, public_key):
+        """Test that a token cannot pick an algorithm its key does not verify."""
+        validator = JWTValidator(public_key=public_key, issuer="check-review-saas")
+        token = jwt.encode(claims_payload(), "s" * 32, algorithm="HS256")
+
+        is_valid, claims, error = validator.validate(token)
+        assert not is_valid
+        assert claims is None
+
     def test_check_roles_success(self, public_key, valid_token):
         """Test role checking with valid roles."""
         validator = JWTValidator(
@@ -223,10 +223,11 @@ function UsersAdmin() {
         </div>
 
         {/* Pagination */}
-        {usersData && usersData.total_pages > 1 && (
+        {usersData && (usersData.has_previous || usersData.has_next) && (
           <div className="px-6 py-4 border-t border-gray-200 flex items-center justify-between">
             <p className="text-sm text-gray-700">
-              Page {page} of {usersData.total_pages} ({usersData.total} total)
+              Page {page}
+              {usersData.total_pages != null && ` of ${usersData.total_pages} (${usersData.total} total)`}
             </p>
             <div className="flex gap-2">
               <button
@@ -1871,10 +1872,11 @@ function AuditLogAdmin() {
         </div>
 
         {/* Pagination */}
-        {logsData && logsData.total_pages > 1 && (
+        {logsData && (logsData.has_previous || logsData.has_next) && (
           <div className="px-6 py-4 border-t border-gray-200 flex items-center justify-between">
             <p className="text-sm text-gray-700">
-              Page {page} of {logsData.total_pages} ({logsData.total} total entries)
+              Page {page}
+              {logsData.total_pages != null && ` of ${logsData.total_pages} (${logsData.total} total entries)`}
             </p>
             <div className="flex gap-2">
               <button
@@ -629,7 +629,9 @@ export default function ArchivePage() {
               <div className="bg-white rounded-lg shadow px-6 py-3 flex items-center justify-between">
                 <div className="text-sm text-gray-500">
                   Showing {((page - 1) * pageSize) + 1} to{' '}
-                  {Math.min(page * pageSize, data.total)} of {data.total} results
+                  {data.total != null
+                    ? <>{Math.min(page * pageSize, data.total)} of {data.total} results</>
+                    : (page - 1) * pageSize + data.items.length}
                 </div>
                 <div className="flex items-center space-x-2">
                   <button
@@ -640,7 +642,7 @@ export default function ArchivePage() {
                     <ChevronLeftIcon className="h-5 w-5" />
                   </button>
                   <span className="text-sm text-gray-700">
-                    Page {page} of {data.total_pages}
+                    Page {page}{data.total_pages != null && ` of ${data.total_pages}`}
                   </span>
                   <button
                     onClick={() => setPage((p) => p + 1)}
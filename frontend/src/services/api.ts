@@ -243,6 +243,7 @@ export const checkApi = {
   getAdjacentItems: async (itemId: string, params?: {
     status?: string[];
     risk_level?: string[];
+    prefetch?: number;
   }) => {
     const response = await api.get(`/checks/${itemId}/adjacent`, { params });
     return response.data as {
@@ -250,6 +251,7 @@ export const checkApi = {
       next_id: string | null;
       position: number;
       total: number;
+      next_ids: string[];
     };
   },
 };
@@ -432,7 +434,7 @@ export const imageApi = {
   },
 
   /**
-   * Mint multiple one-time tokens at once (max 10).
+   * Mint multiple one-time tokens at once (max 100).
    * Useful for loading all images on a check detail view.
    */
   mintTokensBatch: async (imageIds: string[], isThumbnail = false): Promise<{
@@ -211,12 +211,15 @@ export interface Permission {
 // API response types
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  // null on cursor pages fetched without a count; page with has_next instead
+  total: number | null;
   page: number;
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
   has_next: boolean;
   has_previous: boolean;
+  next_cursor?: string | null;
+  total_is_estimate?: boolean;
 }
 
 // ROI (Region of Interest) types for overlays